@@ -10,9 +10,9 @@ import redis
 from fastapi import APIRouter, HTTPException
 from loguru import logger
 
-from app.config.settings import settings
 from app.core.conversation_summary import get_latest_conversation_summary
 from app.core.redis_conversation_store import get_recent_messages
+from app.core.redis_pool import get_redis
 
 router = APIRouter(prefix="/admin/conversations", tags=["admin"])
 
@@ -23,7 +23,7 @@ def _get_redis_client() -> redis.Redis:
     Returns:
         Redis client with string decoding enabled
     """
-    return redis.from_url(settings.redis_url, decode_responses=True)
+    return get_redis()
 
 
 def _get_redis_key(conversation_id: str) -> str:
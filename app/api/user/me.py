@@ -41,6 +41,7 @@ from app.api.schemas.schemas import (
 )
 from app.config.settings import settings
 from app.core.password import hash_password, verify_password
+from app.core.response_cache import probe_response
 from app.db.models import (
     Activity,
     AthleteProfile,
@@ -1047,10 +1048,14 @@ def _determine_sync_state(account: StravaAccount) -> str:
 
 
 @router.get("/status")
-def get_status(user_id: str = Depends(get_current_user_id)):
+def get_status(request: Request, user_id: str = Depends(get_current_user_id)):
     """Get athlete sync status.
 
+    Supports If-None-Match (304) and a short-lived response cache keyed by the
+    user's data version.
+
     Args:
+        request: Incoming request (for conditional GET headers)
         user_id: Current authenticated user ID (from auth dependency)
 
     Returns:
@@ -1060,6 +1065,9 @@ def get_status(user_id: str = Depends(get_current_user_id)):
             "state": "ok" | "syncing" | "stale"
         }
     """
+    probe = probe_response(request, user_id, "me.status")
+    if (cached := probe.cached()) is not None:
+        return cached
     try:
         request_time = time.time()
         now_str = datetime.now(timezone.utc).strftime("%H:%M:%S.%f")[:-3]
@@ -1090,11 +1098,13 @@ def get_status(user_id: str = Depends(get_current_user_id)):
         logger.error(f"Error getting status: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to get status: {e!s}") from e
     else:
-        return {
-            "connected": True,
-            "last_sync": last_sync,
-            "state": state,
-        }
+        return probe.respond(
+            {
+                "connected": True,
+                "last_sync": last_sync,
+                "state": state,
+            }
+        )
 
 
 # get_overview_data moved to app.services.overview_service to break import cycle
@@ -1144,12 +1154,17 @@ def get_overview_debug(
 
 @router.get("/overview")
 def get_overview(
+    request: Request,
     user_id: str = Depends(get_current_user_id),
     days: int = Query(default=7, ge=1, le=365, description="Number of days to look back"),
 ):
     """Get athlete training overview.
 
+    Supports If-None-Match (304) and a short-lived response cache keyed by the
+    user's data version.
+
     Args:
+        request: Incoming request (for conditional GET headers)
         user_id: Current authenticated user ID (from auth dependency)
         days: Number of days to look back (default: 7, max: 365)
 
@@ -1179,8 +1194,11 @@ def get_overview(
         - Uses derived data (daily_training_summary), not raw activities
     """
     logger.info(f"[API] /me/overview endpoint called with days={days} (query parameter)")
+    probe = probe_response(request, user_id, "me.overview", {"days": days})
+    if (cached := probe.cached()) is not None:
+        return cached
     try:
-        return get_overview_data(user_id, days=days)
+        return probe.respond(get_overview_data(user_id, days=days))
     except HTTPException:
         raise
     except Exception as e:
@@ -9,7 +9,7 @@ from datetime import date, datetime, timedelta, timezone
 from typing import Any
 from zoneinfo import ZoneInfo
 
-from fastapi import APIRouter, Depends, HTTPException, Response, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from loguru import logger
 from pydantic import BaseModel, Field
 from sqlalchemy import delete as sql_delete
@@ -28,14 +28,14 @@ from app.api.schemas.schemas import (
     LLMFeedback,
     WeeklySummaryCardResponse,
 )
-from app.calendar.auto_match_service import auto_match_sessions
-from app.calendar.reconciliation_service import reconcile_calendar
+from app.calendar.execution_context import ACTIVE_LINK_STATUSES, ExecutionContext, load_execution_context
+from app.calendar.reconciliation_store import load_reconciliation
 from app.calendar.view_helper import calendar_session_from_view_row, get_calendar_items_from_view
+from app.core.response_cache import probe_response
 from app.core.system_memory import log_memory_snapshot
-from app.db.models import Activity, CoachFeedback, PlannedSession, StravaAccount, User
+from app.db.models import Activity, CoachFeedback, PlannedSession, SessionLink, StravaAccount, User
 from app.db.session import get_session
 from app.pairing.session_links import (
-    get_link_for_activity,
     get_link_for_planned,
     unlink_by_planned,
     upsert_link,
@@ -52,10 +52,6 @@ from app.workouts.targets_utils import get_distance_meters, get_duration_seconds
 
 router = APIRouter(prefix="/calendar", tags=["calendar"])
 
-# Only treat SessionLinks as "paired" when status is confirmed or proposed (not rejected).
-# Rejected links should not hide the activity - we show both planned and activity.
-ACTIVE_LINK_STATUSES: frozenset[str] = frozenset({"confirmed", "proposed"})
-
 # Schema v2: Use calendar_items view for unified querying
 SQL_CALENDAR_ITEMS = text("""
 SELECT kind, starts_at, ends_at, sport, title, status, payload
@@ -99,6 +95,7 @@ def _compute_execution_state_for_planned(
     linked_activity: Activity | None,
     item_id: str,
     now_utc: datetime,
+    context: ExecutionContext | None = None,
 ) -> ExecutionStateInfo:
     """Compute execution_state_info for a planned session.
 
@@ -111,18 +108,28 @@ def _compute_execution_state_for_planned(
         linked_activity: Linked activity if available
         item_id: Item ID
         now_utc: Current UTC time
+        context: Preloaded links/summaries (avoids per-row queries when given)
 
     Returns:
         ExecutionStateInfo object
     """
+
+    def _link() -> SessionLink | None:
+        if not item_id:
+            return None
+        return context.link_for_planned(item_id) if context else get_link_for_planned(session, item_id)
+
     # PHASE 5.2: Try to get execution summary first (faster)
     llm_feedback = None
     if linked_activity:
-        summary = get_execution_summary(session, linked_activity.id)
+        if context:
+            summary = context.summary_for_activity(linked_activity.id)
+        else:
+            summary = get_execution_summary(session, linked_activity.id)
         if summary:
             # Use summary data
             execution_state = derive_execution_state(planned_session, linked_activity, now_utc)
-            session_link = get_link_for_planned(session, item_id) if item_id else None
+            session_link = _link()
             resolved_at = session_link.resolved_at.isoformat() if session_link and session_link.resolved_at else None
 
             # Extract LLM feedback if available (safely handle missing column)
@@ -147,7 +154,7 @@ def _compute_execution_state_for_planned(
 
     # Fallback: derive execution_state on-the-fly if no summary
     execution_state = derive_execution_state(planned_session, linked_activity, now_utc)
-    session_link = get_link_for_planned(session, item_id) if item_id else None
+    session_link = _link()
     deltas = session_link.deltas if session_link else None
     resolved_at = session_link.resolved_at.isoformat() if session_link and session_link.resolved_at else None
     reason = _build_match_reason_string(session_link.match_reason if session_link else None)
@@ -165,6 +172,7 @@ def _load_planned_session_with_activity(
     item_id: str,
     pairing_map: dict[str, str],
     now_utc: datetime,
+    context: ExecutionContext | None = None,
 ) -> ExecutionStateInfo | None:
     """Load planned session and linked activity, computing execution state.
 
@@ -173,10 +181,19 @@ def _load_planned_session_with_activity(
         item_id: Planned session ID
         pairing_map: Map of planned_session_id -> activity_id
         now_utc: Current UTC time
+        context: Preloaded rows; when given no queries are issued
 
     Returns:
         ExecutionStateInfo if successful, None if transaction aborted
     """
+    if context is not None:
+        planned_session = context.planned_sessions.get(item_id)
+        if not planned_session:
+            return None
+        return _compute_execution_state_for_planned(
+            session, planned_session, context.linked_activity(item_id), item_id, now_utc, context
+        )
+
     try:
         planned_session = session.get(PlannedSession, item_id)
         linked_activity = None
@@ -211,6 +228,37 @@ def _load_planned_session_with_activity(
         return None
 
 
+def _load_view_context(
+    session: Session,
+    view_rows: list[dict[str, Any]],
+    include_workouts: bool = False,
+) -> ExecutionContext:
+    """Prefetch execution context for calendar_items view rows.
+
+    Args:
+        session: Database session
+        view_rows: Rows from get_calendar_items_from_view
+        include_workouts: Also load workouts and steps (only /today renders steps)
+
+    Returns:
+        ExecutionContext covering every planned/activity row
+    """
+    planned_ids: list[str] = []
+    activity_ids: list[str] = []
+    workout_ids: list[str] = []
+    for row in view_rows:
+        item_id = str(row.get("item_id", ""))
+        kind = str(row.get("kind", ""))
+        if kind == "planned":
+            planned_ids.append(item_id)
+            workout_id = (row.get("payload") or {}).get("workout_id")
+            if include_workouts and workout_id:
+                workout_ids.append(str(workout_id))
+        elif kind == "activity":
+            activity_ids.append(item_id)
+    return load_execution_context(session, planned_ids, activity_ids, workout_ids=workout_ids)
+
+
 def _compute_execution_state_for_activity() -> ExecutionStateInfo:
     """Compute execution_state_info for an unpaired activity.
 
@@ -336,71 +384,38 @@ def _get_activities_safe(
 
 
 def _run_reconciliation_safe(
+    session: Session,
     user_id: str,
-    athlete_id: int,
-    start_date: date,
-    end_date: date,
+    planned_sessions: list[PlannedSession],
 ) -> tuple[dict[str, str], set[str]]:
-    """Run reconciliation with safe error handling and auto-matching.
+    """Look up stored reconciliation results with safe error handling.
 
-    This function:
-    1. Runs reconciliation to find matches
-    2. Automatically creates workouts for matches (idempotent)
-    3. Returns reconciliation status map
+    Reconciliation and auto-matching run on the write side (see
+    app.calendar.reconciliation_store); this read path never writes.
 
     Args:
+        session: Database session
         user_id: User ID
-        athlete_id: Athlete ID
-        start_date: Start date
-        end_date: End date
+        planned_sessions: Planned sessions being rendered
 
     Returns:
         Tuple of (reconciliation_map, matched_activity_ids)
     """
-    reconciliation_map: dict[str, str] = {}
-    matched_activity_ids: set[str] = set()
-
     try:
-        reconciliation_results = reconcile_calendar(
-            user_id=user_id,
-            athlete_id=athlete_id,
-            start_date=start_date,
-            end_date=end_date,
-        )
-
-        # Auto-match: create workouts for matches
-        try:
-            auto_match_sessions(user_id=user_id, reconciliation_results=reconciliation_results)
-        except Exception as e:
-            logger.warning(f"[CALENDAR] Auto-match failed, continuing with reconciliation: {e!r}")
-
-        # Build reconciliation map
-        # CRITICAL: Only override DB status if there's a REAL matched activity
-        # MISSED status should NOT flip planned → completed (keep it as planned)
-        # BUT we DO include MISSED in reconciliation_map so frontend can display MISSED label
-        for result in reconciliation_results:
-            # Only set reconciliation status if:
-            # 1. There's a matched activity (COMPLETED, PARTIAL, SUBSTITUTED have matched_activity_id)
-            # 2. OR session is explicitly SKIPPED (user marked it)
-            # 3. OR session is MISSED (for frontend label display, but doesn't change DB status)
-            if result.matched_activity_id or result.status.value in {"skipped", "missed"}:
-                reconciliation_map[result.session_id] = result.status.value
-            else:
-                # Other statuses (shouldn't happen, but be safe)
-                reconciliation_map[result.session_id] = result.status.value
-
-            if result.matched_activity_id:
-                matched_activity_ids.add(result.matched_activity_id)
+        # reconciliation_map carries every status, including MISSED (frontend label only,
+        # doesn't flip planned -> completed) and SKIPPED; matched_activity_ids only holds
+        # activities with a REAL match (COMPLETED, PARTIAL, SUBSTITUTED)
+        return load_reconciliation(session, user_id, planned_sessions)
     except Exception as e:
-        logger.warning(f"[CALENDAR] Reconciliation failed, using planned status: {e!r}")
-
-    return reconciliation_map, matched_activity_ids
+        logger.warning(f"[CALENDAR] Reconciliation lookup failed, using planned status: {e!r}")
+        return {}, set()
 
 
 def _planned_session_to_calendar(
     planned: PlannedSession,
     reconciliation_status: str | None = None,
     session: Session | None = None,
+    context: ExecutionContext | None = None,
 ) -> CalendarSession:
     """Convert PlannedSession to CalendarSession.
 
@@ -410,6 +425,7 @@ def _planned_session_to_calendar(
         planned: PlannedSession record
         reconciliation_status: Optional status from reconciliation (overrides planned.status)
         session: Database session (required for execution_state computation)
+        context: Preloaded execution context from load_execution_context (list views)
 
     Returns:
         CalendarSession object
@@ -445,7 +461,16 @@ def _planned_session_to_calendar(
 
     # PHASE 2.2: Compute execution_state centrally
     execution_state_info = None
-    if session:
+    if session and context is not None:
+        execution_state_info = _compute_execution_state_for_planned(
+            session,
+            planned,
+            context.linked_activity(str(planned.id)),
+            str(planned.id),
+            datetime.now(timezone.utc),
+            context,
+        )
+    elif session:
         # Get linked activity via session_links
         session_link = get_link_for_planned(session, str(planned.id))
         linked_activity = None
@@ -583,6 +608,9 @@ def get_season(user_id: str = Depends(get_current_user_id)):
             len(view_rows),
         )
 
+        # Prefetch links, planned sessions, paired activities and summaries in bulk
+        context = _load_view_context(session, view_rows)
+
         # Build pairing maps for efficient lookup
         pairing_map: dict[str, str] = {}  # planned_session_id -> activity_id
         activity_pairing_map: dict[str, str] = {}  # activity_id -> planned_session_id
@@ -592,13 +620,13 @@ def get_season(user_id: str = Depends(get_current_user_id)):
             kind = str(row.get("kind", ""))
 
             if kind == "planned":
-                link = get_link_for_planned(session, item_id)
-                if link and link.status in ACTIVE_LINK_STATUSES:
-                    pairing_map[item_id] = link.activity_id
+                activity_id = context.paired_activity_id(item_id)
+                if activity_id:
+                    pairing_map[item_id] = activity_id
             elif kind == "activity":
-                link = get_link_for_activity(session, item_id)
-                if link and link.status in ACTIVE_LINK_STATUSES:
-                    activity_pairing_map[item_id] = link.planned_session_id
+                planned_id = context.paired_planned_id(item_id)
+                if planned_id:
+                    activity_pairing_map[item_id] = planned_id
 
         # PHASE 2.2: Enrich view rows with pairing info and compute execution_state
         # Filter out activities that are paired to a planned session (show only the planned session card)
@@ -622,7 +650,7 @@ def get_season(user_id: str = Depends(get_current_user_id)):
                     activity_id = pairing_map[item_id]
                     payload = {**payload, "paired_activity_id": activity_id}
                 execution_state_info = _load_planned_session_with_activity(
-                    session, item_id, pairing_map, now_utc
+                    session, item_id, pairing_map, now_utc, context
                 )
             elif kind == "activity":
                 # For unpaired activities, execution_state is "executed_unplanned"
@@ -665,19 +693,26 @@ def get_season(user_id: str = Depends(get_current_user_id)):
 
 
 @router.get("/week", response_model=CalendarWeekResponse)
-def get_week(user_id: str = Depends(get_current_user_id)):
+def get_week(request: Request, user_id: str = Depends(get_current_user_id)):
     """Get calendar data for the current week from real activities.
 
     **Data Source**: Reads from database (not from Strava API).
     Activities are synced incrementally in the background and stored in the database.
 
+    Supports If-None-Match (304) and a short-lived response cache keyed by the
+    user's data version.
+
     Args:
+        request: Incoming request (for conditional GET headers)
         user_id: Current authenticated user ID (from auth dependency)
 
     Returns:
         CalendarWeekResponse with sessions for this week
     """
     logger.info(f"[CALENDAR] GET /calendar/week called for user_id={user_id}")
+    probe = probe_response(request, user_id, "calendar.week")
+    if (cached := probe.cached()) is not None:
+        return cached
     try:
         with get_session() as session:
             # Get user for timezone
@@ -717,6 +752,9 @@ def get_week(user_id: str = Depends(get_current_user_id)):
                 len(view_rows),
             )
 
+            # Prefetch links, planned sessions, paired activities and summaries in bulk
+            context = _load_view_context(session, view_rows)
+
             # Build pairing maps for efficient lookup
             pairing_map: dict[str, str] = {}  # planned_session_id -> activity_id
             activity_pairing_map: dict[str, str] = {}  # activity_id -> planned_session_id
@@ -726,13 +764,13 @@ def get_week(user_id: str = Depends(get_current_user_id)):
                 kind = str(row.get("kind", ""))
 
                 if kind == "planned":
-                    link = get_link_for_planned(session, item_id)
-                    if link and link.status in ACTIVE_LINK_STATUSES:
-                        pairing_map[item_id] = link.activity_id
+                    activity_id = context.paired_activity_id(item_id)
+                    if activity_id:
+                        pairing_map[item_id] = activity_id
                 elif kind == "activity":
-                    link = get_link_for_activity(session, item_id)
-                    if link and link.status in ACTIVE_LINK_STATUSES:
-                        activity_pairing_map[item_id] = link.planned_session_id
+                    planned_id = context.paired_planned_id(item_id)
+                    if planned_id:
+                        activity_pairing_map[item_id] = planned_id
 
             # PHASE 2.2: Enrich view rows with pairing info and compute execution_state
             # Filter out activities that are paired to a planned session (show only the planned session card)
@@ -752,18 +790,12 @@ def get_week(user_id: str = Depends(get_current_user_id)):
                 execution_state_info = None
                 if kind == "planned":
                     # Load PlannedSession and linked Activity to compute execution_state
-                    planned_session = session.get(PlannedSession, item_id)
-                    linked_activity = None
-
                     if item_id in pairing_map:
                         activity_id = pairing_map[item_id]
-                        linked_activity = session.get(Activity, activity_id)
                         payload = {**payload, "paired_activity_id": activity_id}
-
-                    if planned_session:
-                        execution_state_info = _compute_execution_state_for_planned(
-                            session, planned_session, linked_activity, item_id, now_utc
-                        )
+                    execution_state_info = _load_planned_session_with_activity(
+                        session, item_id, pairing_map, now_utc, context
+                    )
                 elif kind == "activity":
                     # For unpaired activities, execution_state is "executed_unplanned"
                     execution_state_info = _compute_execution_state_for_activity()
@@ -776,10 +808,12 @@ def get_week(user_id: str = Depends(get_current_user_id)):
             # Sort by date and time
             sessions.sort(key=lambda s: (s.date, s.time or ""))
 
-            return CalendarWeekResponse(
-                week_start=monday_local.strftime("%Y-%m-%d"),
-                week_end=sunday_date_local.strftime("%Y-%m-%d"),
-                sessions=sessions,
+            return probe.respond(
+                CalendarWeekResponse(
+                    week_start=monday_local.strftime("%Y-%m-%d"),
+                    week_end=sunday_date_local.strftime("%Y-%m-%d"),
+                    sessions=sessions,
+                )
             )
     except HTTPException:
         raise
@@ -891,6 +925,9 @@ def get_range(
                 len(view_rows),
             )
 
+            # Prefetch links, planned sessions, paired activities and summaries in bulk
+            context = _load_view_context(session, view_rows)
+
             # Build pairing maps for efficient lookup
             pairing_map: dict[str, str] = {}  # planned_session_id -> activity_id
             activity_pairing_map: dict[str, str] = {}  # activity_id -> planned_session_id
@@ -900,13 +937,13 @@ def get_range(
                 kind = str(row.get("kind", ""))
 
                 if kind == "planned":
-                    link = get_link_for_planned(session, item_id)
-                    if link and link.status in ACTIVE_LINK_STATUSES:
-                        pairing_map[item_id] = link.activity_id
+                    activity_id = context.paired_activity_id(item_id)
+                    if activity_id:
+                        pairing_map[item_id] = activity_id
                 elif kind == "activity":
-                    link = get_link_for_activity(session, item_id)
-                    if link and link.status in ACTIVE_LINK_STATUSES:
-                        activity_pairing_map[item_id] = link.planned_session_id
+                    planned_id = context.paired_planned_id(item_id)
+                    if planned_id:
+                        activity_pairing_map[item_id] = planned_id
 
             # PHASE 2.2: Enrich view rows with pairing info and compute execution_state
             # Filter out activities that are paired to a planned session (show only the planned session card)
@@ -930,7 +967,7 @@ def get_range(
                         activity_id = pairing_map[item_id]
                         payload = {**payload, "paired_activity_id": activity_id}
                     execution_state_info = _load_planned_session_with_activity(
-                        session, item_id, pairing_map, now_utc
+                        session, item_id, pairing_map, now_utc, context
                     )
                 elif kind == "activity":
                     # For unpaired activities, execution_state is "executed_unplanned"
@@ -1204,7 +1241,10 @@ def _persist_coach_feedback(
 
 
 async def _process_planned_session_for_today(
-    session: Session, row: dict[str, Any], user_id: str
+    session: Session,
+    row: dict[str, Any],
+    user_id: str,
+    context: ExecutionContext | None = None,
 ) -> tuple[list[str] | None, list[dict[str, Any]] | None, str | None]:
     """Process a planned session row and generate LLM content if needed.
 
@@ -1212,6 +1252,7 @@ async def _process_planned_session_for_today(
         session: Database session
         row: Calendar item row from view
         user_id: User ID for the session
+        context: Preloaded activities/workouts for today's rows
 
     Returns:
         Tuple of (instructions, steps, coach_insight)
@@ -1240,9 +1281,12 @@ async def _process_planned_session_for_today(
         actual_distance_km: float | None = None
 
         if is_completed and paired_activity_id:
-            actual_activity = session.execute(
-                select(Activity).where(Activity.id == paired_activity_id)
-            ).scalar_one_or_none()
+            if context and paired_activity_id in context.activities:
+                actual_activity = context.activities[paired_activity_id]
+            else:
+                actual_activity = session.execute(
+                    select(Activity).where(Activity.id == paired_activity_id)
+                ).scalar_one_or_none()
 
             if actual_activity:
                 if actual_activity.duration_seconds:
@@ -1266,7 +1310,7 @@ async def _process_planned_session_for_today(
         if workout_id:
             # ❗ SINGLE SOURCE OF TRUTH: Fetch actual workout steps from database
             # Use canonical workout steps, not LLM-generated generic "Warm-up, Main, Cooldown"
-            canonical_steps = _load_canonical_workout_steps(session, workout_id)
+            canonical_steps = _load_canonical_workout_steps(session, workout_id, context)
             if canonical_steps:
                 steps = canonical_steps
                 logger.info(
@@ -1372,32 +1416,37 @@ async def _process_planned_session_for_today(
 
 
 def _load_canonical_workout_steps(
-    session: Session, workout_id: str
+    session: Session, workout_id: str, context: ExecutionContext | None = None
 ) -> list[dict[str, Any]] | None:
     """Load canonical workout steps from database.
 
     Args:
         session: Database session
         workout_id: Workout ID
+        context: Preloaded workouts/steps; used instead of querying when it covers workout_id
 
     Returns:
         List of step dictionaries or None if not found
     """
     try:
-        # Fetch workout for raw_notes (needed for step name inference)
-        workout_obj = session.execute(
-            select(Workout).where(Workout.id == workout_id)
-        ).scalar_one_or_none()
+        if context and str(workout_id) in context.workouts:
+            workout_obj = context.workouts[str(workout_id)]
+            workout_steps_query = context.workout_steps.get(str(workout_id), [])
+        else:
+            # Fetch workout for raw_notes (needed for step name inference)
+            workout_obj = session.execute(
+                select(Workout).where(Workout.id == workout_id)
+            ).scalar_one_or_none()
 
-        workout_steps_query = (
-            session.execute(
-                select(WorkoutStep)
-                .where(WorkoutStep.workout_id == workout_id)
-                .order_by(WorkoutStep.step_index.asc())
+            workout_steps_query = (
+                session.execute(
+                    select(WorkoutStep)
+                    .where(WorkoutStep.workout_id == workout_id)
+                    .order_by(WorkoutStep.step_index.asc())
+                )
+                .scalars()
+                .all()
             )
-            .scalars()
-            .all()
-        )
 
         if not workout_steps_query:
             return None
@@ -1425,19 +1474,26 @@ def _load_canonical_workout_steps(
 
 
 @router.get("/today", response_model=CalendarTodayResponse)
-async def get_today(user_id: str = Depends(get_current_user_id)):
+async def get_today(request: Request, user_id: str = Depends(get_current_user_id)):
     """Get calendar data for today from real activities.
 
     **Data Source**: Reads from database (not from Strava API).
     Activities are synced incrementally in the background and stored in the database.
 
+    Supports If-None-Match (304) and a short-lived response cache keyed by the
+    user's data version.
+
     Args:
+        request: Incoming request (for conditional GET headers)
         user_id: Current authenticated user ID (from auth dependency)
 
     Returns:
         CalendarTodayResponse with sessions for today
     """
     logger.info(f"[CALENDAR] GET /calendar/today called for user_id={user_id}")
+    probe = probe_response(request, user_id, "calendar.today")
+    if (cached := probe.cached()) is not None:
+        return cached
     try:
         with get_session() as session:
             # Get user for timezone
@@ -1471,6 +1527,9 @@ async def get_today(user_id: str = Depends(get_current_user_id)):
                 len(view_rows),
             )
 
+            # Prefetch links, planned sessions, paired activities and summaries in bulk
+            context = _load_view_context(session, view_rows, include_workouts=True)
+
             # Build pairing maps for efficient lookup
             pairing_map: dict[str, str] = {}  # planned_session_id -> activity_id
             activity_pairing_map: dict[str, str] = {}  # activity_id -> planned_session_id
@@ -1480,13 +1539,13 @@ async def get_today(user_id: str = Depends(get_current_user_id)):
                 kind = str(row.get("kind", ""))
 
                 if kind == "planned":
-                    link = get_link_for_planned(session, item_id)
-                    if link and link.status in ACTIVE_LINK_STATUSES:
-                        pairing_map[item_id] = link.activity_id
+                    activity_id = context.paired_activity_id(item_id)
+                    if activity_id:
+                        pairing_map[item_id] = activity_id
                 elif kind == "activity":
-                    link = get_link_for_activity(session, item_id)
-                    if link and link.status in ACTIVE_LINK_STATUSES:
-                        activity_pairing_map[item_id] = link.planned_session_id
+                    planned_id = context.paired_planned_id(item_id)
+                    if planned_id:
+                        activity_pairing_map[item_id] = planned_id
 
             # PHASE 2.2: Enrich view rows with pairing info and compute execution_state
             # Filter out activities that are paired to a planned session (show only the planned session card)
@@ -1506,18 +1565,12 @@ async def get_today(user_id: str = Depends(get_current_user_id)):
                 execution_state_info = None
                 if kind == "planned":
                     # Load PlannedSession and linked Activity to compute execution_state
-                    planned_session = session.get(PlannedSession, item_id)
-                    linked_activity = None
-
                     if item_id in pairing_map:
                         activity_id = pairing_map[item_id]
-                        linked_activity = session.get(Activity, activity_id)
                         payload = {**payload, "paired_activity_id": activity_id}
-
-                    if planned_session:
-                        execution_state_info = _compute_execution_state_for_planned(
-                            session, planned_session, linked_activity, item_id, now_utc
-                        )
+                    execution_state_info = _load_planned_session_with_activity(
+                        session, item_id, pairing_map, now_utc, context
+                    )
                 elif kind == "activity":
                     # For unpaired activities, execution_state is "executed_unplanned"
                     execution_state_info = _compute_execution_state_for_activity()
@@ -1559,7 +1612,7 @@ async def get_today(user_id: str = Depends(get_current_user_id)):
                         status=status,
                     )
                     instructions, steps, coach_insight = await _process_planned_session_for_today(
-                        session, row, user_id
+                        session, row, user_id, context
                     )
                 else:
                     logger.debug(
@@ -1594,9 +1647,11 @@ async def get_today(user_id: str = Depends(get_current_user_id)):
             # Sort by time
             sessions.sort(key=lambda s: s.time or "23:59")
 
-        return CalendarTodayResponse(
-            date=today_str,
-            sessions=sessions,
+        return probe.respond(
+            CalendarTodayResponse(
+                date=today_str,
+                sessions=sessions,
+            )
         )
     except HTTPException:
         raise
@@ -1648,11 +1703,9 @@ def get_sessions(limit: int = 50, offset: int = 0, user_id: str = Depends(get_cu
         )
         planned_list = list(planned_sessions)
 
-        # Run reconciliation if we have athlete_id and planned sessions
+        # Look up stored reconciliation if we have athlete_id and planned sessions
         if athlete_id and planned_list:
-            min_date = min(p.date.date() if isinstance(p.date, datetime) else p.date for p in planned_list)
-            max_date = max(p.date.date() if isinstance(p.date, datetime) else p.date for p in planned_list)
-            reconciliation_map, matched_activity_ids = _run_reconciliation_safe(user_id, athlete_id, min_date, max_date)
+            reconciliation_map, matched_activity_ids = _run_reconciliation_safe(session, user_id, planned_list)
         else:
             reconciliation_map, matched_activity_ids = {}, set()
 
@@ -1665,8 +1718,9 @@ def get_sessions(limit: int = 50, offset: int = 0, user_id: str = Depends(get_cu
 
         # Convert planned sessions with reconciliation status
         # PHASE 2.2: Pass session for execution_state computation
+        context = load_execution_context(session, planned_sessions=planned_list)
         planned_calendar_sessions = [
-            _planned_session_to_calendar(p, reconciliation_map.get(p.id), session=session)
+            _planned_session_to_calendar(p, reconciliation_map.get(p.id), session=session, context=context)
             for p in planned_list
         ]
 
@@ -1721,25 +1775,11 @@ def get_session_by_id(
         # Get athlete_id for reconciliation
         athlete_id = _get_athlete_id(db_session, user_id)
 
-        # Run reconciliation if we have athlete_id
+        # Look up stored reconciliation if we have athlete_id
         reconciliation_status: str | None = None
         if athlete_id:
-            try:
-                # Get the date range for reconciliation (just the session date)
-                session_date = planned_session.date.date() if isinstance(planned_session.date, datetime) else planned_session.date
-                reconciliation_results = reconcile_calendar(
-                    user_id=user_id,
-                    athlete_id=athlete_id,
-                    start_date=session_date,
-                    end_date=session_date,
-                )
-                # Find the reconciliation result for this session
-                for result in reconciliation_results:
-                    if result.session_id == session_id:
-                        reconciliation_status = result.status.value
-                        break
-            except Exception as e:
-                logger.warning(f"[CALENDAR] Reconciliation failed for session {session_id}: {e!r}")
+            reconciliation_map, _ = _run_reconciliation_safe(db_session, user_id, [planned_session])
+            reconciliation_status = reconciliation_map.get(planned_session.id)
 
         return _planned_session_to_calendar(planned_session, reconciliation_status, session=db_session)
 
@@ -14,6 +14,7 @@ from typing import Any, Literal
 
 from pydantic import BaseModel, Field
 
+from app.calendar.day_index import DayIndex
 from app.db.models import PlannedSession
 from app.db.schema_v2_map import combine_date_time
 
@@ -303,8 +304,23 @@ def _is_key_session(session: PlannedSession | dict) -> bool:
     return session_type.lower() == "run" and duration is not None and duration > 90
 
 
+def index_sessions_by_day(existing_sessions: list[PlannedSession]) -> DayIndex[PlannedSession]:
+    """Build the shared day/time index over existing calendar sessions.
+
+    Sessions are bucketed by the stored datetime's own calendar day (session.date.date()),
+    matching how conflicts have always been grouped.
+
+    Args:
+        existing_sessions: Existing PlannedSession objects for the user
+
+    Returns:
+        DayIndex over the sessions
+    """
+    return DayIndex(existing_sessions, start=lambda s: s.starts_at, day=lambda s: s.date.date())
+
+
 def detect_conflicts(
-    existing_sessions: list[PlannedSession],
+    existing_sessions: list[PlannedSession] | DayIndex[PlannedSession],
     candidate_sessions: list[PlannedSession | dict[str, Any]],
 ) -> list[Conflict]:
     """Detect conflicts between existing and candidate sessions.
@@ -319,21 +335,21 @@ def detect_conflicts(
     Also flags > 1 key session (workout/long run) on same day.
 
     Args:
-        existing_sessions: List of existing sessions in the calendar (PlannedSession objects)
+        existing_sessions: Existing sessions in the calendar (PlannedSession objects), or a
+            prebuilt index from index_sessions_by_day() when checking many candidates
         candidate_sessions: List of candidate sessions to check (PlannedSession or dict)
 
     Returns:
         List of detected conflicts
     """
     conflicts: list[Conflict] = []
+    # (existing_session_id, candidate_title) pairs already flagged, for O(1) dedupe
+    flagged_pairs: set[tuple[str, str]] = set()
 
     # Group sessions by date for efficient lookup
-    existing_by_date: dict[date_type, list[PlannedSession]] = {}
-    for session in existing_sessions:
-        session_date = session.date.date()
-        if session_date not in existing_by_date:
-            existing_by_date[session_date] = []
-        existing_by_date[session_date].append(session)
+    existing_by_date = (
+        existing_sessions if isinstance(existing_sessions, DayIndex) else index_sessions_by_day(existing_sessions)
+    )
 
     # Check each candidate session against existing sessions
     for candidate in candidate_sessions:
@@ -343,8 +359,8 @@ def detect_conflicts(
         candidate_id = _get_session_id(candidate)
 
         # Check against existing sessions on same date
-        if candidate_date in existing_by_date:
-            for existing in existing_by_date[candidate_date]:
+        if existing_by_date.has_day(candidate_date):
+            for existing in existing_by_date.on_day(candidate_date):
                 # Skip if candidate is the same session as existing (update/re-upload scenario)
                 existing_id_str = str(existing.id)
                 if candidate_id and candidate_id == existing_id_str:
@@ -360,6 +376,7 @@ def detect_conflicts(
                 # Conflict type 1 & 2: All-day overlap (both all-day OR one all-day vs timed)
                 # All-day sessions conflict with all other sessions on the same day
                 if candidate_time_info.is_all_day or existing_time_info.is_all_day:
+                    flagged_pairs.add((existing_id_str, candidate_title))
                     conflicts.append(
                         Conflict(
                             date=candidate_date,
@@ -385,6 +402,7 @@ def detect_conflicts(
                         existing_time_info.end_time,
                     )
                 ):
+                    flagged_pairs.add((existing_id_str, candidate_title))
                     conflicts.append(
                         Conflict(
                             date=candidate_date,
@@ -398,25 +416,19 @@ def detect_conflicts(
 
                 # Conflict type 4: Multiple key sessions on same day
                 # Check if both are key sessions (even if they don't overlap in time)
-                if _is_key_session(existing) and _is_key_session(candidate):
-                    # Only add if not already added as time_overlap
-                    existing_id_str = str(existing.id)
-                    already_conflicted = any(
-                        c.existing_session_id == existing_id_str
-                        and c.candidate_session_title == candidate_title
-                        for c in conflicts
-                    )
-                    if not already_conflicted:
-                        conflicts.append(
-                            Conflict(
-                                date=candidate_date,
-                                existing_session_id=existing_id_str,
-                                candidate_session_id=candidate_id,
-                                existing_session_title=existing.title or "",
-                                candidate_session_title=candidate_title,
-                                reason="multiple_key_sessions",
-                            )
+                # Only add if not already added as time_overlap
+                if _is_key_session(existing) and _is_key_session(candidate) and (existing_id_str, candidate_title) not in flagged_pairs:
+                    flagged_pairs.add((existing_id_str, candidate_title))
+                    conflicts.append(
+                        Conflict(
+                            date=candidate_date,
+                            existing_session_id=existing_id_str,
+                            candidate_session_id=candidate_id,
+                            existing_session_title=existing.title or "",
+                            candidate_session_title=candidate_title,
+                            reason="multiple_key_sessions",
                         )
+                    )
 
     # Also check for multiple key sessions within candidate sessions themselves
     candidate_by_date: dict[date_type, list[PlannedSession | dict[str, Any]]] = {}
@@ -426,6 +438,9 @@ def detect_conflicts(
             candidate_by_date[session_date] = []
         candidate_by_date[session_date].append(session)
 
+    flagged_titles: set[tuple[date_type, str, str]] = {
+        (c.date, c.existing_session_title, c.candidate_session_title) for c in conflicts
+    }
     for date_key, sessions_on_date in candidate_by_date.items():
         key_sessions = [s for s in sessions_on_date if _is_key_session(s)]
         if len(key_sessions) > 1:
@@ -434,13 +449,8 @@ def detect_conflicts(
                 # Check if conflict already exists
                 key_title_i = _get_session_title(key_sessions[i])
                 key_title_i1 = _get_session_title(key_sessions[i + 1])
-                already_conflicted = any(
-                    c.date == date_key
-                    and c.existing_session_title == key_title_i
-                    and c.candidate_session_title == key_title_i1
-                    for c in conflicts
-                )
-                if not already_conflicted:
+                if (date_key, key_title_i, key_title_i1) not in flagged_titles:
+                    flagged_titles.add((date_key, key_title_i, key_title_i1))
                     conflicts.append(
                         Conflict(
                             date=date_key,
@@ -493,21 +503,27 @@ MAX_SHIFT_DAYS = 3  # Max shift window: ±3 days
 
 def _find_next_available_date(
     session_date: date_type,
-    existing_sessions: list[PlannedSession],
+    existing_sessions: list[PlannedSession] | DayIndex[PlannedSession] | set[date_type],
     max_shift_days: int = MAX_SHIFT_DAYS,
 ) -> date_type | None:
     """Find next available date for a session within shift window.
 
     Args:
         session_date: Original session date
-        existing_sessions: List of existing sessions (already filtered by athlete)
+        existing_sessions: Existing sessions (already filtered by athlete), their day index,
+            or the set of already-taken dates
         max_shift_days: Maximum days to shift (default: 3)
 
     Returns:
         Available date or None if no date found
     """
     # Group existing sessions by date
-    existing_dates: set[date_type] = {s.date.date() for s in existing_sessions}
+    if isinstance(existing_sessions, set):
+        existing_dates = existing_sessions
+    elif isinstance(existing_sessions, DayIndex):
+        existing_dates = existing_sessions.days()
+    else:
+        existing_dates = index_sessions_by_day(existing_sessions).days()
 
     # Try same weekday next week first
     weekday = session_date.weekday()
@@ -559,53 +575,22 @@ def auto_shift_sessions(
     shifted_sessions: list[dict] = []
     unresolved_conflicts: list[Conflict] = []
 
-    # Convert existing sessions to dict-like objects for conflict detection
-    # We'll use a wrapper that provides the same interface
+    # Index existing sessions once; taken dates grow as candidates are placed
+    existing_index = index_sessions_by_day(existing_sessions)
+    all_taken_dates: set[date_type] = existing_index.days()
+
     for session_dict in candidate_sessions:
         session_date = _get_session_date(session_dict).date()
-        conflicts = detect_conflicts(existing_sessions, [session_dict])
+        conflicts = detect_conflicts(existing_index, [session_dict])
 
         if not conflicts:
             # No conflicts - keep original date
             shifted_sessions.append(session_dict)
+            all_taken_dates.add(session_date)
             continue
 
-        # Try to find available date
-        # We can't easily convert dicts to PlannedSession without DB session,
-        # so we'll use a simpler approach: just check dates
-        shifted_dates: set[date_type] = set()
-        for shifted in shifted_sessions:
-            shifted_dates.add(_get_session_date(shifted).date())
-
-        # Combine existing and shifted dates
-        existing_dates: set[date_type] = {s.date.date() for s in existing_sessions}
-        all_taken_dates = existing_dates | shifted_dates
-
-        # Find available date
-        available_date: date_type | None = None
-
-        # Try same weekday next week first
-        days_to_next_week = 7
-        if days_to_next_week <= max_shift_days:
-            candidate_date = session_date + timedelta(days=days_to_next_week)
-            if candidate_date not in all_taken_dates:
-                available_date = candidate_date
-
-        # Try next day
-        if not available_date:
-            for days_offset in range(1, max_shift_days + 1):
-                candidate_date = session_date + timedelta(days=days_offset)
-                if candidate_date not in all_taken_dates:
-                    available_date = candidate_date
-                    break
-
-        # Try previous day
-        if not available_date:
-            for days_offset in range(1, max_shift_days + 1):
-                candidate_date = session_date - timedelta(days=days_offset)
-                if candidate_date not in all_taken_dates:
-                    available_date = candidate_date
-                    break
+        # Find available date among days not taken by existing or already placed sessions
+        available_date = _find_next_available_date(session_date, all_taken_dates, max_shift_days)
 
         if available_date:
             # Shift session to available date
@@ -635,6 +620,7 @@ def auto_shift_sessions(
             # Verify no new conflicts with shifted date (simple check: just date, not full conflict detection)
             # For full verification, we'd need to convert back, but this is good enough for auto-shift
             shifted_sessions.append(shifted_session)
+            all_taken_dates.add(available_date)
         else:
             # No available date found - mark as unresolved
             unresolved_conflicts.extend(conflicts)
@@ -669,7 +655,7 @@ class CalendarConflict:
 
 
 def detect_execution_conflicts(
-    existing_sessions: list[PlannedSession],
+    existing_sessions: list[PlannedSession] | DayIndex[PlannedSession],
     candidate_date: date_type,
     candidate_duration_minutes: int | None,
     candidate_time: str | None,
@@ -683,7 +669,7 @@ def detect_execution_conflicts(
     2. Manual override - existing manual session on same day (if detectable)
 
     Args:
-        existing_sessions: List of existing PlannedSession objects for the user
+        existing_sessions: Existing PlannedSession objects for the user (or their day index)
         candidate_date: Date of candidate session
         candidate_duration_minutes: Duration of candidate session (minutes)
         candidate_time: Time of candidate session (HH:MM format, optional)
@@ -695,58 +681,57 @@ def detect_execution_conflicts(
 
     candidate_date_datetime = datetime.combine(candidate_date, datetime.min.time()).replace(tzinfo=timezone.utc)
 
+    if not isinstance(existing_sessions, DayIndex):
+        existing_sessions = index_sessions_by_day(existing_sessions)
+
     # Check existing sessions on same date
-    for existing in existing_sessions:
-        existing_date = existing.date.date()
-
-        # Same date - check for conflicts
-        if existing_date == candidate_date:
-            # Conflict 1: Duplicate session_id
-            # (Note: This checks if we're trying to write a duplicate, not if existing has duplicate)
-            # For duplicate detection, caller should check if session_id already exists in DB
-
-            # Conflict 2: Time overlap
-            existing_time_info = SessionTimeInfo.from_session(existing)
-            candidate_time_info = SessionTimeInfo(
-                session_date=candidate_date_datetime,
-                time_str=candidate_time,
-                duration_minutes=candidate_duration_minutes,
-            )
+    for existing in existing_sessions.on_day(candidate_date):
+        # Conflict 1: Duplicate session_id
+        # (Note: This checks if we're trying to write a duplicate, not if existing has duplicate)
+        # For duplicate detection, caller should check if session_id already exists in DB
+
+        # Conflict 2: Time overlap
+        existing_time_info = SessionTimeInfo.from_session(existing)
+        candidate_time_info = SessionTimeInfo(
+            session_date=candidate_date_datetime,
+            time_str=candidate_time,
+            duration_minutes=candidate_duration_minutes,
+        )
 
-            # Check time overlap (both have times and they overlap)
-            has_times = (
-                not existing_time_info.is_all_day
-                and not candidate_time_info.is_all_day
-                and existing_time_info.start_time is not None
-                and existing_time_info.end_time is not None
-                and candidate_time_info.start_time is not None
-                and candidate_time_info.end_time is not None
-            )
-            if has_times and _time_ranges_overlap(
-                existing_time_info.start_time,
-                existing_time_info.end_time,
-                candidate_time_info.start_time,
-                candidate_time_info.end_time,
-            ):
-                conflicts.append(
-                    CalendarConflict(
-                        date=candidate_date,
-                        conflict_type=ConflictType.TIME_OVERLAP,
-                        existing_session_id=str(existing.id),
-                    )
+        # Check time overlap (both have times and they overlap)
+        has_times = (
+            not existing_time_info.is_all_day
+            and not candidate_time_info.is_all_day
+            and existing_time_info.start_time is not None
+            and existing_time_info.end_time is not None
+            and candidate_time_info.start_time is not None
+            and candidate_time_info.end_time is not None
+        )
+        if has_times and _time_ranges_overlap(
+            existing_time_info.start_time,
+            existing_time_info.end_time,
+            candidate_time_info.start_time,
+            candidate_time_info.end_time,
+        ):
+            conflicts.append(
+                CalendarConflict(
+                    date=candidate_date,
+                    conflict_type=ConflictType.TIME_OVERLAP,
+                    existing_session_id=str(existing.id),
                 )
-                continue
+            )
+            continue
 
-            # Conflict 3: All-day overlap (either is all-day)
-            if existing_time_info.is_all_day or candidate_time_info.is_all_day:
-                conflicts.append(
-                    CalendarConflict(
-                        date=candidate_date,
-                        conflict_type=ConflictType.TIME_OVERLAP,
-                        existing_session_id=str(existing.id),
-                    )
+        # Conflict 3: All-day overlap (either is all-day)
+        if existing_time_info.is_all_day or candidate_time_info.is_all_day:
+            conflicts.append(
+                CalendarConflict(
+                    date=candidate_date,
+                    conflict_type=ConflictType.TIME_OVERLAP,
+                    existing_session_id=str(existing.id),
                 )
-                continue
+            )
+            continue
 
     return conflicts
 
@@ -774,11 +759,11 @@ def detect_execution_conflicts_batch(
     candidate_session_ids: set[str] = {s.get("id", "") for s in candidate_sessions if s.get("id")}
 
     # Check for duplicate session_ids in database
-    existing_session_ids: set[str] = {str(s.id) for s in existing_sessions}
+    existing_by_id: dict[str, PlannedSession] = {str(s.id): s for s in existing_sessions}
     for candidate_id in candidate_session_ids:
-        if candidate_id in existing_session_ids:
+        if candidate_id in existing_by_id:
             # Find the existing session to get its date
-            existing = next((s for s in existing_sessions if str(s.id) == candidate_id), None)
+            existing = existing_by_id[candidate_id]
             if existing:
                 conflicts.append(
                     CalendarConflict(
@@ -788,6 +773,9 @@ def detect_execution_conflicts_batch(
                     )
                 )
 
+    # Index existing sessions once instead of rescanning them per candidate
+    existing_index = index_sessions_by_day(existing_sessions)
+
     # Check each candidate session for conflicts
     for candidate in candidate_sessions:
         candidate_id = candidate.get("id")
@@ -808,7 +796,7 @@ def detect_execution_conflicts_batch(
 
         # Detect conflicts for this candidate
         session_conflicts = detect_execution_conflicts(
-            existing_sessions=existing_sessions,
+            existing_sessions=existing_index,
             candidate_date=candidate_date,
             candidate_duration_minutes=candidate_duration,
             candidate_time=candidate_time,
@@ -0,0 +1,111 @@
+"""Day / time-range index shared by reconciliation and conflict detection.
+
+Reconciliation needs "activities starting inside a time window" and conflict
+detection needs "sessions on a given day". Both used to scan the full list for
+every planned/candidate session (O(P·A)). DayIndex is built once per call in
+O(n log n) and answers:
+
+- on_day(day): items bucketed on a calendar day (dict lookup)
+- between(start, end): items whose start time falls in [start, end] (bisect
+  over a sorted array of UTC timestamps)
+
+Items can be added incrementally (auto-shift places sessions one at a time).
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import Callable, Iterable, Iterator
+from datetime import date, datetime, timezone
+
+
+def _to_utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+class DayIndex[T]:
+    """Index of items by calendar day and by UTC start time.
+
+    Args:
+        items: Items to index
+        start: Returns an item's start datetime (naive values are treated as UTC).
+            Items whose start is None are kept out of time-range queries.
+        day: Returns the calendar day an item is bucketed under. Defaults to the
+            UTC day of start(item). Callers that historically grouped by the
+            stored datetime's own .date() pass that here to keep semantics.
+    """
+
+    def __init__(
+        self,
+        items: Iterable[T],
+        start: Callable[[T], datetime | None],
+        day: Callable[[T], date | None] | None = None,
+    ) -> None:
+        self._start = start
+        self._day = day or self._utc_day
+        self._by_day: dict[date, list[T]] = {}
+        # Parallel sorted arrays: (utc_start, insertion_seq) and items in the same order.
+        # insertion_seq keeps ties stable and avoids comparing items.
+        self._keys: list[tuple[datetime, int]] = []
+        self._items: list[T] = []
+        self._seq = 0
+        self._count = 0
+
+        timed: list[tuple[tuple[datetime, int], T]] = []
+        for item in items:
+            key = self._bucket(item)
+            if key is not None:
+                timed.append((key, item))
+        timed.sort(key=lambda pair: pair[0])
+        self._keys = [key for key, _ in timed]
+        self._items = [item for _, item in timed]
+
+    def _utc_day(self, item: T) -> date | None:
+        value = self._start(item)
+        return _to_utc(value).date() if value is not None else None
+
+    def _bucket(self, item: T) -> tuple[datetime, int] | None:
+        """Add item to its day bucket and return its sort key (None if untimed)."""
+        self._count += 1
+        item_day = self._day(item)
+        if item_day is not None:
+            self._by_day.setdefault(item_day, []).append(item)
+        value = self._start(item)
+        self._seq += 1
+        return (_to_utc(value), self._seq) if value is not None else None
+
+    def add(self, item: T) -> None:
+        """Index one more item (O(log n) search, O(n) worst-case insert)."""
+        key = self._bucket(item)
+        if key is None:
+            return
+        position = bisect_right(self._keys, key)
+        insort(self._keys, key)
+        self._items.insert(position, item)
+
+    def on_day(self, day: date) -> list[T]:
+        """Items bucketed on a calendar day (empty list if none)."""
+        return self._by_day.get(day, [])
+
+    def has_day(self, day: date) -> bool:
+        """Whether any item is bucketed on a calendar day."""
+        return bool(self._by_day.get(day))
+
+    def between(self, start: datetime, end: datetime) -> list[T]:
+        """Items whose start time is within [start, end], ordered by start time."""
+        lo = bisect_left(self._keys, (_to_utc(start), 0))
+        hi = bisect_right(self._keys, (_to_utc(end), self._seq + 1))
+        return self._items[lo:hi]
+
+    def days(self) -> set[date]:
+        """All calendar days that have at least one item."""
+        return {d for d, bucket in self._by_day.items() if bucket}
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[T]:
+        """Iterate timed items in start-time order."""
+        return iter(self._items)
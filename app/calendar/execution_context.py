@@ -0,0 +1,177 @@
+"""Bulk prefetch of everything needed to render planned sessions on the calendar.
+
+Calendar conversion used to resolve execution state one row at a time: a
+session link lookup, the planned session, the paired activity, its execution
+summary and (for /today) the workout and its steps. A season view therefore
+issued hundreds of queries.
+
+load_execution_context() loads all of that for a list of planned sessions /
+activities in a fixed number of IN queries (chunked for very long lists) and
+returns an ExecutionContext the converters read from instead of the database.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+
+from loguru import logger
+from sqlalchemy import or_, select
+from sqlalchemy.exc import ProgrammingError
+from sqlalchemy.orm import Session
+
+from app.db.models import Activity, PlannedSession, SessionLink, WorkoutExecutionSummary
+from app.workouts.models import Workout, WorkoutStep
+
+# Only treat SessionLinks as "paired" when status is confirmed or proposed (not rejected).
+# Rejected links should not hide the activity - we show both planned and activity.
+ACTIVE_LINK_STATUSES: frozenset[str] = frozenset({"confirmed", "proposed"})
+
+# Upper bound on bound parameters per IN clause
+IN_BATCH_SIZE = 500
+
+
+def _chunks(ids: list[str]) -> Iterable[list[str]]:
+    for i in range(0, len(ids), IN_BATCH_SIZE):
+        yield ids[i : i + IN_BATCH_SIZE]
+
+
+@dataclass
+class ExecutionContext:
+    """Preloaded rows for converting planned sessions to calendar sessions."""
+
+    planned_sessions: dict[str, PlannedSession] = field(default_factory=dict)
+    links_by_planned: dict[str, SessionLink] = field(default_factory=dict)
+    links_by_activity: dict[str, SessionLink] = field(default_factory=dict)
+    activities: dict[str, Activity] = field(default_factory=dict)
+    summaries: dict[str, WorkoutExecutionSummary] = field(default_factory=dict)
+    workouts: dict[str, Workout] = field(default_factory=dict)
+    workout_steps: dict[str, list[WorkoutStep]] = field(default_factory=dict)
+
+    def link_for_planned(self, planned_session_id: str) -> SessionLink | None:
+        """Session link for a planned session (any status)."""
+        return self.links_by_planned.get(planned_session_id)
+
+    def paired_activity_id(self, planned_session_id: str) -> str | None:
+        """Activity ID paired to a planned session via an active link."""
+        link = self.links_by_planned.get(planned_session_id)
+        if link and link.status in ACTIVE_LINK_STATUSES:
+            return link.activity_id
+        return None
+
+    def paired_planned_id(self, activity_id: str) -> str | None:
+        """Planned session ID paired to an activity via an active link."""
+        link = self.links_by_activity.get(activity_id)
+        if link and link.status in ACTIVE_LINK_STATUSES:
+            return link.planned_session_id
+        return None
+
+    def linked_activity(self, planned_session_id: str) -> Activity | None:
+        """Activity paired to a planned session via an active link."""
+        activity_id = self.paired_activity_id(planned_session_id)
+        return self.activities.get(activity_id) if activity_id else None
+
+    def summary_for_activity(self, activity_id: str) -> WorkoutExecutionSummary | None:
+        """Execution summary for an activity."""
+        return self.summaries.get(activity_id)
+
+
+def _load_summaries(session: Session, activity_ids: list[str]) -> dict[str, WorkoutExecutionSummary]:
+    """Load execution summaries by activity, tolerating a pending llm_feedback migration."""
+    summaries: dict[str, WorkoutExecutionSummary] = {}
+    try:
+        for chunk in _chunks(activity_ids):
+            for summary in session.execute(
+                select(WorkoutExecutionSummary).where(WorkoutExecutionSummary.activity_id.in_(chunk))
+            ).scalars():
+                summaries[summary.activity_id] = summary
+    except ProgrammingError as e:
+        error_str = str(e).lower()
+        if "llm_feedback" in error_str or "undefinedcolumn" in error_str or "does not exist" in error_str:
+            logger.warning(
+                "[EXECUTION_CONTEXT] workout_execution_summaries unavailable (migration pending), "
+                "continuing without summaries"
+            )
+            session.rollback()
+            return {}
+        raise
+    return summaries
+
+
+def load_execution_context(
+    session: Session,
+    planned_session_ids: Iterable[str] = (),
+    activity_ids: Iterable[str] = (),
+    *,
+    planned_sessions: Iterable[PlannedSession] = (),
+    workout_ids: Iterable[str] = (),
+) -> ExecutionContext:
+    """Prefetch links, planned sessions, activities, summaries and workouts.
+
+    Query count depends only on the number of IN_BATCH_SIZE chunks, not on the
+    number of rows rendered.
+
+    Args:
+        session: Database session
+        planned_session_ids: Planned session IDs to load (by ID)
+        activity_ids: Activity IDs whose pairing should be resolved
+        planned_sessions: Already-loaded planned sessions (not re-queried)
+        workout_ids: Workout IDs whose workout and steps should be loaded
+
+    Returns:
+        ExecutionContext with everything needed for execution state
+    """
+    context = ExecutionContext()
+    for planned in planned_sessions:
+        context.planned_sessions[str(planned.id)] = planned
+
+    planned_ids = list(dict.fromkeys([*map(str, planned_session_ids), *context.planned_sessions]))
+    standalone_activity_ids = list(dict.fromkeys(map(str, activity_ids)))
+
+    # 1. Session links for both sides
+    if planned_ids or standalone_activity_ids:
+        planned_chunks = list(_chunks(planned_ids))
+        activity_chunks = list(_chunks(standalone_activity_ids))
+        for i in range(max(len(planned_chunks), len(activity_chunks))):
+            clauses = []
+            if i < len(planned_chunks):
+                clauses.append(SessionLink.planned_session_id.in_(planned_chunks[i]))
+            if i < len(activity_chunks):
+                clauses.append(SessionLink.activity_id.in_(activity_chunks[i]))
+            for link in session.execute(select(SessionLink).where(or_(*clauses))).scalars():
+                context.links_by_planned[link.planned_session_id] = link
+                context.links_by_activity[link.activity_id] = link
+
+    # 2. Planned sessions not handed in by the caller
+    missing_planned = [pid for pid in planned_ids if pid not in context.planned_sessions]
+    for chunk in _chunks(missing_planned):
+        for planned in session.execute(select(PlannedSession).where(PlannedSession.id.in_(chunk))).scalars():
+            context.planned_sessions[str(planned.id)] = planned
+
+    # 3. Paired activities and their execution summaries
+    paired_activity_ids = list(
+        dict.fromkeys(aid for pid in planned_ids if (aid := context.paired_activity_id(pid)) is not None)
+    )
+    for chunk in _chunks(paired_activity_ids):
+        for activity in session.execute(select(Activity).where(Activity.id.in_(chunk))).scalars():
+            context.activities[str(activity.id)] = activity
+    if context.activities:
+        context.summaries = _load_summaries(session, list(context.activities))
+
+    # 4. Workouts and their steps (ordered by step_index)
+    workout_id_list = list(dict.fromkeys(map(str, workout_ids)))
+    for chunk in _chunks(workout_id_list):
+        for workout in session.execute(select(Workout).where(Workout.id.in_(chunk))).scalars():
+            context.workouts[str(workout.id)] = workout
+        for step in session.execute(
+            select(WorkoutStep)
+            .where(WorkoutStep.workout_id.in_(chunk))
+            .order_by(WorkoutStep.workout_id, WorkoutStep.step_index.asc())
+        ).scalars():
+            context.workout_steps.setdefault(str(step.workout_id), []).append(step)
+
+    logger.debug(
+        f"[EXECUTION_CONTEXT] planned={len(context.planned_sessions)} links={len(context.links_by_planned)} "
+        f"activities={len(context.activities)} summaries={len(context.summaries)} workouts={len(context.workouts)}"
+    )
+    return context
@@ -23,6 +23,8 @@ from enum import StrEnum
 
 from loguru import logger
 
+from app.calendar.day_index import DayIndex
+
 
 def ensure_utc(dt: datetime | None) -> datetime | None:
     """Normalize datetime to UTC-aware.
@@ -142,10 +144,13 @@ def reconcile_sessions(
     results: list[ReconciliationResult] = []
     matched_activity_ids: set[str] = set()
 
+    # Index activities by start time once; each session then does a window lookup
+    activity_index = _build_activity_index(completed_activities)
+
     for planned in planned_sessions:
         result = _reconcile_single_session(
             planned=planned,
-            completed_activities=completed_activities,
+            completed_activities=activity_index,
             matched_activity_ids=matched_activity_ids,
             config=config,
         )
@@ -164,9 +169,16 @@ def reconcile_sessions(
     return results
 
 
+def _build_activity_index(
+    completed_activities: list[CompletedActivityInput],
+) -> DayIndex[CompletedActivityInput]:
+    """Index completed activities by UTC start time for window lookups."""
+    return DayIndex(completed_activities, start=lambda a: ensure_utc(a.start_time))
+
+
 def _reconcile_single_session(
     planned: PlannedSessionInput,
-    completed_activities: list[CompletedActivityInput],
+    completed_activities: DayIndex[CompletedActivityInput],
     matched_activity_ids: set[str],
     config: ReconciliationConfig,
 ) -> ReconciliationResult:
@@ -174,7 +186,7 @@ def _reconcile_single_session(
 
     Args:
         planned: Planned session to reconcile
-        completed_activities: All available activities
+        completed_activities: Index of all available activities
         matched_activity_ids: Set of activity IDs already matched to other sessions
         config: Reconciliation configuration
 
@@ -248,7 +260,7 @@ def _reconcile_single_session(
 
 def _find_candidate_activities(
     planned: PlannedSessionInput,
-    completed_activities: list[CompletedActivityInput],
+    completed_activities: DayIndex[CompletedActivityInput] | list[CompletedActivityInput],
     matched_activity_ids: set[str],
     config: ReconciliationConfig,
 ) -> list[CompletedActivityInput]:
@@ -260,40 +272,27 @@ def _find_candidate_activities(
 
     Args:
         planned: Planned session
-        completed_activities: All activities
+        completed_activities: Activity index (a plain list is indexed on the fly)
         matched_activity_ids: Already matched activity IDs
         config: Configuration with time tolerance
 
     Returns:
-        List of candidate activities
+        List of candidate activities, ordered by start time
     """
-    candidates: list[CompletedActivityInput] = []
+    if not isinstance(completed_activities, DayIndex):
+        completed_activities = _build_activity_index(completed_activities)
 
     # Calculate time window
     planned_datetime = datetime.combine(planned.date, datetime.min.time()).replace(tzinfo=timezone.utc)
     window_start = planned_datetime - timedelta(hours=config.time_tolerance_hours)
     window_end = planned_datetime + timedelta(hours=24 + config.time_tolerance_hours)
 
-    # Normalize window bounds to UTC
-    window_start_utc = ensure_utc(window_start)
-    window_end_utc = ensure_utc(window_end)
-
-    for activity in completed_activities:
-        # Skip if already matched
-        if activity.activity_id in matched_activity_ids:
-            continue
-
-        # Normalize activity time and check if within time window
-        activity_time = ensure_utc(activity.start_time)
-        if (
-            activity_time is not None
-            and window_start_utc is not None
-            and window_end_utc is not None
-            and window_start_utc <= activity_time <= window_end_utc
-        ):
-            candidates.append(activity)
-
-    return candidates
+    # Range lookup on the sorted index instead of scanning every activity
+    return [
+        activity
+        for activity in completed_activities.between(window_start, window_end)
+        if activity.activity_id not in matched_activity_ids
+    ]
 
 
 def _select_best_match(
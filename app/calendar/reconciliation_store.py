@@ -0,0 +1,322 @@
+"""Persisted, incrementally maintained calendar reconciliation results.
+
+Reconciliation (and the auto-match that follows it) used to run on every
+calendar read. This module moves that work to the write side:
+
+- Writes to Activity / PlannedSession rows mark their UTC day dirty (via
+  SQLAlchemy session events registered with register_reconciliation_listeners).
+- After the writing transaction commits, its dirty days are queued for a single
+  background worker, which merges the days queued meanwhile (e.g. by bulk
+  ingestion), reconciles and auto-matches the window around each and persists
+  the results to CalendarReconciliation rows.
+- Calendar reads call load_reconciliation(), which is a pure lookup. Sessions
+  without a stored row (legacy data, refresh still in flight) are reconciled
+  in memory for that request only - nothing is written on the read path.
+- Once a window is reconciled, the materialized week summaries covering it
+  are rebuilt (week_summary_store), so they see auto-match pairing changes.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterable
+from contextvars import ContextVar
+from datetime import date, datetime, timedelta, timezone
+
+from loguru import logger
+from sqlalchemy import delete, event, inspect, select
+from sqlalchemy.orm import Session
+
+from app.calendar.auto_match_service import auto_match_sessions
+from app.calendar.reconciliation import ReconciliationResult
+from app.calendar.reconciliation_service import reconcile_calendar
+from app.calendar.week_summary_store import refresh_weeks_for_days
+from app.db.models import Activity, CalendarReconciliation, PlannedSession, SessionLink
+from app.db.session import get_session
+
+# Reconciliation matches activities up to ±12h around a planned day, so a change
+# on day D can affect sessions on D-1..D+1.
+DIRTY_WINDOW_DAYS = 1
+
+_DIRTY_KEY = "calendar_reconciliation_dirty"
+
+# Set while a refresh is writing, so its own writes don't re-mark days dirty
+_refreshing: ContextVar[bool] = ContextVar("calendar_reconciliation_refreshing", default=False)
+
+_listeners_registered = False
+
+# Dirty days waiting for the refresh worker (user_id -> days), merged across commits
+_pending: dict[str, set[date]] = {}
+_pending_lock = threading.Lock()
+_worker: threading.Thread | None = None
+
+
+def _utc_day(value: datetime | date | None) -> date | None:
+    """Return the UTC calendar day for a datetime/date value."""
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            return value.date()
+        return value.astimezone(timezone.utc).date()
+    return value
+
+
+def load_reconciliation(
+    session: Session,
+    user_id: str,
+    planned_sessions: Iterable[PlannedSession],
+) -> tuple[dict[str, str], set[str]]:
+    """Look up reconciliation status for planned sessions (read-only).
+
+    Args:
+        session: Database session
+        user_id: User ID
+        planned_sessions: Planned sessions being rendered
+
+    Returns:
+        Tuple of (reconciliation_map, matched_activity_ids) where
+        reconciliation_map maps planned_session_id -> status value
+    """
+    planned_list = list(planned_sessions)
+    reconciliation_map: dict[str, str] = {}
+    matched_activity_ids: set[str] = set()
+    if not planned_list:
+        return reconciliation_map, matched_activity_ids
+
+    planned_ids = [str(p.id) for p in planned_list]
+    records = session.execute(
+        select(CalendarReconciliation).where(
+            CalendarReconciliation.user_id == user_id,
+            CalendarReconciliation.planned_session_id.in_(planned_ids),
+        )
+    ).scalars()
+
+    for record in records:
+        reconciliation_map[record.planned_session_id] = record.status
+        if record.matched_activity_id:
+            matched_activity_ids.add(record.matched_activity_id)
+
+    missing = [p for p in planned_list if str(p.id) not in reconciliation_map]
+    if missing:
+        days = [d for d in (_utc_day(p.starts_at) for p in missing) if d is not None]
+        if days:
+            logger.debug(
+                f"[RECONCILIATION_STORE] {len(missing)} sessions without stored results for user_id={user_id}, "
+                "reconciling in memory"
+            )
+            missing_ids = {str(p.id) for p in missing}
+            for result in reconcile_calendar(user_id=user_id, athlete_id=0, start_date=min(days), end_date=max(days)):
+                if result.session_id not in missing_ids:
+                    continue
+                reconciliation_map[result.session_id] = result.status.value
+                if result.matched_activity_id:
+                    matched_activity_ids.add(result.matched_activity_id)
+
+    return reconciliation_map, matched_activity_ids
+
+
+def _persist_results(
+    session: Session,
+    user_id: str,
+    start_date: date,
+    end_date: date,
+    results: list[ReconciliationResult],
+) -> None:
+    """Upsert fresh results for the window and drop rows for sessions that left it."""
+    now = datetime.now(timezone.utc)
+    result_ids = {r.session_id for r in results}
+
+    existing = {
+        record.planned_session_id: record
+        for record in session.execute(
+            select(CalendarReconciliation).where(
+                CalendarReconciliation.user_id == user_id,
+                CalendarReconciliation.day >= start_date,
+                CalendarReconciliation.day <= end_date,
+            )
+        ).scalars()
+    }
+    # Sessions moved out of the window keep their row keyed by id; re-home it
+    if result_ids - existing.keys():
+        existing.update(
+            {
+                record.planned_session_id: record
+                for record in session.execute(
+                    select(CalendarReconciliation).where(
+                        CalendarReconciliation.planned_session_id.in_(result_ids - existing.keys())
+                    )
+                ).scalars()
+            }
+        )
+
+    stale_ids = [sid for sid, record in existing.items() if sid not in result_ids and start_date <= record.day <= end_date]
+    if stale_ids:
+        session.execute(delete(CalendarReconciliation).where(CalendarReconciliation.planned_session_id.in_(stale_ids)))
+
+    for result in results:
+        record = existing.get(result.session_id)
+        if record is None:
+            record = CalendarReconciliation(user_id=user_id, planned_session_id=result.session_id)
+            session.add(record)
+        record.day = date.fromisoformat(result.date)
+        record.status = result.status.value
+        record.matched_activity_id = result.matched_activity_id
+        record.confidence = result.confidence
+        record.reason_code = result.reason_code.value
+        record.explanation = result.explanation
+        record.computed_at = now
+
+
+def refresh_reconciliation(user_id: str, start_date: date, end_date: date) -> list[ReconciliationResult]:
+    """Recompute, auto-match and persist reconciliation for a day window.
+
+    Called from write paths (never from calendar reads).
+
+    Args:
+        user_id: User ID
+        start_date: First day of the window (inclusive)
+        end_date: Last day of the window (inclusive)
+
+    Returns:
+        Fresh reconciliation results for the window
+    """
+    token = _refreshing.set(True)
+    try:
+        results = reconcile_calendar(user_id=user_id, athlete_id=0, start_date=start_date, end_date=end_date)
+        try:
+            auto_match_sessions(user_id=user_id, reconciliation_results=results)
+        except Exception as e:
+            logger.warning(f"[RECONCILIATION_STORE] Auto-match failed, persisting reconciliation anyway: {e!r}")
+
+        with get_session() as session:
+            _persist_results(session, user_id, start_date, end_date, results)
+            session.commit()
+
+        logger.info(
+            f"[RECONCILIATION_STORE] Refreshed user_id={user_id} window={start_date}..{end_date} sessions={len(results)}"
+        )
+        return results
+    finally:
+        _refreshing.reset(token)
+
+
+def _merge_days(days: set[date]) -> list[tuple[date, date]]:
+    """Collapse dirty days into contiguous, padded windows."""
+    windows: list[tuple[date, date]] = []
+    pad = timedelta(days=DIRTY_WINDOW_DAYS)
+    for day in sorted(days):
+        start, end = day - pad, day + pad
+        if windows and start <= windows[-1][1] + timedelta(days=1):
+            windows[-1] = (windows[-1][0], max(windows[-1][1], end))
+        else:
+            windows.append((start, end))
+    return windows
+
+
+def refresh_dirty_days(dirty: dict[str, set[date]]) -> None:
+    """Refresh every window touched by a committed transaction.
+
+    Args:
+        dirty: Mapping of user_id -> set of dirty UTC days
+    """
+    for user_id, days in dirty.items():
+        touched: set[date] = set()
+        for start_date, end_date in _merge_days(days):
+            touched.update(start_date + timedelta(days=n) for n in range((end_date - start_date).days + 1))
+            try:
+                refresh_reconciliation(user_id, start_date, end_date)
+            except Exception:
+                logger.exception(f"[RECONCILIATION_STORE] Refresh failed for user_id={user_id} window={start_date}..{end_date}")
+        refresh_weeks_for_days(user_id, touched)
+
+
+def _collect_dirty(session: Session, _flush_context: object) -> None:
+    """after_flush hook: remember which (user, day) pairs were written."""
+    if _refreshing.get():
+        return
+    dirty: dict[str, set[date]] = session.info.setdefault(_DIRTY_KEY, {})
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(obj, SessionLink):
+            # Manual pairing changes: dirty the planned session's day
+            with session.no_autoflush:
+                planned = session.get(PlannedSession, obj.planned_session_id)
+            day = _utc_day(planned.starts_at) if planned else None
+            if obj.user_id and day:
+                dirty.setdefault(str(obj.user_id), set()).add(day)
+            continue
+        if not isinstance(obj, (Activity, PlannedSession)):
+            continue
+        user_id = getattr(obj, "user_id", None)
+        day = _utc_day(getattr(obj, "starts_at", None))
+        if user_id and day:
+            dirty.setdefault(str(user_id), set()).add(day)
+        # A moved session also invalidates the day it moved away from
+        if user_id and obj in session.dirty:
+            for old in inspect(obj).attrs.starts_at.history.deleted or ():
+                old_day = _utc_day(old)
+                if old_day:
+                    dirty.setdefault(str(user_id), set()).add(old_day)
+
+
+def _drain_pending() -> None:
+    """Refresh worker: process queued dirty days until the queue is empty."""
+    global _worker
+    while True:
+        with _pending_lock:
+            if not _pending:
+                _worker = None
+                return
+            dirty = dict(_pending)
+            _pending.clear()
+        try:
+            refresh_dirty_days(dirty)
+        except Exception:
+            logger.exception("[RECONCILIATION_STORE] Dirty day refresh failed")
+
+
+def queue_dirty_days(dirty: dict[str, set[date]]) -> None:
+    """Queue dirty days for the refresh worker, starting it if it is idle.
+
+    Days queued while the worker is busy are merged and refreshed in its next
+    round, so at most one refresh thread runs per process.
+
+    Args:
+        dirty: Mapping of user_id -> set of dirty UTC days
+    """
+    global _worker
+    with _pending_lock:
+        for user_id, days in dirty.items():
+            _pending.setdefault(user_id, set()).update(days)
+        if _worker is not None:
+            return
+        _worker = threading.Thread(target=_drain_pending, name="calendar-reconciliation-refresh", daemon=True)
+        _worker.start()
+
+
+def _dispatch_dirty(session: Session) -> None:
+    """after_commit hook: queue dirty windows for refresh off the request thread."""
+    dirty = session.info.pop(_DIRTY_KEY, None)
+    if not dirty:
+        return
+    queue_dirty_days(dirty)
+
+
+def _discard_dirty(session: Session, _previous_transaction: object) -> None:
+    """after_soft_rollback hook: nothing was written, nothing to refresh."""
+    session.info.pop(_DIRTY_KEY, None)
+
+
+def register_reconciliation_listeners() -> None:
+    """Register session hooks that keep CalendarReconciliation rows current.
+
+    Idempotent. Called once at application startup.
+    """
+    global _listeners_registered
+    if _listeners_registered:
+        return
+    event.listen(Session, "after_flush", _collect_dirty)
+    event.listen(Session, "after_commit", _dispatch_dirty)
+    event.listen(Session, "after_soft_rollback", _discard_dirty)
+    _listeners_registered = True
+    logger.info("[RECONCILIATION_STORE] Registered calendar reconciliation write hooks")
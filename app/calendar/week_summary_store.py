@@ -0,0 +1,274 @@
+"""Materialized per-user, per-week calendar summaries.
+
+The season summary and the weekly summary card used to rebuild every week
+from raw PlannedSession / Activity rows on each call. This module keeps one
+CalendarWeekSummary row per (user, week) instead:
+
+- After reconciliation refreshes a dirty day window (reconciliation_store),
+  the weeks covering that window are rebuilt here, so pairing changes made by
+  auto-match are already reflected.
+- Readers call load_week_summaries(), which returns fresh rows only. Missing
+  or clock-stale weeks are queued for a small background pool (a week already
+  queued or being rebuilt is not queued again); the caller computes those
+  weeks in memory for the current request.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta, timezone
+from typing import Any
+
+from loguru import logger
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.api.schemas.schemas import CalendarSession
+from app.calendar.execution_context import load_execution_context
+from app.calendar.view_helper import calendar_session_from_view_row, get_calendar_items_from_view
+from app.db.models import CalendarWeekSummary
+from app.db.session import get_session
+from app.services.weekly_summary_builder import build_weekly_execution_summary_context, is_week_summary_fresh
+
+MAX_KEY_SESSIONS = 3
+MAX_COMPLETED_TITLES = 5
+
+# Background rebuilds of stale weeks found by readers
+REFRESH_WORKERS = 2
+_refresh_executor = ThreadPoolExecutor(max_workers=REFRESH_WORKERS, thread_name_prefix="week-summary-refresh")
+_in_flight: set[tuple[str, date]] = set()
+_in_flight_lock = threading.Lock()
+
+
+def week_start_for(day: date) -> date:
+    """Monday of the week containing day."""
+    return day - timedelta(days=day.weekday())
+
+
+def key_session_names(week_sessions: list[CalendarSession]) -> list[str]:
+    """Up to MAX_KEY_SESSIONS unique names of completed sessions, in order."""
+    key_sessions: list[str] = []
+    seen: set[str] = set()
+    for session in week_sessions:
+        if session.status != "completed":
+            continue
+        name = session.title or session.type or "Training"
+        if name and name not in seen:
+            key_sessions.append(name)
+            seen.add(name)
+            if len(key_sessions) >= MAX_KEY_SESSIONS:
+                break
+    return key_sessions
+
+
+def week_flags(week_sessions: list[CalendarSession]) -> list[str]:
+    """Flags for a week: "missed_sessions" and/or "fatigue"."""
+    flags: list[str] = []
+
+    # Missed sessions: planned but not completed
+    planned_count = sum(1 for s in week_sessions if s.status == "planned")
+    completed_count = sum(1 for s in week_sessions if s.status == "completed")
+    if planned_count > 0 and completed_count < planned_count * 0.7:
+        flags.append("missed_sessions")
+
+    # Simple fatigue detection: high volume of hard sessions
+    hard_sessions = sum(1 for s in week_sessions if s.status == "completed" and s.intensity in {"hard", "moderate"})
+    if hard_sessions >= 4:
+        flags.append("fatigue")
+
+    return flags
+
+
+def summarize_week_sessions(week_sessions: list[CalendarSession]) -> dict[str, Any]:
+    """Session-derived fields of a week summary (shared with in-memory fallbacks).
+
+    Args:
+        week_sessions: Calendar sessions of one week, sorted by date
+
+    Returns:
+        Dict of CalendarWeekSummary column values
+    """
+    completed = [s for s in week_sessions if s.status == "completed"]
+    planned = [s for s in week_sessions if s.status == "planned"]
+    return {
+        "planned_count": len(planned),
+        "completed_count": len(completed),
+        "planned_duration_seconds": sum((s.duration_minutes or 0) * 60 for s in week_sessions if s.status != "completed"),
+        "completed_duration_seconds": sum((s.duration_minutes or 0) * 60 for s in completed),
+        "key_sessions": key_session_names(week_sessions),
+        "completed_titles": [s.title or s.type for s in completed if s.title or s.type][:MAX_COMPLETED_TITLES],
+        "flags": week_flags(week_sessions),
+    }
+
+
+def load_calendar_sessions(session: Session, user_id: str, start_date: date, end_date: date) -> list[CalendarSession]:
+    """Calendar sessions (paired activities folded into their planned session) for a date range.
+
+    Args:
+        session: Database session
+        user_id: User ID
+        start_date: First day (inclusive, UTC)
+        end_date: Last day (inclusive, UTC)
+
+    Returns:
+        CalendarSession list sorted by date
+    """
+    start_dt = datetime.combine(start_date, datetime.min.time()).replace(tzinfo=timezone.utc)
+    end_dt = datetime.combine(end_date + timedelta(days=1), datetime.min.time()).replace(tzinfo=timezone.utc)
+    view_rows = get_calendar_items_from_view(session, user_id, start_dt, end_dt)
+
+    planned_ids = [str(r.get("item_id", "")) for r in view_rows if r.get("kind") == "planned"]
+    activity_ids = [str(r.get("item_id", "")) for r in view_rows if r.get("kind") == "activity"]
+    context = load_execution_context(session, planned_ids, activity_ids)
+
+    sessions: list[CalendarSession] = []
+    for row in view_rows:
+        item_id = str(row.get("item_id", ""))
+        kind = str(row.get("kind", ""))
+        payload = row.get("payload") or {}
+        if kind == "activity" and context.paired_planned_id(item_id):
+            continue
+        if kind == "planned" and (activity_id := context.paired_activity_id(item_id)):
+            payload = {**payload, "paired_activity_id": activity_id}
+        sessions.append(calendar_session_from_view_row({**row, "payload": payload}))
+    sessions.sort(key=lambda s: s.date)
+    return sessions
+
+
+def compute_week_summary(session: Session, user_id: str, week_start: date) -> dict[str, Any]:
+    """Compute all CalendarWeekSummary column values for one week.
+
+    Args:
+        session: Database session
+        user_id: User ID
+        week_start: Monday of the week
+
+    Returns:
+        Dict of column values (excluding id/user_id/week_start/computed_at)
+    """
+    week_end = week_start + timedelta(days=6)
+    values = summarize_week_sessions(load_calendar_sessions(session, user_id, week_start, week_end))
+    execution = build_weekly_execution_summary_context(session, user_id, week_start, week_end)
+    values.update(
+        total_planned_sessions=execution.total_planned_sessions,
+        executed_as_planned_count=execution.executed_as_planned_count,
+        missed_sessions_count=execution.missed_sessions_count,
+        unplanned_sessions_count=execution.unplanned_sessions_count,
+        strongest_session_id=execution.strongest_session_id,
+        strongest_session_narrative=execution.strongest_session_narrative,
+    )
+    return values
+
+
+def _persist_week_summaries(session: Session, user_id: str, values_by_week: dict[date, dict[str, Any]]) -> None:
+    """Insert or update the rows for the given weeks (not committed)."""
+    existing = {
+        row.week_start: row
+        for row in session.execute(
+            select(CalendarWeekSummary).where(
+                CalendarWeekSummary.user_id == user_id,
+                CalendarWeekSummary.week_start.in_(list(values_by_week)),
+            )
+        ).scalars()
+    }
+    now = datetime.now(timezone.utc)
+    for week_start, values in values_by_week.items():
+        row = existing.get(week_start)
+        if row is None:
+            row = CalendarWeekSummary(user_id=user_id, week_start=week_start)
+            session.add(row)
+        for column, value in values.items():
+            setattr(row, column, value)
+        row.computed_at = now
+
+
+def refresh_week_summaries(user_id: str, week_starts: Iterable[date]) -> None:
+    """Rebuild and persist summaries for the given weeks.
+
+    Called from write paths (after reconciliation refresh) and for stale weeks
+    found by readers - never synchronously on a read. If a concurrent refresh
+    inserts one of the rows first, the write is retried as an update.
+
+    Args:
+        user_id: User ID
+        week_starts: Mondays of the weeks to rebuild
+    """
+    weeks = sorted({week_start_for(w) for w in week_starts})
+    if not weeks:
+        return
+    with get_session() as session:
+        values_by_week = {week_start: compute_week_summary(session, user_id, week_start) for week_start in weeks}
+        _persist_week_summaries(session, user_id, values_by_week)
+        try:
+            session.commit()
+        except IntegrityError:
+            session.rollback()
+            logger.debug(f"[WEEK_SUMMARY_STORE] Concurrent insert for user_id={user_id}, retrying as update")
+            _persist_week_summaries(session, user_id, values_by_week)
+            session.commit()
+    logger.info(f"[WEEK_SUMMARY_STORE] Rebuilt {len(weeks)} weeks for user_id={user_id} ({weeks[0]}..{weeks[-1]})")
+
+
+def refresh_weeks_for_days(user_id: str, days: Iterable[date]) -> None:
+    """Rebuild the weeks covering a set of days (errors are logged, not raised)."""
+    try:
+        refresh_week_summaries(user_id, {week_start_for(d) for d in days})
+    except Exception:
+        logger.exception(f"[WEEK_SUMMARY_STORE] Refresh failed for user_id={user_id}")
+
+
+def _run_refresh(user_id: str, week_starts: list[date]) -> None:
+    try:
+        refresh_weeks_for_days(user_id, week_starts)
+    finally:
+        with _in_flight_lock:
+            _in_flight.difference_update((user_id, w) for w in week_starts)
+
+
+def _schedule_refresh(user_id: str, week_starts: list[date]) -> None:
+    """Queue a background rebuild of the weeks not already queued or rebuilding."""
+    with _in_flight_lock:
+        weeks = [w for w in week_starts if (user_id, w) not in _in_flight]
+        _in_flight.update((user_id, w) for w in weeks)
+    if weeks:
+        _refresh_executor.submit(_run_refresh, user_id, weeks)
+
+
+def load_week_summaries(
+    session: Session,
+    user_id: str,
+    week_starts: Iterable[date],
+) -> dict[date, CalendarWeekSummary]:
+    """Look up fresh materialized summaries for weeks (read-only).
+
+    Weeks without a fresh row are rebuilt in the background and left out of the
+    result; callers compute them in memory for this request.
+
+    Args:
+        session: Database session
+        user_id: User ID
+        week_starts: Mondays of the weeks being rendered
+
+    Returns:
+        Mapping of week_start -> fresh CalendarWeekSummary
+    """
+    weeks = sorted({week_start_for(w) for w in week_starts})
+    if not weeks:
+        return {}
+    today = datetime.now(timezone.utc).date()
+    rows = session.execute(
+        select(CalendarWeekSummary).where(
+            CalendarWeekSummary.user_id == user_id,
+            CalendarWeekSummary.week_start.in_(weeks),
+        )
+    ).scalars()
+    fresh = {row.week_start: row for row in rows if is_week_summary_fresh(row, today)}
+
+    stale = [w for w in weeks if w not in fresh]
+    if stale:
+        logger.debug(f"[WEEK_SUMMARY_STORE] {len(stale)} weeks missing/stale for user_id={user_id}, queueing rebuild")
+        _schedule_refresh(user_id, stale)
+    return fresh
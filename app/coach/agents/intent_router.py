@@ -0,0 +1,419 @@
+"""Tiered intent router ahead of the LLM classifier.
+
+Most chat turns are easy to classify ("thanks", "build me a plan for next
+week", "how am I doing?"), yet every one used to cost a classifier LLM call.
+The router tries cheap tiers first and escalates only when unsure:
+
+1. rules: compiled patterns for unambiguous messages. The only tier allowed
+   to produce a tool call (explicit plan request with exactly one horizon).
+2. nearest_neighbour: cosine similarity against labeled example messages in
+   an in-memory VectorStore. Vectors are hashed word and character-trigram
+   counts computed locally, so this tier never calls a model. It only
+   resolves read-only intents, and only above a similarity threshold.
+3. llm: orchestrator_classifier.classify_intent.
+
+Live chat (/coach/chat and the chat service) replies through the
+orchestrator agent, so route_chat_turn() only lets acknowledgments skip the
+model; every other live turn runs the agent inside model_turn() and is
+counted in the llm tier.
+
+Per-tier attempts, resolutions and latency are kept for the ops API
+(get_router_stats), including the fraction of turns resolved without a
+model call.
+"""
+
+import re
+import threading
+import time
+import zlib
+from collections.abc import Generator
+from contextlib import contextmanager
+from typing import Literal
+
+from loguru import logger
+
+from app.coach.agents.orchestrator_agent import is_executable_request, is_execution_confirmation
+from app.coach.agents.orchestrator_classifier import classify_intent
+from app.coach.agents.orchestrator_deps import CoachDeps
+from app.coach.schemas.orchestration import OrchestrationDecision
+from app.config.settings import settings
+from app.embeddings.vector_store import EmbeddedItem, VectorStore
+
+RouterTier = Literal["rules", "nearest_neighbour", "llm"]
+
+TIERS: tuple[RouterTier, ...] = ("rules", "nearest_neighbour", "llm")
+
+RULE_CONFIDENCE = 0.95
+
+# Hashed feature space of the local message vectors
+VECTOR_DIM = 1024
+
+# ---------------------------------------------------------------------------
+# Tier 1: rules
+# ---------------------------------------------------------------------------
+
+# Thanks and activity check-ins that get a canned reply. "ok"/"okay" are left
+# out: they also confirm a pending proposal (is_execution_confirmation).
+_ACKNOWLEDGMENTS = frozenset({
+    "thanks",
+    "thank you",
+    "thx",
+    "ty",
+    "got it",
+    "sounds good",
+    "cool",
+    "nice",
+    "👍",
+    "👌",
+    "i ran yesterday",
+    "i ran today",
+    "i worked out",
+    "i trained today",
+    "ran yesterday",
+    "ran today",
+    "worked out",
+    "trained today",
+})
+_PLAN_REQUEST = re.compile(r"\b(create|build|generate|make|write|draft|put together)\b.*\b(plan|schedule|training block)\b")
+# Requests that change or cancel something are left to the classifier (revise vs plan)
+_CHANGE_OR_NEGATION = re.compile(
+    r"\b(change|move|swap|adjust|reduce|increase|shorten|lengthen|skip|replace|modify|update|revise|cancel|delete|remove"
+    r"|don't|do not|not|never|stop|why)\b"
+)
+_HORIZONS: dict[str, re.Pattern[str]] = {
+    "day": re.compile(r"\b(today|tomorrow|tonight|next (run|workout|session))\b"),
+    "week": re.compile(r"\b((this|next|coming) week|weekly|week)\b"),
+    "season": re.compile(r"\b(season|marathon|half marathon|10k|5k|race|ultra|months?)\b"),
+}
+_ASSESSMENT = re.compile(
+    r"\b(how am i doing|how('s| is) my (fitness|training|form|load|progress)"
+    r"|am i (over ?training|ready|recovered|fit)"
+    r"|(what('s| is)|show me) my (ctl|atl|tsb|fitness|fatigue|form|training load))\b"
+)
+_CONCEPT_QUESTION = re.compile(
+    r"^(what('s| is| are| does)|explain|define)\b.*\b(ctl|atl|tsb|vo2 ?max|threshold|tempo|zone \d|zones|taper"
+    r"|base phase|build phase|fartlek|strides|lactate|training stress|easy pace)\b"
+)
+
+
+def _normalize(text: str) -> str:
+    return " ".join(text.lower().replace("\u2019", "'").split())
+
+
+def is_simple_acknowledgment(message: str) -> bool:
+    """Check if a message is a simple acknowledgment that can be fast-pathed.
+
+    Args:
+        message: User message
+
+    Returns:
+        True if the message is thanks or an activity check-in with no question
+    """
+    return _normalize(message).rstrip(" !.") in _ACKNOWLEDGMENTS
+
+
+def _needs_orchestrator(text: str) -> bool:
+    """Whether a message asks for (or confirms) an action, so read-only tiers must not resolve it."""
+    return is_executable_request(text) or is_execution_confirmation(text)
+
+
+def _no_tool(intent: str, confidence: float, reason: str) -> OrchestrationDecision:
+    return OrchestrationDecision(
+        user_intent=intent,
+        horizon="none",
+        confidence=confidence,
+        action="NO_TOOL",
+        tool_name="none",
+        read_only=True,
+        reason=reason,
+    )
+
+
+def _match_rules(text: str) -> OrchestrationDecision | None:
+    """Classify unambiguous messages with compiled patterns.
+
+    Args:
+        text: Normalized user message
+
+    Returns:
+        Decision, or None if no rule applies unambiguously
+    """
+    if is_simple_acknowledgment(text):
+        return _no_tool("question", RULE_CONFIDENCE, "Acknowledgment (rule)")
+
+    if _CHANGE_OR_NEGATION.search(text):
+        return None
+
+    if _PLAN_REQUEST.search(text):
+        horizons = [horizon for horizon, pattern in _HORIZONS.items() if pattern.search(text)]
+        if len(horizons) != 1:
+            return None
+        return OrchestrationDecision(
+            user_intent="plan",
+            horizon=horizons[0],
+            confidence=RULE_CONFIDENCE,
+            action="CALL_TOOL",
+            tool_name="plan",
+            read_only=False,
+            reason=f"Explicit {horizons[0]} plan request (rule)",
+        )
+
+    if _needs_orchestrator(text):
+        return None
+
+    if _ASSESSMENT.search(text):
+        return _no_tool("assess", RULE_CONFIDENCE, "Training state check-in (rule)")
+
+    if _CONCEPT_QUESTION.search(text):
+        return _no_tool("explain", RULE_CONFIDENCE, "Training concept question (rule)")
+
+    return None
+
+
+# ---------------------------------------------------------------------------
+# Tier 2: nearest neighbour over labeled examples
+# ---------------------------------------------------------------------------
+
+# Labels map to read-only intents; "escalate" examples pull look-alike
+# mutation requests towards the LLM instead of a read-only answer.
+_READ_ONLY_LABELS: dict[str, str] = {
+    "acknowledge": "question",
+    "assess": "assess",
+    "explain": "explain",
+}
+
+LABELED_EXAMPLES: tuple[tuple[str, str], ...] = (
+    ("acknowledge", "thanks that helps"),
+    ("acknowledge", "ok thank you coach"),
+    ("acknowledge", "great thanks"),
+    ("acknowledge", "got it thanks"),
+    ("acknowledge", "sounds good to me"),
+    ("acknowledge", "perfect thank you"),
+    ("acknowledge", "hey coach"),
+    ("acknowledge", "good morning coach"),
+    ("assess", "how is my training going"),
+    ("assess", "how am i doing lately"),
+    ("assess", "am i getting fitter"),
+    ("assess", "is my fitness improving"),
+    ("assess", "am i too tired right now"),
+    ("assess", "how is my recovery"),
+    ("assess", "what is my current training load"),
+    ("assess", "how fit am i right now"),
+    ("assess", "am i on track for my race"),
+    ("explain", "what does tsb mean"),
+    ("explain", "what is ctl"),
+    ("explain", "explain threshold pace"),
+    ("explain", "what is a tempo run"),
+    ("explain", "what are training zones"),
+    ("explain", "why do runners taper"),
+    ("explain", "what is the point of easy runs"),
+    ("explain", "what are strides"),
+    ("explain", "how does vo2max training work"),
+    ("escalate", "create a plan for next week"),
+    ("escalate", "build me a marathon plan"),
+    ("escalate", "plan my training"),
+    ("escalate", "move my long run to sunday"),
+    ("escalate", "make tomorrow easier"),
+    ("escalate", "change my workout today"),
+    ("escalate", "i want to run a half marathon in october"),
+    ("escalate", "skip tomorrow's session"),
+    ("escalate", "can you adjust my plan i am sick"),
+    ("escalate", "what should i run today"),
+)
+
+_example_store: VectorStore | None = None
+_example_store_lock = threading.Lock()
+
+
+def _features(text: str) -> list[str]:
+    words = re.findall(r"[a-z0-9']+", text)
+    features = [f"w:{word}" for word in words]
+    for word in words:
+        padded = f"#{word}#"
+        features.extend(f"c:{padded[i : i + 3]}" for i in range(len(padded) - 2))
+    return features
+
+
+def vectorize(text: str) -> list[float]:
+    """Local bag-of-features vector for a message (no model call).
+
+    Args:
+        text: Message text
+
+    Returns:
+        VECTOR_DIM-dimensional count vector of hashed word and
+        character-trigram features
+    """
+    vector = [0.0] * VECTOR_DIM
+    for feature in _features(_normalize(text)):
+        vector[zlib.crc32(feature.encode("utf-8")) % VECTOR_DIM] += 1.0
+    return vector
+
+
+def _get_example_store() -> VectorStore:
+    """Get the labeled-example vector store (built on first use)."""
+    global _example_store
+    with _example_store_lock:
+        if _example_store is None:
+            _example_store = VectorStore([
+                EmbeddedItem(id=f"{label}:{index}", embedding=vectorize(text), metadata={"label": label})
+                for index, (label, text) in enumerate(LABELED_EXAMPLES)
+            ])
+        return _example_store
+
+
+def _match_nearest_neighbour(text: str) -> OrchestrationDecision | None:
+    """Classify by the most similar labeled example.
+
+    Args:
+        text: Normalized user message
+
+    Returns:
+        Read-only decision, or None if the closest example is below the
+        similarity threshold or needs the classifier
+    """
+    if _needs_orchestrator(text):
+        return None
+    matches = _get_example_store().query(vectorize(text), top_k=1)
+    if not matches:
+        return None
+    example_id, similarity, metadata = matches[0]
+    intent = _READ_ONLY_LABELS.get(str(metadata["label"]))
+    if intent is None or similarity < settings.intent_router_min_similarity:
+        return None
+    return _no_tool(intent, round(similarity, 3), f"Nearest example {example_id} (similarity {similarity:.2f})")
+
+
+# ---------------------------------------------------------------------------
+# Routing and stats
+# ---------------------------------------------------------------------------
+
+_stats_lock = threading.Lock()
+_turns = 0
+_stats: dict[RouterTier, dict[str, float]] = {
+    tier: {"attempts": 0, "resolved": 0, "total_ms": 0.0, "max_ms": 0.0} for tier in TIERS
+}
+
+
+def _record(tier: RouterTier, started: float, resolved: bool) -> None:
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    with _stats_lock:
+        stats = _stats[tier]
+        stats["attempts"] += 1
+        stats["resolved"] += int(resolved)
+        stats["total_ms"] += elapsed_ms
+        stats["max_ms"] = max(stats["max_ms"], elapsed_ms)
+
+
+async def route_intent(
+    user_input: str,
+    deps: CoachDeps,
+    minimal_context: dict | None = None,
+) -> OrchestrationDecision:
+    """Classify user intent, using the LLM classifier only when cheaper tiers are unsure.
+
+    Args:
+        user_input: User's message
+        deps: Coach dependencies
+        minimal_context: Minimal context for the LLM classifier
+
+    Returns:
+        OrchestrationDecision
+    """
+    global _turns
+    with _stats_lock:
+        _turns += 1
+    if settings.intent_router_enabled:
+        text = _normalize(user_input)
+        for tier, matcher in (("rules", _match_rules), ("nearest_neighbour", _match_nearest_neighbour)):
+            started = time.perf_counter()
+            decision = matcher(text)
+            _record(tier, started, decision is not None)
+            if decision is not None:
+                logger.info(
+                    "Intent routed without LLM",
+                    tier=tier,
+                    intent=decision.user_intent,
+                    horizon=decision.horizon,
+                    action=decision.action,
+                    confidence=decision.confidence,
+                )
+                return decision
+
+    started = time.perf_counter()
+    decision = await classify_intent(user_input, deps, minimal_context)
+    _record("llm", started, True)
+    return decision
+
+
+def route_chat_turn(user_input: str) -> OrchestrationDecision | None:
+    """Resolve a live chat turn without a model call, if possible.
+
+    Live chat replies are generated by the orchestrator agent, so the only
+    turns that can skip it are acknowledgments (answered with a canned reply).
+    For every other turn this returns None; run the agent inside model_turn()
+    so the turn is counted in the llm tier.
+
+    Args:
+        user_input: User's message
+
+    Returns:
+        Acknowledgment decision, or None if the orchestrator must answer
+    """
+    global _turns
+    with _stats_lock:
+        _turns += 1
+    if not settings.intent_router_enabled:
+        return None
+    started = time.perf_counter()
+    resolved = is_simple_acknowledgment(user_input)
+    _record("rules", started, resolved)
+    if not resolved:
+        return None
+    logger.info("Chat turn routed without LLM", tier="rules", intent="acknowledgment")
+    return _no_tool("question", RULE_CONFIDENCE, "Acknowledgment (rule)")
+
+
+@contextmanager
+def model_turn() -> Generator[None, None, None]:
+    """Record a live chat turn answered by the orchestrator agent (llm tier)."""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        _record("llm", started, True)
+
+
+def get_router_stats() -> dict:
+    """Routing counters for this worker.
+
+    Returns:
+        Dict with turns, resolved_without_llm (fraction of turns) and per-tier
+        attempts, resolved, avg_ms and max_ms
+    """
+    with _stats_lock:
+        turns = _turns
+        tiers = {tier: dict(stats) for tier, stats in _stats.items()}
+    resolved_locally = tiers["rules"]["resolved"] + tiers["nearest_neighbour"]["resolved"]
+    return {
+        "turns": turns,
+        "resolved_without_llm": round(resolved_locally / turns, 3) if turns else 0.0,
+        "tiers": {
+            tier: {
+                "attempts": int(stats["attempts"]),
+                "resolved": int(stats["resolved"]),
+                "avg_ms": round(stats["total_ms"] / stats["attempts"], 3) if stats["attempts"] else 0.0,
+                "max_ms": round(stats["max_ms"], 3),
+            }
+            for tier, stats in tiers.items()
+        },
+    }
+
+
+def reset_router_stats() -> None:
+    """Reset routing counters (tests)."""
+    global _turns
+    with _stats_lock:
+        _turns = 0
+        for stats in _stats.values():
+            stats.update({"attempts": 0, "resolved": 0, "total_ms": 0.0, "max_ms": 0.0})
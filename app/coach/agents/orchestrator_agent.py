@@ -8,28 +8,30 @@ All tool execution happens in the separate executor module.
 """
 
 import time
+from collections.abc import AsyncIterable
 from datetime import date, datetime, timezone
 from pathlib import Path
 from typing import cast
 
 from loguru import logger
 from pydantic import ValidationError
-from pydantic_ai import Agent
+from pydantic_ai import Agent, RunContext
 from pydantic_ai.exceptions import UsageLimitExceeded
-from pydantic_ai.messages import ModelMessage
+from pydantic_ai.messages import AgentStreamEvent, ModelMessage, PartDeltaEvent, PartStartEvent, ToolCallPart, ToolCallPartDelta
 
 from app.coach.agents.decision_bias import apply_rag_bias
 from app.coach.agents.orchestrator_deps import CoachDeps
 from app.coach.agents.orchestrator_state import OrchestratorState
+from app.coach.chat_events import MessageFieldStreamer, emit_local_event, is_streaming
 from app.coach.config.models import ORCHESTRATOR_MODEL
 from app.coach.config.prompt_versions import ORCHESTRATOR_PROMPT_VERSION
-from app.coach.mcp_client import MCPError, call_tool
+from app.coach.mcp_client import HISTORY_LOAD_LIMIT, MCPError, call_tool
 from app.coach.policy.athlete_context import AthleteContext
 from app.coach.policy.intent_context import IntentContext
 from app.coach.policy.weekly_policy_v0 import WeeklyDecision
 from app.coach.policy.weekly_policy_v3 import decide_weekly_action_v3
 from app.coach.policy.weekly_policy_v4 import decide_weekly_action_v4, derive_trajectory
-from app.coach.prompts.loader import load_prompt
+from app.coach.prompts.loader import load_prompt, prompt_hash
 from app.coach.rag.adapter import OrchestratorRagAdapter
 from app.coach.rag.logging import log_rag_usage
 from app.coach.schemas.orchestrator_response import OrchestratorAgentResponse
@@ -42,7 +44,9 @@ from app.core.slot_extraction import generate_clarification_for_missing_slots
 from app.core.slot_gate import REQUIRED_SLOTS, validate_slots
 from app.core.token_guard import LLMMessage, enforce_token_limit
 from app.core.trace_metadata import get_trace_metadata_from_deps
+from app.services.intelligence.context_assembler import ContextSource, assemble_context_async
 from app.services.llm.model import get_model
+from app.services.llm.telemetry import llm_call_site
 from app.tools.semantic.evaluate_plan_change import evaluate_plan_change
 
 # ============================================================================
@@ -490,6 +494,8 @@ def is_execution_confirmation(msg: str) -> bool:
 # Load prompt synchronously at module level (will be replaced with async loading if needed)
 # For now, we'll load it lazily in run_conversation
 ORCHESTRATOR_INSTRUCTIONS = ""
+# Registry content hash of the loaded instructions (None when loaded via MCP)
+ORCHESTRATOR_PROMPT_HASH: str | None = None
 
 
 # ============================================================================
@@ -507,7 +513,9 @@ ORCHESTRATOR_INSTRUCTIONS = ""
 ORCHESTRATOR_AGENT_MODEL = get_model("openai", ORCHESTRATOR_MODEL)
 
 # Agent will be initialized with instructions in run_conversation
-# We need to load instructions asynchronously first
+# We need to load instructions asynchronously first. It is created once and
+# reused for every turn; the per-user profile block is a dynamic instructions
+# part evaluated from deps on each run.
 ORCHESTRATOR_AGENT: Agent[CoachDeps, OrchestratorAgentResponse] | None = None
 
 # Agent initialization will happen in run_conversation after loading instructions
@@ -525,21 +533,20 @@ logger.info(
 _RAG_ADAPTER: OrchestratorRagAdapter | None = None
 
 
-def _inject_profile_into_prompt(base_instructions: str, deps: CoachDeps) -> str:
-    """Inject profile data into orchestrator prompt.
+def _build_profile_section(deps: CoachDeps) -> str:
+    """Build the per-user athlete profile block of the orchestrator instructions.
 
     Args:
-        base_instructions: Base orchestrator instructions
         deps: Coach dependencies with profile data
 
     Returns:
-        Instructions with profile data injected
+        Profile section text, or empty string if no profile data
     """
     if not deps.structured_profile_data:
-        return base_instructions
+        return ""
 
     profile_data = deps.structured_profile_data
-    profile_lines = ["\n---", "ATHLETE PROFILE (AUTHORITATIVE):"]
+    profile_lines = ["---", "ATHLETE PROFILE (AUTHORITATIVE):"]
 
     # Build structured profile section
     if profile_data.structured_profile:
@@ -593,8 +600,124 @@ def _inject_profile_into_prompt(base_instructions: str, deps: CoachDeps) -> str:
     profile_lines.append("The athlete profile is authoritative.")
     profile_lines.append("Do not reinterpret, rewrite, or question it unless explicitly instructed.")
 
-    profile_section = "\n".join(profile_lines)
-    return f"{base_instructions}\n{profile_section}"
+    return "\n".join(profile_lines)
+
+
+def _inject_profile_into_prompt(base_instructions: str, deps: CoachDeps) -> str:
+    """Inject profile data into orchestrator prompt.
+
+    Produces the same text the agent sees (static instructions followed by
+    the dynamic profile part); used for token accounting and logging.
+
+    Args:
+        base_instructions: Base orchestrator instructions
+        deps: Coach dependencies with profile data
+
+    Returns:
+        Instructions with profile data injected
+    """
+    profile_section = _build_profile_section(deps)
+    if not profile_section:
+        return base_instructions
+    return f"{base_instructions}\n\n{profile_section}"
+
+
+def _profile_instructions(ctx: RunContext[CoachDeps]) -> str:
+    """Dynamic instructions part: the athlete profile for this run's deps."""
+    return _build_profile_section(ctx.deps)
+
+
+def _create_orchestrator_agent(instructions: str) -> Agent[CoachDeps, OrchestratorAgentResponse]:
+    """Create the long-lived orchestrator agent.
+
+    Args:
+        instructions: Static orchestrator instructions
+
+    Returns:
+        Agent with the profile block registered as dynamic instructions
+    """
+    agent = Agent(
+        instructions=instructions,
+        model=ORCHESTRATOR_AGENT_MODEL,
+        output_type=OrchestratorAgentResponse,
+        deps_type=CoachDeps,
+        tools=[],  # No tools - decision only
+        name="Virtus Coach Orchestrator",
+        instrument=True,
+    )
+    agent.instructions(_profile_instructions)
+    return agent
+
+
+async def _stream_message_tokens(_ctx: RunContext[CoachDeps], events: AsyncIterable[AgentStreamEvent]) -> None:
+    """Forward the decision's "message" text to the chat stream as it is generated.
+
+    The agent has no tools, so every tool-call part is the structured output;
+    its streamed JSON arguments are reduced to deltas of the message field.
+    """
+    streamer = MessageFieldStreamer("message")
+    async for event in events:
+        if isinstance(event, PartStartEvent) and isinstance(event.part, ToolCallPart):
+            streamer = MessageFieldStreamer("message")
+            delta = streamer.feed(event.part.args or "")
+        elif isinstance(event, PartDeltaEvent) and isinstance(event.delta, ToolCallPartDelta) and event.delta.args_delta:
+            delta = streamer.feed(event.delta.args_delta)
+        else:
+            continue
+        if delta:
+            emit_local_event("token", {"text": delta})
+
+
+def _history_display(message_history: list[LLMMessage] | None) -> str:
+    """Render message history for debug logs."""
+    if not message_history:
+        return "(none)"
+    return "\n".join(f"{msg.get('role', 'unknown').upper()}: {msg.get('content', '')}" for msg in message_history)
+
+
+def _full_prompt_text(instructions: str, message_history: list, user_input: str) -> str:
+    """Render the full prompt (instructions, history, user input) for debug logs."""
+    prompt_parts = [f"Instructions: {instructions}"]
+    if message_history:
+        history_text = "\n".join([f"{msg.get('role', 'unknown')}: {msg.get('content', '')}" for msg in message_history])
+        prompt_parts.append(f"Message History:\n{history_text}")
+    prompt_parts.append(f"User Input: {user_input}")
+    return "\n\n".join(prompt_parts)
+
+
+async def _load_message_history(athlete_id: int) -> list[dict]:
+    """Load conversation history via MCP.
+
+    Args:
+        athlete_id: Athlete ID
+
+    Returns:
+        Last HISTORY_LOAD_LIMIT messages, or an empty list if the MCP call fails
+    """
+    logger.debug(
+        "Orchestrator: Loading conversation history via MCP",
+        athlete_id=athlete_id,
+        limit=HISTORY_LOAD_LIMIT,
+    )
+    try:
+        result = await call_tool("load_context", {"athlete_id": athlete_id, "limit": HISTORY_LOAD_LIMIT})
+    except MCPError as e:
+        logger.debug(
+            "Orchestrator: Failed to load context via MCP",
+            athlete_id=athlete_id,
+            error_code=e.code,
+            error_message=e.message,
+        )
+        logger.error(f"Failed to load context: {e.code}: {e.message}")
+        return []
+    message_history = result["messages"]
+    logger.debug(
+        "Orchestrator: Conversation history loaded",
+        athlete_id=athlete_id,
+        message_count=len(message_history) if message_history else 0,
+        has_history=bool(message_history),
+    )
+    return message_history
 
 
 def _get_rag_adapter() -> OrchestratorRagAdapter | None:
@@ -677,66 +800,38 @@ async def run_conversation(
         user_input=user_input,
     )
 
-    # Load orchestrator instructions via MCP (if not already loaded)
-    global ORCHESTRATOR_INSTRUCTIONS, ORCHESTRATOR_AGENT
-    if not ORCHESTRATOR_INSTRUCTIONS:
-        logger.debug("Orchestrator: Loading instructions via MCP")
-        ORCHESTRATOR_INSTRUCTIONS = await load_prompt("orchestrator.txt")
+    # Prompt (if not loaded yet, or the prompt file changed), conversation history
+    # and the RAG adapter are independent: fetch them concurrently
+    global ORCHESTRATOR_INSTRUCTIONS, ORCHESTRATOR_AGENT, ORCHESTRATOR_PROMPT_HASH
+    current_prompt_hash = prompt_hash("orchestrator.txt")
+    context_sources = [
+        ContextSource("history", _load_message_history, (deps.athlete_id,), required=True),
+        ContextSource("rag_adapter", _get_rag_adapter),
+    ]
+    if not ORCHESTRATOR_INSTRUCTIONS or current_prompt_hash != ORCHESTRATOR_PROMPT_HASH:
+        logger.debug("Orchestrator: Loading instructions")
+        context_sources.append(ContextSource("instructions", load_prompt, ("orchestrator.txt",), required=True))
+    turn_context = await assemble_context_async("coach_turn", context_sources)
+    logger.info(f"[PLAN] context_load={time.monotonic() - t0:.1f}s")
+
+    if "instructions" in turn_context.values:
+        ORCHESTRATOR_INSTRUCTIONS = turn_context["instructions"]
+        ORCHESTRATOR_PROMPT_HASH = current_prompt_hash
+        ORCHESTRATOR_AGENT = None
         logger.debug(
             "Orchestrator: Instructions loaded",
             instructions_length=len(ORCHESTRATOR_INSTRUCTIONS),
+            prompt_hash=current_prompt_hash,
         )
+    if ORCHESTRATOR_AGENT is None:
         logger.debug("Orchestrator: Creating agent instance")
-        ORCHESTRATOR_AGENT = Agent(
-            instructions=ORCHESTRATOR_INSTRUCTIONS,
-            model=ORCHESTRATOR_AGENT_MODEL,
-            output_type=OrchestratorAgentResponse,
-            deps_type=CoachDeps,
-            tools=[],  # No tools - decision only
-            name="Virtus Coach Orchestrator",
-            instrument=True,
-        )
+        ORCHESTRATOR_AGENT = _create_orchestrator_agent(ORCHESTRATOR_INSTRUCTIONS)
         logger.debug("Orchestrator: Agent instance created")
-    else:
-        logger.debug(
-            "Orchestrator: Instructions already loaded",
-            instructions_length=len(ORCHESTRATOR_INSTRUCTIONS),
-        )
 
-    # Inject profile data into instructions per-request (not cached)
-    # Profile data is user-specific, so we inject it dynamically
+    # Profile data is user-specific: the agent adds it per run as dynamic
+    # instructions. The combined text is still needed for the token guard.
     instructions_with_profile = _inject_profile_into_prompt(ORCHESTRATOR_INSTRUCTIONS, deps)
-
-    # Load conversation history via MCP
-    logger.debug(
-        "Orchestrator: Loading conversation history via MCP",
-        athlete_id=deps.athlete_id,
-        limit=20,
-    )
-    try:
-        result = await call_tool("load_context", {"athlete_id": deps.athlete_id, "limit": 20})
-        message_history = result["messages"]
-        t1 = time.monotonic()
-        context_load_time = t1 - t0
-        logger.info(f"[PLAN] context_load={context_load_time:.1f}s")
-        logger.debug(
-            "Orchestrator: Conversation history loaded",
-            athlete_id=deps.athlete_id,
-            message_count=len(message_history) if message_history else 0,
-            has_history=bool(message_history),
-        )
-    except MCPError as e:
-        t1 = time.monotonic()
-        context_load_time = t1 - t0
-        logger.info(f"[PLAN] context_load={context_load_time:.1f}s")
-        logger.debug(
-            "Orchestrator: Failed to load context via MCP",
-            athlete_id=deps.athlete_id,
-            error_code=e.code,
-            error_message=e.message,
-        )
-        logger.error(f"Failed to load context: {e.code}: {e.message}")
-        message_history = []
+    message_history = turn_context["history"]
 
     # Log LLM model being called
     model_name = ORCHESTRATOR_AGENT_MODEL.model_name
@@ -747,28 +842,20 @@ async def run_conversation(
         athlete_id=deps.athlete_id,
     )
 
-    # Log full prompt at debug level (use instructions_with_profile for logging)
-    prompt_parts = [f"Instructions: {instructions_with_profile}"]
-    if message_history:
-        history_text = "\n".join([f"{msg.get('role', 'unknown')}: {msg.get('content', '')}" for msg in message_history])
-        prompt_parts.append(f"Message History:\n{history_text}")
-    prompt_parts.append(f"User Input: {user_input}")
-    full_prompt_text = "\n\n".join(prompt_parts)
-
-    logger.debug(
+    # Log full prompt at debug level (lazy: rendered only if debug is enabled)
+    logger.opt(lazy=True).debug(
         "Orchestrator: Exact prompt sent to LLM",
-        system_prompt=instructions_with_profile,
-        message_history=message_history,
-        user_input=user_input,
-        full_prompt=full_prompt_text,
+        system_prompt=lambda: instructions_with_profile,
+        message_history=lambda: message_history,
+        user_input=lambda: user_input,
+        full_prompt=lambda: _full_prompt_text(instructions_with_profile, message_history, user_input),
     )
-    logger.debug(
+    logger.opt(lazy=True).debug(
         "Orchestrator prompt",
-        prompt_length=len(full_prompt_text),
-        instructions_length=len(instructions_with_profile),
-        message_history_length=len(message_history) if message_history else 0,
-        user_input_length=len(user_input),
-        full_prompt=full_prompt_text,
+        prompt_length=lambda: len(_full_prompt_text(instructions_with_profile, message_history, user_input)),
+        instructions_length=lambda: len(instructions_with_profile),
+        message_history_length=lambda: len(message_history) if message_history else 0,
+        user_input_length=lambda: len(user_input),
     )
 
     # Ensure agent is initialized
@@ -891,50 +978,36 @@ async def run_conversation(
         {
             "model": model_name,
             "prompt_version": ORCHESTRATOR_PROMPT_VERSION,
+            "prompt_hash": ORCHESTRATOR_PROMPT_HASH,
+            "context.total_ms": turn_context.total_ms,
+            **{f"context.{name}_ms": elapsed_ms for name, elapsed_ms in turn_context.timings_ms.items()},
         }
     )
 
     try:
         t2_start = time.monotonic()
-        with trace(
-            name="llm.orchestrator_decision",
-            metadata=trace_meta,
+        with (
+            trace(name="llm.orchestrator_decision", metadata=trace_meta),
+            llm_call_site("coach.orchestrator"),
         ):
-            # Create a temporary agent with profile-injected instructions
-            # This allows per-request profile injection without modifying cached agent
-            agent_with_profile = Agent(
-                instructions=instructions_with_profile,
-                model=ORCHESTRATOR_AGENT_MODEL,
-                output_type=OrchestratorAgentResponse,
-                deps_type=CoachDeps,
-                tools=[],  # No tools - decision only
-                name="Virtus Coach Orchestrator",
-                instrument=True,
-            )
+            # Shared agent; the profile block is added by its dynamic instructions
             message_history_for_log = cast(list[ModelMessage], typed_message_history) if typed_message_history else None
-            history_str = ""
-            if message_history_for_log:
-                history_lines = []
-                for msg in message_history_for_log:
-                    role = msg.get("role", "unknown") if isinstance(msg, dict) else getattr(msg, "role", "unknown")
-                    content = msg.get("content", "") if isinstance(msg, dict) else getattr(msg, "content", "")
-                    history_lines.append(f"{role.upper()}: {content}")
-                history_str = "\n".join(history_lines)
-            history_display = history_str if history_str else "(none)"
-            logger.debug(
+            logger.opt(lazy=True).debug(
                 "LLM Prompt: Orchestrator Agent Decision\n"
                 "System Prompt:\n{system_prompt}\n\n"
                 "Message History ({message_history_count} messages):\n{history_display}\n\n"
                 "User Prompt:\n{user_prompt}",
-                system_prompt=instructions_with_profile,
-                user_prompt=user_input,
-                history_display=history_display,
-                message_history_count=len(message_history_for_log) if message_history_for_log else 0,
+                system_prompt=lambda: instructions_with_profile,
+                user_prompt=lambda: user_input,
+                history_display=lambda: _history_display(typed_message_history),
+                message_history_count=lambda: len(typed_message_history) if typed_message_history else 0,
             )
-            result = await agent_with_profile.run(
+            result = await ORCHESTRATOR_AGENT.run(
                 user_prompt=user_input,
                 deps=deps,
                 message_history=message_history_for_log,
+                # Streaming chat: request a streamed model response and forward message tokens
+                event_stream_handler=_stream_message_tokens if is_streaming() else None,
             )
         t2 = time.monotonic()
         llm_generate_time = t2 - t2_start
@@ -1227,9 +1300,9 @@ async def run_conversation(
                     horizon="week",
                 )
 
-                logger.debug(
+                logger.opt(lazy=True).debug(
                     "Policy input state",
-                    current_state=evaluation.current_state.model_dump(),
+                    current_state=evaluation.current_state.model_dump,
                 )
 
                 # Build AthleteContext with simple heuristics
@@ -1289,10 +1362,10 @@ async def run_conversation(
                     adherence_reliability=adherence_reliability,
                 )
 
-                logger.debug(
+                logger.opt(lazy=True).debug(
                     "Policy v3 input",
-                    athlete=athlete_context,
-                    state=evaluation.current_state.model_dump(),
+                    athlete=lambda: athlete_context,
+                    state=evaluation.current_state.model_dump,
                 )
 
                 # Build IntentContext with simple heuristics
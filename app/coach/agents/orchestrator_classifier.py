@@ -10,15 +10,18 @@ from pydantic_ai.exceptions import UsageLimitExceeded
 
 from app.coach.agents.orchestrator_deps import CoachDeps
 from app.coach.config.models import ORCHESTRATOR_MODEL
-from app.coach.prompts.loader import load_prompt
+from app.coach.prompts.loader import load_prompt, prompt_hash
 from app.coach.schemas.orchestration import OrchestrationDecision
 from app.services.llm.model import get_model
+from app.services.llm.telemetry import with_llm_call_site
 
 # Global classifier agent (lazy loaded)
 CLASSIFIER_AGENT: Agent[CoachDeps, OrchestrationDecision] | None = None
 CLASSIFIER_INSTRUCTIONS = ""
+CLASSIFIER_PROMPT_HASH: str | None = None
 
 
+@with_llm_call_site("coach.intent_classifier")
 async def classify_intent(
     user_input: str,
     deps: CoachDeps,
@@ -34,14 +37,16 @@ async def classify_intent(
     Returns:
         OrchestrationDecision with classification and action
     """
-    global CLASSIFIER_AGENT, CLASSIFIER_INSTRUCTIONS
+    global CLASSIFIER_AGENT, CLASSIFIER_INSTRUCTIONS, CLASSIFIER_PROMPT_HASH
 
-    # Load classifier prompt if not already loaded
-    if not CLASSIFIER_INSTRUCTIONS:
+    # Load classifier prompt if not already loaded (or the prompt file changed)
+    current_prompt_hash = prompt_hash("orchestrator_classifier.txt")
+    if not CLASSIFIER_INSTRUCTIONS or current_prompt_hash != CLASSIFIER_PROMPT_HASH:
         CLASSIFIER_INSTRUCTIONS = await load_prompt("orchestrator_classifier.txt")
+        CLASSIFIER_PROMPT_HASH = current_prompt_hash
         CLASSIFIER_AGENT = Agent(
             instructions=CLASSIFIER_INSTRUCTIONS,
-            model=ORCHESTRATOR_MODEL,
+            model=get_model("openai", ORCHESTRATOR_MODEL),
             output_type=OrchestrationDecision,
             deps_type=CoachDeps,
             name="Orchestrator Classifier",
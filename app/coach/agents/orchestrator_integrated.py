@@ -1,7 +1,7 @@
 """Integrated orchestrator with classification, guard, and unified planning.
 
 This orchestrator implements the complete flow:
-User → Classifier → Guard → Tool → Response
+User → Intent router (→ LLM classifier) → Guard → Tool → Response
 
 Every message is classified before action.
 Only one intentional action happens per turn.
@@ -15,7 +15,7 @@ from loguru import logger
 
 from app.coach.admin.decision_logger import DECISION_LOGGER
 from app.coach.admin.execution_guard import EXECUTION_GUARD
-from app.coach.agents.orchestrator_classifier import classify_intent
+from app.coach.agents.intent_router import route_intent
 from app.coach.agents.orchestrator_deps import CoachDeps
 from app.coach.schemas.orchestration import OrchestrationDecision
 from app.coach.schemas.orchestrator_response import OrchestratorAgentResponse, ResponseType
@@ -58,8 +58,8 @@ async def run_orchestrated_conversation(
     # Build minimal context for classifier
     minimal_context = _build_minimal_context(deps)
 
-    # Step 1: Classify intent
-    decision = await classify_intent(user_input, deps, minimal_context)
+    # Step 1: Classify intent (rules / example match first, LLM classifier when unsure)
+    decision = await route_intent(user_input, deps, minimal_context)
 
     # Step 2: Check execution guard
     allowed, guard_reason = EXECUTION_GUARD.check(decision)
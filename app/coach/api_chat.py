@@ -1,10 +1,16 @@
+import asyncio
+import time
+import uuid
+from collections.abc import AsyncIterator
 from datetime import date, datetime, timezone
-from typing import Literal, cast
+from typing import Any, Literal, cast
 
 from fastapi import APIRouter, BackgroundTasks, Depends, Request
+from fastapi.responses import StreamingResponse
 from loguru import logger
 from sqlalchemy import select
 
+from app.coach.agents.intent_router import model_turn, route_chat_turn
 from app.coach.agents.orchestrator_agent import run_conversation
 from app.coach.agents.orchestrator_deps import (
     AthleteProfileData,
@@ -13,11 +19,18 @@ from app.coach.agents.orchestrator_deps import (
     StructuredProfileData,
     TrainingPreferencesData,
 )
+from app.coach.chat_events import (
+    ChatEventSubscription,
+    format_sse,
+    publish_chat_event,
+    reset_chat_event_sink,
+    set_chat_event_sink,
+)
 from app.coach.config.models import USER_FACING_MODEL
 from app.coach.execution_guard import TurnExecutionGuard
 from app.coach.executor.action_executor import CoachActionExecutor
 from app.coach.executor.errors import ExecutionError, InvalidModificationSpecError, NoActionError, PersistenceError
-from app.coach.mcp_client import MCPError, call_tool, emit_progress_event_safe
+from app.coach.mcp_client import MCPError, call_tool, coach_turn_reads, emit_progress_event_safe, prefetch_turn_tools
 from app.coach.progress_steps import PLAN_WEEK_STEPS
 from app.coach.services.response_postprocessor import postprocess_response
 from app.coach.services.state_builder import build_athlete_state
@@ -51,6 +64,21 @@ from app.upload.upload_detector import is_activity_upload, is_plan_upload
 
 router = APIRouter(prefix="/coach", tags=["coach"])
 
+# Idle seconds after which /chat/stream sends an SSE comment (keeps proxies from closing the stream)
+STREAM_KEEPALIVE_SECONDS = 15.0
+
+# Max seconds to wait for Redis-delivered events still in flight when a streamed turn ends
+STREAM_DRAIN_SECONDS = 1.0
+
+# Message sent in the "error" event when a streamed turn fails
+STREAM_ERROR_MESSAGE = "Something went wrong while processing your message. Please try again."
+
+# Internal marker published when a streamed turn ends (used to drain pub/sub in order)
+_STREAM_END_EVENT = "_stream_end"
+
+# Streamed turns keep running if the client disconnects; hold references until they finish
+_stream_turns: set[asyncio.Task] = set()
+
 
 def _get_athlete_id() -> int | None:
     """Get athlete ID from the first StravaAuth entry.
@@ -111,29 +139,6 @@ def _is_history_empty(athlete_id: int | None = None) -> bool:
         return message_count == 0
 
 
-def _is_simple_acknowledgment(message: str) -> bool:
-    """Check if message is a simple activity acknowledgment that doesn't need agent processing.
-
-    Args:
-        message: User's message
-
-    Returns:
-        True if message is a simple acknowledgment that should be handled via fast-path
-    """
-    normalized = message.strip().lower()
-    simple_acks = {
-        "i ran yesterday",
-        "i ran today",
-        "i worked out",
-        "i trained today",
-        "ran yesterday",
-        "ran today",
-        "worked out",
-        "trained today",
-    }
-    return normalized in simple_acks
-
-
 def get_or_create_athlete_id(db, user_id: str) -> int | None:
     """Get athlete_id from user_id via StravaAccount.
 
@@ -420,9 +425,9 @@ async def coach_chat(
             plan_items=None,
         )
 
-    # Fast-path: Handle simple activity acknowledgments without invoking agent
+    # Fast-path: acknowledgments the intent router resolves skip the agent
     # This prevents internal looping in pydantic_ai for trivial conversational inputs
-    if _is_simple_acknowledgment(req.message):
+    if route_chat_turn(req.message) is not None:
         logger.info(
             "Fast-path: Handling simple acknowledgment without agent",
             conversation_id=conversation_id,
@@ -616,14 +621,20 @@ async def coach_chat(
     )
     set_association_properties(trace_meta)
 
+    # History, recent activities and this week's sessions in one MCP round trip
+    await prefetch_turn_tools(coach_turn_reads(athlete_id, user_id))
+
     # Get decision from orchestrator (use normalized content, pass conversation_id for slot persistence)
     # Wrap in conversation-level trace (root span)
-    with trace(
-        name="conversation.turn",
-        metadata={
-            **trace_meta,
-            "intent": "unknown",  # Will be updated after decision
-        },
+    with (
+        trace(
+            name="conversation.turn",
+            metadata={
+                **trace_meta,
+                "intent": "unknown",  # Will be updated after decision
+            },
+        ),
+        model_turn(),
     ):
         decision = await run_conversation(
             user_input=normalized_user_message.content,
@@ -808,6 +819,106 @@ async def coach_chat(
     )
 
 
+@router.post("/chat/stream")
+async def coach_chat_stream(
+    req: CoachChatRequest,
+    request: Request,
+    user_id: str = Depends(validate_conversation_ownership),
+) -> StreamingResponse:
+    """Streaming variant of /coach/chat (server-sent events).
+
+    Runs the same turn as coach_chat. Write actions that coach_chat defers to
+    background tasks run inside the stream, so their progress is delivered
+    here instead of through polling.
+
+    Events:
+    - token: {"text": ...} orchestrator message text as the model generates it
+    - progress: {"stage", "message", "metadata"} plan progress (PlanProgressStage)
+    - step: {"step_id", "label", "status", "message"} executor step events
+    - response: the final CoachChatResponse (authoritative; replaces streamed tokens)
+    - error: {"message": ...} the turn failed
+    - done: {} the turn, including deferred plan execution, has finished
+
+    Progress and step events come from Redis pub/sub, so they arrive no matter
+    which process emits them; without Redis the stream still carries tokens
+    and the final response.
+    """
+    conversation_id = get_conversation_id(request)
+    stream_id = uuid.uuid4().hex
+    queue: asyncio.Queue[tuple[str, dict[str, Any]] | None] = asyncio.Queue()
+
+    def _sink(event: str, data: dict[str, Any]) -> None:
+        queue.put_nowait((event, data))
+
+    async def _run_turn() -> None:
+        token = set_chat_event_sink(_sink)
+        turn_tasks = BackgroundTasks()
+        try:
+            response = await coach_chat(req, request, turn_tasks, user_id)
+            _sink("response", response.model_dump(mode="json"))
+            # Deferred executor runs + message persistence, in order
+            await turn_tasks()
+        except Exception:
+            logger.exception(f"Streamed coach chat turn failed (conversation_id={conversation_id})")
+            # Details stay in the server log; the client only learns the turn failed
+            _sink("error", {"message": STREAM_ERROR_MESSAGE})
+        finally:
+            reset_chat_event_sink(token)
+            queue.put_nowait(None)
+
+    async def _forward(subscription: ChatEventSubscription) -> None:
+        async for event, data in subscription.events():
+            queue.put_nowait((event, data))
+
+    async def _events() -> AsyncIterator[str]:
+        started = time.monotonic()
+        first_event_at: float | None = None
+        async with ChatEventSubscription(conversation_id) as subscription:
+            forwarder = asyncio.create_task(_forward(subscription))
+            turn = asyncio.create_task(_run_turn())
+            _stream_turns.add(turn)
+            turn.add_done_callback(_stream_turns.discard)
+            drain_deadline: float | None = None
+            try:
+                while True:
+                    timeout = STREAM_KEEPALIVE_SECONDS
+                    if drain_deadline is not None:
+                        timeout = max(0.0, drain_deadline - time.monotonic())
+                    try:
+                        item = await asyncio.wait_for(queue.get(), timeout=timeout)
+                    except TimeoutError:
+                        if drain_deadline is not None:
+                            break
+                        yield ": keep-alive\n\n"
+                        continue
+                    if item is None:
+                        if not subscription.active:
+                            break
+                        # Pub/sub may still hold events published before the turn ended
+                        publish_chat_event(conversation_id, _STREAM_END_EVENT, {"stream_id": stream_id})
+                        drain_deadline = time.monotonic() + STREAM_DRAIN_SECONDS
+                        continue
+                    event, data = item
+                    if event == _STREAM_END_EVENT:
+                        if data.get("stream_id") == stream_id:
+                            break
+                        continue
+                    if first_event_at is None:
+                        first_event_at = time.monotonic()
+                        logger.info(f"[CHAT_STREAM] first_event={first_event_at - started:.2f}s event={event}")
+                    yield format_sse(event, data)
+                yield format_sse("done", {})
+                logger.info(f"[CHAT_STREAM] total={time.monotonic() - started:.2f}s conversation_id={conversation_id}")
+            finally:
+                forwarder.cancel()
+
+    return StreamingResponse(
+        _events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.get("/conversations/{conversation_id}/progress", response_model=ProgressResponse)
 async def get_conversation_progress(
     conversation_id: str,
@@ -0,0 +1,219 @@
+"""Live chat events for the streaming coach chat endpoint.
+
+Two delivery paths feed POST /coach/chat/stream:
+
+- Progress events (plan progress stages, executor step events) are published
+  to a per-conversation Redis pub/sub channel, so the worker holding the SSE
+  connection receives them no matter which process (API worker, background
+  task, MCP DB server) emitted them.
+- Model tokens and the final response are produced by the request's own
+  pipeline task and delivered in-process through a context-local sink.
+
+Publishing is fire-and-forget: Redis failures are logged at debug and never
+affect the emitter. Progress remains available through the polled
+/conversations/{id}/progress endpoint either way.
+"""
+
+import json
+import time
+from collections.abc import AsyncIterator, Callable
+from contextvars import ContextVar
+from typing import Any
+
+import redis
+from loguru import logger
+from pydantic_core import from_json
+
+from app.core.redis_pool import get_async_redis, get_redis
+
+CHANNEL_PREFIX = "coach:chat_events:"
+
+# After a failed publish, skip publishing for this long (keeps emitters fast while Redis is down)
+PUBLISH_BACKOFF_SECONDS = 30.0
+
+# Sink for in-process events of the current chat turn (set by the streaming endpoint)
+_event_sink: ContextVar[Callable[[str, dict[str, Any]], None] | None] = ContextVar("coach_chat_event_sink", default=None)
+
+_publish_paused_until = 0.0
+
+
+def _get_redis_client() -> redis.Redis:
+    """Get the shared Redis client.
+
+    Returns:
+        Redis client with string decoding enabled
+    """
+    return get_redis()
+
+
+def channel_name(conversation_id: str) -> str:
+    """Redis pub/sub channel for a conversation's live events."""
+    return f"{CHANNEL_PREFIX}{conversation_id}"
+
+
+def publish_chat_event(conversation_id: str, event: str, data: dict[str, Any]) -> None:
+    """Publish a live event for a conversation (non-blocking, never raises).
+
+    Args:
+        conversation_id: Conversation ID
+        event: SSE event name (e.g., "progress", "step")
+        data: JSON-serializable event payload
+    """
+    global _publish_paused_until
+    if not conversation_id or time.monotonic() < _publish_paused_until:
+        return
+    try:
+        payload = json.dumps({"event": event, "data": data}, default=str)
+        _get_redis_client().publish(channel_name(conversation_id), payload)
+    except redis.RedisError as e:
+        _publish_paused_until = time.monotonic() + PUBLISH_BACKOFF_SECONDS
+        logger.debug(f"[CHAT_EVENTS] Publish failed, pausing for {PUBLISH_BACKOFF_SECONDS:.0f}s (non-fatal): {e!r}")
+    except (TypeError, ValueError) as e:
+        logger.debug(f"[CHAT_EVENTS] Unserializable event dropped: {e!r}")
+
+
+class ChatEventSubscription:
+    """Async context manager subscribed to a conversation's event channel.
+
+    The subscription is active once __aenter__ returns, so events published
+    afterwards are not missed. If Redis is unavailable the subscription is
+    inert: events() ends immediately.
+
+    Example:
+        async with ChatEventSubscription(conversation_id) as subscription:
+            start_work()
+            async for event, data in subscription.events():
+                ...
+    """
+
+    def __init__(self, conversation_id: str):
+        self.conversation_id = conversation_id
+        self._pubsub: Any = None
+
+    async def __aenter__(self) -> "ChatEventSubscription":
+        try:
+            # Holds one connection from the shared asyncio pool until closed
+            self._pubsub = get_async_redis().pubsub(ignore_subscribe_messages=True)
+            await self._pubsub.subscribe(channel_name(self.conversation_id))
+        except (redis.RedisError, OSError) as e:
+            logger.debug(f"[CHAT_EVENTS] Subscribe failed, streaming without progress events: {e!r}")
+            await self._close()
+        return self
+
+    @property
+    def active(self) -> bool:
+        """Whether the Redis subscription is live."""
+        return self._pubsub is not None
+
+    async def __aexit__(self, *_exc: object) -> None:
+        await self._close()
+
+    async def _close(self) -> None:
+        pubsub = self._pubsub
+        self._pubsub = None
+        try:
+            if pubsub is not None:
+                await pubsub.aclose()
+        except (redis.RedisError, OSError):
+            pass
+
+    async def events(self) -> AsyncIterator[tuple[str, dict[str, Any]]]:
+        """Yield (event, data) pairs in publish order until the subscription closes."""
+        if self._pubsub is None:
+            return
+        try:
+            async for message in self._pubsub.listen():
+                if message.get("type") != "message":
+                    continue
+                try:
+                    payload = json.loads(message["data"])
+                    yield payload["event"], payload["data"]
+                except (ValueError, KeyError, TypeError):
+                    logger.debug(f"[CHAT_EVENTS] Dropping malformed event on {channel_name(self.conversation_id)}")
+        except (redis.RedisError, OSError) as e:
+            logger.debug(f"[CHAT_EVENTS] Subscription ended: {e!r}")
+
+
+def set_chat_event_sink(sink: Callable[[str, dict[str, Any]], None] | None) -> Any:
+    """Install the in-process event sink for the current context.
+
+    Args:
+        sink: Callable receiving (event, data), or None to disable
+
+    Returns:
+        Token for reset_chat_event_sink()
+    """
+    return _event_sink.set(sink)
+
+
+def reset_chat_event_sink(token: Any) -> None:
+    """Restore the sink that was active before set_chat_event_sink()."""
+    _event_sink.reset(token)
+
+
+def is_streaming() -> bool:
+    """Whether the current chat turn has a live event sink."""
+    return _event_sink.get() is not None
+
+
+def emit_local_event(event: str, data: dict[str, Any]) -> None:
+    """Deliver an event to the current turn's sink, if any.
+
+    Args:
+        event: SSE event name (e.g., "token", "response")
+        data: JSON-serializable payload
+    """
+    sink = _event_sink.get()
+    if sink is not None:
+        sink(event, data)
+
+
+class MessageFieldStreamer:
+    """Turns streamed tool-call argument JSON into text deltas of one field.
+
+    Structured outputs arrive as partial JSON ('{"intent": "q", "message": "Ke');
+    this tracks the named string field across chunks and emits only newly
+    generated text as "token" events.
+    """
+
+    def __init__(self, field: str = "message"):
+        self.field = field
+        self._buffer = ""
+        self._sent = 0
+
+    def feed(self, args_delta: str | dict[str, Any]) -> str:
+        """Add an argument chunk and return the new text (may be empty).
+
+        Args:
+            args_delta: JSON text fragment, or a full args dict
+
+        Returns:
+            Text appended to the field since the previous call
+        """
+        if isinstance(args_delta, dict):
+            parsed: Any = args_delta
+        else:
+            self._buffer += args_delta
+            try:
+                parsed = from_json(self._buffer, allow_partial="trailing-strings")
+            except ValueError:
+                return ""
+        value = parsed.get(self.field) if isinstance(parsed, dict) else None
+        if not isinstance(value, str) or len(value) <= self._sent:
+            return ""
+        delta = value[self._sent :]
+        self._sent = len(value)
+        return delta
+
+
+def format_sse(event: str, data: dict[str, Any]) -> str:
+    """Format one server-sent event frame.
+
+    Args:
+        event: Event name
+        data: JSON-serializable payload
+
+    Returns:
+        SSE frame text
+    """
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
@@ -30,7 +30,7 @@ from app.coach.extraction.adjust_extractor import (
 from app.coach.extraction.modify_race_extractor import extract_race_modification_llm
 from app.coach.extraction.modify_season_extractor import extract_modify_season
 from app.coach.extraction.modify_week_extractor import extract_week_modification_llm
-from app.coach.mcp_client import MCPError, call_tool, emit_progress_event_safe
+from app.coach.mcp_client import MCPError, call_tool, emit_progress_event_safe, week_planned_sessions_arguments
 from app.coach.policy.weekly_policy_v0 import decide_weekly_action
 from app.coach.schemas.athlete_state import AthleteState
 from app.coach.schemas.orchestrator_response import OrchestratorAgentResponse
@@ -2118,19 +2118,7 @@ class CoachActionExecutor:
             Message with training state, scheduled workouts, and coaching feedback
         """
         try:
-            now = datetime.now(timezone.utc)
-            days_since_monday = now.weekday()
-            monday = (now - timedelta(days=days_since_monday)).replace(hour=0, minute=0, second=0, microsecond=0)
-            sunday = monday + timedelta(days=6, hours=23, minutes=59, seconds=59)
-
-            sessions_result = await call_tool(
-                "get_planned_sessions",
-                {
-                    "user_id": user_id,
-                    "start_date": monday.isoformat(),
-                    "end_date": sunday.isoformat(),
-                },
-            )
+            sessions_result = await call_tool("get_planned_sessions", week_planned_sessions_arguments(user_id))
 
             sessions_data = sessions_result.get("sessions", [])
 
@@ -2288,24 +2276,12 @@ class CoachActionExecutor:
             if horizon == "today":
                 start_date = now.replace(hour=0, minute=0, second=0, microsecond=0)
                 end_date = now.replace(hour=23, minute=59, second=59, microsecond=999999)
-            elif horizon == "week":
-                days_since_monday = now.weekday()
-                start_date = (now - timedelta(days=days_since_monday)).replace(hour=0, minute=0, second=0, microsecond=0)
-                end_date = start_date + timedelta(days=6, hours=23, minutes=59, seconds=59)
+                arguments = {"user_id": deps.user_id, "start_date": start_date.isoformat(), "end_date": end_date.isoformat()}
             else:
-                # Default to current week for other horizons
-                days_since_monday = now.weekday()
-                start_date = (now - timedelta(days=days_since_monday)).replace(hour=0, minute=0, second=0, microsecond=0)
-                end_date = start_date + timedelta(days=6, hours=23, minutes=59, seconds=59)
+                # Current week (also the default for other horizons); matches the turn prefetch
+                arguments = week_planned_sessions_arguments(deps.user_id, now)
 
-            sessions_result = await call_tool(
-                "get_planned_sessions",
-                {
-                    "user_id": deps.user_id,
-                    "start_date": start_date.isoformat(),
-                    "end_date": end_date.isoformat(),
-                },
-            )
+            sessions_result = await call_tool("get_planned_sessions", arguments)
 
             sessions_data = sessions_result.get("sessions", [])
 
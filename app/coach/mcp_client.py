@@ -1,18 +1,33 @@
 """MCP Client for orchestrator agent.
 
 Handles all communication with MCP servers for database and filesystem operations.
+
+All calls share one pooled keep-alive HTTP/2 client. Concurrent calls per
+tool are capped by TOOL_CONCURRENCY_LIMITS, and call_tools_batch() sends
+independent DB tool calls in a single /mcp/tools/batch request.
+
+A coach turn starts with prefetch_turn_tools(coach_turn_reads(...)), which
+fetches the turn's read-only loads (conversation history, recent activities,
+this week's planned sessions) in one batch. call_tool() serves identical reads
+from that prefetch until a write that may change them (save_context only
+invalidates the history).
 """
 
 import asyncio
 import inspect
 import json
 import os
+import weakref
+from contextlib import AsyncExitStack
+from contextvars import ContextVar
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any
 
 import httpx
 from loguru import logger
 
+from app.coach.chat_events import publish_chat_event
 from app.coach.mcp_health import record_mcp_success
 from app.config.settings import settings
 from app.core.observe import trace
@@ -55,22 +70,130 @@ TOOL_TIMEOUTS: dict[str, float] = {
     "run_analysis": 120.0,  # 2 minutes for analysis
 }
 
+# Max concurrent in-flight calls per tool (per event loop)
+DEFAULT_TOOL_CONCURRENCY = 8
+TOOL_CONCURRENCY_LIMITS: dict[str, int] = {
+    "plan_week": 2,
+    "plan_season": 1,
+    "run_analysis": 4,
+}
+
+# Servers that implement POST /mcp/tools/batch
+MCP_BATCH_SERVERS: set[str] = {MCP_DB_SERVER_URL}
+
+# Idle keep-alive connections are closed after this many seconds
+KEEPALIVE_EXPIRY = 30.0
+
+# Read-only tools whose results a turn may prefetch and reuse
+PREFETCHABLE_TOOLS: frozenset[str] = frozenset(
+    {"load_context", "get_recent_activities", "get_yesterday_activities", "get_planned_sessions"}
+)
+# Prefetched reads a DB tool can change; any other DB tool drops the whole prefetch
+PREFETCH_INVALIDATED_BY: dict[str, frozenset[str]] = {
+    "save_context": frozenset({"load_context"}),
+    "emit_progress_event": frozenset(),
+}
+
+# Coach turn reads (see coach_turn_reads)
+HISTORY_LOAD_LIMIT = 20
+RECENT_ACTIVITY_DAYS = 7
+
 _client: httpx.AsyncClient | None = None
+_tool_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, asyncio.Semaphore]]" = (
+    weakref.WeakKeyDictionary()
+)
+# Serializes multi-permit acquisition by batches (per event loop), so two
+# batches can never each hold part of the permits the other is waiting for
+_batch_acquire_locks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]" = weakref.WeakKeyDictionary()
+
+# Prefetched read results of the current turn, keyed by _prefetch_key()
+_turn_prefetch: ContextVar[dict[str, dict[str, Any]] | None] = ContextVar("mcp_turn_prefetch", default=None)
 
 
 def _get_client() -> httpx.AsyncClient:
-    """Get or create HTTP client, handling event loop closure.
+    """Get or create the pooled HTTP client, handling event loop closure.
 
     Client is created with a default timeout that can be overridden per-request.
-    Per-request timeouts from TOOL_TIMEOUTS take precedence.
+    Per-request timeouts from TOOL_TIMEOUTS take precedence. Connections are
+    kept alive and reused across calls; HTTP/2 multiplexes concurrent calls
+    over one connection.
     """
     global _client
     if _client is None or _client.is_closed:
         # Set reasonable default timeout - per-request timeouts will override
-        _client = httpx.AsyncClient(timeout=HTTP_TIMEOUT)
+        _client = httpx.AsyncClient(
+            timeout=HTTP_TIMEOUT,
+            http2=settings.mcp_client_http2,
+            limits=httpx.Limits(
+                max_connections=settings.mcp_client_max_connections,
+                max_keepalive_connections=settings.mcp_client_max_keepalive_connections,
+                keepalive_expiry=KEEPALIVE_EXPIRY,
+            ),
+        )
     return _client
 
 
+def _tool_semaphore(tool_name: str) -> asyncio.Semaphore:
+    """Get the concurrency limiter for a tool on the running event loop."""
+    loop = asyncio.get_running_loop()
+    semaphores = _tool_semaphores.setdefault(loop, {})
+    semaphore = semaphores.get(tool_name)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(_tool_limit(tool_name))
+        semaphores[tool_name] = semaphore
+    return semaphore
+
+
+def _tool_limit(tool_name: str) -> int:
+    return TOOL_CONCURRENCY_LIMITS.get(tool_name, DEFAULT_TOOL_CONCURRENCY)
+
+
+def _prefetch_key(tool_name: str, arguments: dict[str, Any]) -> str:
+    return f"{tool_name}:{json.dumps(arguments, sort_keys=True, default=str)}"
+
+
+def _invalidate_prefetch(prefetched: dict[str, dict[str, Any]], tool_name: str) -> None:
+    """Drop prefetched reads that calling tool_name may change."""
+    if MCP_TOOL_ROUTES.get(tool_name) != MCP_DB_SERVER_URL:
+        return
+    stale_tools = PREFETCH_INVALIDATED_BY.get(tool_name)
+    if stale_tools is None:
+        prefetched.clear()
+        return
+    for key in [key for key in prefetched if key.partition(":")[0] in stale_tools]:
+        del prefetched[key]
+
+
+def week_planned_sessions_arguments(user_id: str, now: datetime | None = None) -> dict[str, Any]:
+    """get_planned_sessions arguments for the current Monday-Sunday week (UTC).
+
+    Coach paths that read this week's sessions build their arguments here, so
+    the reads match the turn prefetch.
+    """
+    now = now or datetime.now(timezone.utc)
+    monday = (now - timedelta(days=now.weekday())).replace(hour=0, minute=0, second=0, microsecond=0)
+    sunday = monday + timedelta(days=6, hours=23, minutes=59, seconds=59)
+    return {"user_id": user_id, "start_date": monday.isoformat(), "end_date": sunday.isoformat()}
+
+
+def coach_turn_reads(athlete_id: int, user_id: str) -> list[tuple[str, dict[str, Any]]]:
+    """Read-only loads of a coach turn, for prefetch_turn_tools().
+
+    Args:
+        athlete_id: Athlete ID
+        user_id: User ID
+
+    Returns:
+        (tool_name, arguments) pairs: conversation history, recent activities
+        and this week's planned sessions
+    """
+    return [
+        ("load_context", {"athlete_id": athlete_id, "limit": HISTORY_LOAD_LIMIT}),
+        ("get_recent_activities", {"user_id": user_id, "days": RECENT_ACTIVITY_DAYS}),
+        ("get_planned_sessions", week_planned_sessions_arguments(user_id)),
+    ]
+
+
 # Test-only MCP call log (guarded by MCP_TEST_MODE env var)
 MCP_CALL_LOG: list[str] = []
 
@@ -108,6 +231,13 @@ async def emit_progress_event_safe(
         status: Event status
         message: Optional message
     """
+    # Live copy for streaming chat clients (Redis pub/sub, never blocks or raises)
+    publish_chat_event(
+        conversation_id,
+        "step",
+        {"step_id": step_id, "label": label, "status": status, "message": message},
+    )
+
     # Feature flag check - progress events disabled by default for production stability
     if not settings.enable_progress_events:
         return
@@ -258,29 +388,39 @@ async def call_tool(tool_name: str, arguments: dict[str, Any]) -> dict[str, Any]
     Raises:
         MCPError: If tool call fails after retries
     """
-    # Get caller information for diagnostic logging
-    frame = inspect.currentframe()
-    caller_frame = frame.f_back if frame else None
-    caller_info = "unknown"
-    if caller_frame:
-        caller_file = caller_frame.f_code.co_filename
-        caller_line = caller_frame.f_lineno
-        caller_func = caller_frame.f_code.co_name
-        # Extract just the file name, not full path
-        caller_file = Path(caller_file).name
-        caller_info = f"{caller_file}:{caller_line}:{caller_func}"
+    prefetched = _turn_prefetch.get()
+    if prefetched:
+        if tool_name in PREFETCHABLE_TOOLS:
+            if (result := prefetched.get(_prefetch_key(tool_name, arguments))) is not None:
+                logger.debug("MCP: Served from turn prefetch", tool=tool_name)
+                return result
+        else:
+            _invalidate_prefetch(prefetched, tool_name)
 
     # Get timeout for this tool
     request_timeout = TOOL_TIMEOUTS.get(tool_name, HTTP_TIMEOUT)
 
-    # Critical diagnostic log - shows WHO is calling and WHAT timeout
-    logger.warning(
-        f"MCP CALL → tool={tool_name}, phase={caller_info}, timeout={request_timeout}s",
-        tool=tool_name,
-        caller=caller_info,
-        timeout=request_timeout,
-        argument_keys=list(arguments.keys()) if isinstance(arguments, dict) else None,
-    )
+    if settings.mcp_client_diagnostics_enabled:
+        # Get caller information for diagnostic logging
+        frame = inspect.currentframe()
+        caller_frame = frame.f_back if frame else None
+        caller_info = "unknown"
+        if caller_frame:
+            caller_file = caller_frame.f_code.co_filename
+            caller_line = caller_frame.f_lineno
+            caller_func = caller_frame.f_code.co_name
+            # Extract just the file name, not full path
+            caller_file = Path(caller_file).name
+            caller_info = f"{caller_file}:{caller_line}:{caller_func}"
+
+        # Critical diagnostic log - shows WHO is calling and WHAT timeout
+        logger.warning(
+            f"MCP CALL → tool={tool_name}, phase={caller_info}, timeout={request_timeout}s",
+            tool=tool_name,
+            caller=caller_info,
+            timeout=request_timeout,
+            argument_keys=list(arguments.keys()) if isinstance(arguments, dict) else None,
+        )
 
     logger.debug(
         "MCP: Starting tool call",
@@ -315,7 +455,7 @@ async def call_tool(tool_name: str, arguments: dict[str, Any]) -> dict[str, Any]
         MCP_CALL_LOG.append(tool_name)
         logger.debug("MCP: Test mode - tool logged to MCP_CALL_LOG", tool=tool_name)
 
-    # Note: request_timeout already set above in diagnostic logging
+    # Note: request_timeout already set above
 
     # Instrument tool execution with tracing
     # Note: conversation_id and user_id are not available in call_tool signature,
@@ -362,14 +502,15 @@ async def call_tool(tool_name: str, arguments: dict[str, Any]) -> dict[str, Any]
                     payload_keys=["tool", "arguments"],
                 )
 
-                response = await client.post(
-                    endpoint,
-                    json={
-                        "tool": tool_name,
-                        "arguments": arguments,
-                    },
-                    timeout=request_timeout,
-                )
+                async with _tool_semaphore(tool_name):
+                    response = await client.post(
+                        endpoint,
+                        json={
+                            "tool": tool_name,
+                            "arguments": arguments,
+                        },
+                        timeout=request_timeout,
+                    )
 
                 logger.debug(
                     "MCP: HTTP response received",
@@ -674,3 +815,182 @@ async def call_tool(tool_name: str, arguments: dict[str, Any]) -> dict[str, Any]
         max_retries=max_retries,
     )
     raise MCPError("INTERNAL_ERROR", f"Unexpected error: tool call to {tool_name} completed without result or exception")
+
+
+def _batch_item_result(tool_name: str, item: Any) -> dict[str, Any] | MCPError:
+    """Convert one /mcp/tools/batch entry into a result or MCPError."""
+    if not isinstance(item, dict):
+        return MCPError("INVALID_RESPONSE", f"Malformed batch entry for {tool_name}")
+    if "error" in item:
+        error = item["error"] if isinstance(item["error"], dict) else {}
+        error_code = error.get("code", "UNKNOWN_ERROR")
+        error_message = error.get("message", "Unknown error")
+        logger.error(f"MCP tool error (batch): {tool_name} - {error_code}: {error_message}")
+        return MCPError(error_code, error_message)
+    if item.get("result") is None:
+        return MCPError("INVALID_RESPONSE", f"Missing 'result' field in MCP batch response for {tool_name}")
+    return item["result"]
+
+
+async def _call_tools_individually(calls: list[tuple[str, dict[str, Any]]]) -> list[dict[str, Any] | MCPError]:
+    """Run calls concurrently through call_tool (with its retries)."""
+
+    async def _one(tool_name: str, arguments: dict[str, Any]) -> dict[str, Any] | MCPError:
+        try:
+            return await call_tool(tool_name, arguments)
+        except MCPError as e:
+            return e
+
+    return list(await asyncio.gather(*(_one(tool_name, arguments) for tool_name, arguments in calls)))
+
+
+async def _post_batch(server_url: str, calls: list[tuple[str, dict[str, Any]]]) -> list[dict[str, Any] | MCPError]:
+    """Send calls to one server's /mcp/tools/batch endpoint.
+
+    Falls back to individual calls if the server does not implement the
+    batch endpoint (404/405); the server is then skipped for later batches.
+    """
+    endpoint = f"{server_url}/mcp/tools/batch"
+    request_timeout = max(TOOL_TIMEOUTS.get(tool_name, HTTP_TIMEOUT) for tool_name, _ in calls)
+    tool_names = sorted({tool_name for tool_name, _ in calls})
+
+    permits: dict[str, int] = {}
+    for tool_name, _ in calls:
+        permits[tool_name] = permits.get(tool_name, 0) + 1
+
+    try:
+        async with AsyncExitStack() as stack:
+            # One permit per call, as if the calls were sent individually
+            loop = asyncio.get_running_loop()
+            async with _batch_acquire_locks.setdefault(loop, asyncio.Lock()):
+                for tool_name in tool_names:
+                    semaphore = _tool_semaphore(tool_name)
+                    for _ in range(permits[tool_name]):
+                        await stack.enter_async_context(semaphore)
+            response = await _get_client().post(
+                endpoint,
+                json={"calls": [{"tool": tool_name, "arguments": arguments} for tool_name, arguments in calls]},
+                timeout=request_timeout,
+            )
+        if response.status_code in {404, 405}:
+            logger.info(f"[MCP] Batch endpoint not available on {server_url}; using individual calls")
+            MCP_BATCH_SERVERS.discard(server_url)
+            return await _call_tools_individually(calls)
+        # Log tool calls for testing (test-only, guarded by env var)
+        if os.getenv("MCP_TEST_MODE") == "1":
+            MCP_CALL_LOG.extend(tool_name for tool_name, _ in calls)
+        response.raise_for_status()
+        data = response.json()
+    except httpx.TimeoutException:
+        logger.error(f"[MCP] Batch call timed out: tools={tool_names}, timeout={request_timeout}s")
+        error = MCPError("TIMEOUT", f"Batch call to {tool_names} timed out (timeout: {request_timeout}s)")
+        return [error] * len(calls)
+    except httpx.HTTPStatusError as e:
+        logger.error(f"[MCP] Batch call HTTP error: tools={tool_names}, status={e.response.status_code}")
+        error = MCPError("HTTP_ERROR", f"HTTP {e.response.status_code} error calling batch {tool_names}")
+        return [error] * len(calls)
+    except httpx.RequestError as e:
+        logger.error(f"[MCP] Batch call request error: tools={tool_names}, error={e!s}")
+        error = MCPError("NETWORK_ERROR", f"Network error calling batch {tool_names}: {e!s}")
+        return [error] * len(calls)
+
+    if "error" in data:
+        error = data["error"]
+        logger.error(f"[MCP] Batch request rejected: {error}")
+        return [MCPError(error.get("code", "UNKNOWN_ERROR"), error.get("message", "Unknown error"))] * len(calls)
+
+    items = data.get("results")
+    if not isinstance(items, list) or len(items) != len(calls):
+        error = MCPError("INVALID_RESPONSE", f"Batch response does not match request ({len(calls)} calls)")
+        return [error] * len(calls)
+
+    record_mcp_success()
+    return [_batch_item_result(tool_name, item) for (tool_name, _), item in zip(calls, items, strict=True)]
+
+
+def _split_by_tool_limits(
+    server_url: str, indexes: list[int], calls: list[tuple[str, dict[str, Any]]]
+) -> list[tuple[str, list[int]]]:
+    """Split a server's calls into batches with at most a tool's concurrency limit of calls per tool."""
+    chunks: list[list[int]] = []
+    for index in indexes:
+        tool_name = calls[index][0]
+        chunk = next(
+            (c for c in chunks if sum(calls[i][0] == tool_name for i in c) < _tool_limit(tool_name)),
+            None,
+        )
+        if chunk is None:
+            chunks.append([index])
+        else:
+            chunk.append(index)
+    return [(server_url, chunk) for chunk in chunks]
+
+
+async def call_tools_batch(calls: list[tuple[str, dict[str, Any]]]) -> list[dict[str, Any] | MCPError]:
+    """Call several independent MCP tools with as few round trips as possible.
+
+    Reads prefetched for the turn are served from the prefetch. Calls routed
+    to a server with a batch endpoint are sent in one request and run
+    concurrently server-side; all other calls run concurrently through
+    call_tool(). Calls must not depend on each other's results or order.
+
+    Batched calls are not retried (a batch may contain non-idempotent tools).
+
+    Args:
+        calls: (tool_name, arguments) pairs
+
+    Returns:
+        One entry per call, in order: the tool result dict, or the MCPError
+        that call failed with (errors are returned, not raised)
+    """
+    results: list[dict[str, Any] | MCPError | None] = [None] * len(calls)
+    prefetched = _turn_prefetch.get() or {}
+    by_server: dict[str, list[int]] = {}
+    for index, (tool_name, arguments) in enumerate(calls):
+        server_url = MCP_TOOL_ROUTES.get(tool_name)
+        if server_url is None:
+            results[index] = MCPError("TOOL_NOT_FOUND", f"Tool '{tool_name}' not found in routing table")
+            continue
+        if tool_name in PREFETCHABLE_TOOLS and (result := prefetched.get(_prefetch_key(tool_name, arguments))) is not None:
+            results[index] = result
+            continue
+        if prefetched and tool_name not in PREFETCHABLE_TOOLS:
+            _invalidate_prefetch(prefetched, tool_name)
+        by_server.setdefault(server_url, []).append(index)
+
+    async def _run_group(server_url: str, indexes: list[int]) -> None:
+        group = [calls[index] for index in indexes]
+        if len(group) > 1 and server_url in MCP_BATCH_SERVERS:
+            group_results = await _post_batch(server_url, group)
+        else:
+            group_results = await _call_tools_individually(group)
+        for index, result in zip(indexes, group_results, strict=True):
+            results[index] = result
+
+    groups = [chunk for server_url, indexes in by_server.items() for chunk in _split_by_tool_limits(server_url, indexes, calls)]
+    with trace(name="tool.batch", metadata={"tools": ",".join(tool_name for tool_name, _ in calls)}):
+        await asyncio.gather(*(_run_group(server_url, indexes) for server_url, indexes in groups))
+
+    return results  # type: ignore[return-value]  # every slot is filled above
+
+
+async def prefetch_turn_tools(calls: list[tuple[str, dict[str, Any]]]) -> None:
+    """Start a turn by fetching its read-only tool results in one batch.
+
+    Replaces any previous turn's prefetch in this context. Later call_tool()
+    calls with identical arguments are served from the prefetch until a
+    non-read tool is called; failed reads are simply not prefetched.
+
+    Args:
+        calls: (tool_name, arguments) pairs of PREFETCHABLE_TOOLS
+    """
+    prefetched: dict[str, dict[str, Any]] = {}
+    _turn_prefetch.set(prefetched)
+    reads = [(tool_name, arguments) for tool_name, arguments in calls if tool_name in PREFETCHABLE_TOOLS]
+    if not reads:
+        return
+    for (tool_name, arguments), result in zip(reads, await call_tools_batch(reads), strict=True):
+        if isinstance(result, MCPError):
+            logger.debug(f"[MCP] Prefetch of {tool_name} failed ({result.code}); it will be fetched on use")
+            continue
+        prefetched[_prefetch_key(tool_name, arguments)] = result
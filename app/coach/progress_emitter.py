@@ -1,11 +1,13 @@
 """Progress emitter for plan generation.
 
 This module provides utilities for emitting progress events during plan generation.
-Progress events are stored as transient messages that can be updated/replaced.
+Progress events are stored as transient messages that can be updated/replaced,
+and published live for the streaming chat endpoint.
 """
 
 from loguru import logger
 
+from app.coach.chat_events import publish_chat_event
 from app.coach.conversation_store import ConversationStore
 from app.coach.progress import PlanProgressStage
 
@@ -60,6 +62,12 @@ async def emit_plan_progress(
         transient=True,
     )
 
+    publish_chat_event(
+        conversation_id,
+        "progress",
+        {"stage": stage.value, "message": message, "metadata": progress_metadata},
+    )
+
     logger.debug(
         "Plan progress emitted",
         conversation_id=conversation_id,
@@ -1,25 +1,26 @@
 """Unified prompt loader interface.
 
-This module provides a single interface for loading prompts that works in both
-local and deployed environments:
-- Local (APP_ENV=local): Reads directly from filesystem
-- Staging/Production (APP_ENV=staging|production): Uses MCP FS server
+This module provides a single interface for loading prompts. The source is
+selected by PROMPT_SOURCE:
+- registry (default): In-process prompt registry (loaded once, hot-reloaded
+  on file mtime change)
+- mcp: MCP FS server (remote, one HTTP call per load)
 
 All prompt loading should go through load_prompt() - never access prompts directly.
 """
 
 import os
-from pathlib import Path
 
 from loguru import logger
 
 from app.coach.mcp_client import MCPError, call_tool
+from app.coach.prompts.registry import get_prompt, get_prompt_hash
 
-APP_ENV = os.getenv("APP_ENV", "local")
+PROMPT_SOURCE = os.getenv("PROMPT_SOURCE", "registry")
 
 
 def _load_prompt_local(name: str) -> str:
-    """Load prompt from local filesystem (CLI/dev only).
+    """Load prompt from the in-process registry.
 
     Args:
         name: Prompt filename (e.g., "orchestrator.txt", "season_plan.txt")
@@ -28,23 +29,13 @@ def _load_prompt_local(name: str) -> str:
         Prompt content as string
 
     Raises:
-        RuntimeError: If called outside local environment
         FileNotFoundError: If prompt file doesn't exist
     """
-    if APP_ENV != "local":
-        raise RuntimeError("Local prompt loading forbidden outside local env")
-
-    prompt_dir = Path(__file__).parent
-    prompt_path = prompt_dir / name
-
-    if not prompt_path.exists():
-        raise FileNotFoundError(f"Local prompt not found: {prompt_path}")
-
-    return prompt_path.read_text(encoding="utf-8")
+    return get_prompt(name)
 
 
 async def _load_prompt_remote(name: str) -> str:
-    """Load prompt via MCP FS server (staging/production).
+    """Load prompt via MCP FS server (PROMPT_SOURCE=mcp).
 
     Args:
         name: Prompt filename (e.g., "orchestrator.txt", "season_plan.txt")
@@ -80,9 +71,9 @@ async def load_prompt(name: str) -> str:
     """Load a prompt file (unified interface).
 
     This is the ONLY function that should be used to load prompts.
-    It automatically selects the appropriate loading method based on APP_ENV:
-    - local: Reads from filesystem
-    - staging/production: Uses MCP FS server
+    It selects the loading method based on PROMPT_SOURCE:
+    - registry: In-process prompt registry (default)
+    - mcp: MCP FS server
 
     Args:
         name: Prompt filename (e.g., "orchestrator.txt", "season_plan.txt")
@@ -98,9 +89,25 @@ async def load_prompt(name: str) -> str:
         >>> prompt = await load_prompt("season_plan.txt")
         >>> orchestrator_prompt = await load_prompt("orchestrator.txt")
     """
-    mode = "local" if APP_ENV == "local" else "remote"
-    logger.info(f"Loading prompt '{name}' via {mode}")
-
-    if APP_ENV == "local":
+    if PROMPT_SOURCE != "mcp":
         return _load_prompt_local(name)
+
+    logger.info(f"Loading prompt '{name}' via mcp")
     return await _load_prompt_remote(name)
+
+
+def prompt_hash(name: str) -> str | None:
+    """Content hash of a prompt, for cache keys, tracing and reload checks.
+
+    Args:
+        name: Prompt filename
+
+    Returns:
+        Short sha256 digest, or None when prompts come from MCP or the file is missing
+    """
+    if PROMPT_SOURCE == "mcp":
+        return None
+    try:
+        return get_prompt_hash(name)
+    except FileNotFoundError:
+        return None
@@ -0,0 +1,175 @@
+"""In-process prompt registry.
+
+Loads every prompt file from the coach and planner prompt directories once
+and serves them from memory. Files are re-read only when their mtime
+changes (checked at most every RELOAD_CHECK_SECONDS per prompt), so prompt
+edits are picked up without a restart.
+
+Each prompt carries a content hash (sha256, shortened) for use in cache
+keys and trace metadata.
+
+Prompt names are filenames, e.g. "orchestrator.txt" or "macro_plan.txt";
+directories are searched in PROMPT_DIRS order.
+"""
+
+import hashlib
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from loguru import logger
+
+_APP_DIR = Path(__file__).parent.parent.parent
+PROMPT_DIRS: tuple[Path, ...] = (
+    _APP_DIR / "coach" / "prompts",
+    _APP_DIR / "planner" / "prompts",
+)
+PROMPT_SUFFIX = ".txt"
+
+# Minimum interval between mtime checks for one prompt
+RELOAD_CHECK_SECONDS = 1.0
+
+
+@dataclass(frozen=True)
+class PromptEntry:
+    """A loaded prompt file."""
+
+    name: str
+    path: Path
+    content: str
+    content_hash: str
+    mtime_ns: int
+
+
+def _read_entry(name: str, path: Path) -> PromptEntry:
+    stat = path.stat()
+    content = path.read_text(encoding="utf-8")
+    return PromptEntry(
+        name=name,
+        path=path,
+        content=content,
+        content_hash=hashlib.sha256(content.encode("utf-8")).hexdigest()[:16],
+        mtime_ns=stat.st_mtime_ns,
+    )
+
+
+class PromptRegistry:
+    """Thread-safe, mtime-reloading cache of prompt files."""
+
+    def __init__(self, prompt_dirs: tuple[Path, ...] = PROMPT_DIRS):
+        self.prompt_dirs = prompt_dirs
+        self._entries: dict[str, PromptEntry] = {}
+        self._checked_at: dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._loaded = False
+
+    def _load_all(self) -> None:
+        """Load all prompt files (first directory wins on duplicate names)."""
+        for prompt_dir in reversed(self.prompt_dirs):
+            if not prompt_dir.exists():
+                continue
+            for path in sorted(prompt_dir.glob(f"*{PROMPT_SUFFIX}")):
+                self._entries[path.name] = _read_entry(path.name, path)
+        now = time.monotonic()
+        self._checked_at = dict.fromkeys(self._entries, now)
+        self._loaded = True
+        logger.info(f"[PROMPTS] Loaded {len(self._entries)} prompts from {len(self.prompt_dirs)} directories")
+
+    def _find_path(self, name: str) -> Path | None:
+        for prompt_dir in self.prompt_dirs:
+            path = prompt_dir / name
+            if path.is_file():
+                return path
+        return None
+
+    def get(self, name: str) -> PromptEntry:
+        """Get a prompt, reloading it if the file changed on disk.
+
+        Args:
+            name: Prompt filename (e.g., "orchestrator.txt")
+
+        Returns:
+            Current PromptEntry
+
+        Raises:
+            FileNotFoundError: If no prompt with that name exists
+        """
+        if Path(name).name != name:
+            raise FileNotFoundError(f"Invalid prompt name: {name}")
+
+        with self._lock:
+            if not self._loaded:
+                self._load_all()
+
+            entry = self._entries.get(name)
+            now = time.monotonic()
+            if entry is not None and now - self._checked_at.get(name, 0.0) < RELOAD_CHECK_SECONDS:
+                return entry
+            self._checked_at[name] = now
+
+            if entry is None:
+                # Prompt file added after startup
+                path = self._find_path(name)
+                if path is None:
+                    raise FileNotFoundError(f"Prompt not found: {name}")
+                entry = _read_entry(name, path)
+                self._entries[name] = entry
+                return entry
+
+            try:
+                mtime_ns = entry.path.stat().st_mtime_ns
+            except FileNotFoundError:
+                # Deleted on disk: keep serving the last good version
+                logger.warning(f"[PROMPTS] Prompt file removed, serving cached copy: {entry.path}")
+                return entry
+            if mtime_ns != entry.mtime_ns:
+                entry = _read_entry(name, entry.path)
+                self._entries[name] = entry
+                logger.info(f"[PROMPTS] Reloaded {name} (hash={entry.content_hash})")
+            return entry
+
+    def clear(self) -> None:
+        """Drop all cached prompts (next access reloads from disk)."""
+        with self._lock:
+            self._entries.clear()
+            self._checked_at.clear()
+            self._loaded = False
+
+
+_registry = PromptRegistry()
+
+
+def get_prompt_registry() -> PromptRegistry:
+    """Get the process-wide prompt registry."""
+    return _registry
+
+
+def get_prompt(name: str) -> str:
+    """Get prompt content from the registry.
+
+    Args:
+        name: Prompt filename (e.g., "macro_plan.txt")
+
+    Returns:
+        Prompt content
+
+    Raises:
+        FileNotFoundError: If no prompt with that name exists
+    """
+    return _registry.get(name).content
+
+
+def get_prompt_hash(name: str) -> str:
+    """Get the content hash of a prompt (for cache keys and tracing).
+
+    Args:
+        name: Prompt filename
+
+    Returns:
+        Short sha256 hex digest of the prompt content
+
+    Raises:
+        FileNotFoundError: If no prompt with that name exists
+    """
+    return _registry.get(name).content_hash
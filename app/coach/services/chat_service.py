@@ -7,12 +7,20 @@ from datetime import datetime, timezone
 from loguru import logger
 from sqlalchemy import select
 
+from app.coach.agents.intent_router import model_turn, route_chat_turn
 from app.coach.agents.orchestrator_agent import run_conversation
 from app.coach.agents.orchestrator_deps import AthleteProfileData, CoachDeps, RaceProfileData, TrainingPreferencesData
 from app.coach.execution_guard import TurnExecutionGuard
 from app.coach.executor.action_executor import CoachActionExecutor
 from app.coach.executor.errors import ExecutionError, InvalidModificationSpecError, NoActionError, PersistenceError
-from app.coach.mcp_client import MCPError, call_tool, emit_progress_event_safe
+from app.coach.mcp_client import (
+    HISTORY_LOAD_LIMIT,
+    MCPError,
+    call_tool,
+    coach_turn_reads,
+    emit_progress_event_safe,
+    prefetch_turn_tools,
+)
 from app.coach.services.state_builder import build_athlete_state
 from app.coach.tools.cold_start import welcome_new_user
 from app.db.models import AthleteProfile, StravaAccount, UserSettings
@@ -78,6 +86,10 @@ async def process_coach_chat(
         conversation_id=conversation_id,
     )
 
+    # History, recent activities and this week's sessions in one MCP round trip
+    if athlete_id is not None:
+        await prefetch_turn_tools(coach_turn_reads(athlete_id, resolved_user_id))
+
     # Check if this is a cold start (empty history)
     history_empty = await _is_history_empty(athlete_id)
     logger.debug(
@@ -120,8 +132,8 @@ async def process_coach_chat(
             )
             return welcome_new_user(None)
 
-    # Fast-path: Handle simple activity acknowledgments
-    if _is_simple_acknowledgment(message):
+    # Fast-path: acknowledgments the intent router resolves need no model call
+    if route_chat_turn(message) is not None:
         logger.info(
             "Fast-path: Handling simple acknowledgment",
             conversation_id=conversation_id,
@@ -229,11 +241,12 @@ async def process_coach_chat(
     )
 
     # Get decision from orchestrator (pass conversation_id for slot persistence)
-    decision = await run_conversation(
-        user_input=message,
-        deps=deps,
-        conversation_id=conversation_id,
-    )
+    with model_turn():
+        decision = await run_conversation(
+            user_input=message,
+            deps=deps,
+            conversation_id=conversation_id,
+        )
 
     # CRITICAL: Emit planned events ONLY if action is EXECUTE
     # NO_ACTION must be pure - no side effects, no events, no DB writes
@@ -313,7 +326,8 @@ async def _is_history_empty(athlete_id: int | None = None) -> bool:
         return True
 
     try:
-        result = await call_tool("load_context", {"athlete_id": athlete_id, "limit": 1})
+        # Same arguments as the orchestrator's history load, so both use the turn prefetch
+        result = await call_tool("load_context", {"athlete_id": athlete_id, "limit": HISTORY_LOAD_LIMIT})
         messages = result.get("messages", [])
         return len(messages) == 0
     except Exception as e:
@@ -356,33 +370,6 @@ def _is_simple_greeting(message: str) -> bool:
     return False
 
 
-def _is_simple_acknowledgment(message: str) -> bool:
-    """Check if message is a simple acknowledgment that can be fast-pathed.
-
-    Args:
-        message: User message to check
-
-    Returns:
-        True if message is a simple acknowledgment
-    """
-    message_lower = message.lower().strip()
-    acknowledgments = [
-        "thanks",
-        "thank you",
-        "thx",
-        "ty",
-        "ok",
-        "okay",
-        "got it",
-        "sounds good",
-        "cool",
-        "nice",
-        "👍",
-        "👌",
-    ]
-    return message_lower in acknowledgments
-
-
 def dispatch_coach_chat(
     message: str,
     athlete_id: int,
@@ -429,7 +416,7 @@ def dispatch_coach_chat(
                 reply = welcome_new_user(None)
             return ("cold_start", reply)
 
-        if _is_simple_acknowledgment(message):
+        if route_chat_turn(message) is not None:
             return ("general", "Nice work 👍 Want feedback on recovery, pacing, or tomorrow's plan?")
 
         try:
@@ -519,11 +506,13 @@ def dispatch_coach_chat(
             execution_guard=execution_guard,
         )
 
-        decision = await run_conversation(
-            user_input=message,
-            deps=deps,
-            conversation_id=conversation_id,
-        )
+        await prefetch_turn_tools(coach_turn_reads(athlete_id, user_id))
+        with model_turn():
+            decision = await run_conversation(
+                user_input=message,
+                deps=deps,
+                conversation_id=conversation_id,
+            )
 
         if decision.action == "EXECUTE" and decision.action_plan:
             for step in decision.action_plan.steps:
@@ -3,44 +3,35 @@ from typing import Any
 
 from loguru import logger
 
-from app.coach.mcp_client import MCPError, call_tool
+from app.coach.mcp_client import RECENT_ACTIVITY_DAYS, MCPError, call_tools_batch
 from app.coach.schemas.athlete_state import AthleteState
 from app.coach.utils.llm_client import CoachLLMClient
 
 
-async def _get_recent_activities(user_id: str, days: int = 7) -> list[dict]:
-    """Get recent activities for a user via MCP.
+async def _get_recent_and_yesterday_activities(user_id: str, days: int = RECENT_ACTIVITY_DAYS) -> tuple[list[dict], list[dict]]:
+    """Get yesterday's and recent activities in one MCP batch call.
 
     Args:
         user_id: User ID (Clerk string)
-        days: Number of days to look back (default: 7)
+        days: Number of days to look back for recent activities (default: 7)
 
     Returns:
-        List of activity dictionaries, ordered by start_time (most recent first)
+        Tuple of (yesterday activities, recent activities); a failed call yields []
     """
-    try:
-        result = await call_tool("get_recent_activities", {"user_id": user_id, "days": days})
-        return result.get("activities", [])
-    except MCPError as e:
-        logger.error(f"Failed to get recent activities: {e.code}: {e.message}")
-        return []
-
-
-async def _get_yesterday_activities(user_id: str) -> list[dict]:
-    """Get activities from yesterday via MCP.
-
-    Args:
-        user_id: User ID (Clerk string)
-
-    Returns:
-        List of activity dictionaries from yesterday
-    """
-    try:
-        result = await call_tool("get_yesterday_activities", {"user_id": user_id})
-        return result.get("activities", [])
-    except MCPError as e:
-        logger.error(f"Failed to get yesterday activities: {e.code}: {e.message}")
-        return []
+    yesterday_result, recent_result = await call_tools_batch(
+        [
+            ("get_yesterday_activities", {"user_id": user_id}),
+            ("get_recent_activities", {"user_id": user_id, "days": days}),
+        ]
+    )
+    activities: list[list[dict]] = []
+    for label, result in (("yesterday", yesterday_result), ("recent", recent_result)):
+        if isinstance(result, MCPError):
+            logger.error(f"Failed to get {label} activities: {result.code}: {result.message}")
+            activities.append([])
+        else:
+            activities.append(result.get("activities", []))
+    return activities[0], activities[1]
 
 
 def _format_activity_summary(activity: dict) -> str:
@@ -214,8 +205,7 @@ async def recommend_next_session(state: AthleteState, user_id: str | None = None
     context_string = ""
     if user_id:
         try:
-            yesterday_activities = await _get_yesterday_activities(user_id)
-            recent_activities = await _get_recent_activities(user_id, days=7)
+            yesterday_activities, recent_activities = await _get_recent_and_yesterday_activities(user_id)
             context_string = _build_context_string(yesterday_activities, recent_activities)
             logger.info(f"Found {len(yesterday_activities)} activities yesterday, {len(recent_activities)} activities in last 7 days")
         except Exception as e:
@@ -7,6 +7,7 @@ It handles:
 - Parsing JSON responses
 - Validating against schemas and constraints
 - Retrying on failure (up to 2 retries)
+- Hedging slow requests within per-call-site latency budgets
 """
 
 import json
@@ -33,7 +34,10 @@ from app.core.constraints import (
     validate_season_plan,
     validate_weekly_intent,
 )
+from app.infra.llm.single_flight import coalesced
+from app.services.llm.hedging import LLMBudgetExceededError, hedged
 from app.services.llm.model import get_model
+from app.services.llm.telemetry import with_llm_call_site
 
 # Maximum retries for LLM calls
 MAX_RETRIES = 2
@@ -64,6 +68,11 @@ def _get_model():
     return get_model("openai", USER_FACING_MODEL)
 
 
+def _client_call_key(client: "CoachLLMClient", *args: Any, **kwargs: Any) -> tuple:
+    """Single-flight identity of a client call: model and inputs, not the instance."""
+    return getattr(client.model, "model_name", type(client.model).__name__), args, kwargs
+
+
 class CoachLLMClient:
     """Client for generating training intents via LLM.
 
@@ -72,12 +81,17 @@ class CoachLLMClient:
     - Invoking the LLM
     - Parsing and validating responses
     - Retrying on failure
+
+    Generation methods are single-flight: identical concurrent calls (same
+    model and inputs) share one LLM request, also across workers.
     """
 
     def __init__(self) -> None:
         """Initialize the client."""
         self.model = _get_model()
 
+    @coalesced("coach_llm.season_plan", key=_client_call_key)
+    @with_llm_call_site("coach.season_plan")
     async def generate_season_plan(self, context: dict[str, Any]) -> SeasonPlan:
         """Generate a season plan from LLM.
 
@@ -117,7 +131,9 @@ class CoachLLMClient:
                     user_prompt=user_prompt,
                     attempt=attempt + 1,
                 )
-                result = await agent.run(user_prompt)
+                result = await hedged(
+                    "coach.season_plan", lambda model, prompt=user_prompt: agent.run(prompt, model=model), self.model
+                )
 
                 # Validate against constraints
                 errors = validate_season_plan(result.output)
@@ -142,12 +158,14 @@ class CoachLLMClient:
                 raise ValueError(f"Season plan parsing failed after {MAX_RETRIES + 1} attempts: {e}") from e
             except Exception as e:
                 logger.exception("Error generating season plan")
-                if attempt < MAX_RETRIES:
+                if attempt < MAX_RETRIES and not isinstance(e, LLMBudgetExceededError):
                     continue
                 raise RuntimeError(f"Failed to generate season plan: {type(e).__name__}: {e}") from e
 
         raise RuntimeError("Failed to generate season plan after all retries")
 
+    @coalesced("coach_llm.weekly_intent", key=_client_call_key)
+    @with_llm_call_site("coach.weekly_intent")
     async def generate_weekly_intent(
         self,
         context: dict[str, Any],
@@ -192,7 +210,9 @@ class CoachLLMClient:
                     user_prompt=user_prompt,
                     attempt=attempt + 1,
                 )
-                result = await agent.run(user_prompt)
+                result = await hedged(
+                    "coach.weekly_intent", lambda model, prompt=user_prompt: agent.run(prompt, model=model), self.model
+                )
 
                 # Validate against constraints
                 errors = validate_weekly_intent(result.output, previous_volume)
@@ -217,12 +237,14 @@ class CoachLLMClient:
                 raise ValueError(f"Weekly intent parsing failed after {MAX_RETRIES + 1} attempts: {e}") from e
             except Exception as e:
                 logger.exception("Error generating weekly intent")
-                if attempt < MAX_RETRIES:
+                if attempt < MAX_RETRIES and not isinstance(e, LLMBudgetExceededError):
                     continue
                 raise RuntimeError(f"Failed to generate weekly intent: {type(e).__name__}: {e}") from e
 
         raise RuntimeError("Failed to generate weekly intent after all retries")
 
+    @coalesced("coach_llm.daily_decision", key=_client_call_key)
+    @with_llm_call_site("coach.daily_decision")
     async def generate_daily_decision(self, context: dict[str, Any]) -> DailyDecision:
         """Generate a daily decision from LLM.
 
@@ -263,7 +285,9 @@ class CoachLLMClient:
                     user_prompt=user_prompt,
                     attempt=attempt + 1,
                 )
-                result = await agent.run(user_prompt)
+                result = await hedged(
+                    "coach.daily_decision", lambda model, prompt=user_prompt: agent.run(prompt, model=model), self.model
+                )
 
                 # Validate against constraints
                 errors = validate_daily_decision(result.output)
@@ -292,12 +316,14 @@ class CoachLLMClient:
                 raise ValueError(f"Daily decision parsing failed after {MAX_RETRIES + 1} attempts: {e}") from e
             except Exception as e:
                 logger.exception(f"[DAILY_DECISION] LLM call error: {type(e).__name__}: {e}")
-                if attempt < MAX_RETRIES:
+                if attempt < MAX_RETRIES and not isinstance(e, LLMBudgetExceededError):
                     continue
                 raise RuntimeError(f"Failed to generate daily decision: {type(e).__name__}: {e}") from e
 
         raise RuntimeError("[DAILY_DECISION] Failed to generate daily decision after all retries")
 
+    @coalesced("coach_llm.weekly_report", key=_client_call_key)
+    @with_llm_call_site("coach.weekly_report")
     async def generate_weekly_report(self, context: dict[str, Any]) -> WeeklyReport:
         """Generate a weekly report from LLM.
 
@@ -337,7 +363,9 @@ class CoachLLMClient:
                     user_prompt=user_prompt,
                     attempt=attempt + 1,
                 )
-                result = await agent.run(user_prompt)
+                result = await hedged(
+                    "coach.weekly_report", lambda model, prompt=user_prompt: agent.run(prompt, model=model), self.model
+                )
 
                 # Basic validation (schema validation is handled by pydantic)
                 if not result.output.week_summary or len(result.output.week_summary) < 100:
@@ -361,12 +389,14 @@ class CoachLLMClient:
                 raise ValueError(f"Weekly report parsing failed after {MAX_RETRIES + 1} attempts: {e}") from e
             except Exception as e:
                 logger.exception("Error generating weekly report")
-                if attempt < MAX_RETRIES:
+                if attempt < MAX_RETRIES and not isinstance(e, LLMBudgetExceededError):
                     continue
                 raise RuntimeError(f"Failed to generate weekly report: {type(e).__name__}: {e}") from e
 
         raise RuntimeError("Failed to generate weekly report after all retries")
 
+    @coalesced("coach_llm.weekly_coach_summary", key=_client_call_key)
+    @with_llm_call_site("coach.weekly_summary")
     async def generate_weekly_coach_summary(self, context: dict[str, Any]) -> str:
         """Generate a brief weekly coach summary from LLM.
 
@@ -410,7 +440,9 @@ class CoachLLMClient:
                     user_prompt=user_prompt,
                     attempt=attempt + 1,
                 )
-                result = await agent.run(user_prompt)
+                result = await hedged(
+                    "coach.weekly_summary", lambda model, prompt=user_prompt: agent.run(prompt, model=model), self.model
+                )
 
                 # Validate summary length
                 summary = result.output.summary
@@ -451,7 +483,7 @@ class CoachLLMClient:
                 ) from e
             except Exception as e:
                 logger.exception("Error generating weekly coach summary")
-                if attempt < MAX_RETRIES:
+                if attempt < MAX_RETRIES and not isinstance(e, LLMBudgetExceededError):
                     continue
                 raise RuntimeError(
                     f"Failed to generate weekly coach summary: {type(e).__name__}: {e}"
@@ -459,6 +491,8 @@ class CoachLLMClient:
 
         raise RuntimeError("Failed to generate weekly coach summary after all retries")
 
+    @coalesced("coach_llm.text_feedback", key=_client_call_key)
+    @with_llm_call_site("coach.text_feedback")
     async def generate_text_feedback(self, prompt: str) -> str:
         """Generate simple text feedback (no structured output).
 
@@ -479,7 +513,11 @@ class CoachLLMClient:
         )
 
         try:
-            result = await agent.run("Generate feedback based on the provided context.")
+            result = await hedged(
+                "coach.text_feedback",
+                lambda model: agent.run("Generate feedback based on the provided context.", model=model),
+                self.model,
+            )
             # Extract text from result
             if hasattr(result, "output"):
                 if isinstance(result.output, str):
@@ -701,6 +739,8 @@ class CoachLLMClient:
         )
         return None
 
+    @coalesced("coach_llm.training_plan", key=_client_call_key)
+    @with_llm_call_site("coach.training_plan")
     async def generate_training_plan_via_llm(
         self,
         *,
@@ -812,7 +852,9 @@ class CoachLLMClient:
                     context_length=len(context_str),
                 )
                 t2_start = time.monotonic()
-                result = await agent.run(user_prompt)
+                result = await hedged(
+                    "coach.training_plan", lambda model, prompt=user_prompt: agent.run(prompt, model=model), self.model
+                )
                 t2 = time.monotonic()
                 llm_generate_time = t2 - t2_start
                 logger.info(f"[PLAN] llm_generate={llm_generate_time:.1f}s")
@@ -972,7 +1014,7 @@ class CoachLLMClient:
                     will_retry=attempt < MAX_RETRIES,
                 )
                 logger.exception("Error generating training plan")
-                if attempt < MAX_RETRIES:
+                if attempt < MAX_RETRIES and not isinstance(e, LLMBudgetExceededError):
                     logger.debug(
                         "llm_client: Retrying after exception",
                         attempt=attempt + 1,
@@ -66,6 +66,16 @@ class Settings(BaseSettings):
         validation_alias="DATABASE_URL",
     )
     redis_url: str = Field(default="redis://localhost:6379/0", validation_alias="REDIS_URL")
+    redis_max_connections: int = Field(
+        default=50,
+        validation_alias="REDIS_MAX_CONNECTIONS",
+        description="Max connections in the shared Redis pool (per process, per flavor)",
+    )
+    redis_socket_timeout_seconds: float = Field(
+        default=1.0,
+        validation_alias="REDIS_SOCKET_TIMEOUT_SECONDS",
+        description="Connect/read timeout for shared Redis pool connections (seconds)",
+    )
     openai_api_key: str = Field(default="", validation_alias="OPENAI_API_KEY")
     user_ui_enabled: bool = Field(default=False, validation_alias="USER_UI_ENABLED")
     dev_user_id: str = Field(default="", validation_alias="DEV_USER_ID")
@@ -106,6 +116,156 @@ class Settings(BaseSettings):
         validation_alias="ENABLE_PROGRESS_EVENTS",
         description="Enable progress event emission (default: false for production stability)",
     )
+    response_cache_enabled: bool = Field(
+        default=True,
+        validation_alias="RESPONSE_CACHE_ENABLED",
+        description="Enable ETags and Redis response caching for polled calendar/overview endpoints",
+    )
+    response_cache_ttl_seconds: int = Field(
+        default=60,
+        validation_alias="RESPONSE_CACHE_TTL_SECONDS",
+        description="TTL for cached serialized responses (seconds)",
+    )
+    llm_output_cache_enabled: bool = Field(
+        default=True,
+        validation_alias="LLM_OUTPUT_CACHE_ENABLED",
+        description="Enable the content-addressed cache for validated LLM outputs (session text)",
+    )
+    llm_output_cache_ttl_seconds: int = Field(
+        default=30 * 24 * 60 * 60,
+        validation_alias="LLM_OUTPUT_CACHE_TTL_SECONDS",
+        description="TTL for cached LLM outputs in Redis and on disk (seconds)",
+    )
+    llm_output_cache_dir: str = Field(
+        default="",
+        validation_alias="LLM_OUTPUT_CACHE_DIR",
+        description="Directory for the local disk tier (empty: system temp dir)",
+    )
+    llm_output_cache_max_disk_entries: int = Field(
+        default=5000,
+        validation_alias="LLM_OUTPUT_CACHE_MAX_DISK_ENTRIES",
+        description="Max entries in the disk tier before least-recently-used entries are evicted",
+    )
+    session_text_batch_enabled: bool = Field(
+        default=True,
+        validation_alias="SESSION_TEXT_BATCH_ENABLED",
+        description="Generate a week's session texts in one LLM request during plan creation (per-session calls otherwise)",
+    )
+    daily_decision_batch_concurrency: int = Field(
+        default=8,
+        validation_alias="DAILY_DECISION_BATCH_CONCURRENCY",
+        description="Users processed concurrently by the overnight daily-decision batch",
+    )
+    daily_decision_batch_llm_per_minute: int = Field(
+        default=60,
+        validation_alias="DAILY_DECISION_BATCH_LLM_PER_MINUTE",
+        description="Max daily-decision LLM generations started per minute by the overnight batch (0: unlimited)",
+    )
+    bio_regeneration_batch_size: int = Field(
+        default=100,
+        validation_alias="BIO_REGENERATION_BATCH_SIZE",
+        description="Max stale athlete bios regenerated per background pass",
+    )
+    bio_regeneration_concurrency: int = Field(
+        default=4,
+        validation_alias="BIO_REGENERATION_CONCURRENCY",
+        description="Athlete bios generated concurrently by the background regeneration pass",
+    )
+    llm_single_flight_enabled: bool = Field(
+        default=True,
+        validation_alias="LLM_SINGLE_FLIGHT_ENABLED",
+        description="Coalesce identical concurrent LLM calls into one in-flight request (in-process and across workers)",
+    )
+    llm_single_flight_lock_seconds: int = Field(
+        default=120,
+        validation_alias="LLM_SINGLE_FLIGHT_LOCK_SECONDS",
+        description="TTL of the cross-worker single-flight lock; bounds how long other workers wait for the leader",
+    )
+    llm_single_flight_result_ttl_seconds: int = Field(
+        default=30,
+        validation_alias="LLM_SINGLE_FLIGHT_RESULT_TTL_SECONDS",
+        description="How long a finished call's result stays available in Redis for waiting workers",
+    )
+    llm_concurrency_initial: int = Field(
+        default=8,
+        validation_alias="LLM_CONCURRENCY_INITIAL",
+        description="Starting process-wide limit of concurrent LLM requests (adapts between min and max)",
+    )
+    llm_concurrency_min: int = Field(
+        default=2,
+        validation_alias="LLM_CONCURRENCY_MIN",
+        description="Floor of the adaptive LLM concurrency limit",
+    )
+    llm_concurrency_max: int = Field(
+        default=32,
+        validation_alias="LLM_CONCURRENCY_MAX",
+        description="Ceiling of the adaptive LLM concurrency limit",
+    )
+    llm_latency_target_seconds: float = Field(
+        default=20.0,
+        validation_alias="LLM_LATENCY_TARGET_SECONDS",
+        description="LLM requests slower than this shrink the concurrency limit",
+    )
+    llm_concurrency_cooldown_seconds: float = Field(
+        default=5.0,
+        validation_alias="LLM_CONCURRENCY_COOLDOWN_SECONDS",
+        description="Minimum time between two decreases of the LLM concurrency limit",
+    )
+    llm_hedging_enabled: bool = Field(
+        default=True,
+        validation_alias="LLM_HEDGING_ENABLED",
+        description="Send a hedged request when a user-facing LLM call is slower than its call site's p95 (within latency budgets)",
+    )
+    llm_hedge_model: str = Field(
+        default="",
+        validation_alias="LLM_HEDGE_MODEL",
+        description="Model or deployment for hedged requests (empty: same model as the primary request)",
+    )
+    llm_http_max_connections: int = Field(
+        default=100,
+        validation_alias="LLM_HTTP_MAX_CONNECTIONS",
+        description="Max connections of the shared HTTP transport used by model and embedding clients",
+    )
+    llm_http_max_keepalive_connections: int = Field(
+        default=20,
+        validation_alias="LLM_HTTP_MAX_KEEPALIVE_CONNECTIONS",
+        description="Max idle keep-alive connections kept by the shared model HTTP transport",
+    )
+    intent_router_enabled: bool = Field(
+        default=True,
+        validation_alias="INTENT_ROUTER_ENABLED",
+        description="Classify clear-cut chat turns with rules and example matching before calling the LLM classifier",
+    )
+    intent_router_min_similarity: float = Field(
+        default=0.8,
+        validation_alias="INTENT_ROUTER_MIN_SIMILARITY",
+        description="Minimum cosine similarity to a labeled example for the intent router to skip the LLM classifier",
+    )
+    context_assembly_max_workers: int = Field(
+        default=4,
+        validation_alias="CONTEXT_ASSEMBLY_MAX_WORKERS",
+        description="Threads fetching context sources concurrently (shared across builders; bounds DB connections used)",
+    )
+    mcp_client_diagnostics_enabled: bool = Field(
+        default=True,
+        validation_alias="MCP_CLIENT_DIAGNOSTICS_ENABLED",
+        description="Log caller frame and timeout at WARNING level on every MCP tool call",
+    )
+    mcp_client_max_connections: int = Field(
+        default=20,
+        validation_alias="MCP_CLIENT_MAX_CONNECTIONS",
+        description="Max pooled connections from the MCP client to each MCP server",
+    )
+    mcp_client_max_keepalive_connections: int = Field(
+        default=10,
+        validation_alias="MCP_CLIENT_MAX_KEEPALIVE_CONNECTIONS",
+        description="Max idle keep-alive connections kept by the MCP client",
+    )
+    mcp_client_http2: bool = Field(
+        default=True,
+        validation_alias="MCP_CLIENT_HTTP2",
+        description="Use HTTP/2 for MCP calls",
+    )
     workout_notes_parsing_enabled: bool = Field(
         default=False,
         validation_alias="WORKOUT_NOTES_PARSING_ENABLED",
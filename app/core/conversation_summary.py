@@ -26,13 +26,13 @@ from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from app.coach.config.models import USER_FACING_MODEL
-from app.config.settings import settings
 from app.core.conversation_ownership import get_conversation_owner
 from app.core.memory_compactor import compact_conversation_memory
 from app.core.memory_metrics import increment_memory_counter
 from app.core.message import Message
 from app.core.redis_conversation_store import get_recent_messages
-from app.core.token_counting import count_tokens
+from app.core.redis_pool import get_redis
+from app.core.token_counting import count_tokens, count_tokens_batch
 from app.db.models import (
     Conversation,
     ConversationMessage,
@@ -338,6 +338,21 @@ def _get_messages_since_last_summary(
                 query = query.where(ConversationMessage.ts > last_summary_timestamp)
             query = query.order_by(ConversationMessage.ts).limit(100)
             db_messages = db.execute(query).scalars().all()
+
+            # Legacy rows stored without a token count are counted in one batch
+            uncounted = [m for m in db_messages if m.tokens is None and m.role in {"user", "assistant", "system"} and m.content]
+            backfilled_tokens: dict[str, int] = {}
+            if uncounted:
+                try:
+                    counts = count_tokens_batch(
+                        [(m.role, m.content) for m in uncounted],
+                        conversation_id=conversation_id,
+                        user_id=uncounted[0].user_id or "unknown",
+                    )
+                    backfilled_tokens = {m.id: tokens for m, tokens in zip(uncounted, counts, strict=True)}
+                except ValueError as e:
+                    logger.warning(f"Token backfill failed, skipping uncounted messages: {e}", conversation_id=conversation_id)
+
             messages = []
             for db_msg in db_messages:
                 try:
@@ -370,7 +385,8 @@ def _get_messages_since_last_summary(
                         )
                         continue
 
-                    if db_msg.tokens is None:
+                    tokens = db_msg.tokens if db_msg.tokens is not None else backfilled_tokens.get(db_msg.id)
+                    if tokens is None:
                         logger.warning(
                             "Missing tokens in ConversationMessage, skipping",
                             conversation_id=conversation_id,
@@ -389,7 +405,7 @@ def _get_messages_since_last_summary(
                         role=role,
                         content=db_msg.content,
                         ts=ts_str,
-                        tokens=db_msg.tokens,
+                        tokens=tokens,
                         metadata=db_msg.message_metadata or {},
                     )
                     messages.append(msg)
@@ -424,7 +440,7 @@ def _get_redis_client() -> redis.Redis:
     Returns:
         Redis client with string decoding enabled
     """
-    return redis.from_url(settings.redis_url, decode_responses=True)
+    return get_redis()
 
 
 def _get_summary_redis_key(conversation_id: str) -> str:
@@ -0,0 +1,151 @@
+"""Per-user data version used for conditional GETs and response caching.
+
+Each user has a monotonically increasing counter in Redis. It is bumped after
+any transaction that writes data the polled read endpoints depend on:
+activity ingest, planned-session writes and pairing, metric recompute,
+decision writes and sync-status updates.
+
+Writes through the ORM are picked up automatically by SQLAlchemy session
+hooks (register_data_version_listeners). Raw-SQL writers call
+bump_data_version() themselves.
+
+If Redis is unavailable get_data_version() returns None and callers must
+fall back to serving uncached responses.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+import redis
+from loguru import logger
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.redis_pool import get_redis
+from app.db.models import (
+    Activity,
+    CalendarReconciliation,
+    CalendarWeekSummary,
+    DailyDecision,
+    DailyTrainingLoad,
+    PlannedSession,
+    SessionLink,
+    StravaAccount,
+    User,
+    WeeklyTrainingSummary,
+    WorkoutExecutionSummary,
+)
+
+# Models whose writes change what /calendar/* and /me/* return.
+# CoachFeedback is deliberately absent: /calendar/today writes it while building
+# the very response being cached, and tracking it would invalidate every poll.
+# The calendar's materialized rows are written by background refreshes after the
+# triggering commit, so they bump the version a second time once they land.
+TRACKED_MODELS: tuple[type, ...] = (
+    Activity,
+    PlannedSession,
+    SessionLink,
+    CalendarReconciliation,
+    CalendarWeekSummary,
+    WorkoutExecutionSummary,
+    DailyTrainingLoad,
+    WeeklyTrainingSummary,
+    DailyDecision,
+    StravaAccount,
+    User,
+)
+
+_CHANGED_KEY = "data_version_changed_users"
+
+_listeners_registered = False
+
+
+def _get_redis_client() -> redis.Redis:
+    """Get the shared Redis client.
+
+    Returns:
+        Redis client with string decoding enabled
+    """
+    return get_redis()
+
+
+def _version_key(user_id: str) -> str:
+    return f"user:{user_id}:data_version"
+
+
+def get_data_version(user_id: str) -> int | None:
+    """Current data version for a user.
+
+    Args:
+        user_id: User ID
+
+    Returns:
+        Version number (0 if never bumped), or None if Redis is unavailable
+    """
+    try:
+        value = _get_redis_client().get(_version_key(user_id))
+    except redis.RedisError as e:
+        logger.debug(f"[DATA_VERSION] Redis unavailable reading version for user_id={user_id}: {e!r}")
+        return None
+    return int(value) if value is not None else 0
+
+
+def bump_data_version(user_ids: Iterable[str]) -> None:
+    """Increment the data version for each user.
+
+    Args:
+        user_ids: Users whose data changed
+    """
+    ids = sorted({str(uid) for uid in user_ids if uid})
+    if not ids:
+        return
+    try:
+        pipe = _get_redis_client().pipeline(transaction=False)
+        for user_id in ids:
+            pipe.incr(_version_key(user_id))
+        pipe.execute()
+    except redis.RedisError as e:
+        logger.warning(f"[DATA_VERSION] Failed to bump data version for {len(ids)} users: {e!r}")
+
+
+def _owner_id(obj: object) -> str | None:
+    if isinstance(obj, User):
+        return str(obj.id) if obj.id else None
+    user_id = getattr(obj, "user_id", None)
+    return str(user_id) if user_id else None
+
+
+def _collect_changed(session: Session, _flush_context: object) -> None:
+    """after_flush hook: remember which users had tracked rows written."""
+    changed: set[str] = session.info.setdefault(_CHANGED_KEY, set())
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(obj, TRACKED_MODELS) and (user_id := _owner_id(obj)):
+            changed.add(user_id)
+
+
+def _bump_changed(session: Session) -> None:
+    """after_commit hook: bump versions for users written in the transaction."""
+    changed = session.info.pop(_CHANGED_KEY, None)
+    if changed:
+        bump_data_version(changed)
+
+
+def _discard_changed(session: Session, _previous_transaction: object) -> None:
+    """after_soft_rollback hook: nothing was written."""
+    session.info.pop(_CHANGED_KEY, None)
+
+
+def register_data_version_listeners() -> None:
+    """Register session hooks that bump per-user data versions on commit.
+
+    Idempotent. Called once at application startup.
+    """
+    global _listeners_registered
+    if _listeners_registered:
+        return
+    event.listen(Session, "after_flush", _collect_changed)
+    event.listen(Session, "after_commit", _bump_changed)
+    event.listen(Session, "after_soft_rollback", _discard_changed)
+    _listeners_registered = True
+    logger.info("[DATA_VERSION] Registered per-user data version write hooks")
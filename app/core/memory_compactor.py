@@ -12,45 +12,22 @@ Core invariants:
 6. Compaction is idempotent
 """
 
-import json
 from datetime import datetime, timezone
 
 import redis
 from loguru import logger
 
-from app.config.settings import settings
 from app.core.memory_config import SUMMARY_CONTEXT_TURNS, SUMMARY_SYSTEM_ROLE
 from app.core.memory_metrics import increment_memory_counter
 from app.core.message import Message
 from app.core.redis_conversation_store import (
-    CONVERSATION_TTL_SECONDS,
     MAX_CONVERSATION_MESSAGES,
     get_recent_messages,
+    replace_messages,
 )
 from app.core.token_counting import count_tokens
 
 
-def _get_redis_client() -> redis.Redis:
-    """Get Redis client instance.
-
-    Returns:
-        Redis client with string decoding enabled
-    """
-    return redis.from_url(settings.redis_url, decode_responses=True)
-
-
-def _get_redis_key(conversation_id: str) -> str:
-    """Construct Redis key for conversation messages.
-
-    Args:
-        conversation_id: Conversation ID
-
-    Returns:
-        Redis key string
-    """
-    return f"conversation:{conversation_id}:messages"
-
-
 def _render_summary_text(summary: dict) -> str:
     """Render summary dictionary as human-readable text.
 
@@ -188,9 +165,6 @@ def compact_conversation_memory(
         summary_created_at: Timestamp when summary was created
     """
     try:
-        redis_client = _get_redis_client()
-        key = _get_redis_key(conversation_id)
-
         # Step 1: Read Redis history (read-only, no TTL refresh)
         messages = get_recent_messages(conversation_id, limit=MAX_CONVERSATION_MESSAGES)
 
@@ -262,11 +236,7 @@ def compact_conversation_memory(
         compacted_messages = [summary_message, *last_turns]
         messages_after = len(compacted_messages)
 
-        pipeline = redis_client.pipeline()
-        pipeline.delete(key)
-        pipeline.rpush(key, *[json.dumps(m.model_dump()) for m in compacted_messages])
-        pipeline.expire(key, CONVERSATION_TTL_SECONDS)
-        pipeline.execute()
+        replace_messages(conversation_id, compacted_messages)
 
         logger.info(
             "memory_compacted",
@@ -20,6 +20,7 @@ from loguru import logger
 from app.core.memory_metrics import MemoryMetrics, log_memory_metrics
 from app.core.message import Message
 from app.core.prompt_history import extract_summary_version, get_prompt_history, has_summary
+from app.core.redis_conversation_store import get_conversation_tokens
 from app.core.summarization_config import (
     MAX_HISTORY_MESSAGES_BEFORE_SUMMARY,
     MAX_HISTORY_TOKENS_BEFORE_SUMMARY,
@@ -30,6 +31,7 @@ from app.core.summarization_trigger import (
     should_trigger_summarization,
 )
 from app.core.token_counting import count_tokens
+from app.core.token_guard import LLMMessage as GuardMessage
 from app.core.token_guard import enforce_token_limit
 
 
@@ -100,8 +102,10 @@ def build_prompt(
     # This happens after history retrieval but before prompt building
     # Trigger is checked based on objective thresholds (tokens, messages)
     if history_messages:
-        # Calculate history metrics
-        history_tokens = sum(msg.tokens for msg in history_messages)
+        # Calculate history metrics (running Redis total; O(1) per turn)
+        history_tokens = get_conversation_tokens(conversation_id)
+        if history_tokens is None:
+            history_tokens = sum(msg.tokens for msg in history_messages)
         history_message_count = len(history_messages)
         messages_since_last_summary = count_messages_since_last_summary(history_messages)
 
@@ -127,39 +131,39 @@ def build_prompt(
                 messages_since_last_summary=messages_since_last_summary,
             )
 
-            # Enqueue summarization asynchronously (non-blocking)
-            # B34 will implement the actual summarization logic
+            # Enqueue summarization for the background worker (non-blocking, deduplicated)
             enqueue_conversation_summary(conversation_id)
 
     # Step 3: Convert canonical Messages → LLM messages
     # Preserve ordering, preserve role exactly
     # Map Message.role → LLMMessage.role
     # Map Message.content → LLMMessage.content
-    # Ignore metadata, timestamps, tokens
-    llm_history: list[LLMMessage] = [
+    # Carry Message.tokens so the token guard does not recount history
+    # Ignore metadata, timestamps
+    llm_history: list[GuardMessage] = [
         {
             "role": msg.role,  # Already validated as "user"|"assistant"|"system"
             "content": msg.content,
+            "tokens": msg.tokens,
         }
         for msg in history_messages
     ]
 
     # Step 4: Append current user message last
-    current_llm_message: LLMMessage = {
+    current_llm_message: GuardMessage = {
         "role": current_user_message.role,
         "content": current_user_message.content,
+        "tokens": current_user_message.tokens,
     }
 
-    # Assemble final prompt
-    prompt: list[LLMMessage] = [system_message, *llm_history, current_llm_message]
-
     # Step 5: Enforce token limit with deterministic truncation (B32)
     # This ensures no LLM call can exceed token limits
-    prompt, truncation_meta = enforce_token_limit(
-        prompt,
+    guarded, truncation_meta = enforce_token_limit(
+        [system_message, *llm_history, current_llm_message],
         conversation_id=conversation_id,
         user_id=current_user_message.user_id,
     )
+    prompt: list[LLMMessage] = [{"role": msg["role"], "content": msg["content"]} for msg in guarded]
 
     # Step 6: Logging & observability (B37)
     roles_sequence = [msg["role"] for msg in prompt]
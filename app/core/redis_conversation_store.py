@@ -8,6 +8,17 @@ in strict order (oldest → newest).
 
 B26: Rolling window of normalized messages per conversation_id in Redis.
 B28: Sliding window enforcement - Redis contains at most N most-recent messages per conversation.
+
+Storage format: each list entry is a compact JSON array
+    ["m1", role, content, ts, tokens, user_id, metadata?]
+(conversation_id is implied by the key). Entries were validated when they
+were normalized, so reads rebuild Messages without re-running validators.
+Legacy entries (full Message JSON objects) are still read.
+
+Token accounting: conversation:{id}:tokens holds the running token total of
+the stored window, maintained on every append/eviction, so budget checks
+(summarization triggers, admin metrics) read one integer instead of loading
+and summing the history.
 """
 
 import inspect
@@ -16,8 +27,8 @@ import json
 import redis
 from loguru import logger
 
-from app.config.settings import settings
 from app.core.message import Message
+from app.core.redis_pool import get_redis
 
 # Maximum number of messages to keep in Redis per conversation (B28)
 # This enforces a strict sliding window with oldest-turn eviction
@@ -28,13 +39,17 @@ MAX_CONVERSATION_MESSAGES = 50
 CONVERSATION_TTL_SECONDS = 86400
 
 
+# Version tag of the compact list-entry encoding
+_COMPACT_TAG = "m1"
+
+
 def _get_redis_client() -> redis.Redis:
     """Get Redis client instance.
 
     Returns:
-        Redis client with string decoding enabled
+        Shared Redis client with string decoding enabled
     """
-    return redis.from_url(settings.redis_url, decode_responses=True)
+    return get_redis()
 
 
 def _get_redis_key(conversation_id: str) -> str:
@@ -49,32 +64,77 @@ def _get_redis_key(conversation_id: str) -> str:
     return f"conversation:{conversation_id}:messages"
 
 
+def _get_tokens_key(conversation_id: str) -> str:
+    """Redis key for a conversation's running token total."""
+    return f"conversation:{conversation_id}:tokens"
+
+
+def _entry_tokens(message_json: str | None) -> int:
+    """Token count stored in a list entry (0 if missing or unreadable)."""
+    if not message_json:
+        return 0
+    try:
+        data = json.loads(message_json)
+        tokens = data[4] if isinstance(data, list) else data.get("tokens")
+        return int(tokens or 0)
+    except (ValueError, TypeError, IndexError, AttributeError):
+        return 0
+
+
 def _serialize_message(message: Message) -> str:
-    """Serialize Message to JSON string.
+    """Serialize Message to its compact list-entry encoding.
 
     Args:
         message: Normalized Message object
 
     Returns:
-        JSON string representation
+        Compact JSON array string
+    """
+    fields: list = [_COMPACT_TAG, message.role, message.content, message.ts, message.tokens, message.user_id]
+    if message.metadata:
+        fields.append(message.metadata)
+    return json.dumps(fields, ensure_ascii=False, separators=(",", ":"))
+
+
+def _message_from_compact(data: list, conversation_id: str | None) -> Message:
+    """Rebuild a Message from a decoded compact entry (no validation).
+
+    Raises:
+        ValueError: If the entry is not a compact message entry
     """
-    return message.model_dump_json()
+    if len(data) < 6 or data[0] != _COMPACT_TAG or conversation_id is None:
+        raise ValueError(f"Unrecognized compact message entry: {json.dumps(data)[:40]}")
+    return Message.model_construct(
+        conversation_id=conversation_id,
+        user_id=data[5],
+        role=data[1],
+        content=data[2],
+        ts=data[3],
+        tokens=data[4],
+        metadata=data[6] if len(data) > 6 else {},
+    )
 
 
-def _deserialize_message(message_json: str) -> Message:
-    """Deserialize JSON string to Message object.
+def _deserialize_message(message_json: str, conversation_id: str | None = None) -> Message:
+    """Deserialize a stored list entry to a Message object.
+
+    Compact entries are rebuilt without validation (they were validated
+    before being written); legacy JSON objects are fully validated.
 
     Args:
-        message_json: JSON string representation of Message
+        message_json: Stored entry (compact array or legacy Message JSON)
+        conversation_id: Conversation the entry belongs to (required for compact entries)
 
     Returns:
         Message object
 
     Raises:
-        ValueError: If JSON is invalid or cannot be parsed into Message
+        ValueError: If the entry is invalid or cannot be parsed into Message
     """
     try:
         data = json.loads(message_json)
+        if isinstance(data, list):
+            return _message_from_compact(data, conversation_id)
         return Message(**data)
     except (json.JSONDecodeError, ValueError, TypeError) as e:
         raise ValueError(f"Failed to deserialize message: {e}") from e
@@ -83,12 +143,12 @@ def _deserialize_message(message_json: str) -> Message:
 def write_message(message: Message) -> None:
     """Write a normalized message to Redis.
 
-    This function:
-    1. Serializes the message to JSON
-    2. Appends to Redis list (RPUSH)
-    3. Trims list to MAX_CONVERSATION_MESSAGES (LTRIM) - B28 sliding window enforcement
+    Appends the message, trims the list to MAX_CONVERSATION_MESSAGES
+    (B28 sliding window, oldest-first eviction), adds the message's tokens to
+    the running total and refreshes the TTLs in a single pipelined MULTI/EXEC
+    round trip. When an entry is evicted its tokens are subtracted afterwards.
 
-    Redis operations are synchronous. Failures are logged but do not raise exceptions.
+    Failures are logged but do not raise exceptions.
 
     Args:
         message: Normalized Message object with tokens populated
@@ -96,74 +156,38 @@ def write_message(message: Message) -> None:
     try:
         redis_client = _get_redis_client()
         key = _get_redis_key(message.conversation_id)
+        tokens_key = _get_tokens_key(message.conversation_id)
 
-        # Serialize message
-        message_json = _serialize_message(message)
-
-        # Append to list (oldest → newest)
-        redis_client.rpush(key, message_json)
-
-        # B28: Enforce sliding window - trim to last N messages (oldest-first eviction)
-        # Get count before trim for logging
-        count_before_trim_result = redis_client.llen(key)
-        # Handle potential awaitable (shouldn't happen with sync client, but type checker doesn't know)
-        if inspect.isawaitable(count_before_trim_result):
-            # This shouldn't happen with sync client, but satisfy type checker
-            count_before_trim = 0
-        else:
-            count_before_trim = int(count_before_trim_result) if count_before_trim_result is not None else 0
-
+        pipeline = redis_client.pipeline(transaction=True)
+        # Current head: the entry this append evicts if the window is full
+        pipeline.lindex(key, 0)
+        pipeline.rpush(key, _serialize_message(message))
         # LTRIM key -N -1 keeps the last N elements, preserving order (oldest → newest)
-        try:
-            redis_client.ltrim(key, -MAX_CONVERSATION_MESSAGES, -1)
-            count_after_trim_result = redis_client.llen(key)
-            # Handle potential awaitable
-            if inspect.isawaitable(count_after_trim_result):
-                count_after_trim = 0
-            else:
-                count_after_trim = int(count_after_trim_result) if count_after_trim_result is not None else 0
-
-            # Log trim event if trimming occurred
-            if count_before_trim > MAX_CONVERSATION_MESSAGES:
-                logger.debug(
-                    "Redis sliding window trim",
-                    conversation_id=message.conversation_id,
-                    max_messages=MAX_CONVERSATION_MESSAGES,
-                    count_before=count_before_trim,
-                    count_after=count_after_trim,
-                    event="redis_sliding_window_trim",
-                )
-        except redis.RedisError as e:
-            # LTRIM failure is non-fatal - log error but continue
-            logger.warning(
-                "Failed to trim Redis list (non-fatal)",
-                conversation_id=message.conversation_id,
-                error=str(e),
-                event="redis_trim_failed",
-            )
-
-        # Refresh TTL on every write to keep active conversations alive
-        # This ensures active conversations never expire mid-session
-        try:
-            redis_client.expire(key, CONVERSATION_TTL_SECONDS)
+        pipeline.ltrim(key, -MAX_CONVERSATION_MESSAGES, -1)
+        pipeline.incrby(tokens_key, message.tokens)
+        # Refresh TTL on every write so active conversations never expire mid-session
+        pipeline.expire(key, CONVERSATION_TTL_SECONDS)
+        pipeline.expire(tokens_key, CONVERSATION_TTL_SECONDS)
+        head, count_before_trim, _, token_total, _, _ = pipeline.execute()
+
+        count_before_trim = int(count_before_trim or 0)
+        if count_before_trim > 1 and int(token_total) == message.tokens:
+            # Counter did not exist yet (history written before token accounting); rebuild on next read
+            redis_client.delete(tokens_key)
+        elif count_before_trim > MAX_CONVERSATION_MESSAGES:
+            redis_client.decrby(tokens_key, _entry_tokens(head))
+
+        message_count = min(count_before_trim, MAX_CONVERSATION_MESSAGES)
+        if count_before_trim > MAX_CONVERSATION_MESSAGES:
             logger.debug(
-                "Redis TTL refreshed",
-                conversation_id=message.conversation_id,
-                ttl_seconds=CONVERSATION_TTL_SECONDS,
-                event="redis_ttl_refreshed",
-            )
-        except redis.RedisError as e:
-            # TTL refresh failure is non-fatal - log warning but continue
-            logger.warning(
-                "Failed to refresh Redis TTL (non-fatal)",
+                "Redis sliding window trim",
                 conversation_id=message.conversation_id,
-                error=str(e),
-                event="redis_ttl_refresh_failed",
+                max_messages=MAX_CONVERSATION_MESSAGES,
+                count_before=count_before_trim,
+                count_after=message_count,
+                event="redis_sliding_window_trim",
             )
 
-        # Get current count for logging
-        message_count = redis_client.llen(key)
-
         logger.debug(
             "Redis message appended",
             conversation_id=message.conversation_id,
@@ -171,6 +195,7 @@ def write_message(message: Message) -> None:
             role=message.role,
             message_count=message_count,
             tokens=message.tokens,
+            ttl_seconds=CONVERSATION_TTL_SECONDS,
             event="redis_append",
         )
     except redis.RedisError as e:
@@ -190,12 +215,34 @@ def write_message(message: Message) -> None:
         )
 
 
+def replace_messages(conversation_id: str, messages: list[Message]) -> None:
+    """Atomically replace a conversation's Redis history (used by compaction).
+
+    Args:
+        conversation_id: Conversation ID
+        messages: New history, oldest first
+
+    Raises:
+        redis.RedisError: If the Redis transaction fails
+    """
+    key = _get_redis_key(conversation_id)
+    tokens_key = _get_tokens_key(conversation_id)
+    kept = messages[-MAX_CONVERSATION_MESSAGES:]
+    pipeline = _get_redis_client().pipeline(transaction=True)
+    pipeline.delete(key, tokens_key)
+    if kept:
+        pipeline.rpush(key, *[_serialize_message(m) for m in kept])
+        pipeline.set(tokens_key, sum(m.tokens for m in kept), ex=CONVERSATION_TTL_SECONDS)
+        pipeline.expire(key, CONVERSATION_TTL_SECONDS)
+    pipeline.execute()
+
+
 def get_recent_messages(conversation_id: str, limit: int = 50) -> list[Message]:
     """Get recent messages from Redis for a conversation.
 
     This function:
-    1. Retrieves the last N messages from Redis list (LRANGE)
-    2. Deserializes JSON strings to Message objects
+    1. Retrieves the last N messages from Redis list (one LRANGE round trip)
+    2. Decodes entries to Message objects (compact entries skip re-validation)
     3. Preserves ordering (oldest → newest)
 
     Note: This is a read operation and does NOT refresh TTL.
@@ -246,7 +293,7 @@ def get_recent_messages(conversation_id: str, limit: int = 50) -> list[Message]:
         messages: list[Message] = []
         for message_json in message_jsons:
             try:
-                message = _deserialize_message(message_json)
+                message = _deserialize_message(message_json, conversation_id)
                 messages.append(message)
             except ValueError as e:
                 # Log deserialization errors but continue processing other messages
@@ -299,3 +346,43 @@ def get_message_count(conversation_id: str) -> int:
             error=str(e),
         )
         return 0
+
+
+def get_conversation_tokens(conversation_id: str) -> int | None:
+    """Get the running token total of a conversation's stored window.
+
+    O(1) in the common case. If the counter is missing (history written before
+    token accounting, or the key expired independently) it is rebuilt from the
+    stored entries once.
+
+    Note: This is a read operation and does NOT refresh TTL.
+
+    Args:
+        conversation_id: Conversation ID
+
+    Returns:
+        Total tokens of the messages currently in Redis (0 if none), or None if
+        Redis is unavailable
+    """
+    try:
+        redis_client = _get_redis_client()
+        total = redis_client.get(_get_tokens_key(conversation_id))
+        if total is not None:
+            return int(total)
+
+        key = _get_redis_key(conversation_id)
+        total = sum(_entry_tokens(entry) for entry in redis_client.lrange(key, 0, -1))
+        ttl = redis_client.ttl(key)
+        if total and ttl and ttl > 0:
+            # NX: never overwrite a counter a concurrent write just created
+            redis_client.set(_get_tokens_key(conversation_id), total, ex=ttl, nx=True)
+    except (redis.RedisError, ValueError) as e:
+        logger.debug(
+            "Failed to get token total from Redis",
+            conversation_id=conversation_id,
+            error=str(e),
+            event="redis_token_total_failed",
+        )
+        return None
+    else:
+        return total
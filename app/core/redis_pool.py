@@ -0,0 +1,95 @@
+"""Shared Redis connection pools.
+
+Every module talks to Redis through the clients returned here instead of
+calling redis.from_url() itself, so the process keeps one bounded pool of
+reusable connections rather than one pool (and fresh TCP/TLS handshakes)
+per call site or per call.
+
+- get_redis(): sync client over a process-wide pool (thread-safe)
+- get_async_redis(): asyncio client over a pool bound to the running event
+  loop (asyncio connections cannot be shared across loops)
+
+Both decode responses to str. Clients never connect at creation time;
+connection errors surface on the first command as redis.RedisError, which
+callers already treat as non-fatal.
+"""
+
+import asyncio
+import threading
+import weakref
+
+import redis
+import redis.asyncio as redis_async
+from loguru import logger
+
+from app.config.settings import settings
+
+_lock = threading.Lock()
+_sync_pool: redis.ConnectionPool | None = None
+_sync_client: redis.Redis | None = None
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, redis_async.Redis]" = weakref.WeakKeyDictionary()
+
+
+def get_redis() -> redis.Redis:
+    """Get the shared sync Redis client.
+
+    Returns:
+        Redis client with string decoding enabled, backed by the shared pool
+    """
+    global _sync_pool, _sync_client
+    if _sync_client is None:
+        with _lock:
+            if _sync_client is None:
+                _sync_pool = redis.ConnectionPool.from_url(
+                    settings.redis_url,
+                    decode_responses=True,
+                    max_connections=settings.redis_max_connections,
+                    socket_connect_timeout=settings.redis_socket_timeout_seconds,
+                    socket_timeout=settings.redis_socket_timeout_seconds,
+                    health_check_interval=30,
+                )
+                _sync_client = redis.Redis(connection_pool=_sync_pool)
+                logger.debug(f"[REDIS] Shared sync pool created (max_connections={settings.redis_max_connections})")
+    return _sync_client
+
+
+def get_async_redis() -> redis_async.Redis:
+    """Get the shared asyncio Redis client for the running event loop.
+
+    Commands have no read timeout so pub/sub listeners can block while idle;
+    connecting is bounded by the configured socket timeout.
+
+    Returns:
+        asyncio Redis client with string decoding enabled
+
+    Raises:
+        RuntimeError: If called outside a running event loop
+    """
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        client = redis_async.Redis(
+            connection_pool=redis_async.ConnectionPool.from_url(
+                settings.redis_url,
+                decode_responses=True,
+                max_connections=settings.redis_max_connections,
+                socket_connect_timeout=settings.redis_socket_timeout_seconds,
+                health_check_interval=30,
+            )
+        )
+        _async_clients[loop] = client
+    return client
+
+
+def get_pool_stats() -> dict[str, int]:
+    """Connection counts of the shared sync pool (for ops endpoints and debugging)."""
+    if _sync_pool is None:
+        return {"created_connections": 0, "in_use_connections": 0, "available_connections": 0}
+    # redis-py keeps these as private attributes; read them defensively
+    in_use = len(getattr(_sync_pool, "_in_use_connections", ()))
+    available = len(getattr(_sync_pool, "_available_connections", ()))
+    return {
+        "created_connections": int(getattr(_sync_pool, "_created_connections", in_use + available)),
+        "in_use_connections": in_use,
+        "available_connections": available,
+    }
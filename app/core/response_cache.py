@@ -0,0 +1,137 @@
+"""Conditional GET and short-lived response caching for polled read endpoints.
+
+The mobile app polls a handful of endpoints on every foreground. Responses are
+keyed by (user, endpoint, params, data version, time bucket):
+
+- The strong ETag is a hash of that key, so If-None-Match can be answered with
+  304 from a single Redis GET, before touching the database.
+- The serialized JSON body is cached in Redis under the same key for
+  settings.response_cache_ttl_seconds.
+
+The time bucket rotates ETags every ETAG_TIME_BUCKET_SECONDS because some
+fields (missed sessions, sync staleness, "today") change with the clock
+rather than with data.
+
+Usage in an endpoint:
+
+    probe = probe_response(request, user_id, "calendar.week")
+    if (cached := probe.cached()) is not None:
+        return cached
+    ...build result...
+    return probe.respond(result)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import time
+from dataclasses import dataclass
+from typing import Any
+
+import redis
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+from loguru import logger
+
+from app.config.settings import settings
+from app.core.data_version import get_data_version
+from app.core.redis_pool import get_redis
+
+ETAG_TIME_BUCKET_SECONDS = 300
+
+
+def _get_redis_client() -> redis.Redis:
+    """Get the shared Redis client.
+
+    Returns:
+        Redis client with string decoding enabled
+    """
+    return get_redis()
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = {tag.strip() for tag in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+@dataclass
+class ResponseProbe:
+    """Cache/ETag state for one request. Inert when caching is unavailable."""
+
+    request: Request
+    cache_key: str | None = None
+    etag: str | None = None
+
+    def cached(self) -> Response | None:
+        """Return a 304 or cached 200 response if one applies."""
+        if self.etag is None or self.cache_key is None:
+            return None
+        headers = {"ETag": self.etag, "Cache-Control": "private, no-cache"}
+        if _etag_matches(self.request.headers.get("if-none-match"), self.etag):
+            return Response(status_code=304, headers=headers)
+        try:
+            body = _get_redis_client().get(self.cache_key)
+        except redis.RedisError as e:
+            logger.debug(f"[RESPONSE_CACHE] Cache read failed for {self.cache_key}: {e!r}")
+            return None
+        if body is None:
+            return None
+        return Response(content=body, media_type="application/json", headers=headers)
+
+    def respond(self, result: Any) -> Any:
+        """Cache a freshly built result and return it with its ETag.
+
+        Args:
+            result: Response model or JSON-serializable value
+
+        Returns:
+            JSON Response carrying the ETag, or result unchanged if caching is off
+        """
+        if self.etag is None or self.cache_key is None:
+            return result
+        body = json.dumps(jsonable_encoder(result), separators=(",", ":"))
+        try:
+            _get_redis_client().set(self.cache_key, body, ex=settings.response_cache_ttl_seconds)
+        except redis.RedisError as e:
+            logger.debug(f"[RESPONSE_CACHE] Cache write failed for {self.cache_key}: {e!r}")
+        return Response(
+            content=body,
+            media_type="application/json",
+            headers={"ETag": self.etag, "Cache-Control": "private, no-cache"},
+        )
+
+
+def probe_response(
+    request: Request,
+    user_id: str,
+    endpoint: str,
+    params: dict[str, Any] | None = None,
+) -> ResponseProbe:
+    """Resolve the cache key and ETag for a request.
+
+    Args:
+        request: Incoming request (for If-None-Match)
+        user_id: Authenticated user ID
+        endpoint: Stable endpoint name, e.g. "calendar.week"
+        params: Query parameters that change the response
+
+    Returns:
+        ResponseProbe; inert if caching is disabled or Redis is unavailable
+    """
+    if not settings.response_cache_enabled:
+        return ResponseProbe(request)
+    version = get_data_version(user_id)
+    if version is None:
+        return ResponseProbe(request)
+
+    bucket = int(time.time()) // ETAG_TIME_BUCKET_SECONDS
+    params_part = json.dumps(params or {}, sort_keys=True, default=str)
+    digest = hashlib.sha256(f"{user_id}|{endpoint}|{params_part}|{version}|{bucket}".encode()).hexdigest()[:32]
+    return ResponseProbe(
+        request,
+        cache_key=f"response_cache:{user_id}:{endpoint}:{digest}",
+        etag=f'"{digest}"',
+    )
@@ -21,3 +21,19 @@ MAX_HISTORY_MESSAGES_BEFORE_SUMMARY = 30
 # This prevents summary spam by ensuring summaries are only triggered when enough
 # new messages have accumulated
 MIN_MESSAGES_SINCE_LAST_SUMMARY = 10
+
+# Background summarization worker (summarization_queue)
+
+# Delay between enqueue and summarization; repeated triggers within the window
+# collapse into one job (the conversation usually gains a few more turns)
+SUMMARY_QUEUE_DEBOUNCE_SECONDS = 30
+
+# Max conversations claimed per worker pass
+SUMMARY_WORKER_BATCH_SIZE = 20
+
+# Max concurrent summarization LLM calls per worker pass
+SUMMARY_WORKER_CONCURRENCY = 4
+
+# Failed summarizations are retried after this delay, up to SUMMARY_MAX_ATTEMPTS times
+SUMMARY_RETRY_DELAY_SECONDS = 300
+SUMMARY_MAX_ATTEMPTS = 3
@@ -1,37 +1,217 @@
-"""Summarization queue interface (B33 placeholder, B34 implementation).
+"""Background conversation summarization queue (B33 trigger, B34 worker).
 
-This module provides the interface for enqueueing conversation summarization tasks.
-B33 implements the trigger logic and calls this function when summarization is needed.
+B33 calls enqueue_conversation_summary() from the prompt builder when a
+conversation crosses the summarization thresholds. The summarization LLM
+call then runs in a background worker pass, off the request path.
 
-B34 will implement the actual summarization generation logic.
+Queue:
+- Redis sorted set (member = conversation_id, score = due time). Enqueueing
+  an already-queued conversation is a no-op, so repeated triggers while a
+  job is pending collapse into one.
+- In-process fallback with the same semantics when Redis is unavailable.
 
-Core invariant: This function never blocks. It enqueues work asynchronously.
+Worker pass (run_summarization_pass, scheduled by summarization_tick):
+- Claims up to SUMMARY_WORKER_BATCH_SIZE due conversations (ZREM-based, so
+  concurrent workers never claim the same conversation)
+- Summarizes them with at most SUMMARY_WORKER_CONCURRENCY LLM calls in flight
+- Persists via save_conversation_summary (Postgres, then write-through to the
+  Redis latest-summary cache)
+- Re-enqueues failures after SUMMARY_RETRY_DELAY_SECONDS, up to
+  SUMMARY_MAX_ATTEMPTS attempts
+
+Core invariant: enqueue_conversation_summary() never blocks and never raises.
 """
 
+import asyncio
+import contextlib
+import threading
+import time
+
+import redis
 from loguru import logger
 
+from app.core.conversation_summary import save_conversation_summary, summarize_conversation
+from app.core.redis_pool import get_redis
+from app.core.summarization_config import (
+    SUMMARY_MAX_ATTEMPTS,
+    SUMMARY_QUEUE_DEBOUNCE_SECONDS,
+    SUMMARY_RETRY_DELAY_SECONDS,
+    SUMMARY_WORKER_BATCH_SIZE,
+    SUMMARY_WORKER_CONCURRENCY,
+)
+
+QUEUE_KEY = "summarization:queue"
+ATTEMPTS_KEY = "summarization:attempts"
+
+# In-process fallback queue (conversation_id -> due time) and attempt counts
+_local_lock = threading.Lock()
+_local_queue: dict[str, float] = {}
+_local_attempts: dict[str, int] = {}
+
+
+def _get_redis_client() -> redis.Redis:
+    """Get the shared Redis client.
+
+    Returns:
+        Redis client with string decoding enabled
+    """
+    return get_redis()
+
+
+def _schedule(conversation_id: str, due_at: float) -> bool:
+    """Add a conversation to the queue unless already queued.
+
+    Returns:
+        True if newly queued, False if it was already pending
+    """
+    try:
+        return bool(_get_redis_client().zadd(QUEUE_KEY, {conversation_id: due_at}, nx=True))
+    except redis.RedisError as e:
+        logger.debug(f"[SUMMARY_QUEUE] Redis enqueue failed, using in-process queue: {e!r}")
+    with _local_lock:
+        if conversation_id in _local_queue:
+            return False
+        _local_queue[conversation_id] = due_at
+        return True
+
 
 def enqueue_conversation_summary(conversation_id: str) -> None:
     """Enqueue a conversation summarization task.
 
     This function is called by B33 when summarization trigger fires.
-    It schedules summarization to run asynchronously without blocking the request.
-
-    B34 will implement the actual summarization logic:
-    - Generate summary via LLM
-    - Store summary as system message with summary_version in metadata
-    - Compact conversation history
-
-    For now, this is a placeholder that only logs the event.
-    The actual implementation will be in B34.
+    Summarization runs in the next worker pass after the debounce window;
+    enqueueing a conversation that is already pending does nothing.
 
     Args:
         conversation_id: Conversation ID to summarize
     """
-    # Placeholder implementation for B33
-    # B34 will implement actual summarization logic
+    if not conversation_id:
+        return
+    queued = _schedule(conversation_id, time.time() + SUMMARY_QUEUE_DEBOUNCE_SECONDS)
     logger.debug(
-        "Conversation summarization enqueued (B34 placeholder)",
+        "Conversation summarization enqueued" if queued else "Conversation summarization already pending",
         conversation_id=conversation_id,
-        event="summary_enqueued",
+        event="summary_enqueued" if queued else "summary_enqueue_deduped",
     )
+
+
+def _claim_due(limit: int) -> list[str]:
+    """Claim up to `limit` due conversations (removing them from the queue).
+
+    Returns:
+        Claimed conversation IDs, oldest due first
+    """
+    now = time.time()
+    claimed: list[str] = []
+    try:
+        client = _get_redis_client()
+        due = client.zrangebyscore(QUEUE_KEY, "-inf", now, start=0, num=limit)
+        # ZREM succeeds for exactly one worker
+        claimed.extend(conversation_id for conversation_id in due if client.zrem(QUEUE_KEY, conversation_id))
+    except redis.RedisError as e:
+        logger.debug(f"[SUMMARY_QUEUE] Redis claim failed (non-fatal): {e!r}")
+
+    with _local_lock:
+        due = sorted((due_at, cid) for cid, due_at in _local_queue.items() if due_at <= now)
+        for _, conversation_id in due[: max(0, limit - len(claimed))]:
+            del _local_queue[conversation_id]
+            claimed.append(conversation_id)
+    return claimed
+
+
+def _record_failure(conversation_id: str) -> int:
+    """Count a failed attempt.
+
+    Returns:
+        Attempts so far (including this one)
+    """
+    try:
+        return int(_get_redis_client().hincrby(ATTEMPTS_KEY, conversation_id, 1))
+    except redis.RedisError:
+        pass
+    with _local_lock:
+        attempts = _local_attempts.get(conversation_id, 0) + 1
+        _local_attempts[conversation_id] = attempts
+    return attempts
+
+
+def _clear_attempts(conversation_id: str) -> None:
+    with _local_lock:
+        _local_attempts.pop(conversation_id, None)
+    try:
+        _get_redis_client().hdel(ATTEMPTS_KEY, conversation_id)
+    except redis.RedisError as e:
+        logger.debug(f"[SUMMARY_QUEUE] Redis attempts reset failed (non-fatal): {e!r}")
+
+
+async def _summarize_one(conversation_id: str) -> bool:
+    """Summarize and persist one conversation.
+
+    Returns:
+        True on success
+    """
+    try:
+        summary = await summarize_conversation(conversation_id)
+        await asyncio.to_thread(save_conversation_summary, conversation_id, summary)
+    except Exception as e:
+        attempts = _record_failure(conversation_id)
+        if attempts < SUMMARY_MAX_ATTEMPTS:
+            _schedule(conversation_id, time.time() + SUMMARY_RETRY_DELAY_SECONDS)
+            logger.warning(
+                f"[SUMMARY_QUEUE] Summarization failed (attempt {attempts}/{SUMMARY_MAX_ATTEMPTS}), retry scheduled: {e}",
+                conversation_id=conversation_id,
+            )
+        else:
+            _clear_attempts(conversation_id)
+            logger.error(
+                f"[SUMMARY_QUEUE] Summarization failed after {attempts} attempts, dropping: {e}",
+                conversation_id=conversation_id,
+            )
+        return False
+    _clear_attempts(conversation_id)
+    return True
+
+
+async def run_summarization_pass(
+    batch_size: int = SUMMARY_WORKER_BATCH_SIZE,
+    concurrency: int = SUMMARY_WORKER_CONCURRENCY,
+) -> dict[str, int]:
+    """Summarize the conversations that are due, with bounded concurrency.
+
+    Args:
+        batch_size: Max conversations to claim in this pass
+        concurrency: Max summarizations running at once
+
+    Returns:
+        Dict with claimed / succeeded / failed counts
+    """
+    conversation_ids = _claim_due(batch_size)
+    if not conversation_ids:
+        return {"claimed": 0, "succeeded": 0, "failed": 0}
+
+    started = time.monotonic()
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _bounded(conversation_id: str) -> bool:
+        async with semaphore:
+            return await _summarize_one(conversation_id)
+
+    results = await asyncio.gather(*(_bounded(cid) for cid in conversation_ids))
+    succeeded = sum(results)
+    stats = {"claimed": len(conversation_ids), "succeeded": succeeded, "failed": len(results) - succeeded}
+    logger.info(f"[SUMMARY_QUEUE] Pass complete in {time.monotonic() - started:.1f}s: {stats}")
+    return stats
+
+
+def summarization_tick() -> None:
+    """Scheduler entry point: run one summarization pass (sync wrapper)."""
+    asyncio.run(run_summarization_pass())
+
+
+def get_queue_depth() -> int:
+    """Number of conversations waiting for summarization (Redis + in-process)."""
+    with _local_lock:
+        depth = len(_local_queue)
+    with contextlib.suppress(redis.RedisError):
+        depth += int(_get_redis_client().zcard(QUEUE_KEY))
+    return depth
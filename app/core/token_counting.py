@@ -5,8 +5,17 @@ for OpenAI models. All token counting must go through this module to ensure
 consistency and determinism.
 
 Core invariant: Every message has a token count before storage or prompt use.
+
+Counts are computed once per distinct (role, content): results are memoized,
+so recounting a history that was already seen on a previous turn does not
+re-encode it. count_tokens_batch() encodes many uncached messages in one call
+for cold paths (imports, rebuilding history from Postgres).
 """
 
+import threading
+from collections import OrderedDict
+from collections.abc import Sequence
+from functools import lru_cache
 from typing import Literal
 
 import tiktoken
@@ -28,7 +37,15 @@ MAX_PROMPT_TOKENS = 180_000
 # Reserved buffer for completion tokens
 TRUNCATION_BUFFER = 2_000
 
+# Distinct formatted messages whose counts are memoized
+TOKEN_COUNT_CACHE_SIZE = 4096
+
+# LRU memo: formatted message -> token count
+_count_cache: OrderedDict[str, int] = OrderedDict()
+_count_cache_lock = threading.Lock()
+
 
+@lru_cache(maxsize=1)
 def _get_encoding() -> tiktoken.Encoding:
     """Get tiktoken encoding for OpenAI models.
 
@@ -62,35 +79,43 @@ def _format_message_for_counting(role: Literal["user", "assistant", "system"], c
     return f"{role}\n{content}"
 
 
-def count_tokens(
-    role: Literal["user", "assistant", "system"],
-    content: str,
-    conversation_id: str,
-    user_id: str,
-) -> int:
-    """Count tokens for a normalized message.
+def _cached_count(formatted: str) -> int | None:
+    with _count_cache_lock:
+        token_count = _count_cache.get(formatted)
+        if token_count is not None:
+            _count_cache.move_to_end(formatted)
+        return token_count
 
-    This is a pure, deterministic function that:
-    - Counts tokens based on role and content
-    - Uses the same formatting as OpenAI API calls
-    - Always returns the same count for the same input
 
-    Args:
-        role: Message role
-        content: Message content
-        conversation_id: Conversation ID for logging
-        user_id: User ID for logging
+def _store_count(formatted: str, token_count: int) -> None:
+    with _count_cache_lock:
+        _count_cache[formatted] = token_count
+        _count_cache.move_to_end(formatted)
+        while len(_count_cache) > TOKEN_COUNT_CACHE_SIZE:
+            _count_cache.popitem(last=False)
 
-    Returns:
-        Token count as integer
+
+def _count_formatted(formatted: str) -> int:
+    """Token count of a formatted message (memoized)."""
+    token_count = _cached_count(formatted)
+    if token_count is None:
+        token_count = len(_get_encoding().encode(formatted))
+        _store_count(formatted, token_count)
+    return token_count
+
+
+def _check_token_count(
+    token_count: int,
+    role: str,
+    content: str,
+    conversation_id: str,
+    user_id: str,
+) -> None:
+    """Apply the safety ceiling and warning threshold to a token count.
 
     Raises:
         ValueError: If token count exceeds MAX_TOKENS_PER_MESSAGE
     """
-    encoding = _get_encoding()
-    formatted = _format_message_for_counting(role, content)
-    token_count = len(encoding.encode(formatted))
-
     # Defensive limit check
     if token_count > MAX_TOKENS_PER_MESSAGE:
         logger.error(
@@ -116,4 +141,69 @@ def count_tokens(
             content_length=len(content),
         )
 
+
+def count_tokens(
+    role: Literal["user", "assistant", "system"],
+    content: str,
+    conversation_id: str,
+    user_id: str,
+) -> int:
+    """Count tokens for a normalized message.
+
+    This is a pure, deterministic function that:
+    - Counts tokens based on role and content
+    - Uses the same formatting as OpenAI API calls
+    - Always returns the same count for the same input
+
+    Args:
+        role: Message role
+        content: Message content
+        conversation_id: Conversation ID for logging
+        user_id: User ID for logging
+
+    Returns:
+        Token count as integer
+
+    Raises:
+        ValueError: If token count exceeds MAX_TOKENS_PER_MESSAGE
+    """
+    token_count = _count_formatted(_format_message_for_counting(role, content))
+    _check_token_count(token_count, role, content, conversation_id, user_id)
     return token_count
+
+
+def count_tokens_batch(
+    messages: Sequence[tuple[Literal["user", "assistant", "system"], str]],
+    conversation_id: str,
+    user_id: str,
+) -> list[int]:
+    """Count tokens for many messages, encoding uncached ones in a single batch.
+
+    Returns exactly what count_tokens() would return for each message.
+
+    Args:
+        messages: (role, content) pairs
+        conversation_id: Conversation ID for logging
+        user_id: User ID for logging
+
+    Returns:
+        Token counts, in input order
+
+    Raises:
+        ValueError: If any message exceeds MAX_TOKENS_PER_MESSAGE
+    """
+    formatted = [_format_message_for_counting(role, content) for role, content in messages]
+    known = {text: _cached_count(text) for text in formatted}
+    # Encode the distinct uncached texts in one batch
+    missing = [text for text, token_count in known.items() if token_count is None]
+    if missing:
+        for text, tokens in zip(missing, _get_encoding().encode_batch(missing), strict=True):
+            known[text] = len(tokens)
+            _store_count(text, len(tokens))
+
+    counts: list[int] = []
+    for (role, content), text in zip(messages, formatted, strict=True):
+        token_count = known[text] or 0
+        _check_token_count(token_count, role, content, conversation_id, user_id)
+        counts.append(token_count)
+    return counts
@@ -10,9 +10,13 @@ history deterministically. The guard ensures:
 5. No LLM call can exceed token limits
 
 Core invariant: prompt_tokens + completion_tokens < MAX_MODEL_TOKENS
+
+Each message is counted once per call: messages carrying a stored "tokens"
+count (set at normalization time) are not re-encoded, the rest are counted in
+one batch, and truncation works on running sums.
 """
 
-from typing import Literal, TypedDict
+from typing import Literal, NotRequired, TypedDict
 
 from loguru import logger
 
@@ -20,7 +24,7 @@ from app.core.memory_metrics import increment_memory_counter
 from app.core.token_counting import (
     MAX_MODEL_TOKENS,
     MAX_PROMPT_TOKENS,
-    count_tokens,
+    count_tokens_batch,
 )
 
 
@@ -28,10 +32,13 @@ class LLMMessage(TypedDict):
     """LLM message format with role and content.
 
     This matches the format expected by pydantic_ai and OpenAI API.
+    The optional tokens field carries a precomputed count (Message.tokens)
+    so the guard does not re-encode the message.
     """
 
     role: Literal["user", "assistant", "system"]
     content: str
+    tokens: NotRequired[int]
 
 
 class TruncationMetadata(TypedDict):
@@ -43,15 +50,15 @@ class TruncationMetadata(TypedDict):
     original_tokens: int
 
 
-def count_prompt_tokens(
+def message_token_counts(
     messages: list[LLMMessage],
     conversation_id: str,
     user_id: str,
-) -> int:
-    """Count total tokens in a list of LLM messages.
+) -> list[int]:
+    """Token count of each LLM message.
 
-    This is a pure, deterministic function that counts tokens for each message
-    and sums them. Uses the same token counting logic as message normalization.
+    Precomputed counts are used as-is; the remaining messages are counted in
+    a single batch. Messages with an invalid role count as 0.
 
     Args:
         messages: List of LLM messages
@@ -59,30 +66,54 @@ def count_prompt_tokens(
         user_id: User ID for logging
 
     Returns:
-        Total token count as integer
+        Token counts, in message order
     """
-    total = 0
-    for msg in messages:
-        role_str = msg["role"]
-        # Validate and convert to proper literal type
-        if role_str not in {"user", "assistant", "system"}:
+    counts = [0] * len(messages)
+    to_count: list[int] = []
+    for i, msg in enumerate(messages):
+        if msg["role"] not in {"user", "assistant", "system"}:
             logger.warning(
                 "Invalid role in message, skipping token count",
                 conversation_id=conversation_id,
-                role=role_str,
+                role=msg["role"],
             )
             continue
-        role: Literal["user", "assistant", "system"] = role_str
-        content = msg["content"]
-        token_count = count_tokens(
-            role=role,
-            content=content,
+        stored = msg.get("tokens")
+        if stored is not None:
+            counts[i] = stored
+        else:
+            to_count.append(i)
+
+    if to_count:
+        batch = count_tokens_batch(
+            [(messages[i]["role"], messages[i]["content"]) for i in to_count],
             conversation_id=conversation_id,
             user_id=user_id,
         )
-        total += token_count
+        for i, token_count in zip(to_count, batch, strict=True):
+            counts[i] = token_count
+    return counts
 
-    return total
+
+def count_prompt_tokens(
+    messages: list[LLMMessage],
+    conversation_id: str,
+    user_id: str,
+) -> int:
+    """Count total tokens in a list of LLM messages.
+
+    This is a pure, deterministic function that counts tokens for each message
+    and sums them. Uses the same token counting logic as message normalization.
+
+    Args:
+        messages: List of LLM messages
+        conversation_id: Conversation ID for logging
+        user_id: User ID for logging
+
+    Returns:
+        Total token count as integer
+    """
+    return sum(message_token_counts(messages, conversation_id, user_id))
 
 
 def enforce_token_limit(
@@ -123,8 +154,9 @@ def enforce_token_limit(
         RuntimeError: If prompt exceeds model hard limit even after truncation
                      (should never happen, but exists as safety check)
     """
-    # Count original tokens
-    original_tokens = count_prompt_tokens(messages, conversation_id, user_id)
+    # Count each message once; everything below works on these counts
+    counts = message_token_counts(messages, conversation_id, user_id)
+    original_tokens = sum(counts)
 
     # If within limit, return unchanged
     if original_tokens <= max_prompt_tokens:
@@ -159,6 +191,7 @@ def enforce_token_limit(
         raise ValueError("Last message must be user message")
 
     history = messages[1:-1]
+    history_counts = counts[1:-1]
 
     # Log history before truncation for debugging
     logger.debug(
@@ -175,19 +208,17 @@ def enforce_token_limit(
     truncated_history: list[LLMMessage] = []
     removed: list[LLMMessage] = []
 
-    # Iterate history in reverse (newest first)
-    for msg in reversed(history):
-        # Try adding this message
-        test_history = [msg, *truncated_history]
-        test_messages = [system, *test_history, user_tail]
-        test_tokens = count_prompt_tokens(test_messages, conversation_id, user_id)
-
-        if test_tokens <= max_prompt_tokens:
+    # Iterate history in reverse (newest first), tracking the running prompt total
+    final_tokens = counts[0] + counts[-1]
+    for msg, msg_tokens in zip(reversed(history), reversed(history_counts), strict=True):
+        if final_tokens + msg_tokens <= max_prompt_tokens:
             # This message fits, add it to truncated_history
-            truncated_history.insert(0, msg)
+            truncated_history.append(msg)
+            final_tokens += msg_tokens
         else:
             # This message would exceed limit, drop it
             removed.append(msg)
+    truncated_history.reverse()
 
     # Log history after truncation for debugging
     logger.debug(
@@ -204,7 +235,6 @@ def enforce_token_limit(
 
     # Build final messages
     final_messages = [system, *truncated_history, user_tail]
-    final_tokens = count_prompt_tokens(final_messages, conversation_id, user_id)
 
     # Absolute hard failure check - should never happen
     if final_tokens > MAX_MODEL_TOKENS:
@@ -214,8 +244,8 @@ def enforce_token_limit(
             user_id=user_id,
             final_tokens=final_tokens,
             max_model_tokens=MAX_MODEL_TOKENS,
-            system_tokens=count_prompt_tokens([system], conversation_id, user_id),
-            user_tail_tokens=count_prompt_tokens([user_tail], conversation_id, user_id),
+            system_tokens=counts[0],
+            user_tail_tokens=counts[-1],
         )
         raise RuntimeError(f"Prompt exceeds model hard token limit ({final_tokens} > {MAX_MODEL_TOKENS})")
 
@@ -1732,6 +1732,88 @@ class WorkoutReconciliation(Base):
     )
 
 
+class CalendarReconciliation(Base):
+    """Persisted calendar reconciliation status per planned session.
+
+    Written by app.calendar.reconciliation_store whenever an activity or planned
+    session in the session's day window changes. Calendar reads look these rows
+    up instead of re-running reconciliation (and auto-match) on every request.
+
+    Schema:
+    - planned_session_id: Planned session this result belongs to (unique, no FK so
+      deleting a planned session never has to clean up here first)
+    - day: UTC calendar day of the planned session
+    - status: SessionStatus value (completed, partial, substituted, missed, skipped)
+    - matched_activity_id: Activity matched by reconciliation (nullable)
+    - confidence / reason_code / explanation: Copied from ReconciliationResult
+    - computed_at: When this result was last recomputed
+    """
+
+    __tablename__ = "calendar_reconciliations"
+
+    id: Mapped[str] = mapped_column(String, primary_key=True, default=lambda: str(uuid.uuid4()), index=True)
+    user_id: Mapped[str] = mapped_column(String, nullable=False, index=True)
+    planned_session_id: Mapped[str] = mapped_column(String, nullable=False, unique=True, index=True)
+    day: Mapped[date] = mapped_column(Date, nullable=False)
+
+    status: Mapped[str] = mapped_column(String, nullable=False)
+    matched_activity_id: Mapped[str | None] = mapped_column(String, nullable=True, index=True)
+    confidence: Mapped[float] = mapped_column(Float, nullable=False, default=1.0)
+    reason_code: Mapped[str] = mapped_column(String, nullable=False)
+    explanation: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+    computed_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=lambda: datetime.now(timezone.utc))
+
+    __table_args__ = (Index("idx_calendar_reconciliations_user_day", "user_id", "day"),)
+
+
+class CalendarWeekSummary(Base):
+    """Materialized per-user, per-week calendar summary.
+
+    Written by app.calendar.week_summary_store for weeks touched by activity,
+    planned-session or pairing writes. The season summary and weekly summary
+    card read these rows instead of rebuilding weeks from the full history.
+
+    Schema:
+    - week_start: Monday (UTC) of the week
+    - planned_count / completed_count: Calendar items still planned / completed
+    - total_planned_sessions, executed_as_planned_count, missed_sessions_count,
+      unplanned_sessions_count: Execution-state counts (weekly summary card)
+    - planned_duration_seconds / completed_duration_seconds: Planned vs completed load
+    - key_sessions: Up to 3 unique completed session names
+    - completed_titles: Up to 5 completed session titles (coach summary context)
+    - flags: Week flags ("fatigue", "missed_sessions")
+    - strongest_session_id / strongest_session_narrative: Best executed session
+    - computed_at: When the row was last rebuilt (missed sessions depend on the clock,
+      so readers treat rows computed before the week ended as stale)
+    """
+
+    __tablename__ = "calendar_week_summaries"
+
+    id: Mapped[str] = mapped_column(String, primary_key=True, default=lambda: str(uuid.uuid4()), index=True)
+    user_id: Mapped[str] = mapped_column(String, nullable=False, index=True)
+    week_start: Mapped[date] = mapped_column(Date, nullable=False)
+
+    planned_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    completed_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    total_planned_sessions: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    executed_as_planned_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    missed_sessions_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    unplanned_sessions_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    planned_duration_seconds: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    completed_duration_seconds: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    key_sessions: Mapped[list] = mapped_column(JSON, nullable=False, default=list)
+    completed_titles: Mapped[list] = mapped_column(JSON, nullable=False, default=list)
+    flags: Mapped[list] = mapped_column(JSON, nullable=False, default=list)
+    strongest_session_id: Mapped[str | None] = mapped_column(String, nullable=True)
+    strongest_session_narrative: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+    computed_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=lambda: datetime.now(timezone.utc))
+
+    __table_args__ = (UniqueConstraint("user_id", "week_start", name="uq_calendar_week_summaries_user_week"),)
+
+
 class PlanEvaluation(Base):
     """Plan evaluation storage for change decisions.
 
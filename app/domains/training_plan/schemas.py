@@ -63,3 +63,18 @@ class SessionTextOutputSchema(BaseModel):
         ...,
         description="hard_minutes, intensity minutes, total distance",
     )
+
+
+class SessionTextBatchItemSchema(SessionTextOutputSchema):
+    """One session description in a batched (per-week) LLM output."""
+
+    session: int = Field(..., ge=1, description="Session number from the request (1-based)")
+
+
+class SessionTextBatchSchema(BaseModel):
+    """Schema for batched session description output (all sessions of one week)."""
+
+    sessions: list[SessionTextBatchItemSchema] = Field(
+        ...,
+        description="Exactly one workout per requested session",
+    )
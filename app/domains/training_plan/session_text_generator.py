@@ -25,7 +25,7 @@ import json
 import redis
 from loguru import logger
 
-from app.config.settings import settings
+from app.core.redis_pool import get_redis
 from app.domains.training_plan.models import (
     PlannedSession,
     PlannedWeek,
@@ -33,21 +33,9 @@ from app.domains.training_plan.models import (
     SessionTextOutput,
 )
 from app.infra.llm.fallback import generate_fallback_session_text
-from app.infra.llm.session_text import generate_session_text_llm
-
-# Semaphore to limit concurrent LLM calls for session text generation
-# Prevents rate limit errors by limiting concurrent API calls
-_LLM_SEMAPHORE = asyncio.Semaphore(10)  # Max 10 concurrent LLM calls
-
-
-def _get_llm_semaphore() -> asyncio.Semaphore:
-    """Get the shared LLM semaphore.
-
-    Returns:
-        Shared semaphore limiting concurrent LLM calls
-    """
-    return _LLM_SEMAPHORE
-
+from app.infra.llm.session_text import generate_session_text_llm, generate_session_texts_batch_llm
+from app.services.llm.governor import PLAN, llm_priority
+from app.services.llm.hedging import LLMBudgetExceededError
 
 # Cache TTL: 7 days (sessions are deterministic for same inputs)
 CACHE_TTL_SECONDS = 7 * 24 * 60 * 60
@@ -59,7 +47,7 @@ def _get_redis_client() -> redis.Redis:
     Returns:
         Redis client with string decoding enabled
     """
-    return redis.from_url(settings.redis_url, decode_responses=True)
+    return get_redis()
 
 
 def _generate_cache_key(input_data: SessionTextInput) -> str:
@@ -154,6 +142,56 @@ def _session_text_output_from_dict(data: dict) -> SessionTextOutput:
     )
 
 
+def _build_session_text_input(session: PlannedSession, context: dict) -> SessionTextInput:
+    """Build the LLM input for a session.
+
+    Args:
+        session: Planned session with template
+        context: Context dict (philosophy_id, race_distance, phase, week_index)
+
+    Returns:
+        SessionTextInput for the session
+    """
+    return SessionTextInput(
+        philosophy_id=context["philosophy_id"],
+        race_distance=context["race_distance"],
+        phase=context["phase"],
+        week_index=context["week_index"],
+        day_type=session.day_type,
+        allocated_distance_mi=session.distance,
+        allocated_duration_min=None,  # TODO: Add duration allocation if needed
+        template_id=session.template.template_id,
+        template_kind=session.template.kind,
+        params=session.template.params,
+        constraints=session.template.constraints,
+    )
+
+
+def _get_usable_cached_output(cache_key: str, is_plan_creation: bool, template_id: str) -> SessionTextOutput | None:
+    """Get a cached output, skipping cached fallback results for plan creation.
+
+    Args:
+        cache_key: Cache key
+        is_plan_creation: Whether the session is generated for plan creation
+        template_id: Template ID (for logging)
+
+    Returns:
+        Cached SessionTextOutput, or None if generation is needed
+    """
+    cached = _get_cached_output(cache_key)
+    if not cached:
+        return None
+    # For plan creation, skip cached fallback results (force LLM generation)
+    if is_plan_creation and cached.get("computed", {}).get("generated_by") == "fallback":
+        logger.debug(
+            "Skipping cached fallback text for plan creation - forcing LLM generation",
+            template_id=template_id,
+        )
+        return None
+    logger.debug("Using cached session text", template_id=template_id)
+    return _session_text_output_from_dict(cached)
+
+
 async def generate_session_text(session: PlannedSession, context: dict) -> SessionTextOutput:
     """Generate session text for a single session.
 
@@ -177,42 +215,20 @@ async def generate_session_text(session: PlannedSession, context: dict) -> Sessi
     Raises:
         ValueError: If generation fails completely
     """
-    # Build input
-    input_data = SessionTextInput(
-        philosophy_id=context["philosophy_id"],
-        race_distance=context["race_distance"],
-        phase=context["phase"],
-        week_index=context["week_index"],
-        day_type=session.day_type,
-        allocated_distance_mi=session.distance,
-        allocated_duration_min=None,  # TODO: Add duration allocation if needed
-        template_id=session.template.template_id,
-        template_kind=session.template.kind,
-        params=session.template.params,
-        constraints=session.template.constraints,
-    )
+    input_data = _build_session_text_input(session, context)
 
     # Fix 2: Check if this is plan creation (fail hard) vs recommend_next_session (allow fallback)
     is_plan_creation = context.get("is_plan_creation", False)
 
     # Check cache - but skip cached fallback results for plan creation
     cache_key = _generate_cache_key(input_data)
-    cached = _get_cached_output(cache_key)
-    if cached:
-        # For plan creation, skip cached fallback results (force LLM generation)
-        if is_plan_creation and cached.get("computed", {}).get("generated_by") == "fallback":
-            logger.debug(
-                "Skipping cached fallback text for plan creation - forcing LLM generation",
-                template_id=session.template.template_id,
-            )
-        else:
-            logger.debug("Using cached session text", template_id=session.template.template_id)
-            return _session_text_output_from_dict(cached)
+    cached_output = _get_usable_cached_output(cache_key, is_plan_creation, session.template.template_id)
+    if cached_output is not None:
+        return cached_output
 
-    # Try LLM generation (with semaphore to limit concurrent calls)
+    # Try LLM generation (concurrency is bounded by the process-wide LLM governor)
     try:
-        semaphore = _get_llm_semaphore()
-        async with semaphore:
+        with llm_priority(PLAN):
             output = await generate_session_text_llm(input_data, retry_on_violation=True)
         _set_cached_output(cache_key, output)
         logger.info(
@@ -231,8 +247,10 @@ async def generate_session_text(session: PlannedSession, context: dict) -> Sessi
             isinstance(e, (ValueError, RuntimeError))
             and ("constraint" in error_str or "violates" in error_str or "constraint" in cause_str or "violates" in cause_str)
         )
+        # Latency budget spent: deterministic text bounds plan creation time too
+        is_budget_exceeded = isinstance(e, LLMBudgetExceededError)
 
-        if is_plan_creation and not is_constraint_violation:
+        if is_plan_creation and not (is_constraint_violation or is_budget_exceeded):
             logger.error(
                 "LLM generation failed for plan creation - aborting (no fallback allowed)",
                 template_id=session.template.template_id,
@@ -249,6 +267,7 @@ async def generate_session_text(session: PlannedSession, context: dict) -> Sessi
             error_type=type(e).__name__,
             is_plan_creation=is_plan_creation,
             is_constraint_violation=is_constraint_violation,
+            is_budget_exceeded=is_budget_exceeded,
         )
 
         logger.warning(
@@ -281,6 +300,56 @@ async def generate_session_text(session: PlannedSession, context: dict) -> Sessi
         return output
 
 
+async def generate_session_texts(sessions: list[PlannedSession], context: dict) -> list[SessionTextOutput]:
+    """Generate session text for all sessions of one week with one batched LLM request.
+
+    Sessions served from the cache are skipped; the rest go to the LLM in a
+    single structured-output request. Sessions whose batched output is
+    missing or violates constraints are generated individually through
+    generate_session_text (with its retries and fallback rules).
+
+    Args:
+        sessions: Sessions of one week, all with templates
+        context: Context dict (see generate_session_text)
+
+    Returns:
+        SessionTextOutput per session, in order
+
+    Raises:
+        Exception: As generate_session_text, for sessions generated individually
+    """
+    is_plan_creation = context.get("is_plan_creation", False)
+    inputs = [_build_session_text_input(session, context) for session in sessions]
+    cache_keys = [_generate_cache_key(input_data) for input_data in inputs]
+    outputs: list[SessionTextOutput | None] = [
+        _get_usable_cached_output(cache_key, is_plan_creation, session.template.template_id)
+        for session, cache_key in zip(sessions, cache_keys, strict=True)
+    ]
+
+    pending = [index for index, output in enumerate(outputs) if output is None]
+    if len(pending) > 1:
+        with llm_priority(PLAN):
+            batch_outputs = await generate_session_texts_batch_llm([inputs[index] for index in pending])
+        for index, output in zip(pending, batch_outputs, strict=True):
+            if output is not None:
+                _set_cached_output(cache_keys[index], output)
+                outputs[index] = output
+
+    retry = [index for index, output in enumerate(outputs) if output is None]
+    if retry:
+        if len(pending) > 1:
+            logger.info(
+                "Generating remaining sessions individually",
+                week_index=context["week_index"],
+                session_count=len(retry),
+            )
+        individual_outputs = await asyncio.gather(*(generate_session_text(sessions[index], context) for index in retry))
+        for index, output in zip(retry, individual_outputs, strict=True):
+            outputs[index] = output
+
+    return [output for output in outputs if output is not None]
+
+
 async def generate_week_sessions(
     week: PlannedWeek,
     context: dict,
@@ -6,12 +6,15 @@ to ensure consistency and enable easy model switching.
 """
 
 import hashlib
+import time
 from typing import Literal
 
 from loguru import logger
 from openai import OpenAI
 
 from app.config.settings import settings
+from app.services.llm.client_pool import get_sync_http_client
+from app.services.llm.telemetry import record_llm_call
 
 # Use text-embedding-3-small as recommended (cheaper, still high quality)
 EMBEDDING_MODEL: Literal["text-embedding-3-small"] = "text-embedding-3-small"
@@ -23,7 +26,8 @@ EMBEDDING_DIMENSION = 1536
 class EmbeddingService:
     """Service for computing text embeddings.
 
-    Thread-safe singleton pattern. Initializes OpenAI client on first use.
+    Thread-safe singleton pattern. Initializes OpenAI client on first use, on
+    the shared pooled HTTP transport.
     """
 
     _instance: "EmbeddingService | None" = None
@@ -44,7 +48,7 @@ class EmbeddingService:
                     "OPENAI_API_KEY not set. Embeddings require OpenAI API key. "
                     "Set OPENAI_API_KEY environment variable."
                 )
-            EmbeddingService._client = OpenAI(api_key=api_key)
+            EmbeddingService._client = OpenAI(api_key=api_key, http_client=get_sync_http_client())
             logger.info(f"Initialized EmbeddingService with model={EMBEDDING_MODEL}")
 
     @staticmethod
@@ -68,15 +72,20 @@ class EmbeddingService:
         if EmbeddingService._client is None:
             raise RuntimeError("EmbeddingService client failed to initialize")
 
+        started = time.monotonic()
         try:
             response = EmbeddingService._client.embeddings.create(
                 model=EMBEDDING_MODEL,
                 input=text,
             )
         except Exception as e:
+            record_llm_call(EMBEDDING_MODEL, time.monotonic() - started, call_site="embeddings", error=e)
             logger.error(f"Failed to compute embedding: {e}")
             raise RuntimeError(f"Embedding computation failed: {e}") from e
         else:
+            record_llm_call(
+                EMBEDDING_MODEL, time.monotonic() - started, call_site="embeddings", input_tokens=response.usage.prompt_tokens
+            )
             embedding = response.data[0].embedding
             logger.debug(f"Computed embedding for text (length={len(text)}, dim={len(embedding)})")
             return embedding
@@ -107,15 +116,20 @@ class EmbeddingService:
         if EmbeddingService._client is None:
             raise RuntimeError("EmbeddingService client failed to initialize")
 
+        started = time.monotonic()
         try:
             response = EmbeddingService._client.embeddings.create(
                 model=EMBEDDING_MODEL,
                 input=non_empty_texts,
             )
         except Exception as e:
+            record_llm_call(EMBEDDING_MODEL, time.monotonic() - started, call_site="embeddings", error=e)
             logger.error(f"Failed to compute batch embeddings: {e}")
             raise RuntimeError(f"Batch embedding computation failed: {e}") from e
         else:
+            record_llm_call(
+                EMBEDDING_MODEL, time.monotonic() - started, call_site="embeddings", input_tokens=response.usage.prompt_tokens
+            )
             embeddings = [item.embedding for item in response.data]
             logger.debug(f"Computed {len(embeddings)} embeddings in batch")
             return embeddings
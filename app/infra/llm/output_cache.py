@@ -0,0 +1,294 @@
+"""Content-addressed cache for validated LLM outputs.
+
+Entries are keyed by a canonical hash of everything that determines the
+LLM's output: the structured input, the prompt file contents and the model
+name. Editing a prompt or switching models therefore changes every key, and
+identical inputs across athletes and plan regenerations share one entry.
+
+Two tiers:
+- Redis (shared across processes, TTL-based expiry)
+- Local disk (per-instance; TTL plus least-recently-used eviction once the
+  entry count exceeds settings.llm_output_cache_max_disk_entries)
+
+Lookups try Redis first, then disk; a disk hit is written back to Redis.
+Every lookup is reported to planner observability with the generation
+latency a hit avoided. Cache failures are never fatal.
+
+Async callers use aget()/aset(): Redis goes through the asyncio client and
+disk IO runs in a worker thread, so neither blocks the event loop.
+"""
+
+import asyncio
+import contextlib
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from dataclasses import asdict, is_dataclass
+from enum import Enum
+from pathlib import Path
+from typing import Any
+
+import redis
+import redis.asyncio as redis_async
+from loguru import logger
+
+from app.config.settings import settings
+from app.core.redis_pool import get_async_redis, get_redis
+from app.planner.observability import record_cache_lookup
+
+
+def _get_redis_client() -> redis.Redis:
+    """Get the shared Redis client.
+
+    Returns:
+        Redis client with string decoding enabled
+    """
+    return get_redis()
+
+
+def _get_async_redis_client() -> redis_async.Redis:
+    """Get the shared asyncio Redis client for the running event loop.
+
+    Returns:
+        asyncio Redis client with string decoding enabled
+    """
+    return get_async_redis()
+
+
+def _canonical(value: Any) -> Any:
+    """Convert dataclasses/enums/containers into canonical JSON-ready values."""
+    if is_dataclass(value) and not isinstance(value, type):
+        return _canonical(asdict(value))
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, dict):
+        return {str(k): _canonical(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_canonical(v) for v in value]
+    if isinstance(value, float) and value.is_integer():
+        # 5.0 and 5 produce the same prompt text
+        return int(value)
+    return value
+
+
+def content_key(payload: Any, prompt: str, model: str) -> str:
+    """Canonical hash of an LLM request.
+
+    Args:
+        payload: Structured input (dataclass, dict, ...); key order is irrelevant
+        prompt: Full system prompt contents
+        model: Model name
+
+    Returns:
+        Hex sha256 digest
+    """
+    canonical = json.dumps(
+        {
+            "input": _canonical(payload),
+            "prompt_sha256": hashlib.sha256(prompt.encode("utf-8")).hexdigest(),
+            "model": model,
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _access_time(path: Path) -> float:
+    try:
+        return path.stat().st_mtime
+    except OSError:
+        # Removed concurrently; evict first
+        return 0.0
+
+
+class LLMOutputCache:
+    """Two-tier (Redis + disk) cache of LLM outputs for one namespace.
+
+    Values are JSON-serializable dicts. Each entry records the latency of the
+    LLM call that produced it, which is reported as saved time on a hit.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        disk_dir: Path | None = None,
+        ttl_seconds: int | None = None,
+        max_disk_entries: int | None = None,
+    ):
+        self.namespace = namespace
+        base_dir = Path(settings.llm_output_cache_dir) if settings.llm_output_cache_dir else (
+            Path(tempfile.gettempdir()) / "llm_output_cache"
+        )
+        self.disk_dir = disk_dir or base_dir / namespace
+        self.ttl_seconds = ttl_seconds or settings.llm_output_cache_ttl_seconds
+        self.max_disk_entries = max_disk_entries or settings.llm_output_cache_max_disk_entries
+        self._disk_lock = threading.Lock()
+        # Entries on disk, counted on the first write and tracked from then on
+        self._disk_entries: int | None = None
+
+    def _redis_key(self, key: str) -> str:
+        return f"llm_cache:{self.namespace}:{key}"
+
+    def _disk_path(self, key: str) -> Path:
+        return self.disk_dir / f"{key}.json"
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Look up a cached output.
+
+        Args:
+            key: Key from content_key()
+
+        Returns:
+            Cached value or None on miss (or when caching is disabled)
+        """
+        if not settings.llm_output_cache_enabled:
+            return None
+
+        tier = "redis"
+        entry = self._redis_get(key)
+        if entry is None:
+            tier = "disk"
+            entry = self._disk_get(key)
+            if entry is not None:
+                self._redis_set(key, entry)
+        return self._record_lookup(entry, tier)
+
+    async def aget(self, key: str) -> dict[str, Any] | None:
+        """Look up a cached output without blocking the event loop (see get())."""
+        if not settings.llm_output_cache_enabled:
+            return None
+
+        tier = "redis"
+        entry = await self._aredis_get(key)
+        if entry is None:
+            tier = "disk"
+            entry = await asyncio.to_thread(self._disk_get, key)
+            if entry is not None:
+                await self._aredis_set(key, entry)
+        return self._record_lookup(entry, tier)
+
+    def set(self, key: str, value: dict[str, Any], latency_seconds: float = 0.0) -> None:
+        """Store an output in both tiers.
+
+        Args:
+            key: Key from content_key()
+            value: JSON-serializable output
+            latency_seconds: Time the LLM call took to produce value
+        """
+        if not settings.llm_output_cache_enabled:
+            return
+        entry = self._entry(value, latency_seconds)
+        self._redis_set(key, entry)
+        self._disk_set(key, entry)
+
+    async def aset(self, key: str, value: dict[str, Any], latency_seconds: float = 0.0) -> None:
+        """Store an output in both tiers without blocking the event loop (see set())."""
+        if not settings.llm_output_cache_enabled:
+            return
+        entry = self._entry(value, latency_seconds)
+        await self._aredis_set(key, entry)
+        await asyncio.to_thread(self._disk_set, key, entry)
+
+    @staticmethod
+    def _entry(value: dict[str, Any], latency_seconds: float) -> dict[str, Any]:
+        return {"value": value, "latency_seconds": latency_seconds, "stored_at": time.time()}
+
+    def _record_lookup(self, entry: dict[str, Any] | None, tier: str) -> dict[str, Any] | None:
+        if entry is None:
+            record_cache_lookup(self.namespace, hit=False)
+            return None
+        record_cache_lookup(self.namespace, hit=True, tier=tier, saved_seconds=float(entry.get("latency_seconds", 0.0)))
+        return entry["value"]
+
+    def _redis_get(self, key: str) -> dict[str, Any] | None:
+        try:
+            raw = _get_redis_client().get(self._redis_key(key))
+        except redis.RedisError as e:
+            logger.debug(f"[LLM_CACHE] Redis read failed (non-fatal): {e!r}")
+            return None
+        return json.loads(raw) if raw else None
+
+    def _redis_set(self, key: str, entry: dict[str, Any]) -> None:
+        try:
+            _get_redis_client().set(self._redis_key(key), json.dumps(entry, default=str), ex=self.ttl_seconds)
+        except redis.RedisError as e:
+            logger.debug(f"[LLM_CACHE] Redis write failed (non-fatal): {e!r}")
+
+    async def _aredis_get(self, key: str) -> dict[str, Any] | None:
+        try:
+            raw = await _get_async_redis_client().get(self._redis_key(key))
+        except redis.RedisError as e:
+            logger.debug(f"[LLM_CACHE] Redis read failed (non-fatal): {e!r}")
+            return None
+        return json.loads(raw) if raw else None
+
+    async def _aredis_set(self, key: str, entry: dict[str, Any]) -> None:
+        try:
+            await _get_async_redis_client().set(self._redis_key(key), json.dumps(entry, default=str), ex=self.ttl_seconds)
+        except redis.RedisError as e:
+            logger.debug(f"[LLM_CACHE] Redis write failed (non-fatal): {e!r}")
+
+    def _disk_get(self, key: str) -> dict[str, Any] | None:
+        path = self._disk_path(key)
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.debug(f"[LLM_CACHE] Disk read failed for {path.name} (non-fatal): {e!r}")
+            return None
+
+        if time.time() - float(entry.get("stored_at", 0.0)) > self.ttl_seconds:
+            path.unlink(missing_ok=True)
+            with self._disk_lock:
+                if self._disk_entries is not None:
+                    self._disk_entries = max(0, self._disk_entries - 1)
+            return None
+        # Access time drives LRU eviction
+        with contextlib.suppress(OSError):
+            os.utime(path)
+        return entry
+
+    def _disk_set(self, key: str, entry: dict[str, Any]) -> None:
+        path = self._disk_path(key)
+        try:
+            self.disk_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp_path.write_text(json.dumps(entry, default=str), encoding="utf-8")
+            added = not path.exists()
+            tmp_path.replace(path)
+        except OSError as e:
+            logger.debug(f"[LLM_CACHE] Disk write failed for {path.name} (non-fatal): {e!r}")
+            return
+        if added:
+            self._entry_added()
+
+    def _entry_added(self) -> None:
+        """Count a new disk entry and evict once the limit is exceeded."""
+        with self._disk_lock:
+            if self._disk_entries is None:
+                self._disk_entries = sum(1 for _ in self.disk_dir.glob("*.json"))
+            else:
+                self._disk_entries += 1
+            if self._disk_entries > self.max_disk_entries:
+                self._evict()
+
+    def _evict(self) -> None:
+        """Drop least-recently-used disk entries beyond max_disk_entries (caller holds _disk_lock).
+
+        Re-counts the directory, so entries written by other processes sharing
+        it are accounted for.
+        """
+        entries = list(self.disk_dir.glob("*.json"))
+        excess = len(entries) - self.max_disk_entries
+        if excess > 0:
+            by_access = sorted(entries, key=_access_time)
+            for path in by_access[:excess]:
+                path.unlink(missing_ok=True)
+            logger.debug(f"[LLM_CACHE] Evicted {excess} disk entries from {self.namespace}")
+        self._disk_entries = min(len(entries), self.max_disk_entries)
@@ -4,25 +4,37 @@ This module handles:
 - LLM call for session text generation
 - Post-LLM constraint validation
 - Retry logic with exponential backoff
+- Content-addressed output cache (input + prompt + model), so identical
+  sessions across athletes and plan regenerations skip the LLM
+- Batched mode: all sessions of a week in one structured-output request
 """
 
 import asyncio
 import json
+import time
 import traceback
-from pathlib import Path
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict
+from typing import Any
 
 from loguru import logger
 from pydantic import ValidationError
 from pydantic_ai import Agent
 
 from app.coach.config.models import USER_FACING_MODEL
+from app.coach.prompts.registry import get_prompt
 from app.domains.training_plan.models import SessionTextInput, SessionTextOutput
-from app.domains.training_plan.schemas import SessionTextOutputSchema
+from app.domains.training_plan.schemas import SessionTextBatchSchema, SessionTextOutputSchema
+from app.infra.llm.output_cache import LLMOutputCache, content_key
+from app.services.llm.hedging import LLMBudgetExceededError, hedged
 from app.services.llm.model import get_model
+from app.services.llm.telemetry import llm_call_site, record_cache_hit, with_llm_call_site
+
+_OUTPUT_CACHE = LLMOutputCache("session_text")
 
 
 def _load_prompt() -> str:
-    """Load session text generator prompt from local filesystem.
+    """Load session text generator prompt from the prompt registry.
 
     Returns:
         Prompt content as string
@@ -30,13 +42,42 @@ def _load_prompt() -> str:
     Raises:
         FileNotFoundError: If prompt file doesn't exist
     """
-    prompt_dir = Path(__file__).parent.parent.parent / "planner" / "prompts"
-    prompt_path = prompt_dir / "session_text_generator.txt"
+    return get_prompt("session_text_generator.txt")
+
 
-    if not prompt_path.exists():
-        raise FileNotFoundError(f"Session text generator prompt not found: {prompt_path}")
+def _load_batch_prompt() -> str:
+    """Load the batched (per-week) session text prompt from the prompt registry.
 
-    return prompt_path.read_text(encoding="utf-8")
+    Returns:
+        Prompt content as string
+    """
+    return get_prompt("session_text_batch_generator.txt")
+
+
+def _session_lines(input_data: SessionTextInput) -> list[str]:
+    """Session-specific lines of a user message (type, allocation, template, constraints)."""
+    lines = [
+        f"Session type: {input_data.day_type.value}",
+        "",
+        f"Allocated distance: {input_data.allocated_distance_mi} miles",
+    ]
+
+    if input_data.allocated_duration_min is not None:
+        lines.append(f"Allocated duration: {input_data.allocated_duration_min} minutes")
+    else:
+        lines.append("Allocated duration: None")
+
+    lines.extend([
+        "",
+        f"Template kind: {input_data.template_kind}",
+        "Template parameters:",
+        json.dumps(input_data.params, indent=2, default=str),
+        "",
+        "Constraints:",
+        json.dumps(input_data.constraints, indent=2, default=str),
+    ])
+
+    return lines
 
 
 def _build_user_message(input_data: SessionTextInput) -> str:
@@ -55,25 +96,35 @@ def _build_user_message(input_data: SessionTextInput) -> str:
         f"Race distance: {input_data.race_distance or 'None'}",
         f"Phase: {input_data.phase}",
         f"Week index: {input_data.week_index}",
-        f"Session type: {input_data.day_type.value}",
-        "",
-        f"Allocated distance: {input_data.allocated_distance_mi} miles",
+        *_session_lines(input_data),
     ]
 
-    if input_data.allocated_duration_min is not None:
-        message_parts.append(f"Allocated duration: {input_data.allocated_duration_min} minutes")
-    else:
-        message_parts.append("Allocated duration: None")
+    return "\n".join(message_parts)
 
-    message_parts.extend([
-        "",
-        f"Template kind: {input_data.template_kind}",
-        "Template parameters:",
-        json.dumps(input_data.params, indent=2, default=str),
+
+def _build_batch_user_message(inputs: list[SessionTextInput]) -> str:
+    """Build the user message for a batch of sessions from one week.
+
+    Week-level context (philosophy, race distance, phase, week index) is sent
+    once; it is taken from the first input.
+
+    Args:
+        inputs: Session text inputs of one week
+
+    Returns:
+        Formatted user message string
+    """
+    first = inputs[0]
+    message_parts = [
+        f"Generate workout descriptions for the following {len(inputs)} sessions of one training week.",
         "",
-        "Constraints:",
-        json.dumps(input_data.constraints, indent=2, default=str),
-    ])
+        f"Philosophy: {first.philosophy_id}",
+        f"Race distance: {first.race_distance or 'None'}",
+        f"Phase: {first.phase}",
+        f"Week index: {first.week_index}",
+    ]
+    for number, input_data in enumerate(inputs, start=1):
+        message_parts.extend(["", f"=== Session {number} ===", *_session_lines(input_data)])
 
     return "\n".join(message_parts)
 
@@ -247,6 +298,16 @@ def _extract_raw_response(result) -> str | None:
     return None
 
 
+def _run_with(agent: Agent, prompt: str) -> Callable[[Any], Awaitable[tuple[Any, Any]]]:
+    """Run function for hedged(): one agent run, returning the model that answered and the result."""
+
+    async def _run(run_model: Any) -> tuple[Any, Any]:
+        return run_model, await agent.run(prompt, model=run_model)
+
+    return _run
+
+
+@with_llm_call_site("session_text")
 async def generate_session_text_llm(
     input_data: SessionTextInput,
     retry_on_violation: bool = True,
@@ -274,6 +335,15 @@ async def generate_session_text_llm(
     # Load system prompt
     system_prompt = _load_prompt()
 
+    # Identical input + prompt + model: reuse the validated output
+    cache_key = content_key(input_data, system_prompt, USER_FACING_MODEL)
+    cached = await _OUTPUT_CACHE.aget(cache_key)
+    if cached is not None:
+        logger.info("Session text served from LLM output cache", template_id=input_data.template_id)
+        record_cache_hit("session_text", USER_FACING_MODEL)
+        return SessionTextOutput(**cached)
+    started_at = time.monotonic()
+
     # Build user message
     user_message = _build_user_message(input_data)
 
@@ -312,7 +382,7 @@ async def generate_session_text_llm(
                 full_prompt=full_prompt,
             )
 
-            result = await agent.run(user_message)
+            answered_by, result = await hedged("session_text", _run_with(agent, user_message), model)
 
             # Extract raw response from result
             raw_response_text = _extract_raw_response(result)
@@ -388,6 +458,9 @@ async def generate_session_text_llm(
                     template_id=input_data.template_id,
                     hard_minutes=output.computed.get("hard_minutes", 0),
                 )
+                # The cache key names the primary model: output of a hedge model is not cached under it
+                if answered_by.model_name == model.model_name:
+                    await _OUTPUT_CACHE.aset(cache_key, asdict(output), latency_seconds=time.monotonic() - started_at)
                 return output
 
             # Constraint violation
@@ -406,6 +479,10 @@ async def generate_session_text_llm(
             )
             _raise_constraint_violation_error(max_attempts_constraint, input_data.template_id)
 
+        except LLMBudgetExceededError:
+            # Budget spent: do not retry, the caller falls back to deterministic text
+            raise
+
         except ValidationError as e:
             if attempt < max_attempts_constraint - 1:
                 logger.warning("Schema validation failed, retrying", extra={"attempt": attempt + 1, "error": str(e)})
@@ -458,3 +535,84 @@ async def generate_session_text_llm(
             f"LLM call failed after {max_attempts_transient} attempts: {type(last_error).__name__}: {last_error}"
         ) from last_error
     raise RuntimeError("Failed to generate session text after all attempts")
+
+
+async def generate_session_texts_batch_llm(inputs: list[SessionTextInput]) -> list[SessionTextOutput | None]:
+    """Generate session texts for one week's sessions in a single LLM request.
+
+    Cached sessions are served from the output cache; the rest are sent
+    together. Each returned item is validated with validate_llm_output().
+    This never raises: sessions whose item is missing, invalid, or whose
+    batch request failed come back as None so the caller can generate them
+    individually (generate_session_text_llm) with its retries.
+
+    Args:
+        inputs: Session text inputs of one week (shared philosophy, race
+            distance, phase and week index)
+
+    Returns:
+        Outputs in input order (None where the session still needs generating)
+    """
+    results: list[SessionTextOutput | None] = [None] * len(inputs)
+    # Keyed with the single-session prompt so batch and per-session outputs share cache entries
+    system_prompt = _load_prompt()
+    cache_keys = [content_key(input_data, system_prompt, USER_FACING_MODEL) for input_data in inputs]
+    pending: list[int] = []
+    for index, cached in enumerate(await asyncio.gather(*(_OUTPUT_CACHE.aget(cache_key) for cache_key in cache_keys))):
+        if cached is not None:
+            results[index] = SessionTextOutput(**cached)
+            record_cache_hit("session_text.batch", USER_FACING_MODEL)
+        else:
+            pending.append(index)
+
+    if not pending:
+        return results
+
+    week_index = inputs[pending[0]].week_index
+    started_at = time.monotonic()
+    agent = Agent(
+        model=get_model("openai", USER_FACING_MODEL),
+        system_prompt=_load_batch_prompt(),
+        output_type=SessionTextBatchSchema,
+    )
+    try:
+        with llm_call_site("session_text.batch"):
+            result = await agent.run(_build_batch_user_message([inputs[index] for index in pending]))
+    except Exception as e:
+        logger.warning(
+            "Batched session text request failed, generating sessions individually",
+            week_index=week_index,
+            session_count=len(pending),
+            error=str(e),
+            error_type=type(e).__name__,
+        )
+        return results
+
+    # Cache entries record each session's share of the batch latency
+    latency_per_session = (time.monotonic() - started_at) / len(pending)
+    for item in result.output.sessions:
+        if not 1 <= item.session <= len(pending):
+            continue
+        index = pending[item.session - 1]
+        if results[index] is not None:
+            continue
+        output = SessionTextOutput(
+            title=item.title,
+            description=item.description,
+            structure=item.structure,
+            computed=item.computed,
+        )
+        if validate_llm_output(inputs[index], output):
+            results[index] = output
+            await _OUTPUT_CACHE.aset(cache_keys[index], asdict(output), latency_seconds=latency_per_session)
+
+    generated = sum(1 for index in pending if results[index] is not None)
+    logger.info(
+        "Batched session text generation complete",
+        week_index=week_index,
+        requested=len(pending),
+        accepted=generated,
+        cached=len(inputs) - len(pending),
+        duration_seconds=round(time.monotonic() - started_at, 2),
+    )
+    return results
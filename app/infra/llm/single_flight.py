@@ -0,0 +1,230 @@
+"""Single-flight coalescing for identical concurrent LLM calls.
+
+When the same call (same canonical input) is issued several times while one
+is already running, only the first one reaches the LLM; the others wait for
+it and receive its result.
+
+Two levels:
+- In-process: callers share one future per call key. This works across event
+  loops (background threads run their own asyncio.run loops).
+- Across workers: the in-process leader takes a short Redis lock
+  (SET NX EX). Leaders in other workers that find the lock held poll for the
+  result handed off under a sibling key instead of calling the LLM.
+
+Failure semantics:
+- In-process followers receive the leader's exception.
+- A worker whose remote leader fails (lock released without a result) or
+  takes longer than the lock TTL runs the call itself.
+- Redis failures degrade to in-process coalescing only.
+
+Results are handed to followers as validated copies (JSON round trip through
+the call's return type), so no two callers share a mutable object.
+"""
+
+import asyncio
+import concurrent.futures
+import functools
+import hashlib
+import json
+import threading
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+from typing import Any, ParamSpec, TypeVar, get_type_hints
+
+import redis
+from loguru import logger
+from pydantic import TypeAdapter, ValidationError
+
+from app.config.settings import settings
+from app.core.redis_pool import get_redis
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+KEY_PREFIX = "llm:single_flight:"
+
+# How often a waiting worker checks for the remote leader's result
+POLL_INTERVAL_SECONDS = 0.25
+
+_flights_lock = threading.Lock()
+_flights: dict[str, concurrent.futures.Future] = {}
+
+
+class _LeaderCancelledError(Exception):
+    """The in-process leader was cancelled; followers retry the call."""
+
+
+def _get_redis_client() -> redis.Redis:
+    """Get the shared Redis client.
+
+    Returns:
+        Redis client with string decoding enabled
+    """
+    return get_redis()
+
+
+def flight_key(*parts: Any) -> str:
+    """Canonical hash of a call's inputs.
+
+    Args:
+        *parts: JSON-serializable values (dict key order is irrelevant;
+            other objects are rendered with str())
+
+    Returns:
+        Hex sha256 digest, or a unique key if the inputs cannot be canonicalized
+    """
+    try:
+        canonical = json.dumps(parts, sort_keys=True, separators=(",", ":"), default=str)
+    except (TypeError, ValueError):
+        # Unorderable keys etc.: never coalesce rather than risk a wrong match
+        return uuid.uuid4().hex
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+async def single_flight(
+    namespace: str,
+    key: str,
+    call: Callable[[], Awaitable[T]],
+    result_type: Any,
+) -> T:
+    """Run `call` unless an identical call is already in flight, then share its result.
+
+    Args:
+        namespace: Call family (e.g., "coach_llm.daily_decision")
+        key: Canonical input key from flight_key()
+        call: Zero-argument coroutine factory performing the LLM call
+        result_type: Return type of call (used to copy/hand off results)
+
+    Returns:
+        The call's result (own or shared)
+    """
+    if not settings.llm_single_flight_enabled:
+        return await call()
+
+    flight_id = f"{namespace}:{key}"
+    adapter = TypeAdapter(result_type)
+    with _flights_lock:
+        future = _flights.get(flight_id)
+        is_leader = future is None
+        if future is None:
+            future = concurrent.futures.Future()
+            _flights[flight_id] = future
+
+    if not is_leader:
+        logger.debug(f"[SINGLE_FLIGHT] Joined in-flight call: {namespace}")
+        try:
+            result = await asyncio.wrap_future(future)
+        except _LeaderCancelledError:
+            return await single_flight(namespace, key, call, result_type)
+        return adapter.validate_json(adapter.dump_json(result))
+
+    try:
+        result = await _run_across_workers(flight_id, call, adapter)
+    except asyncio.CancelledError:
+        future.set_exception(_LeaderCancelledError())
+        raise
+    except Exception as e:
+        future.set_exception(e)
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        with _flights_lock:
+            _flights.pop(flight_id, None)
+
+
+async def _run_across_workers(flight_id: str, call: Callable[[], Awaitable[T]], adapter: TypeAdapter) -> T:
+    """Run the call under the cross-worker lock, or wait for the worker holding it."""
+    lock_key = f"{KEY_PREFIX}{flight_id}:lock"
+    result_key = f"{KEY_PREFIX}{flight_id}:result"
+    token = uuid.uuid4().hex
+    try:
+        client = _get_redis_client()
+        acquired = client.set(lock_key, token, nx=True, ex=settings.llm_single_flight_lock_seconds)
+    except redis.RedisError as e:
+        logger.debug(f"[SINGLE_FLIGHT] Redis unavailable, coalescing in-process only: {e!r}")
+        return await call()
+
+    if not acquired:
+        found, result = await _wait_for_remote_result(client, lock_key, result_key, adapter)
+        if found:
+            logger.debug(f"[SINGLE_FLIGHT] Reused result from another worker: {flight_id.split(':', 1)[0]}")
+            return result
+        return await call()
+
+    try:
+        result = await call()
+        try:
+            client.set(result_key, adapter.dump_json(result), ex=settings.llm_single_flight_result_ttl_seconds)
+        except redis.RedisError as e:
+            logger.debug(f"[SINGLE_FLIGHT] Result handoff failed (non-fatal): {e!r}")
+        return result
+    finally:
+        try:
+            if client.get(lock_key) == token:
+                client.delete(lock_key)
+        except redis.RedisError as e:
+            logger.debug(f"[SINGLE_FLIGHT] Lock release failed, expires with TTL: {e!r}")
+
+
+async def _wait_for_remote_result(
+    client: redis.Redis,
+    lock_key: str,
+    result_key: str,
+    adapter: TypeAdapter,
+) -> tuple[bool, Any]:
+    """Poll for the remote leader's result until its lock is released or expires.
+
+    Returns:
+        (True, result) if the leader handed off a result, else (False, None)
+    """
+    deadline = time.monotonic() + settings.llm_single_flight_lock_seconds
+    while time.monotonic() < deadline:
+        await asyncio.sleep(POLL_INTERVAL_SECONDS)
+        try:
+            raw, locked = client.mget(result_key, lock_key)
+        except redis.RedisError:
+            return False, None
+        if raw is not None:
+            try:
+                return True, adapter.validate_json(raw)
+            except ValidationError:
+                return False, None
+        if locked is None:
+            # Leader finished without a result (failed)
+            return False, None
+    return False, None
+
+
+def coalesced(
+    namespace: str,
+    key: Callable[..., Any] | None = None,
+) -> Callable[[Callable[P, Awaitable[T]]], Callable[P, Awaitable[T]]]:
+    """Decorate an async function so identical concurrent calls share one execution.
+
+    The function's return annotation determines how results are copied and
+    handed off between workers.
+
+    Args:
+        namespace: Call family name
+        key: Maps the call's (*args, **kwargs) to the values that identify it
+            (default: all arguments). Methods use it to drop `self`.
+
+    Returns:
+        Decorator
+    """
+
+    def decorator(fn: Callable[P, Awaitable[T]]) -> Callable[P, Awaitable[T]]:
+        result_type = get_type_hints(fn)["return"]
+
+        @functools.wraps(fn)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+            identity = key(*args, **kwargs) if key else (args, kwargs)
+            # Key is computed before the call: callers may mutate inputs while retrying
+            return await single_flight(namespace, flight_key(identity), lambda: fn(*args, **kwargs), result_type)
+
+        return wrapper
+
+    return decorator
@@ -3,17 +3,16 @@ from __future__ import annotations
 import uuid
 from contextlib import contextmanager
 
-import redis
 from loguru import logger
 
-from app.config.settings import settings
+from app.core.redis_pool import get_redis
 
 LOCK_TTL_SECONDS = 10 * 60  # 10 minutes
 
 
 class RedisLockManager:
     def __init__(self) -> None:
-        self.redis = redis.from_url(settings.redis_url, decode_responses=True)
+        self.redis = get_redis()
 
     @contextmanager
     def acquire(self, key: str):
@@ -4,10 +4,9 @@ import asyncio
 import inspect
 import time
 
-import redis
 from loguru import logger
 
-from app.config.settings import settings
+from app.core.redis_pool import get_redis
 
 # Redis keys
 KEY_15M_USED = "strava:quota:15m:used"
@@ -27,7 +26,7 @@ class RedisStravaQuotaManager:
     TTL_DAILY = 24 * 60 * 60
 
     def __init__(self) -> None:
-        self.redis = redis.from_url(settings.redis_url, decode_responses=True)
+        self.redis = get_redis()
 
     def _get_int(self, key: str) -> int:
         value = self.redis.get(key)
@@ -0,0 +1,27 @@
+"""LLM telemetry collector (read-only).
+
+Per-call-site requests, tokens, cost and latency of this worker, from
+app.services.llm.telemetry.
+"""
+
+from app.internal.ai_ops.types import LlmCallSiteStats, LlmLatencyStats, LlmTelemetryStats
+from app.services.llm.telemetry import get_llm_telemetry
+
+
+def collect_llm_telemetry() -> LlmTelemetryStats:
+    """Collect LLM call telemetry.
+
+    Returns:
+        LlmTelemetryStats with call sites sorted by cost (most expensive first)
+    """
+    telemetry = get_llm_telemetry()
+    return LlmTelemetryStats(
+        since=telemetry["since"],
+        window_seconds=telemetry["window_seconds"],
+        total_requests=telemetry["total_requests"],
+        total_cost_usd=telemetry["total_cost_usd"],
+        call_sites=[
+            LlmCallSiteStats(**{**site, "latency_ms": LlmLatencyStats(**site["latency_ms"])})
+            for site in telemetry["call_sites"]
+        ],
+    )
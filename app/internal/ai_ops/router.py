@@ -3,6 +3,7 @@
 from fastapi import APIRouter
 
 from app.internal.ai_ops.cache import get_cached_ai_ops_summary
+from app.internal.ai_ops.llm_telemetry import collect_llm_telemetry
 
 router = APIRouter(
     prefix="/internal/ai",
@@ -19,3 +20,13 @@ async def get_ai_ops_summary():
         AiOpsSummary with all metrics aggregated
     """
     return get_cached_ai_ops_summary()
+
+
+@router.get("/llm-telemetry")
+async def get_llm_telemetry():
+    """Get LLM call telemetry of this worker (not cached).
+
+    Returns:
+        LlmTelemetryStats with requests, tokens, cost and latency per call site
+    """
+    return collect_llm_telemetry()
@@ -64,3 +64,38 @@ class AiOpsSummary:
     rag: RagStats
     conversation: ConversationStats
     audit: AuditStats
+
+
+@dataclass(frozen=True)
+class LlmLatencyStats:
+    count: int
+    p50: float
+    p90: float
+    p99: float
+    max: float
+
+
+@dataclass(frozen=True)
+class LlmCallSiteStats:
+    call_site: str
+    model: str
+    requests: int
+    errors: int
+    throttled: int
+    retries: int
+    cache_hits: int
+    input_tokens: int
+    output_tokens: int
+    cache_read_tokens: int
+    cost_usd: float
+    latency_ms: LlmLatencyStats
+    tokens_per_request: dict[str, int]
+
+
+@dataclass(frozen=True)
+class LlmTelemetryStats:
+    since: str
+    window_seconds: int
+    total_requests: int
+    total_cost_usd: float
+    call_sites: list[LlmCallSiteStats]
@@ -2,7 +2,21 @@
 
 from fastapi import APIRouter
 
+from app.coach.agents.intent_router import get_router_stats
 from app.internal.ops.cache import get_cached_ops_summary
+from app.internal.ops.types import (
+    IntentRouterStats,
+    IntentRouterTierStats,
+    LLMClientPoolStats,
+    LLMGovernorStats,
+    LLMLaneStats,
+    LLMModelRegistryStats,
+    LLMTransportStats,
+    PlanningCacheStats,
+)
+from app.planning.cache import get_cache_stats
+from app.services.llm.client_pool import get_client_pool_stats
+from app.services.llm.governor import get_governor_stats
 
 router = APIRouter(prefix="/internal/ops", tags=["internal"])
 
@@ -15,3 +29,51 @@ async def get_ops_summary():
         OpsSummary with all metrics aggregated
     """
     return get_cached_ops_summary()
+
+
+@router.get("/planning-cache")
+async def get_planning_cache_stats():
+    """Get session plan cache counters for this worker.
+
+    Returns:
+        PlanningCacheStats (hit/miss/eviction counters and memory usage)
+    """
+    return PlanningCacheStats(**get_cache_stats())
+
+
+@router.get("/llm-governor")
+async def get_llm_governor_stats():
+    """Get the LLM concurrency governor state for this worker.
+
+    Returns:
+        LLMGovernorStats (adaptive limit, in-flight requests, per-lane queue metrics)
+    """
+    stats = get_governor_stats()
+    lanes = {lane: LLMLaneStats(**lane_stats) for lane, lane_stats in stats.pop("lanes").items()}
+    return LLMGovernorStats(**stats, lanes=lanes)
+
+
+@router.get("/llm-clients")
+async def get_llm_client_pool_stats():
+    """Get shared model client and HTTP transport counters for this worker.
+
+    Returns:
+        LLMClientPoolStats (model reuse, per-transport connection reuse and
+        open/idle connections)
+    """
+    stats = get_client_pool_stats()
+    transports = {name: LLMTransportStats(**transport) for name, transport in stats["transports"].items()}
+    return LLMClientPoolStats(models=LLMModelRegistryStats(**stats["models"]), transports=transports)
+
+
+@router.get("/intent-router")
+async def get_intent_router_stats():
+    """Get chat intent routing counters for this worker.
+
+    Returns:
+        IntentRouterStats (fraction of turns resolved without an LLM call,
+        per-tier attempts/resolutions/latency)
+    """
+    stats = get_router_stats()
+    tiers = {tier: IntentRouterTierStats(**tier_stats) for tier, tier_stats in stats.pop("tiers").items()}
+    return IntentRouterStats(**stats, tiers=tiers)
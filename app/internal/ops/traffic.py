@@ -13,7 +13,7 @@ from collections import deque
 import redis
 from loguru import logger
 
-from app.config.settings import settings
+from app.core.redis_pool import get_redis
 from app.internal.ops.types import TrafficSnapshot
 
 # In-memory counters (reset on restart)
@@ -45,7 +45,7 @@ def _get_redis_client() -> redis.Redis:
     Returns:
         Redis client with string decoding enabled
     """
-    return redis.from_url(settings.redis_url, decode_responses=True)
+    return get_redis()
 
 
 def record_request() -> None:
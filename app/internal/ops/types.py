@@ -63,3 +63,90 @@ class OpsSummary:
     sla_threshold: float
     services: list[ServiceHealth]
     traffic: TrafficSnapshot
+
+
+@dataclass(frozen=True)
+class PlanningCacheStats:
+    """Session plan cache counters (app.planning.cache)."""
+
+    memory_hits: int
+    redis_hits: int
+    misses: int
+    sets: int
+    evictions: int
+    entries: int
+    memory_bytes: int
+    max_memory_bytes: int
+    library_version: str
+
+
+@dataclass(frozen=True)
+class LLMLaneStats:
+    """Queue metrics of one LLM governor priority lane."""
+
+    queue_depth: int
+    granted: int
+    avg_wait_ms: float
+    max_wait_ms: float
+
+
+@dataclass(frozen=True)
+class LLMGovernorStats:
+    """Process-wide LLM concurrency governor state (app.services.llm.governor)."""
+
+    limit: float
+    in_flight: int
+    throttled: int
+    slow: int
+    lanes: dict[str, LLMLaneStats]
+
+
+@dataclass(frozen=True)
+class IntentRouterTierStats:
+    """Counters of one intent router tier."""
+
+    attempts: int
+    resolved: int
+    avg_ms: float
+    max_ms: float
+
+
+@dataclass(frozen=True)
+class IntentRouterStats:
+    """Chat intent routing counters (app.coach.agents.intent_router)."""
+
+    turns: int
+    resolved_without_llm: float
+    tiers: dict[str, IntentRouterTierStats]
+
+
+@dataclass(frozen=True)
+class LLMModelRegistryStats:
+    """Reuse of pooled model instances."""
+
+    cached: int
+    built: int
+    reused: int
+    reuse_rate: float
+
+
+@dataclass(frozen=True)
+class LLMTransportStats:
+    """Connection reuse of one shared model HTTP transport."""
+
+    requests: int
+    connections_opened: int
+    tls_handshakes: int
+    connection_reuse_rate: float
+    open_connections: int
+    idle_connections: int
+    max_connections: int
+    max_keepalive_connections: int
+
+
+@dataclass(frozen=True)
+class LLMClientPoolStats:
+    """Shared model clients and transports (app.services.llm.client_pool)."""
+
+    models: LLMModelRegistryStats
+    transports: dict[str, LLMTransportStats]
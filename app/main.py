@@ -53,13 +53,16 @@ from app.api.training.training import router as training_router
 from app.api.user.me import router as me_router
 from app.calendar.api import planned_sessions_router
 from app.calendar.api import router as calendar_router
+from app.calendar.reconciliation_store import register_reconciliation_listeners
 from app.coach.api import router as coach_router
 from app.coach.api_chat import router as coach_chat_router
 from app.config.settings import settings
 from app.core.conversation_id import conversation_id_middleware
+from app.core.data_version import register_data_version_listeners
 from app.core.logger import setup_logger
 from app.core.memory_middleware import memory_monitoring_middleware
 from app.core.observe import init as observe_init
+from app.core.summarization_queue import summarization_tick
 from app.core.system_memory import log_connection_pool_status, log_memory_snapshot
 from app.db.models import Base
 from app.db.schema_check import verify_schema
@@ -76,8 +79,10 @@ from app.internal.ops.router import router as ops_router
 from app.internal.ops.summary import set_process_start_time
 from app.internal.ops.traffic import record_request
 from app.metrics.scheduled_recompute import recompute_metrics_for_all_users
+from app.services.athlete_profile_regeneration import bio_regeneration_tick
 from app.services.intelligence.scheduler import generate_daily_decisions_for_all_users
 from app.services.intelligence.weekly_report_metrics import update_all_recent_weekly_reports_for_all_users
+from app.services.llm.governor import BACKGROUND, llm_priority
 from app.webhooks.garmin import router as webhooks_garmin_router
 from app.webhooks.strava import router as webhooks_router
 from app.workouts.routes import router as workouts_router
@@ -710,6 +715,12 @@ async def lifespan(_app: FastAPI):
     set_process_start_time(time.time())
     logger.info("[OPS] Initialized ops metrics tracking")
 
+    # Keep stored calendar reconciliation current from write paths (reads are lookups only)
+    register_reconciliation_listeners()
+
+    # Bump per-user data versions on commit (drives ETags / response cache for polled endpoints)
+    register_data_version_listeners()
+
     # Log initial memory snapshot (baseline before any heavy initialization)
     try:
         log_memory_snapshot("startup_baseline")
@@ -782,9 +793,11 @@ async def deferred_heavy_init():
         try:
             logging.info(">>> deferred_heavy_init: starting scheduler <<<")
             scheduler = BackgroundScheduler()
+            # Scheduler jobs queue behind chat and plan generation for LLM capacity
+            background_llm = llm_priority(BACKGROUND)
             # Run background sync every 6 hours (Step 5: automated sync)
             scheduler.add_job(
-                sync_tick,
+                background_llm(sync_tick),
                 trigger=IntervalTrigger(hours=6),
                 id="strava_background_sync",
                 name="Strava Background Sync",
@@ -795,16 +808,36 @@ async def deferred_heavy_init():
             # Automatically stops when quota is exhausted, redistributes as users complete
             # Maximizes throughput by using as much available quota as possible
             scheduler.add_job(
-                ingestion_tick,
+                background_llm(ingestion_tick),
                 trigger=IntervalTrigger(minutes=30),
                 id="strava_ingestion_tick",
                 name="Strava Ingestion Tick (History Backfill - Dynamic Quota)",
                 replace_existing=True,
             )
+            # Summarize conversations queued by the prompt builder (off the request path)
+            scheduler.add_job(
+                background_llm(summarization_tick),
+                trigger=IntervalTrigger(minutes=1),
+                id="conversation_summarization",
+                name="Conversation Summarization Worker",
+                replace_existing=True,
+                max_instances=1,
+                coalesce=True,
+            )
+            # Regenerate stale AI-generated athlete bios (off the request path)
+            scheduler.add_job(
+                background_llm(bio_regeneration_tick),
+                trigger=IntervalTrigger(minutes=5),
+                id="athlete_bio_regeneration",
+                name="Athlete Bio Regeneration",
+                replace_existing=True,
+                max_instances=1,
+                coalesce=True,
+            )
             # Run daily decision generation overnight at 2 AM UTC
             # Additional triggers: on-demand when user opens app, and when activities/sessions are created/updated
             scheduler.add_job(
-                generate_daily_decisions_for_all_users,
+                background_llm(generate_daily_decisions_for_all_users),
                 trigger=CronTrigger(hour=2, minute=0),
                 id="daily_decision_generation",
                 name="Daily Decision Generation",
@@ -812,7 +845,7 @@ async def deferred_heavy_init():
             )
             # Run weekly report metrics update on Sundays at 3 AM UTC (after week ends)
             scheduler.add_job(
-                update_all_recent_weekly_reports_for_all_users,
+                background_llm(update_all_recent_weekly_reports_for_all_users),
                 trigger=CronTrigger(day_of_week=6, hour=3, minute=0),  # Sunday 3 AM UTC
                 id="weekly_report_metrics_update",
                 name="Weekly Report Metrics Update",
@@ -820,7 +853,7 @@ async def deferred_heavy_init():
             )
             # Run daily training load metrics recomputation daily at 4 AM UTC
             scheduler.add_job(
-                recompute_metrics_for_all_users,
+                background_llm(recompute_metrics_for_all_users),
                 trigger=CronTrigger(hour=4, minute=0),  # Daily at 4 AM UTC
                 id="daily_training_load_recompute",
                 name="Daily Training Load Metrics Recomputation",
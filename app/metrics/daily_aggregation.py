@@ -15,6 +15,7 @@ from sqlalchemy import bindparam, func, select, text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Session
 
+from app.core.data_version import bump_data_version
 from app.db.models import Activity, StravaAccount
 from app.db.session import get_session
 from app.metrics.training_load import DailyTrainingRow
@@ -136,6 +137,9 @@ def aggregate_daily_training(user_id: str) -> None:
 
         session.commit()
 
+    # Raw-SQL writes bypass the ORM hooks; invalidate /me/overview explicitly
+    bump_data_version([user_id])
+
 
 def get_daily_rows(session: Session, user_id: str, days: int = 60) -> list[DailyTrainingRow]:
     """Get daily training rows from daily_training_summary.
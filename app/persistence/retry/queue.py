@@ -7,7 +7,7 @@ from typing import Optional
 import redis
 from loguru import logger
 
-from app.config.settings import settings
+from app.core.redis_pool import get_redis
 from app.persistence.retry.types import PlannedSessionRetryJob
 
 QUEUE_KEY = "planned_sessions_retry"
@@ -20,7 +20,7 @@ def _get_redis_client() -> redis.Redis | None:
         Redis client if available, None otherwise (best-effort)
     """
     try:
-        return redis.from_url(settings.redis_url, decode_responses=True)
+        return get_redis()
     except Exception as e:
         logger.bind(error=str(e)).warning("Failed to connect to Redis for retry queue")
         return None
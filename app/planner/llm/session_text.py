@@ -4,25 +4,32 @@ This module handles:
 - LLM call for session text generation
 - Post-LLM constraint validation
 - Retry logic with exponential backoff
+- Content-addressed output cache (input + prompt + model), so identical
+  sessions across athletes and plan regenerations skip the LLM
 """
 
 import asyncio
 import json
+import time
 import traceback
-from pathlib import Path
+from dataclasses import asdict
 
 from loguru import logger
 from pydantic import ValidationError
 from pydantic_ai import Agent
 
 from app.coach.config.models import USER_FACING_MODEL
+from app.coach.prompts.registry import get_prompt
 from app.domains.training_plan.models import SessionTextInput, SessionTextOutput
 from app.domains.training_plan.schemas import SessionTextOutputSchema
+from app.infra.llm.output_cache import LLMOutputCache, content_key
 from app.services.llm.model import get_model
 
+_OUTPUT_CACHE = LLMOutputCache("session_text")
+
 
 def _load_prompt() -> str:
-    """Load session text generator prompt from local filesystem.
+    """Load session text generator prompt from the prompt registry.
 
     Returns:
         Prompt content as string
@@ -30,13 +37,7 @@ def _load_prompt() -> str:
     Raises:
         FileNotFoundError: If prompt file doesn't exist
     """
-    prompt_dir = Path(__file__).parent.parent / "prompts"
-    prompt_path = prompt_dir / "session_text_generator.txt"
-
-    if not prompt_path.exists():
-        raise FileNotFoundError(f"Session text generator prompt not found: {prompt_path}")
-
-    return prompt_path.read_text(encoding="utf-8")
+    return get_prompt("session_text_generator.txt")
 
 
 def _build_user_message(input_data: SessionTextInput) -> str:
@@ -274,6 +275,14 @@ async def generate_session_text_llm(
     # Load system prompt
     system_prompt = _load_prompt()
 
+    # Identical input + prompt + model: reuse the validated output
+    cache_key = content_key(input_data, system_prompt, USER_FACING_MODEL)
+    cached = await _OUTPUT_CACHE.aget(cache_key)
+    if cached is not None:
+        logger.info("Session text served from LLM output cache", template_id=input_data.template_id)
+        return SessionTextOutput(**cached)
+    started_at = time.monotonic()
+
     # Build user message
     user_message = _build_user_message(input_data)
 
@@ -388,6 +397,7 @@ async def generate_session_text_llm(
                     template_id=input_data.template_id,
                     hard_minutes=output.computed.get("hard_minutes", 0),
                 )
+                await _OUTPUT_CACHE.aset(cache_key, asdict(output), latency_seconds=time.monotonic() - started_at)
                 return output
 
             # Constraint violation
@@ -13,13 +13,13 @@ Key constraints:
 """
 
 import json
-from pathlib import Path
 
 from loguru import logger
 from pydantic import ValidationError
 from pydantic_ai import Agent
 
 from app.coach.config.models import USER_FACING_MODEL
+from app.coach.prompts.registry import get_prompt
 from app.coach.schemas.athlete_state import AthleteState
 from app.planner.enums import PlanType, WeekFocus
 from app.planner.errors import InvalidMacroPlanError
@@ -30,7 +30,7 @@ from app.services.llm.model import get_model
 
 
 def _load_prompt() -> str:
-    """Load macro plan prompt from local filesystem.
+    """Load macro plan prompt from the prompt registry.
 
     Returns:
         Prompt content as string
@@ -38,13 +38,7 @@ def _load_prompt() -> str:
     Raises:
         FileNotFoundError: If prompt file doesn't exist
     """
-    prompt_dir = Path(__file__).parent / "prompts"
-    prompt_path = prompt_dir / "macro_plan.txt"
-
-    if not prompt_path.exists():
-        raise FileNotFoundError(f"Macro plan prompt not found: {prompt_path}")
-
-    return prompt_path.read_text(encoding="utf-8")
+    return get_prompt("macro_plan.txt")
 
 
 def _build_llm_input(
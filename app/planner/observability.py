@@ -5,8 +5,10 @@ This module provides:
 - Stage-level timing
 - Metrics counters for success/failure rates
 - Funnel tracking for debugging
+- LLM output cache hit rate and saved latency
 """
 
+import threading
 import time
 from contextlib import contextmanager
 from enum import StrEnum
@@ -121,3 +123,68 @@ def timing(metric_name: str):
             metric=metric_name,
             duration_seconds=elapsed,
         )
+
+
+# In-process counters for LLM output caches, keyed by cache name
+_cache_stats: dict[str, dict[str, float]] = {}
+_cache_stats_lock = threading.Lock()
+
+
+def record_cache_lookup(
+    cache: str,
+    hit: bool,
+    tier: str | None = None,
+    saved_seconds: float = 0.0,
+) -> None:
+    """Record an LLM output cache lookup.
+
+    Hits report the generation latency they avoided, so hit rate and saved
+    time can be tracked per cache.
+
+    Args:
+        cache: Cache name (e.g., "session_text")
+        hit: Whether the lookup was served from cache
+        tier: Tier that served the hit ("redis" or "disk")
+        saved_seconds: LLM latency avoided by the hit
+    """
+    with _cache_stats_lock:
+        stats = _cache_stats.setdefault(cache, {"hits": 0, "misses": 0, "saved_seconds": 0.0})
+        if hit:
+            stats["hits"] += 1
+            stats["saved_seconds"] += saved_seconds
+        else:
+            stats["misses"] += 1
+        lookups = stats["hits"] + stats["misses"]
+        hit_rate = stats["hits"] / lookups
+
+    log_event(
+        "planner_cache_lookup",
+        cache=cache,
+        hit=hit,
+        tier=tier,
+        saved_seconds=round(saved_seconds, 3),
+        hit_rate=round(hit_rate, 4),
+    )
+
+
+def get_cache_stats() -> dict[str, dict[str, float]]:
+    """Get per-cache hit/miss counters, hit rate and total saved latency.
+
+    Returns:
+        Mapping of cache name -> {"hits", "misses", "hit_rate", "saved_seconds"}
+    """
+    with _cache_stats_lock:
+        result: dict[str, dict[str, float]] = {}
+        for cache, stats in _cache_stats.items():
+            lookups = stats["hits"] + stats["misses"]
+            result[cache] = {
+                **stats,
+                "hit_rate": stats["hits"] / lookups if lookups else 0.0,
+            }
+        return result
+
+
+def reset_cache_stats() -> None:
+    """Reset LLM output cache counters (tests / process restart)."""
+    with _cache_stats_lock:
+        _cache_stats.clear()
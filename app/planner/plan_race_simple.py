@@ -28,6 +28,7 @@ from app.coach.conversation_store import ConversationStore
 from app.coach.progress import PlanProgressStage
 from app.coach.progress_emitter import emit_plan_progress
 from app.coach.schemas.athlete_state import AthleteState
+from app.config.settings import settings
 from app.domains.training_plan.enums import PlanType, RaceDistance, TrainingIntent, WeekFocus
 from app.domains.training_plan.guards import (
     assert_new_planner_only,
@@ -54,7 +55,7 @@ from app.domains.training_plan.observability import (
 )
 from app.domains.training_plan.plan_pipeline import build_plan_structure
 from app.domains.training_plan.session_template_selector import select_templates_for_week
-from app.domains.training_plan.session_text_generator import generate_session_text
+from app.domains.training_plan.session_text_generator import generate_session_text, generate_session_texts
 from app.domains.training_plan.volume_allocator import allocate_week_volume
 from app.planner.calendar_persistence import PersistResult, persist_plan
 from app.planner.enums import DayType
@@ -220,7 +221,8 @@ async def _generate_week_with_text(
 ) -> PlannedWeek:
     """Generate session text for a week and return PlannedWeek.
 
-    Parallelizes session text generation within the week for better performance.
+    Generates the week's session texts in one batched LLM request (or one
+    request per session in parallel when batching is disabled).
 
     Args:
         week_idx: Week index (0-based)
@@ -244,16 +246,18 @@ async def _generate_week_with_text(
                 "is_plan_creation": True,  # Fix 2: Mark as plan creation (fail hard on LLM errors)
             }
 
-            # Parallelize session text generation within the week
-            # Semaphore is handled inside generate_session_text to limit concurrent LLM calls
-            async def generate_session_with_text(session: PlannedSession) -> PlannedSession:
-                session_text = await generate_session_text(session, context_dict)
-                return session.with_text(session_text)
-
-            # Generate all session texts in parallel (limited by semaphore)
-            sessions_with_text = await asyncio.gather(
-                *[generate_session_with_text(session) for session in planned_sessions]
-            )
+            if settings.session_text_batch_enabled:
+                # One LLM request for the whole week; failing sessions are retried individually
+                session_texts = await generate_session_texts(planned_sessions, context_dict)
+            else:
+                # One request per session, in parallel (admitted by the LLM governor, plan lane)
+                session_texts = await asyncio.gather(
+                    *[generate_session_text(session, context_dict) for session in planned_sessions]
+                )
+            sessions_with_text = [
+                session.with_text(session_text)
+                for session, session_text in zip(planned_sessions, session_texts, strict=True)
+            ]
 
             # Fix 1: Hard invariant after B6 - all sessions must have text_output
             for session in sessions_with_text:
@@ -18,14 +18,13 @@ Key constraints:
 - Must NOT invent workout types
 """
 
-import asyncio
 import hashlib
 import json
 
 import redis
 from loguru import logger
 
-from app.config.settings import settings
+from app.core.redis_pool import get_redis
 from app.domains.training_plan.enums import DayType as DomainDayType
 from app.domains.training_plan.models import SessionTextInput as DomainSessionTextInput
 from app.domains.training_plan.models import SessionTextOutput as DomainSessionTextOutput
@@ -33,26 +32,7 @@ from app.planner.enums import DayType
 from app.planner.llm.fallback import generate_fallback_session_text
 from app.planner.llm.session_text import generate_session_text_llm
 from app.planner.models import PlannedSession, PlannedWeek, SessionTextOutput
-
-# Semaphore to limit concurrent LLM calls for session text generation
-# Prevents rate limit errors by limiting concurrent API calls
-# Shared across all session text generation calls
-_LLM_SEMAPHORE: asyncio.Semaphore | None = None
-
-
-def _get_llm_semaphore() -> asyncio.Semaphore:
-    """Get or create the shared LLM semaphore.
-
-    Returns:
-        Shared semaphore limiting concurrent LLM calls
-    """
-    global _LLM_SEMAPHORE
-    if _LLM_SEMAPHORE is None:
-        # Reduced to 3 for Render deployment to avoid overwhelming resources
-        # and prevent rate limit errors
-        _LLM_SEMAPHORE = asyncio.Semaphore(3)  # Max 3 concurrent LLM calls
-    return _LLM_SEMAPHORE
-
+from app.services.llm.governor import PLAN, llm_priority
 
 # Cache TTL: 7 days (sessions are deterministic for same inputs)
 CACHE_TTL_SECONDS = 7 * 24 * 60 * 60
@@ -64,7 +44,7 @@ def _get_redis_client() -> redis.Redis:
     Returns:
         Redis client with string decoding enabled
     """
-    return redis.from_url(settings.redis_url, decode_responses=True)
+    return get_redis()
 
 
 def _generate_cache_key(input_data: DomainSessionTextInput) -> str:
@@ -232,10 +212,9 @@ async def generate_session_text(session: PlannedSession, context: dict) -> Sessi
             logger.debug("Using cached session text", template_id=session.template.template_id)
             return _session_text_output_from_dict(cached)
 
-    # Try LLM generation (with semaphore to limit concurrent calls)
+    # Try LLM generation (concurrency is bounded by the process-wide LLM governor)
     try:
-        semaphore = _get_llm_semaphore()
-        async with semaphore:
+        with llm_priority(PLAN):
             domain_output = await generate_session_text_llm(input_data, retry_on_violation=True)
         output = _convert_domain_to_planner_output(domain_output)
         _set_cached_output(cache_key, output)
@@ -1,29 +1,118 @@
+"""Session plan cache (memory LRU + shared Redis tier).
+
+Entries are keyed by a stable sha256 of the SessionSpec fields that reach
+the LLM prompt, so keys agree across workers and restarts (unlike hash()).
+Every key is prefixed with the template library version: editing the
+template library or the session prompt orphans old entries instead of
+serving them.
+
+Tiers:
+- In-process LRU bounded by serialized size (MAX_MEMORY_BYTES)
+- Redis, shared by all workers, with REDIS_TTL_SECONDS expiry
+
+Redis failures are non-fatal; the memory tier keeps working on its own.
+Hit/miss/eviction counters are exposed via get_cache_stats() on the
+internal ops router.
+"""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+import redis
 from loguru import logger
 
+from app.core.redis_pool import get_redis
 from app.planning.schema.session_output import SessionPlan
 from app.planning.schema.session_spec import SessionSpec
 
-_spec_cache: dict[int, SessionPlan] = {}
+# Memory tier budget (sum of serialized plan sizes)
+MAX_MEMORY_BYTES = 8 * 1024 * 1024
+
+# Redis tier TTL: 7 days
+REDIS_TTL_SECONDS = 7 * 24 * 60 * 60
+
+_TEMPLATES_DIR = Path(__file__).parent.parent.parent / "data" / "rag" / "planning" / "templates"
+_PROMPT_PATH = Path(__file__).parent / "llm" / "plan_session.py"
+
+_lock = threading.Lock()
+_spec_cache: OrderedDict[str, str] = OrderedDict()
+_memory_bytes = 0
+_stats = {"memory_hits": 0, "redis_hits": 0, "misses": 0, "sets": 0, "evictions": 0}
+
+_library_version: str | None = None
+
+
+def _get_redis_client() -> redis.Redis:
+    """Get the shared Redis client.
+
+    Returns:
+        Redis client with string decoding enabled
+    """
+    return get_redis()
+
+
+def get_template_library_version() -> str:
+    """Content hash of the template library and session prompt (computed once).
+
+    Returns:
+        Short hex digest; identical for identical library contents on every worker
+    """
+    global _library_version
+    if _library_version is None:
+        digest = hashlib.sha256()
+        paths = sorted(_TEMPLATES_DIR.rglob("*.md")) if _TEMPLATES_DIR.exists() else []
+        for path in [*paths, _PROMPT_PATH]:
+            if path.exists():
+                digest.update(path.name.encode())
+                digest.update(path.read_bytes())
+        _library_version = digest.hexdigest()[:12]
+    return _library_version
 
 
-def _cache_key(spec: SessionSpec) -> int:
-    """Generate cache key from SessionSpec.
+def _cache_key(spec: SessionSpec) -> str:
+    """Generate a stable cache key from SessionSpec.
 
     Args:
         spec: SessionSpec to generate key for
 
     Returns:
-        Hash integer for caching
+        Hex sha256 of the prompt-relevant spec fields
     """
-    key_tuple = (
-        spec.sport.value,
-        spec.session_type.value,
-        spec.intensity.value,
-        spec.target_distance_km,
-        spec.target_duration_min,
-        spec.phase,
-    )
-    return hash(key_tuple)
+    key_fields = {
+        "sport": spec.sport.value,
+        "session_type": spec.session_type.value,
+        "intensity": spec.intensity.value,
+        "target_distance_km": spec.target_distance_km,
+        "target_duration_min": spec.target_duration_min,
+        "phase": spec.phase,
+        "goal": spec.goal,
+    }
+    return hashlib.sha256(json.dumps(key_fields, sort_keys=True).encode()).hexdigest()
+
+
+def _redis_key(key: str) -> str:
+    return f"planning:session_plan:{get_template_library_version()}:{key}"
+
+
+def _remember(key: str, payload: str) -> None:
+    """Insert into the memory tier and evict least-recently-used entries over budget."""
+    global _memory_bytes
+    size = len(payload)
+    if size > MAX_MEMORY_BYTES:
+        return
+    with _lock:
+        previous = _spec_cache.pop(key, None)
+        if previous is not None:
+            _memory_bytes -= len(previous)
+        _spec_cache[key] = payload
+        _memory_bytes += size
+        while _memory_bytes > MAX_MEMORY_BYTES:
+            _, evicted = _spec_cache.popitem(last=False)
+            _memory_bytes -= len(evicted)
+            _stats["evictions"] += 1
 
 
 def get_cached_session(spec: SessionSpec) -> SessionPlan | None:
@@ -36,16 +125,36 @@ def get_cached_session(spec: SessionSpec) -> SessionPlan | None:
         Cached SessionPlan or None if not found
     """
     key = _cache_key(spec)
-    cached = _spec_cache.get(key)
-    if cached:
-        logger.debug(
-            "planning_cache: Cache hit",
-            cache_key=key,
-            sport=spec.sport.value,
-            session_type=spec.session_type.value,
-            intensity=spec.intensity.value,
-        )
-    return cached
+    with _lock:
+        payload = _spec_cache.get(key)
+        if payload is not None:
+            _spec_cache.move_to_end(key)
+            _stats["memory_hits"] += 1
+    tier = "memory"
+
+    if payload is None:
+        tier = "redis"
+        try:
+            payload = _get_redis_client().get(_redis_key(key))
+        except redis.RedisError as e:
+            logger.debug(f"planning_cache: Redis read failed (non-fatal): {e!r}")
+        if payload is None:
+            with _lock:
+                _stats["misses"] += 1
+            return None
+        with _lock:
+            _stats["redis_hits"] += 1
+        _remember(key, payload)
+
+    logger.debug(
+        "planning_cache: Cache hit",
+        cache_key=key[:16],
+        tier=tier,
+        sport=spec.sport.value,
+        session_type=spec.session_type.value,
+        intensity=spec.intensity.value,
+    )
+    return SessionPlan.model_validate_json(payload)
 
 
 def set_cached_session(spec: SessionSpec, plan: SessionPlan) -> None:
@@ -56,17 +165,53 @@ def set_cached_session(spec: SessionSpec, plan: SessionPlan) -> None:
         plan: SessionPlan to cache
     """
     key = _cache_key(spec)
-    _spec_cache[key] = plan
+    payload = plan.model_dump_json()
+    _remember(key, payload)
+    with _lock:
+        _stats["sets"] += 1
+    try:
+        _get_redis_client().set(_redis_key(key), payload, ex=REDIS_TTL_SECONDS)
+    except redis.RedisError as e:
+        logger.debug(f"planning_cache: Redis write failed (non-fatal): {e!r}")
     logger.debug(
         "planning_cache: Cache set",
-        cache_key=key,
+        cache_key=key[:16],
         sport=spec.sport.value,
         session_type=spec.session_type.value,
         intensity=spec.intensity.value,
     )
 
 
+def get_cache_stats() -> dict[str, int | str]:
+    """Get cache counters and memory usage.
+
+    Returns:
+        Dict with hit/miss/set/eviction counters, entry count, bytes used,
+        byte budget and template library version
+    """
+    with _lock:
+        return {
+            **_stats,
+            "entries": len(_spec_cache),
+            "memory_bytes": _memory_bytes,
+            "max_memory_bytes": MAX_MEMORY_BYTES,
+            "library_version": get_template_library_version(),
+        }
+
+
 def clear_cache() -> None:
-    """Clear the session plan cache."""
-    _spec_cache.clear()
+    """Clear the session plan cache (memory tier and current-version Redis entries)."""
+    global _memory_bytes
+    with _lock:
+        _spec_cache.clear()
+        _memory_bytes = 0
+        for counter in _stats:
+            _stats[counter] = 0
+    try:
+        client = _get_redis_client()
+        keys = list(client.scan_iter(match=_redis_key("*"), count=500))
+        if keys:
+            client.delete(*keys)
+    except redis.RedisError as e:
+        logger.debug(f"planning_cache: Redis clear failed (non-fatal): {e!r}")
     logger.debug("planning_cache: Cache cleared")
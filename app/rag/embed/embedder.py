@@ -5,6 +5,7 @@ ensuring reproducibility through deterministic ordering and batch processing.
 """
 
 import hashlib
+import time
 from dataclasses import dataclass
 
 import numpy as np
@@ -17,6 +18,8 @@ from app.rag.embed.model_lock import (
     EMBEDDING_MODEL,
 )
 from app.rag.types import RagChunk
+from app.services.llm.client_pool import get_sync_http_client
+from app.services.llm.telemetry import record_llm_call
 
 
 @dataclass
@@ -56,7 +59,7 @@ def embed_chunks(chunks: list[RagChunk]) -> list[EmbeddedChunk]:
         return []
 
     # Initialize OpenAI client
-    client = OpenAI(api_key=settings.openai_api_key)
+    client = OpenAI(api_key=settings.openai_api_key, http_client=get_sync_http_client())
 
     # Sort chunks by chunk_id for deterministic ordering
     sorted_chunks = sorted(chunks, key=lambda c: c.chunk_id)
@@ -70,16 +73,21 @@ def embed_chunks(chunks: list[RagChunk]) -> list[EmbeddedChunk]:
     for i in range(0, len(texts), EMBEDDING_BATCH_SIZE):
         batch_texts = texts[i : i + EMBEDDING_BATCH_SIZE]
 
+        started = time.monotonic()
         try:
             response = client.embeddings.create(
                 model=EMBEDDING_MODEL,
                 input=batch_texts,
             )
+            record_llm_call(
+                EMBEDDING_MODEL, time.monotonic() - started, call_site="rag.embed", input_tokens=response.usage.prompt_tokens
+            )
 
             batch_embeddings = [item.embedding for item in response.data]
             all_embeddings.extend(batch_embeddings)
 
         except Exception as e:
+            record_llm_call(EMBEDDING_MODEL, time.monotonic() - started, call_site="rag.embed", error=e)
             raise ValueError(f"Failed to generate embeddings for batch {i}: {e}") from e
 
     # Verify embedding dimensions
@@ -111,7 +119,7 @@ def embed_query(query: str) -> list[float]:
     Raises:
         ValueError: If embedding API call fails
     """
-    client = OpenAI(api_key=settings.openai_api_key)
+    client = OpenAI(api_key=settings.openai_api_key, http_client=get_sync_http_client())
 
     def _validate_embedding(emb: list[float]) -> list[float]:
         if len(emb) != EMBEDDING_DIM:
@@ -121,11 +129,15 @@ def embed_query(query: str) -> list[float]:
             )
         return emb
 
+    started = time.monotonic()
     try:
         response = client.embeddings.create(
             model=EMBEDDING_MODEL,
             input=[query],
         )
+        record_llm_call(
+            EMBEDDING_MODEL, time.monotonic() - started, call_site="rag.query_embed", input_tokens=response.usage.prompt_tokens
+        )
 
         embedding = response.data[0].embedding
         return _validate_embedding(embedding)
@@ -2,15 +2,21 @@
 
 This service generates narrative bios from structured athlete profile data.
 It uses LLM to create a 3-5 sentence bio that summarizes the athlete's profile.
+
+The bio depends only on the profile summary sent to the LLM, so
+profile_summary_hash() identifies a bio's inputs: bios store it and are not
+regenerated while it is unchanged.
 """
 
-from pathlib import Path
+import hashlib
 
 from loguru import logger
 from pydantic import BaseModel, Field
 from pydantic_ai import Agent
 
 from app.coach.config.models import USER_FACING_MODEL
+from app.coach.prompts.registry import get_prompt
+from app.infra.llm.single_flight import coalesced
 from app.models.athlete_profile import AthleteProfile as AthleteProfileSchema
 from app.models.athlete_profile import NarrativeBio
 from app.services.llm.model import get_model
@@ -23,24 +29,17 @@ class NarrativeBioOutput(BaseModel):
 
 
 def _load_bio_prompt() -> str:
-    """Load bio generator prompt from local filesystem.
+    """Load bio generator prompt from the prompt registry.
 
     Returns:
-        Prompt content as string
-
-    Raises:
-        FileNotFoundError: If prompt file doesn't exist
+        Prompt content as string (default prompt if the file doesn't exist)
     """
-    # Try to find prompt in coach prompts directory
-    prompt_dir = Path(__file__).parent.parent / "coach" / "prompts"
-    prompt_path = prompt_dir / "athlete_bio_generator.txt"
-
-    if not prompt_path.exists():
+    try:
+        return get_prompt("athlete_bio_generator.txt")
+    except FileNotFoundError:
         # Fallback to default prompt
         return _default_bio_prompt()
 
-    return prompt_path.read_text(encoding="utf-8")
-
 
 def _default_bio_prompt() -> str:
     """Default bio generator prompt.
@@ -119,6 +118,21 @@ def _build_profile_summary(profile: AthleteProfileSchema) -> str:
     return "\n".join(parts)
 
 
+def profile_summary_hash(profile: AthleteProfileSchema) -> str:
+    """Hash of the profile summary a bio is generated from.
+
+    Fields that do not reach the summary (and the confidence score, which
+    uses a subset of the summary fields) do not change the hash.
+
+    Args:
+        profile: Athlete profile schema
+
+    Returns:
+        SHA256 hash of the profile summary (hex string)
+    """
+    return hashlib.sha256(_build_profile_summary(profile).encode("utf-8")).hexdigest()
+
+
 def _calculate_confidence(profile: AthleteProfileSchema) -> float:
     """Calculate confidence score based on data completeness.
 
@@ -193,14 +207,20 @@ def _calculate_confidence(profile: AthleteProfileSchema) -> float:
     return round(normalized_score, 2)
 
 
+@coalesced("athlete_bio", key=profile_summary_hash)
 async def generate_athlete_bio(profile: AthleteProfileSchema) -> NarrativeBio:
     """Generate narrative bio from structured profile.
 
+    Concurrent calls for the same profile summary share one LLM request.
+
     Args:
         profile: Structured athlete profile
 
     Returns:
         NarrativeBio object with generated text and confidence score
+
+    Raises:
+        Exception: If the LLM call fails (callers fall back to fallback_bio)
     """
     logger.info("Generating athlete bio via LLM", user_id=None)
 
@@ -228,47 +248,51 @@ Write a 3-5 sentence bio that summarizes this athlete's profile."""
         output_type=NarrativeBioOutput,
     )
 
-    try:
-        # Run agent
-        logger.debug(
-            f"LLM Prompt: Athlete Bio Generation\n"
-            f"System Prompt:\n{system_prompt}\n\n"
-            f"User Prompt:\n{user_message}",
-            system_prompt=system_prompt,
-            user_prompt=user_message,
-        )
-        result = await agent.run(user_message)
-        bio_text = result.data.text
-
-        # Validate sentence count (rough check)
-        sentences = bio_text.split(". ")
-        if len(sentences) < 3:
-            logger.warning("Bio has fewer than 3 sentences, adjusting", sentence_count=len(sentences))
-        elif len(sentences) > 6:
-            logger.warning("Bio has more than 5 sentences, may need truncation", sentence_count=len(sentences))
-
-        # Create bio object
-        bio = NarrativeBio(
-            text=bio_text,
-            confidence_score=confidence,
-            source="ai_generated",
-            depends_on_hash=None,  # Will be set by caller
-        )
+    logger.debug(
+        f"LLM Prompt: Athlete Bio Generation\n"
+        f"System Prompt:\n{system_prompt}\n\n"
+        f"User Prompt:\n{user_message}",
+        system_prompt=system_prompt,
+        user_prompt=user_message,
+    )
+    result = await agent.run(user_message)
+    bio_text = result.output.text
+
+    # Validate sentence count (rough check)
+    sentences = bio_text.split(". ")
+    if len(sentences) < 3:
+        logger.warning("Bio has fewer than 3 sentences, adjusting", sentence_count=len(sentences))
+    elif len(sentences) > 6:
+        logger.warning("Bio has more than 5 sentences, may need truncation", sentence_count=len(sentences))
+
+    logger.info("Athlete bio generated successfully", confidence=confidence, sentence_count=len(sentences))
+    return NarrativeBio(
+        text=bio_text,
+        confidence_score=confidence,
+        source="ai_generated",
+        depends_on_hash=None,  # Will be set by caller
+    )
 
-        logger.info("Athlete bio generated successfully", confidence=confidence, sentence_count=len(sentences))
-
-    except Exception as e:
-        logger.error(f"Failed to generate bio via LLM: {e}", exc_info=True)
-        # Fallback to generic bio
-        fallback_text = _generate_fallback_bio(profile)
-        return NarrativeBio(
-            text=fallback_text,
-            confidence_score=max(0.3, confidence - 0.2),
-            source="ai_generated",
-            depends_on_hash=None,
-        )
-    else:
-        return bio
+
+def fallback_bio(profile: AthleteProfileSchema) -> NarrativeBio:
+    """Build a template bio without the LLM.
+
+    Used when generation fails, and as a placeholder until the background
+    regeneration job writes the generated bio. Template bios are stored
+    without a profile summary hash and stale, so generation is retried.
+
+    Args:
+        profile: Athlete profile schema
+
+    Returns:
+        NarrativeBio with fallback text and reduced confidence
+    """
+    return NarrativeBio(
+        text=_generate_fallback_bio(profile),
+        confidence_score=max(0.3, _calculate_confidence(profile) - 0.2),
+        source="ai_generated",
+        depends_on_hash=None,
+    )
 
 
 def _generate_fallback_bio(profile: AthleteProfileSchema) -> str:
@@ -2,20 +2,30 @@
 
 This service handles automatic bio regeneration when profile data changes.
 It determines when bios need to be regenerated based on trigger fields.
+
+Bios store the hash of the profile summary they were generated from
+(profile_summary_hash). A profile change only affects the bio when that hash
+changes; AI-generated bios are then marked stale and regenerated by the
+background pass (bio_regeneration_tick) in batches with bounded concurrency,
+off the request path.
 """
 
 import asyncio
-import concurrent.futures
+import time
 from datetime import datetime, timezone
 from uuid import uuid4
 
 from loguru import logger
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
+from app.config.settings import settings
 from app.db.models import AthleteBio, AthleteProfile
+from app.db.session import get_session
 from app.models.athlete_profile import AthleteProfile as AthleteProfileSchema
-from app.services.athlete_bio_generator import generate_athlete_bio
-from app.services.athlete_profile_service import compute_profile_hash, get_profile_schema
+from app.models.athlete_profile import NarrativeBio
+from app.services.athlete_bio_generator import fallback_bio, generate_athlete_bio, profile_summary_hash
+from app.services.athlete_profile_service import get_profile_schema
 
 # Fields that trigger bio regeneration
 TRIGGER_FIELDS = {
@@ -38,18 +48,23 @@ TRIGGER_FIELDS = {
 }
 
 
+def _get_latest_bio(session: Session, user_id: str) -> AthleteBio | None:
+    return session.query(AthleteBio).filter_by(user_id=user_id).order_by(AthleteBio.created_at.desc()).first()
+
+
 def handle_profile_change(
     session: Session,
     user_id: str,
     changed_fields: list[str],
 ) -> None:
-    """Handle profile change and trigger bio regeneration if needed.
+    """Handle profile change and queue bio regeneration if needed.
 
     This function:
     1. Checks if any changed fields are in TRIGGER_FIELDS
-    2. Gets the current bio
-    3. If bio.source == 'ai_generated' → regenerate
-    4. If bio.source != 'ai_generated' → mark stale
+    2. Skips if the profile summary hash matches the current bio's
+    3. If no bio exists → store a template bio, queued for generation
+    4. If bio.source == 'ai_generated' → mark stale (regenerated in the background)
+    5. If bio.source != 'ai_generated' → mark stale (left for the user)
 
     Args:
         session: Database session
@@ -63,38 +78,96 @@ def handle_profile_change(
         logger.debug("No trigger fields changed, skipping bio regeneration", user_id=user_id, changed_fields=changed_fields)
         return
 
-    logger.info("Trigger fields changed, checking bio regeneration", user_id=user_id, changed_fields=changed_fields)
+    if session.query(AthleteProfile).filter_by(user_id=user_id).first() is None:
+        logger.warning("Profile not found, skipping bio regeneration", user_id=user_id)
+        return
 
-    # Get current bio
-    bio = session.query(AthleteBio).filter_by(user_id=user_id).order_by(AthleteBio.created_at.desc()).first()
+    profile_schema = get_profile_schema(session, user_id)
+    summary_hash = profile_summary_hash(profile_schema)
+    bio = _get_latest_bio(session, user_id)
 
-    if not bio:
-        # No bio exists - generate one
-        logger.info("No bio exists, generating new bio", user_id=user_id)
-        regenerate_bio(session, user_id)
+    if bio is not None and bio.depends_on_hash == summary_hash:
+        logger.debug("Profile summary unchanged, skipping bio regeneration", user_id=user_id, changed_fields=changed_fields)
         return
 
-    # Check bio source
-    if bio.source == "ai_generated":
-        # Regenerate automatically
-        logger.info("Bio is AI-generated, regenerating", user_id=user_id, bio_id=bio.id)
-        regenerate_bio(session, user_id)
+    logger.info("Profile summary changed, checking bio regeneration", user_id=user_id, changed_fields=changed_fields)
+
+    if not bio:
+        # No bio exists - store a template bio until the generated one is ready
+        logger.info("No bio exists, storing template bio and queueing generation", user_id=user_id)
+        placeholder = fallback_bio(profile_schema)
+        session.add(
+            AthleteBio(
+                id=str(uuid4()),
+                user_id=user_id,
+                text=placeholder.text,
+                confidence_score=placeholder.confidence_score,
+                source="ai_generated",
+                depends_on_hash=None,
+                last_generated_at=datetime.now(timezone.utc),
+                stale=True,
+            )
+        )
+    elif bio.source == "ai_generated":
+        logger.info("Bio is AI-generated, queueing regeneration", user_id=user_id, bio_id=bio.id)
+        bio.stale = True
     else:
         # Mark as stale (user has edited it manually)
         logger.info("Bio is user-edited, marking as stale", user_id=user_id, bio_id=bio.id)
         bio.stale = True
-        session.flush()
+    session.flush()
+
+
+def _store_bio(session: Session, user_id: str, bio_result: NarrativeBio, summary_hash: str | None) -> None:
+    """Write a generated bio (updating the AI-generated bio, or creating one).
+
+    The bio stays stale if the profile summary changed while it was generated,
+    or if it is a template bio (summary_hash None) whose generation must be retried.
+    """
+    bio = _get_latest_bio(session, user_id)
+    stale = summary_hash is None or profile_summary_hash(get_profile_schema(session, user_id)) != summary_hash
+
+    if bio and bio.source == "ai_generated":
+        # Update existing AI-generated bio
+        bio.text = bio_result.text
+        bio.confidence_score = bio_result.confidence_score
+        bio.depends_on_hash = summary_hash
+        bio.last_generated_at = datetime.now(timezone.utc)
+        bio.stale = stale
+        logger.info("Updated existing AI-generated bio", user_id=user_id, bio_id=bio.id)
+    else:
+        # Create new bio record
+        new_bio = AthleteBio(
+            id=str(uuid4()),
+            user_id=user_id,
+            text=bio_result.text,
+            confidence_score=bio_result.confidence_score,
+            source="ai_generated",
+            depends_on_hash=summary_hash,
+            last_generated_at=datetime.now(timezone.utc),
+            stale=stale,
+        )
+        session.add(new_bio)
+        logger.info("Created new bio", user_id=user_id, bio_id=new_bio.id)
+
+    session.flush()
 
 
 def regenerate_bio(session: Session, user_id: str) -> None:
-    """Regenerate bio for user.
+    """Regenerate bio for user now (explicit regeneration request).
 
     This function:
     1. Gets the current profile
     2. Generates new bio
-    3. Computes profile hash
+    3. Computes profile summary hash
     4. Creates or updates bio record
 
+    If generation fails a template bio is stored instead, left stale so the
+    background pass retries generation.
+
+    Must be called from sync code without a running event loop (the API runs
+    sync endpoints in its thread pool); async callers use generate_athlete_bio.
+
     Args:
         session: Database session
         user_id: User ID
@@ -105,52 +178,98 @@ def regenerate_bio(session: Session, user_id: str) -> None:
         logger.warning("Profile not found, skipping bio generation", user_id=user_id)
         return
 
-    # Get profile schema
-    profile_schema = get_profile_schema(session, user_id)
-
-    # Generate bio (async)
+    profile_schema: AthleteProfileSchema = get_profile_schema(session, user_id)
     try:
-        # Run async function in sync context
-        loop = asyncio.get_event_loop()
-        if loop.is_running():
-            # If loop is running, we need to use a different approach
-            # For now, use asyncio.run in a thread or create a task
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                future = executor.submit(asyncio.run, generate_athlete_bio(profile_schema))
-                bio_result = future.result()
-        else:
-            bio_result = loop.run_until_complete(generate_athlete_bio(profile_schema))
-    except RuntimeError:
-        # No event loop, create new one
         bio_result = asyncio.run(generate_athlete_bio(profile_schema))
+    except Exception:
+        logger.exception("Failed to generate bio via LLM, storing template bio", user_id=user_id)
+        _store_bio(session, user_id, fallback_bio(profile_schema), None)
+        return
+    _store_bio(session, user_id, bio_result, profile_summary_hash(profile_schema))
 
-    # Compute profile hash
-    profile_hash = compute_profile_hash(profile)
-
-    # Get or create bio record
-    bio = session.query(AthleteBio).filter_by(user_id=user_id).order_by(AthleteBio.created_at.desc()).first()
 
-    if bio and bio.source == "ai_generated":
-        # Update existing AI-generated bio
-        bio.text = bio_result.text
-        bio.confidence_score = bio_result.confidence_score
-        bio.depends_on_hash = profile_hash
+def _record_failed_attempt(session: Session, user_id: str) -> None:
+    """Stamp a failed generation attempt on the stale bio (it is retried after the others)."""
+    bio = _get_latest_bio(session, user_id)
+    if bio is not None and bio.source == "ai_generated":
         bio.last_generated_at = datetime.now(timezone.utc)
-        bio.stale = False
-        logger.info("Updated existing AI-generated bio", user_id=user_id, bio_id=bio.id)
-    else:
-        # Create new bio record
-        new_bio = AthleteBio(
-            id=str(uuid4()),
-            user_id=user_id,
-            text=bio_result.text,
-            confidence_score=bio_result.confidence_score,
-            source="ai_generated",
-            depends_on_hash=profile_hash,
-            last_generated_at=datetime.now(timezone.utc),
-            stale=False,
+
+
+async def regenerate_stale_bios(batch_size: int | None = None, concurrency: int | None = None) -> dict[str, int]:
+    """Regenerate stale AI-generated bios in one batch.
+
+    Profiles are read in one session, bios are generated concurrently
+    (bounded), and the results are written in one session. Bios whose
+    profile summary hash is unchanged are only un-marked. Bios are taken
+    least recently attempted first; a failed bio stays stale and its attempt
+    time moves it behind the other stale bios.
+
+    Args:
+        batch_size: Max bios per pass (default: settings)
+        concurrency: Bios generated at once (default: settings)
+
+    Returns:
+        Dict with stale / unchanged / regenerated / errors counts
+    """
+    started = time.monotonic()
+    pending: list[tuple[str, AthleteProfileSchema, str]] = []
+    unchanged = 0
+    with get_session() as session:
+        user_ids = (
+            session.execute(
+                select(AthleteBio.user_id)
+                .where(AthleteBio.source == "ai_generated", AthleteBio.stale.is_(True))
+                .group_by(AthleteBio.user_id)
+                # Least recently attempted first, so bios that keep failing cannot hold the batch
+                .order_by(func.max(AthleteBio.last_generated_at).asc().nulls_first(), AthleteBio.user_id)
+                .limit(batch_size or settings.bio_regeneration_batch_size)
+            )
+            .scalars()
+            .all()
         )
-        session.add(new_bio)
-        logger.info("Created new bio", user_id=user_id, bio_id=new_bio.id)
+        for user_id in user_ids:
+            bio = _get_latest_bio(session, user_id)
+            if bio is None or bio.source != "ai_generated" or not bio.stale:
+                continue
+            if session.query(AthleteProfile).filter_by(user_id=user_id).first() is None:
+                continue
+            profile_schema = get_profile_schema(session, user_id)
+            summary_hash = profile_summary_hash(profile_schema)
+            if bio.depends_on_hash == summary_hash:
+                bio.stale = False
+                unchanged += 1
+                continue
+            pending.append((user_id, profile_schema, summary_hash))
+        session.commit()
 
-    session.flush()
+    semaphore = asyncio.Semaphore(concurrency or settings.bio_regeneration_concurrency)
+
+    async def _generate(profile_schema: AthleteProfileSchema) -> NarrativeBio:
+        async with semaphore:
+            return await generate_athlete_bio(profile_schema)
+
+    results = await asyncio.gather(*(_generate(profile_schema) for _, profile_schema, _ in pending), return_exceptions=True)
+
+    errors = 0
+    with get_session() as session:
+        for (user_id, _, summary_hash), result in zip(pending, results, strict=True):
+            if isinstance(result, BaseException):
+                errors += 1
+                logger.opt(exception=result).error(f"[BIO] Failed to regenerate bio for user_id={user_id}")
+                _record_failed_attempt(session, user_id)
+                continue
+            _store_bio(session, user_id, result, summary_hash)
+        session.commit()
+
+    stats = {"stale": len(pending) + unchanged, "unchanged": unchanged, "regenerated": len(pending) - errors, "errors": errors}
+    if stats["stale"]:
+        logger.info(
+            f"[BIO] Regeneration pass completed in {time.monotonic() - started:.1f}s: "
+            f"stale={stats['stale']}, unchanged={unchanged}, regenerated={stats['regenerated']}, errors={errors}"
+        )
+    return stats
+
+
+def bio_regeneration_tick() -> None:
+    """Scheduler entry point: run one bio regeneration pass (sync wrapper)."""
+    asyncio.run(regenerate_stale_bios())
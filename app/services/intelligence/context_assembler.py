@@ -0,0 +1,231 @@
+"""Concurrent, single-pass context assembly.
+
+Context builders used to call one helper after another, each opening its own
+DB session, so a context took the sum of its source latencies. Builders now
+declare their data needs up front as ContextSource entries and the assembler
+fetches them concurrently, returning one immutable AssembledContext with
+per-source timings (for logs and trace metadata).
+
+- Sync sources run on a shared thread pool (context_assembly_max_workers),
+  which also bounds the DB connections context assembly holds at once.
+  Each source keeps its own session: SQLAlchemy sessions are not thread-safe,
+  so a single session cannot be shared by concurrent fetches.
+- assemble_context_async awaits coroutine sources on the event loop and runs
+  sync ones on the same pool.
+- Sources with the same fetch function and arguments are fetched once per
+  assembly.
+- A failing source yields its default and is listed in
+  AssembledContext.failed, unless it is required, in which case the error is
+  raised once all sources have finished.
+"""
+
+import asyncio
+import contextvars
+import functools
+import inspect
+import threading
+import time
+from collections.abc import Callable, Hashable, Mapping, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any
+
+from loguru import logger
+
+from app.config.settings import settings
+
+_THREAD_NAME_PREFIX = "context-assembly"
+
+
+@dataclass(frozen=True)
+class ContextSource:
+    """One piece of data a context needs.
+
+    Attributes:
+        name: Key of the value in the assembled context
+        fetch: Function returning the value (sync or async)
+        args: Positional arguments for fetch (hashable; used for memoization)
+        default: Value used if fetch raises
+        required: Raise fetch errors instead of using the default
+    """
+
+    name: str
+    fetch: Callable[..., Any]
+    args: tuple[Hashable, ...] = ()
+    default: Any = None
+    required: bool = False
+
+    @property
+    def key(self) -> tuple[Callable[..., Any], tuple[Hashable, ...]]:
+        return (self.fetch, self.args)
+
+
+@dataclass(frozen=True)
+class AssembledContext:
+    """Immutable result of one assembly.
+
+    Attributes:
+        values: Fetched value per source name
+        timings_ms: Fetch latency per source name
+        failed: Names of sources that fell back to their default
+        total_ms: Wall time of the whole assembly
+    """
+
+    values: Mapping[str, Any]
+    timings_ms: Mapping[str, float]
+    failed: tuple[str, ...] = ()
+    total_ms: float = 0.0
+
+    def __getitem__(self, name: str) -> Any:
+        return self.values[name]
+
+
+@dataclass(frozen=True)
+class _Fetched:
+    value: Any
+    error: Exception | None
+    elapsed_ms: float
+
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Get the shared context-assembly thread pool (created on first use)."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=max(1, settings.context_assembly_max_workers),
+                thread_name_prefix=_THREAD_NAME_PREFIX,
+            )
+        return _executor
+
+
+def _in_worker_thread() -> bool:
+    return threading.current_thread().name.startswith(_THREAD_NAME_PREFIX)
+
+
+def _fetch(source: ContextSource) -> _Fetched:
+    started = time.perf_counter()
+    try:
+        value = source.fetch(*source.args)
+    except Exception as e:
+        return _Fetched(None, e, (time.perf_counter() - started) * 1000)
+    return _Fetched(value, None, (time.perf_counter() - started) * 1000)
+
+
+async def _fetch_async(source: ContextSource) -> _Fetched:
+    if not inspect.iscoroutinefunction(source.fetch):
+        context = contextvars.copy_context()
+        return await asyncio.get_running_loop().run_in_executor(
+            _get_executor(), functools.partial(context.run, _fetch, source)
+        )
+    started = time.perf_counter()
+    try:
+        value = await source.fetch(*source.args)
+    except Exception as e:
+        return _Fetched(None, e, (time.perf_counter() - started) * 1000)
+    return _Fetched(value, None, (time.perf_counter() - started) * 1000)
+
+
+def _unique(sources: Sequence[ContextSource]) -> dict[tuple, ContextSource]:
+    names = [source.name for source in sources]
+    if len(names) != len(set(names)):
+        raise ValueError(f"Duplicate context source names: {names}")
+    unique: dict[tuple, ContextSource] = {}
+    for source in sources:
+        unique.setdefault(source.key, source)
+    return unique
+
+
+def _collect(
+    label: str,
+    sources: Sequence[ContextSource],
+    fetched: Mapping[tuple, _Fetched],
+    started: float,
+) -> AssembledContext:
+    values: dict[str, Any] = {}
+    timings_ms: dict[str, float] = {}
+    failed: list[str] = []
+    for source in sources:
+        result = fetched[source.key]
+        timings_ms[source.name] = round(result.elapsed_ms, 1)
+        if result.error is None:
+            values[source.name] = result.value
+            continue
+        if source.required:
+            raise result.error
+        logger.warning(f"[CONTEXT] {label}: source {source.name} failed, using default: {result.error!r}")
+        values[source.name] = source.default
+        failed.append(source.name)
+
+    assembled = AssembledContext(
+        values=MappingProxyType(values),
+        timings_ms=MappingProxyType(timings_ms),
+        failed=tuple(failed),
+        total_ms=round((time.perf_counter() - started) * 1000, 1),
+    )
+    logger.info(
+        f"[CONTEXT] {label} assembled in {assembled.total_ms:.0f}ms",
+        sources=len(sources),
+        fetched=len(fetched),
+        timings_ms=dict(timings_ms),
+        failed=assembled.failed,
+    )
+    return assembled
+
+
+def assemble_context(label: str, sources: Sequence[ContextSource]) -> AssembledContext:
+    """Fetch sync context sources concurrently.
+
+    Called from a context-assembly worker (nested assembly), sources are
+    fetched inline so the pool cannot deadlock on itself.
+
+    Args:
+        label: Context name for logs (e.g. "daily_decision")
+        sources: Sources to fetch (unique names)
+
+    Returns:
+        AssembledContext
+
+    Raises:
+        ValueError: If two sources share a name
+        Exception: The error of a failed required source
+    """
+    started = time.perf_counter()
+    unique = _unique(sources)
+    if _in_worker_thread():
+        fetched = {key: _fetch(source) for key, source in unique.items()}
+    else:
+        executor = _get_executor()
+        futures: dict[tuple, Future[_Fetched]] = {
+            key: executor.submit(contextvars.copy_context().run, _fetch, source) for key, source in unique.items()
+        }
+        fetched = {key: future.result() for key, future in futures.items()}
+    return _collect(label, sources, fetched, started)
+
+
+async def assemble_context_async(label: str, sources: Sequence[ContextSource]) -> AssembledContext:
+    """Fetch context sources concurrently from async code.
+
+    Coroutine functions are awaited on the event loop; sync functions run on
+    the shared thread pool.
+
+    Args:
+        label: Context name for logs (e.g. "coach_turn")
+        sources: Sources to fetch (unique names)
+
+    Returns:
+        AssembledContext
+
+    Raises:
+        ValueError: If two sources share a name
+        Exception: The error of a failed required source
+    """
+    started = time.perf_counter()
+    unique = _unique(sources)
+    results = await asyncio.gather(*(_fetch_async(source) for source in unique.values()))
+    return _collect(label, sources, dict(zip(unique, results, strict=True)), started)
@@ -1,6 +1,8 @@
 """Context builder for daily decision generation.
 
 Builds structured context from athlete data for LLM-based daily decision generation.
+Data sources are declared per context and fetched concurrently by the context
+assembler.
 """
 
 from datetime import date, datetime, timedelta, timezone
@@ -14,10 +16,24 @@ from app.coach.schemas.intent_schemas import DailyDecision, SeasonPlan, WeeklyIn
 from app.coach.utils.reconciliation_context import get_recent_missed_workouts, get_reconciliation_stats
 from app.db.models import Activity, PlannedSession
 from app.db.session import get_session
+from app.services.intelligence.context_assembler import ContextSource, assemble_context
 from app.services.intelligence.store import IntentStore
 from app.services.overview_service import get_overview_data
 from app.workouts.models import WorkoutStep
 
+# Used when overview data cannot be loaded
+_MINIMAL_OVERVIEW: dict[str, Any] = {"today": {}, "metrics": {"ctl": [], "atl": [], "tsb": []}, "data_quality": "insufficient"}
+
+_DEFAULT_RECONCILIATION_STATS: dict[str, int | float] = {
+    "completed_count": 0,
+    "missed_count": 0,
+    "partial_count": 0,
+    "substituted_count": 0,
+    "skipped_count": 0,
+    "total_planned": 0,
+    "compliance_rate": 0.0,
+}
+
 
 def _normalize_datetime(dt: datetime) -> datetime:
     """Normalize datetime to timezone-aware (UTC).
@@ -285,29 +301,76 @@ def _get_previous_week_intent(athlete_id: int, week_start: date) -> WeeklyIntent
     return None
 
 
-def _get_recent_decisions_for_context(user_id: str, decision_date: date) -> list[DailyDecision]:
-    """Get recent daily decisions for context.
+def _get_decisions_for_dates(user_id: str, decision_dates: list[date]) -> list[DailyDecision]:
+    """Get the latest active daily decision for each date (one query).
 
     Args:
         user_id: User ID (schema v2: migrated from athlete_id)
-        decision_date: Decision date
+        decision_dates: Dates to look up, in the order decisions are returned
 
     Returns:
-        List of recent daily decisions (last 3 days)
+        Parsed decisions for the dates that have one
     """
-    store = IntentStore()
-    recent_decisions = []
-    for days_ago in range(1, 4):
-        check_date = decision_date - timedelta(days=days_ago)
-        check_date_dt = datetime.combine(check_date, datetime.min.time()).replace(tzinfo=timezone.utc)
-        decision_model = store.get_latest_daily_decision(user_id, check_date_dt, active_only=True)
+    decision_models = IntentStore.get_latest_daily_decisions(
+        user_id,
+        [datetime.combine(d, datetime.min.time()).replace(tzinfo=timezone.utc) for d in decision_dates],
+        active_only=True,
+    )
+    decisions = []
+    for decision_date in decision_dates:
+        decision_model = decision_models.get(decision_date)
         if decision_model:
             try:
-                decision = DailyDecision(**decision_model.decision_data)
-                recent_decisions.append(decision)
+                decisions.append(DailyDecision(**decision_model.decision_data))
             except Exception as e:
                 logger.warning(f"Failed to parse recent decision: {e}")
-    return recent_decisions
+    return decisions
+
+
+def _get_recent_decisions_for_context(user_id: str, decision_date: date) -> list[DailyDecision]:
+    """Get recent daily decisions for context.
+
+    Args:
+        user_id: User ID (schema v2: migrated from athlete_id)
+        decision_date: Decision date
+
+    Returns:
+        List of recent daily decisions (last 3 days, most recent first)
+    """
+    return _get_decisions_for_dates(user_id, [decision_date - timedelta(days=days_ago) for days_ago in range(1, 4)])
+
+
+def _get_week_decisions_for_context(user_id: str, week_start: date) -> list[DailyDecision]:
+    """Get the daily decisions of a week up to today.
+
+    Args:
+        user_id: User ID
+        week_start: Week start date (Monday)
+
+    Returns:
+        Daily decisions in date order
+    """
+    today = datetime.now(timezone.utc).date()
+    week_dates = [week_start + timedelta(days=offset) for offset in range(7)]
+    return _get_decisions_for_dates(user_id, [d for d in week_dates if d <= today])
+
+
+def _get_season_plan_for_context(athlete_id: int) -> SeasonPlan | None:
+    """Get the active season plan for context if available.
+
+    Args:
+        athlete_id: Athlete ID
+
+    Returns:
+        SeasonPlan if available, None otherwise
+    """
+    season_plan_model = IntentStore.get_latest_season_plan(athlete_id, active_only=True)
+    if season_plan_model:
+        try:
+            return SeasonPlan(**season_plan_model.plan_data)
+        except Exception as e:
+            logger.warning(f"Failed to parse season plan: {e}")
+    return None
 
 
 def _convert_workout_step_to_dict(step: WorkoutStep) -> dict[str, Any]:
@@ -421,6 +484,8 @@ def build_daily_decision_context(
 ) -> dict[str, Any]:
     """Build context dictionary for daily decision generation.
 
+    Sources are fetched concurrently (see context_assembler).
+
     Args:
         user_id: User ID
         athlete_id: Athlete ID
@@ -437,31 +502,30 @@ def build_daily_decision_context(
     """
     logger.info(f"Building daily decision context for user_id={user_id}, athlete_id={athlete_id}, date={decision_date.isoformat()}")
 
-    # Get overview data for athlete state
-    try:
-        overview = get_overview_data(user_id)
-    except Exception as e:
-        logger.warning(f"Failed to get overview data: {e}, using minimal context")
-        overview = {"today": {}, "metrics": {"ctl": [], "atl": [], "tsb": []}, "data_quality": "insufficient"}
+    assembled = assemble_context(
+        "daily_decision",
+        [
+            ContextSource("overview", get_overview_data, (user_id,), default=_MINIMAL_OVERVIEW),
+            # ALL activities for training history (not just matched ones), so the LLM
+            # sees complete activity history, not just activities matched to planned sessions
+            ContextSource("activities", _get_activities_for_context, (user_id,), required=True),
+            ContextSource("weekly_intent", _get_weekly_intent_for_context, (athlete_id, decision_date)),
+            ContextSource("recent_decisions", _get_recent_decisions_for_context, (user_id, decision_date), required=True),
+            ContextSource("scheduled_workout", _get_scheduled_workout_for_date, (user_id, decision_date)),
+            ContextSource(
+                "reconciliation_stats",
+                get_reconciliation_stats,
+                (user_id, athlete_id, 30),
+                default=_DEFAULT_RECONCILIATION_STATS,
+            ),
+            ContextSource("missed_workouts", get_recent_missed_workouts, (user_id, athlete_id, 14), default=[]),
+        ],
+    )
 
-    # Get ALL activities for training history (not just matched ones)
-    # This ensures the LLM sees complete activity history, not just activities matched to planned sessions
-    activities_list = _get_activities_for_context(user_id)
+    activities_list = assembled["activities"]
     training_history = _format_training_history(activities_list, days=14)
     yesterday_training = _get_yesterday_training(activities_list)
-
-    # Get training summary (canonical source) for other metrics (volume, compliance, etc.)
-    # Note: This is only used for other context fields, not training_history
-    try:
-        build_training_summary(
-            user_id=user_id,
-            athlete_id=athlete_id,
-            window_days=14,
-        )
-    except Exception as e:
-        logger.warning(f"Failed to get training summary: {e!r}, continuing without summary metrics")
-
-    athlete_state = _build_athlete_state_from_overview(overview)
+    athlete_state = _build_athlete_state_from_overview(assembled["overview"])
 
     # Build day context
     decision_datetime = datetime.combine(decision_date, datetime.min.time()).replace(tzinfo=timezone.utc)
@@ -470,29 +534,10 @@ def build_daily_decision_context(
         "time_of_year": decision_datetime.strftime("%B"),
     }
 
-    # Get optional context components
-    weekly_intent = _get_weekly_intent_for_context(athlete_id, decision_date)
-    recent_decisions = _get_recent_decisions_for_context(user_id, decision_date)
-
-    # Get scheduled workout for today (if any)
-    scheduled_workout = _get_scheduled_workout_for_date(user_id, decision_date)
-
-    # Get reconciliation statistics (missed workouts, compliance)
-    try:
-        reconciliation_stats = get_reconciliation_stats(user_id=user_id, athlete_id=athlete_id, days=30)
-        missed_workouts = get_recent_missed_workouts(user_id=user_id, athlete_id=athlete_id, days=14)
-    except Exception as e:
-        logger.warning(f"Failed to get reconciliation data: {e!r}, using defaults")
-        reconciliation_stats = {
-            "completed_count": 0,
-            "missed_count": 0,
-            "partial_count": 0,
-            "substituted_count": 0,
-            "skipped_count": 0,
-            "total_planned": 0,
-            "compliance_rate": 0.0,
-        }
-        missed_workouts = []
+    weekly_intent = assembled["weekly_intent"]
+    recent_decisions = assembled["recent_decisions"]
+    scheduled_workout = assembled["scheduled_workout"]
+    reconciliation_stats = assembled["reconciliation_stats"]
 
     # Build final context
     context = {
@@ -501,8 +546,8 @@ def build_daily_decision_context(
         "yesterday_training": yesterday_training,
         "day_context": day_context,
         "reconciliation": {
-            "stats": reconciliation_stats,
-            "recent_missed_workouts": missed_workouts,
+            "stats": dict(reconciliation_stats),
+            "recent_missed_workouts": assembled["missed_workouts"],
         },
     }
 
@@ -530,6 +575,8 @@ def build_weekly_intent_context(
 ) -> dict[str, Any]:
     """Build context dictionary for weekly intent generation.
 
+    Sources are fetched concurrently (see context_assembler).
+
     Args:
         user_id: User ID
         athlete_id: Athlete ID
@@ -546,27 +593,34 @@ def build_weekly_intent_context(
     """
     logger.info(f"Building weekly intent context for user_id={user_id}, athlete_id={athlete_id}, week_start={week_start.isoformat()}")
 
-    # Get overview data for athlete state
-    try:
-        overview = get_overview_data(user_id)
-    except Exception as e:
-        logger.warning(f"Failed to get overview data: {e}, using minimal context")
-        overview = {"today": {}, "metrics": {"ctl": [], "atl": [], "tsb": []}, "data_quality": "insufficient"}
+    assembled = assemble_context(
+        "weekly_intent",
+        [
+            ContextSource("overview", get_overview_data, (user_id,), default=_MINIMAL_OVERVIEW),
+            # Training summary is the canonical source for training history
+            ContextSource("training_summary", build_training_summary, (user_id, athlete_id, 28)),
+            ContextSource("season_plan", _get_season_plan_for_context, (athlete_id,), required=True),
+            ContextSource("previous_week_intent", _get_previous_week_intent, (athlete_id, week_start), required=True),
+            ContextSource(
+                "reconciliation_stats",
+                get_reconciliation_stats,
+                (user_id, athlete_id, 30),
+                default=_DEFAULT_RECONCILIATION_STATS,
+            ),
+            ContextSource("missed_workouts", get_recent_missed_workouts, (user_id, athlete_id, 14), default=[]),
+            ContextSource("recent_decisions", _get_week_decisions_for_context, (user_id, week_start), required=True),
+        ],
+    )
 
-    # Get training summary (canonical source)
-    try:
-        training_summary = build_training_summary(
-            user_id=user_id,
-            athlete_id=athlete_id,
-            window_days=28,
-        )
+    training_summary = assembled["training_summary"]
+    if training_summary is not None:
         training_history = _format_training_history_from_summary(training_summary)
-    except Exception as e:
-        logger.warning(f"Failed to get training summary: {e!r}, falling back to activities")
+    else:
+        logger.warning("Training summary unavailable, falling back to activities")
         activities_list = _get_activities_for_context(user_id)
         training_history = _format_training_history(activities_list, days=28)
 
-    athlete_state = _build_athlete_state_from_overview(overview)
+    athlete_state = _build_athlete_state_from_overview(assembled["overview"])
 
     # Build week context
     week_datetime = datetime.combine(week_start, datetime.min.time()).replace(tzinfo=timezone.utc)
@@ -575,49 +629,9 @@ def build_weekly_intent_context(
         "time_of_year": week_datetime.strftime("%B"),
     }
 
-    # Get optional context components
-    store = IntentStore()
-    season_plan_model = store.get_latest_season_plan(athlete_id, active_only=True)
-    season_plan = None
-    if season_plan_model:
-        try:
-            season_plan = SeasonPlan(**season_plan_model.plan_data)
-        except Exception as e:
-            logger.warning(f"Failed to parse season plan: {e}")
-
-    previous_week_intent = _get_previous_week_intent(athlete_id, week_start)
-
-    # Get reconciliation statistics (missed workouts, compliance)
-    try:
-        reconciliation_stats = get_reconciliation_stats(user_id=user_id, athlete_id=athlete_id, days=30)
-        missed_workouts = get_recent_missed_workouts(user_id=user_id, athlete_id=athlete_id, days=14)
-    except Exception as e:
-        logger.warning(f"Failed to get reconciliation data: {e!r}, using defaults")
-        reconciliation_stats = {
-            "completed_count": 0,
-            "missed_count": 0,
-            "partial_count": 0,
-            "substituted_count": 0,
-            "skipped_count": 0,
-            "total_planned": 0,
-            "compliance_rate": 0.0,
-        }
-        missed_workouts = []
-
-    # Get recent daily decisions (last 7 days)
-    recent_decisions = []
-    today = datetime.now(timezone.utc).date()
-    for days_ago in range(0, 7):
-        check_date = week_start + timedelta(days=days_ago)
-        if check_date <= today:
-            check_date_dt = datetime.combine(check_date, datetime.min.time()).replace(tzinfo=timezone.utc)
-            decision_model = store.get_latest_daily_decision(user_id, check_date_dt, active_only=True)
-            if decision_model:
-                try:
-                    decision = DailyDecision(**decision_model.decision_data)
-                    recent_decisions.append(decision)
-                except Exception as e:
-                    logger.warning(f"Failed to parse recent decision: {e}")
+    season_plan = assembled["season_plan"]
+    previous_week_intent = assembled["previous_week_intent"]
+    recent_decisions = assembled["recent_decisions"]
 
     # Build final context
     context = {
@@ -625,8 +639,8 @@ def build_weekly_intent_context(
         "training_history": training_history,
         "week_context": week_context,
         "reconciliation": {
-            "stats": reconciliation_stats,
-            "recent_missed_workouts": missed_workouts,
+            "stats": dict(assembled["reconciliation_stats"]),
+            "recent_missed_workouts": assembled["missed_workouts"],
         },
     }
 
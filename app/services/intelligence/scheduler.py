@@ -1,19 +1,155 @@
 """Scheduled jobs for generating training intelligence.
 
 Generates daily decisions for all active users on a schedule.
+
+The overnight batch first fingerprints every user's context inputs in bulk
+and skips users whose decision for today is already newer than all of them,
+then processes the rest concurrently (bounded, with a shared LLM rate limit).
 """
 
 import asyncio
+import time
 from datetime import date, datetime, timedelta, timezone
 
 from loguru import logger
-from sqlalchemy import select
+from sqlalchemy import func, select
 
-from app.db.models import StravaAccount
+from app.config.settings import settings
+from app.db.models import Activity, DailyTrainingLoad, PlannedSession, StravaAccount, SubjectiveFeedback
+from app.db.models import DailyDecision as DailyDecisionModel
 from app.db.session import get_session
 from app.services.intelligence.store import IntentStore
 from app.services.intelligence.triggers import RegenerationTriggers
 
+# Activities, loads and feedback older than this do not affect a daily decision's context
+CONTEXT_LOOKBACK_DAYS = 14
+
+# Users per set-based fingerprint query (bounds IN-list size)
+FINGERPRINT_CHUNK_SIZE = 500
+
+
+class _RequestRateLimiter:
+    """Spaces request starts to at most `per_minute` per minute across all batch tasks."""
+
+    def __init__(self, per_minute: int):
+        self._interval = 60.0 / per_minute if per_minute > 0 else 0.0
+        self._next_start = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait(self) -> None:
+        """Wait for this request's start slot."""
+        if not self._interval:
+            return
+        async with self._lock:
+            now = time.monotonic()
+            start_at = max(now, self._next_start)
+            self._next_start = start_at + self._interval
+        if start_at > now:
+            await asyncio.sleep(start_at - now)
+
+
+def _as_utc(value: datetime | None) -> datetime | None:
+    """Treat naive timestamps (SQLite, naive columns) as UTC."""
+    if value is None or value.tzinfo is not None:
+        return value
+    return value.replace(tzinfo=timezone.utc)
+
+
+def _max_per_user(session, statements: list) -> dict[str, datetime]:
+    """Run (user_id, timestamp) queries and keep the latest timestamp per user."""
+    latest: dict[str, datetime] = {}
+    for statement in statements:
+        for user_id, raw_changed_at in session.execute(statement).all():
+            changed_at = _as_utc(raw_changed_at)
+            if changed_at is not None and (user_id not in latest or changed_at > latest[user_id]):
+                latest[user_id] = changed_at
+    return latest
+
+
+def _context_fingerprints(user_ids: list[str], today: date) -> tuple[dict[str, datetime], dict[str, datetime]]:
+    """Compute, in a few set-based queries, what changed for each user.
+
+    The fingerprint of a user's daily-decision context is the latest update to
+    any of its inputs: recent activities, today's planned sessions, training
+    load rows and subjective feedback.
+
+    Args:
+        user_ids: Users to fingerprint
+        today: Decision date
+
+    Returns:
+        Tuple of (latest input change per user, creation time of today's active decision per user)
+    """
+    day_start = datetime.combine(today, datetime.min.time()).replace(tzinfo=timezone.utc)
+    since = day_start - timedelta(days=CONTEXT_LOOKBACK_DAYS)
+    latest_inputs: dict[str, datetime] = {}
+    decided_at: dict[str, datetime] = {}
+
+    with get_session() as session:
+        for i in range(0, len(user_ids), FINGERPRINT_CHUNK_SIZE):
+            chunk = user_ids[i : i + FINGERPRINT_CHUNK_SIZE]
+            inputs = _max_per_user(
+                session,
+                [
+                    select(Activity.user_id, func.max(Activity.updated_at))
+                    .where(Activity.user_id.in_(chunk), Activity.starts_at >= since)
+                    .group_by(Activity.user_id),
+                    select(PlannedSession.user_id, func.max(PlannedSession.updated_at))
+                    .where(
+                        PlannedSession.user_id.in_(chunk),
+                        PlannedSession.starts_at >= day_start,
+                        PlannedSession.starts_at < day_start + timedelta(days=1),
+                    )
+                    .group_by(PlannedSession.user_id),
+                    select(DailyTrainingLoad.user_id, func.max(DailyTrainingLoad.updated_at))
+                    .where(DailyTrainingLoad.user_id.in_(chunk), DailyTrainingLoad.day >= since.date())
+                    .group_by(DailyTrainingLoad.user_id),
+                    select(SubjectiveFeedback.user_id, func.max(SubjectiveFeedback.updated_at))
+                    .where(SubjectiveFeedback.user_id.in_(chunk), SubjectiveFeedback.date >= since.date())
+                    .group_by(SubjectiveFeedback.user_id),
+                ],
+            )
+            latest_inputs.update(inputs)
+            decided_at.update(
+                _max_per_user(
+                    session,
+                    [
+                        select(DailyDecisionModel.user_id, func.max(DailyDecisionModel.created_at))
+                        .where(
+                            DailyDecisionModel.user_id.in_(chunk),
+                            DailyDecisionModel.decision_date == day_start,
+                            DailyDecisionModel.is_active.is_(True),
+                        )
+                        .group_by(DailyDecisionModel.user_id),
+                    ],
+                )
+            )
+    return latest_inputs, decided_at
+
+
+def _select_users_to_process(
+    user_accounts: list[tuple[str, int]],
+    today: date,
+) -> list[tuple[str, int]]:
+    """Drop users whose decision for today is newer than every input change.
+
+    Users without a decision for today are always kept; users whose inputs
+    changed after their decision was generated are kept so the context-hash
+    check can decide whether to regenerate.
+    """
+    try:
+        latest_inputs, decided_at = _context_fingerprints([user_id for user_id, _ in user_accounts], today)
+    except Exception:
+        logger.exception("[DAILY_DECISION] Fingerprint prefilter failed, evaluating all users")
+        return list(user_accounts)
+    selected = []
+    for user_id, athlete_id in user_accounts:
+        decision_time = decided_at.get(user_id)
+        changed_at = latest_inputs.get(user_id)
+        if decision_time is None or (changed_at is not None and changed_at > decision_time):
+            selected.append((user_id, athlete_id))
+    return selected
+
 
 async def _process_user_daily_decision(
     user_id: str,
@@ -21,59 +157,72 @@ async def _process_user_daily_decision(
     today: date,
     triggers: RegenerationTriggers,
     store: IntentStore,
-) -> tuple[bool, bool]:
+    rate_limiter: _RequestRateLimiter | None = None,
+) -> bool:
     """Process daily decision generation for a single user.
 
+    Context building (synchronous DB work) runs in a worker thread so users
+    can be processed concurrently.
+
     Args:
         user_id: User ID
         athlete_id: Athlete ID
         today: Today's date
         triggers: RegenerationTriggers instance
         store: IntentStore instance
+        rate_limiter: Shared limiter for LLM generations (None: unlimited)
 
     Returns:
-        Tuple of (success: bool, skipped: bool)
+        True if a decision was generated, False if skipped (context unchanged)
     """
-    # Check if decision already exists
-    decision_date_dt = datetime.combine(today, datetime.min.time()).replace(tzinfo=timezone.utc)
-    existing = store.get_latest_daily_decision(user_id, decision_date_dt, active_only=True)
-
-    if existing:
-        logger.debug(f"Daily decision already exists for user_id={user_id}, athlete_id={athlete_id}, skipping")
-        return False, True
-
     # Build context
     # Lazy import to avoid circular dependency: me.py -> ingestion/tasks -> scheduler -> context_builder -> me.py
     from app.services.intelligence.context_builder import build_daily_decision_context  # noqa: PLC0415
 
-    context = build_daily_decision_context(user_id, athlete_id, today)
+    context = await asyncio.to_thread(build_daily_decision_context, user_id, athlete_id, today)
 
     # Get weekly intent ID if available
     week_start = today - timedelta(days=today.weekday())
     week_start_dt = datetime.combine(week_start, datetime.min.time()).replace(tzinfo=timezone.utc)
-    weekly_intent_model = store.get_latest_weekly_intent(athlete_id, week_start_dt, active_only=True)
+    weekly_intent_model = await asyncio.to_thread(store.get_latest_weekly_intent, athlete_id, week_start_dt, True)
     weekly_intent_id = weekly_intent_model.id if weekly_intent_model else None
 
-    # Generate decision
+    # Generate decision (users with an unchanged context are skipped without taking a rate-limit slot)
     decision_id = await triggers.maybe_regenerate_daily_decision(
         user_id=user_id,
         athlete_id=athlete_id,
         decision_date=today,
         context=context,
         weekly_intent_id=weekly_intent_id,
+        before_generation=rate_limiter.wait if rate_limiter is not None else None,
     )
 
     if decision_id:
         logger.info(f"Generated daily decision for user_id={user_id}, athlete_id={athlete_id}, decision_id={decision_id}")
-        return True, False
+        return True
 
     logger.debug(f"Daily decision generation skipped (context unchanged) for user_id={user_id}, athlete_id={athlete_id}")
-    return False, True
+    return False
+
 
+async def generate_daily_decisions_async(
+    concurrency: int | None = None,
+    llm_per_minute: int | None = None,
+    user_timings: list[float] | None = None,
+) -> dict[str, int]:
+    """Generate daily decisions for all users from a running event loop.
 
-async def _generate_daily_decisions_async() -> None:
-    """Async helper to generate daily decisions for all users."""
+    Args:
+        concurrency: Users processed at once (default: settings)
+        llm_per_minute: Max LLM generations started per minute (default: settings)
+        user_timings: If given, receives the processing time in seconds of each
+            evaluated user (prefiltered users are not timed)
+
+    Returns:
+        Dict with total / prefiltered / success / skipped / errors counts
+    """
     logger.info("[DAILY_DECISION] Starting overnight batch generation for all users")
+    started = time.monotonic()
 
     triggers = RegenerationTriggers()
     store = IntentStore()
@@ -87,27 +236,54 @@ async def _generate_daily_decisions_async() -> None:
     total_users = len(user_accounts)
     logger.info(f"Found {total_users} users with connected Strava accounts")
 
-    success_count = 0
-    error_count = 0
-    skipped_count = 0
-
-    for user_id, athlete_id in user_accounts:
-        try:
-            success, skipped = await _process_user_daily_decision(user_id, athlete_id, today, triggers, store)
-            if success:
-                success_count += 1
-            elif skipped:
-                skipped_count += 1
-        except Exception:
-            logger.exception(
-                f"Failed to generate daily decision for user_id={user_id}, athlete_id={athlete_id}"
-            )
-            error_count += 1
+    to_process = _select_users_to_process(user_accounts, today) if user_accounts else []
+    prefiltered = total_users - len(to_process)
+    logger.info(
+        f"[DAILY_DECISION] Prefilter: {len(to_process)} users need evaluation, "
+        f"{prefiltered} unchanged since today's decision ({time.monotonic() - started:.1f}s)"
+    )
 
+    semaphore = asyncio.Semaphore(concurrency or settings.daily_decision_batch_concurrency)
+    rate_limiter = _RequestRateLimiter(
+        settings.daily_decision_batch_llm_per_minute if llm_per_minute is None else llm_per_minute
+    )
+    timings: list[tuple[float, str]] = []
+
+    async def _run_user(user_id: str, athlete_id: int) -> bool | None:
+        async with semaphore:
+            user_started = time.monotonic()
+            try:
+                return await _process_user_daily_decision(user_id, athlete_id, today, triggers, store, rate_limiter)
+            except Exception:
+                logger.exception(f"Failed to generate daily decision for user_id={user_id}, athlete_id={athlete_id}")
+                return None
+            finally:
+                timings.append((time.monotonic() - user_started, user_id))
+
+    results = await asyncio.gather(*(_run_user(user_id, athlete_id) for user_id, athlete_id in to_process))
+
+    stats = {
+        "total": total_users,
+        "prefiltered": prefiltered,
+        "success": sum(1 for r in results if r is True),
+        "skipped": prefiltered + sum(1 for r in results if r is False),
+        "errors": sum(1 for r in results if r is None),
+    }
+    if user_timings is not None:
+        user_timings.extend(duration for duration, _ in timings)
+    if timings:
+        durations = sorted(duration for duration, _ in timings)
+        slowest_seconds, slowest_user = max(timings)
+        logger.info(
+            f"[DAILY_DECISION] Per-user timing: p50={durations[len(durations) // 2]:.1f}s "
+            f"p95={durations[min(len(durations) - 1, int(len(durations) * 0.95))]:.1f}s "
+            f"max={slowest_seconds:.1f}s (user_id={slowest_user})"
+        )
     logger.info(
-        f"[DAILY_DECISION] Batch generation completed: "
-        f"total={total_users}, success={success_count}, skipped={skipped_count}, errors={error_count}"
+        f"[DAILY_DECISION] Batch generation completed in {time.monotonic() - started:.1f}s: "
+        f"total={stats['total']}, success={stats['success']}, skipped={stats['skipped']}, errors={stats['errors']}"
     )
+    return stats
 
 
 def generate_daily_decisions_for_all_users() -> None:
@@ -119,7 +295,7 @@ def generate_daily_decisions_for_all_users() -> None:
 
     Logs progress and errors but does not raise exceptions to avoid breaking the scheduler.
     """
-    asyncio.run(_generate_daily_decisions_async())
+    asyncio.run(generate_daily_decisions_async())
 
 
 async def trigger_daily_decision_for_user(
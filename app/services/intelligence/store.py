@@ -482,6 +482,39 @@ class IntentStore:
 
             return session.execute(query.order_by(DailyDecisionModel.version.desc())).scalar_one_or_none()
 
+    @staticmethod
+    def get_latest_daily_decisions(
+        user_id: str,
+        decision_dates: list[datetime],
+        active_only: bool = True,
+    ) -> dict[date, DailyDecisionModel]:
+        """Get the latest daily decision for each of several dates in one query.
+
+        Args:
+            user_id: User ID
+            decision_dates: Decision dates
+            active_only: If True, only return active decisions
+
+        Returns:
+            Latest DailyDecisionModel per calendar date (dates without a
+            decision are omitted)
+        """
+        if not decision_dates:
+            return {}
+        with get_session() as session:
+            query = select(DailyDecisionModel).where(
+                DailyDecisionModel.user_id == user_id,
+                DailyDecisionModel.decision_date.in_(decision_dates),
+            )
+
+            if active_only:
+                query = query.where(DailyDecisionModel.is_active.is_(True))
+
+            latest: dict[date, DailyDecisionModel] = {}
+            for decision in session.execute(query.order_by(DailyDecisionModel.version.desc())).scalars():
+                latest.setdefault(decision.decision_date.date(), decision)
+            return latest
+
     @staticmethod
     def save_weekly_report(
         user_id: str,
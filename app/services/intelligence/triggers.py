@@ -4,11 +4,13 @@ Intelligence regenerates only when inputs change.
 Regeneration is explicit and idempotent.
 """
 
+from collections.abc import Awaitable, Callable
 from datetime import date, datetime, timedelta, timezone
 from typing import Any
 
 from loguru import logger
 
+from app.infra.llm.single_flight import flight_key, single_flight
 from app.services.intelligence.runtime import CoachRuntime
 from app.services.intelligence.store import IntentStore
 
@@ -182,6 +184,7 @@ class RegenerationTriggers:
         context: dict[str, Any],
         *,
         weekly_intent_id: str | None = None,
+        before_generation: Callable[[], Awaitable[None]] | None = None,
     ) -> str | None:
         """Regenerate daily decision if needed.
 
@@ -191,6 +194,8 @@ class RegenerationTriggers:
             decision_date: Decision date
             context: Context dictionary
             weekly_intent_id: Optional weekly intent ID
+            before_generation: Awaited right before the LLM call, only when a
+                decision is generated (e.g., a batch rate limiter)
 
         Returns:
             Decision ID if regenerated, None if not needed
@@ -209,14 +214,26 @@ class RegenerationTriggers:
             f"date={decision_date.isoformat()}"
         )
 
-        try:
+        async def _generate_and_save() -> str:
+            if before_generation is not None:
+                await before_generation()
             decision = await self.runtime.run_daily_decision(user_id, athlete_id, context)
-            decision_id = self.store.save_daily_decision(
+            return self.store.save_daily_decision(
                 user_id=user_id,
                 decision=decision,
                 weekly_intent_id=weekly_intent_id,
                 context_hash=context_hash,
             )
+
+        try:
+            # Concurrent triggers for the same user, date and context (activity save +
+            # on-demand) share one generation and one saved decision
+            decision_id = await single_flight(
+                "daily_decision",
+                flight_key(user_id, decision_date, context_hash, weekly_intent_id),
+                _generate_and_save,
+                str,
+            )
         except Exception:
             logger.exception(
                 f"[DAILY_DECISION] Regeneration failed: user_id={user_id}, athlete_id={athlete_id}, "
@@ -0,0 +1,236 @@
+"""Process-wide pooled clients for model providers.
+
+get_model used to build a new OpenAIModel (and provider client) on every
+call, and EmbeddingService kept its own client, so calls paid connection
+setup and TLS handshakes again and again. Now:
+
+- Models are built once per (provider, model) and reused (pooled_model).
+- All model providers share one async HTTP client, and sync SDK clients
+  (embeddings) share one sync transport. Both keep connections alive within
+  the LLM_HTTP_MAX_CONNECTIONS / LLM_HTTP_MAX_KEEPALIVE_CONNECTIONS limits.
+- asyncio connections cannot be shared across event loops, and many LLM
+  calls run in short-lived asyncio.run() loops (scheduler jobs, background
+  generation). The async client therefore keeps one connection pool per
+  running loop, closed when that loop shuts down, so the client and the
+  models built on it work from any loop.
+- Requests, new TCP connections and TLS handshakes are counted through
+  httpcore trace events, so connection reuse is visible on the ops API
+  (get_client_pool_stats).
+"""
+
+import asyncio
+import threading
+from collections.abc import AsyncGenerator, Callable
+from typing import Any, TypeVar
+
+import httpx
+
+from app.config.settings import settings
+
+T = TypeVar("T")
+
+# Idle keep-alive connections are closed after this many seconds
+KEEPALIVE_EXPIRY = 30.0
+
+# Long generations are bounded by call-site budgets, not by the transport
+HTTP_TIMEOUT = httpx.Timeout(timeout=600.0, connect=10.0)
+
+_lock = threading.Lock()
+_models: dict[tuple[str, str], Any] = {}
+_model_lookups = {"built": 0, "reused": 0}
+_async_client: httpx.AsyncClient | None = None
+_sync_client: httpx.Client | None = None
+_transport_counters: dict[str, dict[str, int]] = {
+    transport: {"requests": 0, "connections_opened": 0, "tls_handshakes": 0} for transport in ("async", "sync")
+}
+
+
+def _count(transport: str, event_name: str) -> None:
+    counter = {
+        "connection.connect_tcp.complete": "connections_opened",
+        "connection.start_tls.complete": "tls_handshakes",
+    }.get(event_name)
+    if counter is not None:
+        with _lock:
+            _transport_counters[transport][counter] += 1
+
+
+def _sync_trace(event_name: str, _info: dict) -> None:
+    _count("sync", event_name)
+
+
+def _on_sync_request(request: httpx.Request) -> None:
+    request.extensions["trace"] = _sync_trace
+    with _lock:
+        _transport_counters["sync"]["requests"] += 1
+
+
+def _limits() -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=settings.llm_http_max_connections,
+        max_keepalive_connections=settings.llm_http_max_keepalive_connections,
+        keepalive_expiry=KEEPALIVE_EXPIRY,
+    )
+
+
+class _LoopLocalTransport(httpx.AsyncBaseTransport):
+    """Async transport with one keep-alive connection pool per event loop.
+
+    A loop's connections cannot be used from another loop ("Event loop is
+    closed"), so each running loop gets its own pool. The pool is closed
+    while its loop shuts down: a generator started on the loop is finalized
+    by asyncio.run()'s shutdown_asyncgens(), which closes the pool and drops
+    it, so short-lived loops do not leak pools and sockets.
+    """
+
+    def __init__(self) -> None:
+        self._pools: dict[asyncio.AbstractEventLoop, tuple[httpx.AsyncHTTPTransport, AsyncGenerator[None, None]]] = {}
+
+    async def _pool(self) -> httpx.AsyncHTTPTransport:
+        loop = asyncio.get_running_loop()
+        with _lock:
+            entry = self._pools.get(loop)
+            if entry is not None:
+                return entry[0]
+            # Loops closed without shutting down their async generators: drop their pools
+            for closed in [other for other in self._pools if other.is_closed()]:
+                del self._pools[closed]
+            pool = httpx.AsyncHTTPTransport(limits=_limits())
+            closer = self._close_with_loop(loop, pool)
+            self._pools[loop] = (pool, closer)
+        await anext(closer)
+        return pool
+
+    async def _close_with_loop(self, loop: asyncio.AbstractEventLoop, pool: httpx.AsyncHTTPTransport) -> AsyncGenerator[None, None]:
+        try:
+            yield
+        finally:
+            with _lock:
+                if self._pools.get(loop, (None, None))[0] is pool:
+                    del self._pools[loop]
+            await pool.aclose()
+
+    def pools(self) -> list[httpx.AsyncHTTPTransport]:
+        """Connection pools of all live event loops."""
+        with _lock:
+            return [pool for pool, _ in self._pools.values()]
+
+    @staticmethod
+    async def _trace(event_name: str, _info: dict) -> None:
+        _count("async", event_name)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        request.extensions["trace"] = self._trace
+        with _lock:
+            _transport_counters["async"]["requests"] += 1
+        pool = await self._pool()
+        return await pool.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        # Only the running loop's pool can be closed from here; other loops close theirs on shutdown
+        with _lock:
+            entry = self._pools.get(asyncio.get_running_loop())
+        if entry is not None:
+            await entry[1].aclose()
+
+
+def get_async_http_client() -> httpx.AsyncClient:
+    """Get the shared async HTTP client for model providers (created on first use).
+
+    The client may be used from any event loop; each loop gets its own
+    connection pool.
+    """
+    global _async_client
+    with _lock:
+        if _async_client is None or _async_client.is_closed:
+            _async_client = httpx.AsyncClient(timeout=HTTP_TIMEOUT, transport=_LoopLocalTransport())
+        return _async_client
+
+
+def get_sync_http_client() -> httpx.Client:
+    """Get the shared sync HTTP client for sync SDK clients (created on first use)."""
+    global _sync_client
+    with _lock:
+        if _sync_client is None or _sync_client.is_closed:
+            _sync_client = httpx.Client(
+                timeout=HTTP_TIMEOUT,
+                limits=_limits(),
+                event_hooks={"request": [_on_sync_request]},
+            )
+        return _sync_client
+
+
+def pooled_model(provider: str, model_name: str, build: Callable[[], T]) -> T:
+    """Get the process-wide model instance for (provider, model), building it once.
+
+    Args:
+        provider: Provider name
+        model_name: Model name
+        build: Builds the model on first use
+
+    Returns:
+        Shared model instance
+    """
+    key = (provider, model_name)
+    with _lock:
+        model = _models.get(key)
+        if model is not None:
+            _model_lookups["reused"] += 1
+            return model
+    built = build()
+    with _lock:
+        model = _models.setdefault(key, built)
+        _model_lookups["built" if model is built else "reused"] += 1
+        return model
+
+
+def _open_connections(client: httpx.AsyncClient | httpx.Client | None) -> tuple[int, int]:
+    # httpx does not expose its connection pools; read them defensively
+    transport = getattr(client, "_transport", None)
+    transports = transport.pools() if isinstance(transport, _LoopLocalTransport) else [transport]
+    connections = [
+        connection for transport in transports for connection in getattr(getattr(transport, "_pool", None), "connections", [])
+    ]
+    return len(connections), sum(1 for connection in connections if connection.is_idle())
+
+
+def get_client_pool_stats() -> dict:
+    """Model registry and HTTP transport counters for this worker.
+
+    Returns:
+        Dict with models (cached, built, reused, reuse_rate) and per-transport
+        requests, connections_opened, tls_handshakes, connection_reuse_rate,
+        open and idle connections and configured limits
+    """
+    with _lock:
+        models = {"cached": len(_models), **_model_lookups}
+        counters = {transport: dict(counts) for transport, counts in _transport_counters.items()}
+        clients = {"async": _async_client, "sync": _sync_client}
+    lookups = models["built"] + models["reused"]
+    models["reuse_rate"] = round(models["reused"] / lookups, 3) if lookups else 0.0
+
+    transports = {}
+    for transport, counts in counters.items():
+        open_connections, idle_connections = _open_connections(clients[transport])
+        requests = counts["requests"]
+        transports[transport] = {
+            **counts,
+            "connection_reuse_rate": round(max(0.0, 1 - counts["connections_opened"] / requests), 3) if requests else 0.0,
+            "open_connections": open_connections,
+            "idle_connections": idle_connections,
+            "max_connections": settings.llm_http_max_connections,
+            "max_keepalive_connections": settings.llm_http_max_keepalive_connections,
+        }
+    return {"models": models, "transports": transports}
+
+
+def reset_client_pool() -> None:
+    """Drop pooled models and counters (tests). Clients are left to the garbage collector."""
+    global _async_client, _sync_client
+    with _lock:
+        _models.clear()
+        _model_lookups.update({"built": 0, "reused": 0})
+        for counts in _transport_counters.values():
+            counts.update({"requests": 0, "connections_opened": 0, "tls_handshakes": 0})
+        _async_client = None
+        _sync_client = None
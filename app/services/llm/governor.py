@@ -0,0 +1,271 @@
+"""Process-wide LLM concurrency governor.
+
+Every model request made through get_model() takes a slot from one shared
+governor, so the whole process (API handlers, plan fan-out, scheduler jobs)
+stays inside one concurrency budget instead of each module sizing its own
+semaphore.
+
+Priority lanes:
+- interactive: user-facing chat turns (default for unmarked calls)
+- plan: plan generation fan-out (session texts, week plans)
+- background: scheduler jobs, summarization, reports
+
+Free slots always go to the highest-priority lane with waiters; FIFO within
+a lane. Mark code paths with `llm_priority(...)`:
+
+    with llm_priority(BACKGROUND):
+        run_overnight_batch()
+
+Adaptive limit (AIMD):
+- Each successful request adds 1/limit (about +1 per round of requests)
+- A 429 halves the limit
+- A request slower than the latency target shrinks the limit by 10%
+Decreases happen at most once per cooldown, so a burst of 429s from one
+round of requests counts once.
+
+Waiters may sit on different event loops (background threads run their own
+asyncio.run loops); slots are handed over with call_soon_threadsafe.
+"""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Literal
+
+from loguru import logger
+from pydantic_ai.exceptions import ModelHTTPError
+
+from app.config.settings import settings
+
+LLMLane = Literal["interactive", "plan", "background"]
+
+INTERACTIVE: LLMLane = "interactive"
+PLAN: LLMLane = "plan"
+BACKGROUND: LLMLane = "background"
+
+# Highest priority first
+LANES: tuple[LLMLane, ...] = (INTERACTIVE, PLAN, BACKGROUND)
+
+# Multiplicative decrease factors
+THROTTLE_DECREASE = 0.5
+LATENCY_DECREASE = 0.9
+
+_lane: ContextVar[LLMLane] = ContextVar("llm_priority_lane", default=INTERACTIVE)
+
+
+@contextmanager
+def llm_priority(lane: LLMLane) -> Iterator[None]:
+    """Run LLM requests made in this context in the given lane.
+
+    Also usable as a decorator on sync functions (e.g., scheduler jobs).
+
+    Args:
+        lane: Priority lane for requests made inside the block
+    """
+    token = _lane.set(lane)
+    try:
+        yield
+    finally:
+        _lane.reset(token)
+
+
+def current_lane() -> LLMLane:
+    """Lane of the current context."""
+    return _lane.get()
+
+
+@dataclass(eq=False)
+class _Waiter:
+    lane: LLMLane
+    loop: asyncio.AbstractEventLoop
+    future: asyncio.Future
+    enqueued_at: float
+    granted: bool = False
+
+
+@dataclass
+class _LaneStats:
+    granted: int = 0
+    total_wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+    queue: deque = field(default_factory=deque)
+
+
+class LLMGovernor:
+    """Shared admission control for LLM requests (see module docstring)."""
+
+    def __init__(
+        self,
+        initial_limit: float,
+        min_limit: float,
+        max_limit: float,
+        target_latency_seconds: float,
+        cooldown_seconds: float,
+    ):
+        self.min_limit = max(1.0, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self.limit = min(self.max_limit, max(self.min_limit, initial_limit))
+        self.target_latency_seconds = target_latency_seconds
+        self.cooldown_seconds = cooldown_seconds
+        self.in_flight = 0
+        self.throttled = 0
+        self.slow = 0
+        self._last_decrease = float("-inf")
+        self._lock = threading.Lock()
+        self._lanes: dict[LLMLane, _LaneStats] = {lane: _LaneStats() for lane in LANES}
+
+    @asynccontextmanager
+    async def slot(self, lane: LLMLane | None = None) -> AsyncIterator[None]:
+        """Hold one request slot; the request's outcome feeds the adaptive limit.
+
+        Args:
+            lane: Priority lane (default: the current context's lane)
+        """
+        await self.acquire(lane or current_lane())
+        started = time.monotonic()
+        throttled = False
+        try:
+            yield
+        except ModelHTTPError as e:
+            throttled = e.status_code == 429
+            raise
+        finally:
+            self.release(time.monotonic() - started, throttled=throttled)
+
+    async def acquire(self, lane: LLMLane) -> None:
+        """Wait for a request slot in the given lane."""
+        loop = asyncio.get_running_loop()
+        now = time.monotonic()
+        with self._lock:
+            if self.in_flight < int(self.limit) and not any(stats.queue for stats in self._lanes.values()):
+                self.in_flight += 1
+                self._record_grant(lane, 0.0)
+                return
+            waiter = _Waiter(lane=lane, loop=loop, future=loop.create_future(), enqueued_at=now)
+            self._lanes[lane].queue.append(waiter)
+
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            with self._lock:
+                if not waiter.granted:
+                    self._lanes[lane].queue.remove(waiter)
+                    raise
+            # Granted concurrently with the cancellation: pass the slot on
+            self._return_slot()
+            raise
+
+    def release(self, latency_seconds: float, throttled: bool = False) -> None:
+        """Return a slot and adapt the limit to the request's outcome.
+
+        Args:
+            latency_seconds: Request duration
+            throttled: Whether the provider answered 429
+        """
+        now = time.monotonic()
+        with self._lock:
+            self.in_flight -= 1
+            can_decrease = now - self._last_decrease >= self.cooldown_seconds
+            if throttled:
+                self.throttled += 1
+                if can_decrease:
+                    self._decrease(THROTTLE_DECREASE, now, "429 from provider")
+            elif latency_seconds > self.target_latency_seconds:
+                self.slow += 1
+                if can_decrease:
+                    self._decrease(LATENCY_DECREASE, now, f"latency {latency_seconds:.1f}s over target")
+            else:
+                self.limit = min(self.max_limit, self.limit + 1.0 / self.limit)
+            self._dispatch()
+
+    def _return_slot(self) -> None:
+        """Give back a slot that was never used (no effect on the limit)."""
+        with self._lock:
+            self.in_flight -= 1
+            self._dispatch()
+
+    def _decrease(self, factor: float, now: float, reason: str) -> None:
+        previous = self.limit
+        self.limit = max(self.min_limit, self.limit * factor)
+        self._last_decrease = now
+        logger.info(f"[LLM_GOVERNOR] Concurrency limit {previous:.1f} -> {self.limit:.1f} ({reason})")
+
+    def _dispatch(self) -> None:
+        """Grant free slots to waiters, highest-priority lane first. Caller holds the lock."""
+        now = time.monotonic()
+        for lane in LANES:
+            queue = self._lanes[lane].queue
+            while queue and self.in_flight < int(self.limit):
+                waiter = queue.popleft()
+                try:
+                    waiter.loop.call_soon_threadsafe(_resolve, waiter.future)
+                except RuntimeError:
+                    # Waiter's event loop is closed; nobody is left to use the slot
+                    continue
+                waiter.granted = True
+                self.in_flight += 1
+                self._record_grant(lane, now - waiter.enqueued_at)
+
+    def _record_grant(self, lane: LLMLane, wait_seconds: float) -> None:
+        stats = self._lanes[lane]
+        stats.granted += 1
+        stats.total_wait_seconds += wait_seconds
+        stats.max_wait_seconds = max(stats.max_wait_seconds, wait_seconds)
+
+    def stats(self) -> dict:
+        """Snapshot of the limit, in-flight count and per-lane queue metrics.
+
+        Returns:
+            Dict with limit, in_flight, throttled and slow counts, and per-lane
+            queue_depth, granted, avg_wait_ms and max_wait_ms
+        """
+        with self._lock:
+            return {
+                "limit": round(self.limit, 2),
+                "in_flight": self.in_flight,
+                "throttled": self.throttled,
+                "slow": self.slow,
+                "lanes": {
+                    lane: {
+                        "queue_depth": len(stats.queue),
+                        "granted": stats.granted,
+                        "avg_wait_ms": round(stats.total_wait_seconds / stats.granted * 1000, 1) if stats.granted else 0.0,
+                        "max_wait_ms": round(stats.max_wait_seconds * 1000, 1),
+                    }
+                    for lane, stats in self._lanes.items()
+                },
+            }
+
+
+def _resolve(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+_governor: LLMGovernor | None = None
+_governor_lock = threading.Lock()
+
+
+def get_governor() -> LLMGovernor:
+    """Get the process-wide governor (created from settings on first use)."""
+    global _governor
+    with _governor_lock:
+        if _governor is None:
+            _governor = LLMGovernor(
+                initial_limit=settings.llm_concurrency_initial,
+                min_limit=settings.llm_concurrency_min,
+                max_limit=settings.llm_concurrency_max,
+                target_latency_seconds=settings.llm_latency_target_seconds,
+                cooldown_seconds=settings.llm_concurrency_cooldown_seconds,
+            )
+        return _governor
+
+
+def get_governor_stats() -> dict:
+    """Stats of the process-wide governor (see LLMGovernor.stats)."""
+    return get_governor().stats()
@@ -0,0 +1,297 @@
+"""Hedged LLM requests under per-call-site latency budgets.
+
+A slow provider response used to make the user wait for the whole request
+(and its retries). Each call site now has a latency budget:
+
+- The primary model is called first. If it has not answered by the call
+  site's observed p95 latency (or the budget's hedge_after_seconds until
+  enough samples exist), a hedged request goes to the hedge model
+  (LLM_HEDGE_MODEL, or a second request to the primary model). A primary
+  that fails early is hedged immediately.
+- The first successful result wins; the other request is cancelled.
+  Callers pass a run function returning the parsed structured output, so
+  schema validation is part of "success".
+- When total_seconds is spent, outstanding requests are cancelled and
+  LLMBudgetExceededError is raised. It is not retried: call sites with a
+  deterministic generator (session text: app.infra.llm.fallback) fall back
+  to it, the others fail fast instead of waiting out their retries.
+
+Both timers start once the primary request is admitted by the LLM governor:
+time spent queued behind other requests (e.g., during plan fan-out) neither
+triggers a hedge nor spends the budget, and is not part of the observed p95.
+Calls in the background lane (scheduler jobs) are not hedged and have no
+budget: nobody waits for them, so a hedge would only double their cost.
+
+Requests made inside hedged() are recorded under the call site in the LLM
+telemetry; the hedged request counts as a retry.
+"""
+
+import asyncio
+import math
+import threading
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, TypeVar
+
+from loguru import logger
+
+from app.config.settings import settings
+from app.services.llm.governor import BACKGROUND, current_lane
+from app.services.llm.telemetry import llm_call_site
+
+T = TypeVar("T")
+
+# Successful latencies kept per call site for the p95 estimate
+LATENCY_WINDOW = 200
+
+# Samples needed before the observed p95 replaces the configured hedge delay
+MIN_LATENCY_SAMPLES = 20
+
+# Lower bound of the hedge delay (avoid doubling every request when p95 is tiny)
+MIN_HEDGE_DELAY_SECONDS = 1.0
+
+
+class LLMBudgetExceededError(TimeoutError):
+    """Raised when a call site's latency budget is spent without a result."""
+
+
+@dataclass(frozen=True)
+class LatencyBudget:
+    """Latency budget of one call site.
+
+    Attributes:
+        hedge_after_seconds: Hedge delay until the call site's p95 is known
+        total_seconds: Hard limit before falling back
+    """
+
+    hedge_after_seconds: float
+    total_seconds: float
+
+
+LATENCY_BUDGETS: dict[str, LatencyBudget] = {
+    "coach.season_plan": LatencyBudget(hedge_after_seconds=45.0, total_seconds=150.0),
+    "coach.weekly_intent": LatencyBudget(hedge_after_seconds=30.0, total_seconds=90.0),
+    "coach.daily_decision": LatencyBudget(hedge_after_seconds=20.0, total_seconds=60.0),
+    "coach.weekly_report": LatencyBudget(hedge_after_seconds=30.0, total_seconds=90.0),
+    "coach.weekly_summary": LatencyBudget(hedge_after_seconds=20.0, total_seconds=60.0),
+    "coach.text_feedback": LatencyBudget(hedge_after_seconds=10.0, total_seconds=30.0),
+    "coach.training_plan": LatencyBudget(hedge_after_seconds=60.0, total_seconds=180.0),
+    "session_text": LatencyBudget(hedge_after_seconds=15.0, total_seconds=45.0),
+}
+
+DEFAULT_BUDGET = LatencyBudget(hedge_after_seconds=20.0, total_seconds=60.0)
+
+
+@dataclass
+class _Admission:
+    """Governor admission of a hedged call's primary request."""
+
+    queued: bool = False
+    admitted_at: float | None = None
+    admitted: asyncio.Event = field(default_factory=asyncio.Event)
+
+    def waiting(self, primary_task: asyncio.Task) -> bool:
+        """Whether the primary request is still queued for a governor slot."""
+        return self.queued and self.admitted_at is None and not primary_task.done()
+
+
+# Set while the primary request of a hedged call runs
+_primary_admission: ContextVar[_Admission | None] = ContextVar("llm_hedge_primary_admission", default=None)
+
+
+def mark_queued() -> None:
+    """Note that the current request is waiting for a governor slot."""
+    admission = _primary_admission.get()
+    if admission is not None and admission.admitted_at is None:
+        admission.queued = True
+
+
+def mark_admitted() -> None:
+    """Note that the current request holds a governor slot."""
+    admission = _primary_admission.get()
+    if admission is not None and admission.admitted_at is None:
+        admission.admitted_at = time.monotonic()
+        admission.admitted.set()
+
+
+_stats_lock = threading.Lock()
+_latencies: dict[str, deque[float]] = {}
+_stats: dict[str, dict[str, int]] = {}
+
+
+def _site_stats(call_site: str) -> dict[str, int]:
+    return _stats.setdefault(call_site, {"calls": 0, "hedged": 0, "hedge_wins": 0, "budget_exceeded": 0})
+
+
+def _count(call_site: str, counter: str) -> None:
+    with _stats_lock:
+        _site_stats(call_site)[counter] += 1
+
+
+def _record_latency(call_site: str, latency_seconds: float) -> None:
+    with _stats_lock:
+        _latencies.setdefault(call_site, deque(maxlen=LATENCY_WINDOW)).append(latency_seconds)
+
+
+def observed_p95(call_site: str) -> float | None:
+    """p95 of recent successful latencies at a call site.
+
+    Args:
+        call_site: Call site name
+
+    Returns:
+        p95 in seconds, or None with fewer than MIN_LATENCY_SAMPLES samples
+    """
+    with _stats_lock:
+        samples = sorted(_latencies.get(call_site, ()))
+    if len(samples) < MIN_LATENCY_SAMPLES:
+        return None
+    return samples[min(len(samples) - 1, math.ceil(0.95 * len(samples)) - 1)]
+
+
+def hedge_delay(call_site: str) -> float:
+    """Seconds to wait for the primary model before hedging.
+
+    Args:
+        call_site: Call site name
+
+    Returns:
+        Observed p95 (or the configured delay), within the call site's budget
+    """
+    budget = LATENCY_BUDGETS.get(call_site, DEFAULT_BUDGET)
+    delay = observed_p95(call_site) or budget.hedge_after_seconds
+    return min(max(delay, MIN_HEDGE_DELAY_SECONDS), budget.total_seconds)
+
+
+def _get_hedge_model(primary: Any) -> Any:
+    from app.services.llm.model import get_model  # noqa: PLC0415
+
+    model_name = settings.llm_hedge_model or getattr(primary, "model_name", None)
+    return get_model("openai", model_name) if model_name else primary
+
+
+async def _cancel(tasks: set[asyncio.Task]) -> None:
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def hedged(
+    call_site: str,
+    run: Callable[[Any], Awaitable[T]],
+    primary: Any,
+) -> T:
+    """Run an LLM call with hedging and a latency budget.
+
+    Args:
+        call_site: Call site name (key of LATENCY_BUDGETS)
+        run: Makes one request with the given model and returns the parsed output
+        primary: Primary model
+
+    Returns:
+        Output of the first successful request
+
+    Raises:
+        LLMBudgetExceededError: If the budget is spent without a result
+        Exception: Error of the primary request if both requests fail
+    """
+    with llm_call_site(call_site):
+        return await _hedged(call_site, run, primary)
+
+
+async def _hedged(call_site: str, run: Callable[[Any], Awaitable[T]], primary: Any) -> T:
+    if not settings.llm_hedging_enabled or current_lane() == BACKGROUND:
+        return await run(primary)
+
+    _count(call_site, "calls")
+    budget = LATENCY_BUDGETS.get(call_site, DEFAULT_BUDGET)
+    called_at = time.monotonic()
+    deadline = called_at + budget.total_seconds
+    admission = _Admission()
+    token = _primary_admission.set(admission)
+    try:
+        primary_task = asyncio.ensure_future(run(primary))
+    finally:
+        _primary_admission.reset(token)
+    pending: set[asyncio.Task] = {primary_task}
+    hedge_task: asyncio.Task | None = None
+    errors: list[BaseException] = []
+    try:
+        while pending:
+            if admission.waiting(primary_task):
+                await _wait_for_admission(primary_task, admission)
+            # Timers run from the primary's admission (queue time is not the provider's latency)
+            started = called_at if admission.admitted_at is None else admission.admitted_at
+            deadline = started + budget.total_seconds
+            hedge_at = started + hedge_delay(call_site)
+            wait_until = deadline if hedge_task is not None else min(hedge_at, deadline)
+            done, pending = await asyncio.wait(
+                pending, timeout=max(0.0, wait_until - time.monotonic()), return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                if task.exception() is None:
+                    latency = time.monotonic() - started
+                    _record_latency(call_site, latency)
+                    if task is hedge_task:
+                        _count(call_site, "hedge_wins")
+                        logger.info(f"[HEDGE] {call_site}: hedged request won after {latency:.1f}s")
+                    return task.result()
+                errors.append(task.exception())
+
+            if admission.waiting(primary_task):
+                continue
+            now = time.monotonic()
+            if now >= deadline:
+                break
+            if hedge_task is None and (now >= hedge_at or not pending):
+                reason = "primary failed" if not pending else f"no response after {now - started:.1f}s"
+                logger.info(f"[HEDGE] {call_site}: sending hedged request ({reason})")
+                _count(call_site, "hedged")
+                hedge_task = asyncio.ensure_future(run(_get_hedge_model(primary)))
+                pending.add(hedge_task)
+    finally:
+        await _cancel(pending)
+
+    if errors and time.monotonic() < deadline:
+        raise errors[0]
+    _count(call_site, "budget_exceeded")
+    logger.warning(f"[HEDGE] {call_site}: no result within {budget.total_seconds:.0f}s budget", errors=[repr(e) for e in errors])
+    raise LLMBudgetExceededError(f"{call_site}: no LLM result within {budget.total_seconds:.0f}s budget")
+
+
+async def _wait_for_admission(primary_task: asyncio.Task, admission: _Admission) -> None:
+    """Wait until the queued primary request gets a governor slot (or finishes)."""
+    admitted = asyncio.ensure_future(admission.admitted.wait())
+    try:
+        await asyncio.wait({primary_task, admitted}, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        await _cancel({admitted})
+
+
+def get_hedging_stats() -> dict:
+    """Hedging counters for this worker.
+
+    Returns:
+        Dict per call site with calls, hedged, hedge_wins, budget_exceeded,
+        p95_seconds and hedge_delay_seconds
+    """
+    with _stats_lock:
+        sites = {site: dict(stats) for site, stats in _stats.items()}
+    return {
+        site: {
+            **stats,
+            "p95_seconds": observed_p95(site),
+            "hedge_delay_seconds": round(hedge_delay(site), 3),
+        }
+        for site, stats in sites.items()
+    }
+
+
+def reset_hedging_stats() -> None:
+    """Reset counters and latency samples (tests)."""
+    with _stats_lock:
+        _stats.clear()
+        _latencies.clear()
@@ -1,10 +1,141 @@
 """LLM model abstraction for consistent model access across the application."""
 
 import os
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
 
+from pydantic_ai.exceptions import ModelHTTPError
+from pydantic_ai.messages import ModelMessage, ModelResponse
+from pydantic_ai.models import ModelRequestParameters, StreamedResponse
 from pydantic_ai.models.openai import OpenAIModel
+from pydantic_ai.models.wrapper import WrapperModel
+from pydantic_ai.providers.openai import OpenAIProvider
+from pydantic_ai.settings import ModelSettings
 
 from app.config.settings import settings
+from app.services.llm.client_pool import get_async_http_client, pooled_model
+from app.services.llm.governor import current_lane, get_governor
+from app.services.llm.hedging import mark_admitted, mark_queued
+from app.services.llm.telemetry import record_llm_call
+
+
+def _output_call_site(model_request_parameters: ModelRequestParameters) -> str:
+    # Label for requests made outside any llm_call_site scope
+    if model_request_parameters.output_tools:
+        title = model_request_parameters.output_tools[0].parameters_json_schema.get("title")
+        return f"output:{title or model_request_parameters.output_tools[0].name}"
+    if model_request_parameters.output_object is not None:
+        return f"output:{model_request_parameters.output_object.name or 'object'}"
+    return "text"
+
+
+class InstrumentedModel(WrapperModel):
+    """Model whose requests are recorded in the LLM telemetry (app.services.llm.telemetry)."""
+
+    async def request(
+        self,
+        messages: list[ModelMessage],
+        model_settings: ModelSettings | None,
+        model_request_parameters: ModelRequestParameters,
+    ) -> ModelResponse:
+        started = time.monotonic()
+        try:
+            response = await self.wrapped.request(messages, model_settings, model_request_parameters)
+        except Exception as e:
+            record_llm_call(
+                self.model_name,
+                time.monotonic() - started,
+                default_call_site=_output_call_site(model_request_parameters),
+                error=e,
+            )
+            raise
+        record_llm_call(
+            self.model_name,
+            time.monotonic() - started,
+            default_call_site=_output_call_site(model_request_parameters),
+            input_tokens=response.usage.input_tokens,
+            output_tokens=response.usage.output_tokens,
+            cache_read_tokens=response.usage.cache_read_tokens,
+        )
+        return response
+
+    @asynccontextmanager
+    async def request_stream(
+        self,
+        messages: list[ModelMessage],
+        model_settings: ModelSettings | None,
+        model_request_parameters: ModelRequestParameters,
+        run_context: Any = None,
+    ) -> AsyncIterator[StreamedResponse]:
+        # Recorded when the stream closes, once its usage is known
+        started = time.monotonic()
+        response_stream: StreamedResponse | None = None
+        error: Exception | None = None
+        try:
+            async with self.wrapped.request_stream(
+                messages, model_settings, model_request_parameters, run_context
+            ) as response_stream:
+                yield response_stream
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            usage = response_stream.usage() if response_stream is not None else None
+            record_llm_call(
+                self.model_name,
+                time.monotonic() - started,
+                default_call_site=_output_call_site(model_request_parameters),
+                input_tokens=usage.input_tokens if usage else 0,
+                output_tokens=usage.output_tokens if usage else 0,
+                cache_read_tokens=usage.cache_read_tokens if usage else 0,
+                error=error,
+            )
+
+
+class GovernedModel(WrapperModel):
+    """Model whose requests take a slot from the process-wide LLM governor."""
+
+    async def request(
+        self,
+        messages: list[ModelMessage],
+        model_settings: ModelSettings | None,
+        model_request_parameters: ModelRequestParameters,
+    ) -> ModelResponse:
+        mark_queued()
+        async with get_governor().slot():
+            mark_admitted()
+            return await self.wrapped.request(messages, model_settings, model_request_parameters)
+
+    @asynccontextmanager
+    async def request_stream(
+        self,
+        messages: list[ModelMessage],
+        model_settings: ModelSettings | None,
+        model_request_parameters: ModelRequestParameters,
+        run_context: Any = None,
+    ) -> AsyncIterator[StreamedResponse]:
+        # The slot is held for the whole stream, but only time-to-first-response
+        # feeds the latency signal (stream length depends on the output size)
+        governor = get_governor()
+        mark_queued()
+        await governor.acquire(current_lane())
+        mark_admitted()
+        started = time.monotonic()
+        latency: float | None = None
+        throttled = False
+        try:
+            async with self.wrapped.request_stream(
+                messages, model_settings, model_request_parameters, run_context
+            ) as response_stream:
+                latency = time.monotonic() - started
+                yield response_stream
+        except ModelHTTPError as e:
+            throttled = e.status_code == 429
+            raise
+        finally:
+            governor.release(latency if latency is not None else time.monotonic() - started, throttled=throttled)
 
 
 def get_model(provider: str, model_name: str):
@@ -12,6 +143,12 @@ def get_model(provider: str, model_name: str):
         # Ensure OPENAI_API_KEY is set from settings for pydantic_ai
         if settings.openai_api_key and not os.getenv("OPENAI_API_KEY"):
             os.environ["OPENAI_API_KEY"] = settings.openai_api_key
-        return OpenAIModel(model_name)
+        return pooled_model(
+            provider,
+            model_name,
+            lambda: GovernedModel(
+                InstrumentedModel(OpenAIModel(model_name, provider=OpenAIProvider(http_client=get_async_http_client())))
+            ),
+        )
 
     raise ValueError(f"Unsupported LLM provider: {provider}")
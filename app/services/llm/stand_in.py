@@ -0,0 +1,414 @@
+"""Local OpenAI-compatible stand-in for load testing.
+
+Serves the parts of the OpenAI API the app uses (chat completions, streamed
+or not, and embeddings), so the coach, the planner and scheduler jobs can be
+benchmarked end to end without provider calls. Point the app at it with
+OPENAI_BASE_URL=http://127.0.0.1:8900/v1 (read by every OpenAI client, both
+pydantic-ai models and the embedding SDK clients).
+
+Chat completions are answered, in order, from:
+1. Recordings: <recordings_dir>/<prompt hash>.json, the assistant message and
+   usage of an earlier response to the same messages and tools
+2. The upstream API when record_upstream is set (the response is saved as a
+   recording, so a recorded run can be replayed offline)
+3. Synthetic output: a schema-valid instance of the requested output tool or
+   response format (SYNTHETIC_OUTPUTS fills fields whose constraints live in
+   validators rather than in the JSON schema), or a short text reply
+
+Every response waits for a latency drawn from a log-normal distribution
+(per output type when configured) and fails with the configured error rate
+(429s or 500s, in OpenAI's error format).
+
+Run it with scripts/llm_stand_in.py.
+"""
+
+import asyncio
+import hashlib
+import json
+import math
+import random
+import threading
+import time
+import uuid
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+import httpx
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+SYNTHETIC_TEXT = "Synthetic stand-in reply. Keep today's run easy and conversational, and check in after."
+
+# Field values for output types whose validators reject arbitrary schema-valid data
+SYNTHETIC_OUTPUTS: dict[str, dict[str, Any]] = {
+    "OrchestratorAgentResponse": {
+        "intent": "question",
+        "horizon": None,
+        "action": "NO_ACTION",
+        "confidence": 0.9,
+        "message": "Keep today's run easy and conversational.",
+        "response_type": "recommendation",
+    },
+    "OrchestrationDecision": {
+        "user_intent": "question",
+        "horizon": "none",
+        "confidence": 0.9,
+        "action": "NO_TOOL",
+        "tool_name": "none",
+        "read_only": True,
+        "reason": "General training question.",
+    },
+    "DailyDecision": {
+        "recommendation": "easy",
+        "volume_hours": 1.0,
+        "intensity_focus": "Zone 2 aerobic",
+        "session_type": "Easy run",
+        "risk_level": "low",
+        "confidence": {"score": 0.8, "explanation": "Recent load is stable and recovery markers look normal."},
+        "explanation": "Training load is steady and recovery looks good, so an easy aerobic run keeps the week on track.",
+    },
+    "SessionTextOutputSchema": {
+        "title": "Easy Aerobic Run",
+        "description": "Run at a relaxed, conversational effort for the whole session.",
+        "structure": {"warmup": "10 min easy", "main": "steady easy running", "cooldown": "5 min walk"},
+        "computed": {"hard_minutes": 0, "intensity_minutes": {"easy": 45}},
+    },
+}
+
+
+@dataclass(frozen=True)
+class LatencyProfile:
+    """Log-normal response latency, given by its median and p95."""
+
+    median_ms: float = 800.0
+    p95_ms: float = 2500.0
+
+    def sample_seconds(self, rng: random.Random) -> float:
+        sigma = math.log(max(self.p95_ms, self.median_ms) / self.median_ms) / 1.645 if self.median_ms > 0 else 0.0
+        return self.median_ms * math.exp(rng.gauss(0.0, sigma)) / 1000 if self.median_ms > 0 else 0.0
+
+
+@dataclass
+class StandInConfig:
+    """Stand-in server behaviour.
+
+    Attributes:
+        recordings_dir: Directory of recorded responses (None disables replay and recording)
+        record_upstream: Upstream base URL to forward unrecorded requests to
+            (e.g. https://api.openai.com/v1); its responses are recorded
+        upstream_api_key: API key for the upstream
+        latency: Default latency distribution
+        latency_by_output: Latency distribution per output type name
+            (e.g. "DailyDecision"; "text" for plain text replies, "embeddings")
+        error_rate: Share of requests that fail
+        throttle_share: Share of failures returned as 429 (the rest are 500)
+        seed: Random seed for latencies and failures (None: nondeterministic)
+    """
+
+    recordings_dir: Path | None = None
+    record_upstream: str | None = None
+    upstream_api_key: str = ""
+    latency: LatencyProfile = field(default_factory=LatencyProfile)
+    latency_by_output: dict[str, LatencyProfile] = field(default_factory=dict)
+    error_rate: float = 0.0
+    throttle_share: float = 0.5
+    seed: int | None = None
+
+
+def prompt_hash(body: dict[str, Any]) -> str:
+    """Hash of the messages and tools of a chat completion request.
+
+    The model is left out, so hedged requests to another model and model
+    switches replay the same recording.
+
+    Args:
+        body: Chat completion request body
+
+    Returns:
+        SHA-256 hex digest
+    """
+    key = {
+        "messages": body.get("messages", []),
+        "tools": [tool.get("function", {}) for tool in body.get("tools") or []],
+        "response_format": body.get("response_format"),
+    }
+    return hashlib.sha256(json.dumps(key, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+def _resolve(schema: dict[str, Any], defs: dict[str, Any]) -> dict[str, Any]:
+    while "$ref" in schema:
+        schema = defs[schema["$ref"].rsplit("/", 1)[-1]]
+    return schema
+
+
+def synthesize(schema: dict[str, Any], defs: dict[str, Any] | None = None) -> Any:
+    """Build a minimal instance of a JSON schema.
+
+    Required properties only; first enum/union option; bounds respected.
+
+    Args:
+        schema: JSON schema
+        defs: Definitions for $ref resolution (default: the schema's $defs)
+
+    Returns:
+        Schema-valid value
+    """
+    defs = schema.get("$defs", {}) if defs is None else defs
+    schema = _resolve(schema, defs)
+    if "const" in schema:
+        return schema["const"]
+    if schema.get("enum"):
+        return schema["enum"][0]
+    for union in ("anyOf", "oneOf", "allOf"):
+        if union in schema:
+            options = [_resolve(option, defs) for option in schema[union]]
+            non_null = [option for option in options if option.get("type") != "null"]
+            return synthesize((non_null or options)[0], defs)
+
+    schema_type = schema.get("type", "object")
+    if isinstance(schema_type, list):
+        schema_type = next((t for t in schema_type if t != "null"), "null")
+    if schema_type == "object":
+        properties = schema.get("properties", {})
+        return {name: synthesize(properties[name], defs) for name in schema.get("required", []) if name in properties}
+    if schema_type == "array":
+        return [synthesize(schema.get("items", {}), defs) for _ in range(schema.get("minItems", 0))]
+    if schema_type == "string":
+        if schema.get("format") == "date":
+            return datetime.now(timezone.utc).date().isoformat()
+        if schema.get("format") == "date-time":
+            return datetime.now(timezone.utc).isoformat()
+        min_length = schema.get("minLength", 0)
+        text = SYNTHETIC_TEXT * (min_length // len(SYNTHETIC_TEXT) + 1)
+        return text[: schema.get("maxLength", max(min_length, len(SYNTHETIC_TEXT)))]
+    if schema_type in {"number", "integer"}:
+        low = schema.get("minimum", schema.get("exclusiveMinimum", 0))
+        high = schema.get("maximum", schema.get("exclusiveMaximum", low + 1))
+        return (low + high) / 2 if schema_type == "number" else math.ceil((low + high) / 2)
+    if schema_type == "boolean":
+        return False
+    return None
+
+
+def _output_name(schema: dict[str, Any], fallback: str) -> str:
+    # Schemas usually reach the API without their title; recognize known output types by their fields
+    if schema.get("title"):
+        return schema["title"]
+    properties = set(schema.get("properties", {}))
+    known = [(len(fields), name) for name, fields in SYNTHETIC_OUTPUTS.items() if properties and set(fields) <= properties]
+    return max(known)[1] if known else fallback
+
+
+def _output_request(body: dict[str, Any]) -> tuple[str, dict[str, Any] | None, str | None]:
+    """Output type name, its schema and the output tool name (None for a response format or text)."""
+    tools = [tool.get("function", {}) for tool in body.get("tools") or []]
+    output_tool = next((tool for tool in tools if tool.get("name", "").startswith("final_result")), None)
+    if output_tool is not None:
+        parameters = output_tool.get("parameters", {})
+        return _output_name(parameters, output_tool["name"]), parameters, output_tool["name"]
+    response_format = body.get("response_format") or {}
+    if response_format.get("type") == "json_schema":
+        json_schema = response_format.get("json_schema", {})
+        schema = json_schema.get("schema", {})
+        return _output_name(schema, json_schema.get("name", "json")), schema, None
+    return "text", None, None
+
+
+def _synthetic_message(body: dict[str, Any]) -> dict[str, Any]:
+    name, schema, tool_name = _output_request(body)
+    if schema is None:
+        return {"role": "assistant", "content": SYNTHETIC_TEXT}
+    output = synthesize(schema)
+    if isinstance(output, dict):
+        output.update(SYNTHETIC_OUTPUTS.get(name, {}))
+    if isinstance(output, dict) and "decision_date" in output:
+        output["decision_date"] = datetime.now(timezone.utc).date().isoformat()
+    arguments = json.dumps(output)
+    if tool_name is None:
+        return {"role": "assistant", "content": arguments}
+    return {
+        "role": "assistant",
+        "content": None,
+        "tool_calls": [
+            {"id": f"call_{uuid.uuid4().hex[:24]}", "type": "function", "function": {"name": tool_name, "arguments": arguments}}
+        ],
+    }
+
+
+def _estimate_tokens(value: Any) -> int:
+    return max(1, len(json.dumps(value, default=str)) // 4)
+
+
+class _StandIn:
+    def __init__(self, config: StandInConfig) -> None:
+        self.config = config
+        self._rng = random.Random(config.seed)  # noqa: S311 simulated latency/failures, not security
+        self._lock = threading.Lock()
+        self.counters = {"requests": 0, "replayed": 0, "recorded": 0, "synthetic": 0, "errors": 0, "embeddings": 0}
+
+    def count(self, counter: str) -> None:
+        with self._lock:
+            self.counters[counter] += 1
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return dict(self.counters)
+
+    async def delay(self, output_name: str) -> None:
+        profile = self.config.latency_by_output.get(output_name, self.config.latency)
+        with self._lock:
+            seconds = profile.sample_seconds(self._rng)
+        await asyncio.sleep(seconds)
+
+    def failure(self) -> JSONResponse | None:
+        with self._lock:
+            failed = self._rng.random() < self.config.error_rate
+            throttled = self._rng.random() < self.config.throttle_share
+        if not failed:
+            return None
+        self.count("errors")
+        status, error_type = (429, "rate_limit_exceeded") if throttled else (500, "server_error")
+        return JSONResponse(
+            status_code=status,
+            content={"error": {"message": f"Stand-in injected {status}", "type": error_type, "param": None, "code": error_type}},
+        )
+
+    def _recording_path(self, key: str) -> Path | None:
+        return self.config.recordings_dir / f"{key}.json" if self.config.recordings_dir is not None else None
+
+    async def answer(self, body: dict[str, Any]) -> tuple[dict[str, Any], dict[str, int]]:
+        """Assistant message and usage for a chat completion request."""
+        key = prompt_hash(body)
+        path = self._recording_path(key)
+        if path is not None and path.exists():
+            recording = json.loads(path.read_text(encoding="utf-8"))
+            self.count("replayed")
+            return recording["message"], recording["usage"]
+
+        if self.config.record_upstream:
+            async with httpx.AsyncClient(timeout=600.0) as client:
+                response = await client.post(
+                    f"{self.config.record_upstream.rstrip('/')}/chat/completions",
+                    json={**body, "stream": False, "stream_options": None},
+                    headers={"Authorization": f"Bearer {self.config.upstream_api_key}"},
+                )
+                response.raise_for_status()
+                data = response.json()
+            message, usage = data["choices"][0]["message"], data["usage"]
+            if path is not None:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_text(json.dumps({"message": message, "usage": usage}, indent=2), encoding="utf-8")
+            self.count("recorded")
+            return message, usage
+
+        message = _synthetic_message(body)
+        prompt_tokens = _estimate_tokens(body.get("messages", [])) + _estimate_tokens(body.get("tools") or [])
+        completion_tokens = _estimate_tokens(message)
+        usage = {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+        }
+        self.count("synthetic")
+        return message, usage
+
+
+def _completion(body: dict[str, Any], message: dict[str, Any], usage: dict[str, int]) -> dict[str, Any]:
+    return {
+        "id": f"chatcmpl-{uuid.uuid4().hex}",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": body.get("model", "stand-in"),
+        "choices": [
+            {"index": 0, "message": message, "logprobs": None, "finish_reason": "tool_calls" if message.get("tool_calls") else "stop"}
+        ],
+        "usage": usage,
+    }
+
+
+async def _stream(body: dict[str, Any], message: dict[str, Any], usage: dict[str, int]) -> AsyncIterator[str]:
+    chunk = {
+        "id": f"chatcmpl-{uuid.uuid4().hex}",
+        "object": "chat.completion.chunk",
+        "created": int(time.time()),
+        "model": body.get("model", "stand-in"),
+    }
+    delta: dict[str, Any] = {"role": "assistant"}
+    if message.get("tool_calls"):
+        delta["tool_calls"] = [{"index": index, **call} for index, call in enumerate(message["tool_calls"])]
+    else:
+        delta["content"] = message.get("content") or ""
+    yield f"data: {json.dumps({**chunk, 'choices': [{'index': 0, 'delta': delta, 'finish_reason': None}]})}\n\n"
+    # Hand control back between chunks, like a real token stream
+    await asyncio.sleep(0)
+    finish_reason = "tool_calls" if message.get("tool_calls") else "stop"
+    yield f"data: {json.dumps({**chunk, 'choices': [{'index': 0, 'delta': {}, 'finish_reason': finish_reason}]})}\n\n"
+    if (body.get("stream_options") or {}).get("include_usage"):
+        yield f"data: {json.dumps({**chunk, 'choices': [], 'usage': usage})}\n\n"
+    yield "data: [DONE]\n\n"
+
+
+def _embedding(text: str, dimensions: int) -> list[float]:
+    # Deterministic unit vector per input text
+    rng = random.Random(hashlib.sha256(text.encode("utf-8")).digest())  # noqa: S311 fake vectors, not security
+    vector = [rng.gauss(0.0, 1.0) for _ in range(dimensions)]
+    norm = math.sqrt(sum(value * value for value in vector)) or 1.0
+    return [value / norm for value in vector]
+
+
+def create_stand_in_app(config: StandInConfig | None = None) -> FastAPI:
+    """Create the stand-in server app.
+
+    Args:
+        config: Server behaviour (default: synthetic outputs, default latency, no errors)
+
+    Returns:
+        FastAPI app serving /v1/chat/completions, /v1/embeddings and /stand-in/stats
+    """
+    stand_in = _StandIn(config or StandInConfig())
+    app = FastAPI(title="LLM stand-in", docs_url=None, redoc_url=None)
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request):
+        body = await request.json()
+        stand_in.count("requests")
+        output_name = _output_request(body)[0]
+        await stand_in.delay(output_name)
+        failure = stand_in.failure()
+        if failure is not None:
+            return failure
+        message, usage = await stand_in.answer(body)
+        if body.get("stream"):
+            return StreamingResponse(_stream(body, message, usage), media_type="text/event-stream")
+        return _completion(body, message, usage)
+
+    @app.post("/v1/embeddings")
+    async def embeddings(request: Request):
+        body = await request.json()
+        stand_in.count("embeddings")
+        await stand_in.delay("embeddings")
+        failure = stand_in.failure()
+        if failure is not None:
+            return failure
+        inputs = body["input"] if isinstance(body["input"], list) else [body["input"]]
+        model = body.get("model", "text-embedding-3-small")
+        dimensions = body.get("dimensions") or (3072 if model.endswith("large") else 1536)
+        prompt_tokens = sum(_estimate_tokens(text) for text in inputs)
+        return {
+            "object": "list",
+            "model": model,
+            "data": [
+                {"object": "embedding", "index": index, "embedding": _embedding(str(text), dimensions)}
+                for index, text in enumerate(inputs)
+            ],
+            "usage": {"prompt_tokens": prompt_tokens, "total_tokens": prompt_tokens},
+        }
+
+    @app.get("/stand-in/stats")
+    async def stats():
+        return stand_in.stats()
+
+    return app
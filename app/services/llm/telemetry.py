@@ -0,0 +1,338 @@
+"""In-process LLM call telemetry.
+
+Every model request made through get_model() (agents, CoachLLMClient,
+session text, ...) and every embedding request is recorded per
+(call site, model):
+
+- requests, errors, 429s, retries and cache hits
+- prompt, completion and cached-prompt tokens, and estimated cost
+- rolling latency and tokens-per-request histograms (last hour)
+
+Histograms are HDR-style: log-linear buckets (16 linear sub-buckets per
+power of two) keep every recorded value within 6.25% at constant memory,
+whatever the range. Slots of ROLLING_SLOT_SECONDS are merged on read and
+expire after ROLLING_WINDOW_SECONDS.
+
+Call sites:
+- Mark code with `llm_call_site("coach.daily_decision")` (or the
+  `with_llm_call_site` decorator for async functions). Nested scopes with the
+  same name share the outer scope, so its extra requests count as retries.
+- Unmarked requests are labeled by their structured output type
+  ("output:DailyDecision") or "text".
+
+Read with get_llm_telemetry() (app.internal.ai_ops.llm_telemetry) or write a
+JSON snapshot with dump_llm_telemetry().
+"""
+
+import functools
+import json
+import threading
+import time
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, ParamSpec, TypeVar
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+# Linear sub-buckets per power of two (max relative error 1/16)
+SUB_BUCKETS = 16
+
+ROLLING_WINDOW_SECONDS = 3600
+ROLLING_SLOT_SECONDS = 300
+
+# USD per 1M tokens: (prompt, cached prompt, completion)
+MODEL_PRICES_PER_MILLION: dict[str, tuple[float, float, float]] = {
+    "gpt-4o": (2.50, 1.25, 10.00),
+    "gpt-4o-mini": (0.15, 0.075, 0.60),
+    "gpt-4.1": (2.00, 0.50, 8.00),
+    "gpt-4.1-mini": (0.40, 0.10, 1.60),
+    "gpt-4.1-nano": (0.10, 0.025, 0.40),
+    "text-embedding-3-small": (0.02, 0.02, 0.0),
+    "text-embedding-3-large": (0.13, 0.13, 0.0),
+}
+
+
+class Histogram:
+    """Log-linear histogram of non-negative values (HDR-style)."""
+
+    def __init__(self) -> None:
+        self.counts: dict[int, int] = {}
+        self.count = 0
+        self.max = 0.0
+
+    @staticmethod
+    def _index(value: float) -> int:
+        if value < 1:
+            return -1
+        exponent = int(value).bit_length() - 1
+        sub_bucket = min(SUB_BUCKETS - 1, int((value / (1 << exponent) - 1) * SUB_BUCKETS))
+        return exponent * SUB_BUCKETS + sub_bucket
+
+    @staticmethod
+    def _upper_bound(index: int) -> float:
+        if index < 0:
+            return 1.0
+        exponent, sub_bucket = divmod(index, SUB_BUCKETS)
+        return (1 << exponent) * (1 + (sub_bucket + 1) / SUB_BUCKETS)
+
+    def record(self, value: float) -> None:
+        index = self._index(value)
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.count += 1
+        self.max = max(self.max, value)
+
+    def merge(self, other: "Histogram") -> None:
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+        self.count += other.count
+        self.max = max(self.max, other.max)
+
+    def percentile(self, q: float) -> float:
+        """Value at quantile q (0-100): upper bound of its bucket, capped at the max."""
+        if not self.count:
+            return 0.0
+        rank = max(1, round(q / 100 * self.count))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                return min(self._upper_bound(index), self.max)
+        return self.max
+
+
+class RollingHistogram:
+    """Histogram over the last ROLLING_WINDOW_SECONDS, kept in time slots."""
+
+    def __init__(self) -> None:
+        self._slots: dict[int, Histogram] = {}
+
+    def record(self, value: float, now: float) -> None:
+        slot = int(now // ROLLING_SLOT_SECONDS)
+        self._slots.setdefault(slot, Histogram()).record(value)
+        oldest = slot - ROLLING_WINDOW_SECONDS // ROLLING_SLOT_SECONDS
+        for expired in [s for s in self._slots if s <= oldest]:
+            del self._slots[expired]
+
+    def snapshot(self, now: float) -> Histogram:
+        oldest = int(now // ROLLING_SLOT_SECONDS) - ROLLING_WINDOW_SECONDS // ROLLING_SLOT_SECONDS
+        merged = Histogram()
+        for slot, histogram in self._slots.items():
+            if slot > oldest:
+                merged.merge(histogram)
+        return merged
+
+
+@dataclass
+class _SiteStats:
+    requests: int = 0
+    errors: int = 0
+    throttled: int = 0
+    retries: int = 0
+    cache_hits: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cache_read_tokens: int = 0
+    cost_usd: float = 0.0
+    latency_ms: RollingHistogram = field(default_factory=RollingHistogram)
+    tokens: RollingHistogram = field(default_factory=RollingHistogram)
+
+
+@dataclass(eq=False)
+class _CallSiteScope:
+    name: str
+    requests: int = 0
+
+
+_call_site: ContextVar[_CallSiteScope | None] = ContextVar("llm_call_site", default=None)
+_lock = threading.Lock()
+_sites: dict[tuple[str, str], _SiteStats] = {}
+_started_at = time.time()
+
+
+@contextmanager
+def llm_call_site(name: str) -> Iterator[None]:
+    """Attribute LLM requests made in this context to a call site.
+
+    Args:
+        name: Call site name (e.g. "coach.daily_decision")
+    """
+    current = _call_site.get()
+    if current is not None and current.name == name:
+        yield
+        return
+    token = _call_site.set(_CallSiteScope(name))
+    try:
+        yield
+    finally:
+        _call_site.reset(token)
+
+
+def with_llm_call_site(name: str) -> Callable[[Callable[P, Awaitable[R]]], Callable[P, Awaitable[R]]]:
+    """Decorator form of llm_call_site for async functions.
+
+    Args:
+        name: Call site name
+    """
+
+    def decorator(func: Callable[P, Awaitable[R]]) -> Callable[P, Awaitable[R]]:
+        @functools.wraps(func)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            with llm_call_site(name):
+                return await func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def estimate_cost_usd(model: str, input_tokens: int, output_tokens: int, cache_read_tokens: int = 0) -> float:
+    """Estimated cost of one request (0.0 for models without a known price).
+
+    Args:
+        model: Model name
+        input_tokens: Prompt tokens (including cached ones)
+        output_tokens: Completion tokens
+        cache_read_tokens: Prompt tokens served from the provider's prompt cache
+
+    Returns:
+        Cost in USD
+    """
+    prices = MODEL_PRICES_PER_MILLION.get(model)
+    if prices is None:
+        return 0.0
+    prompt_price, cached_price, completion_price = prices
+    uncached = max(0, input_tokens - cache_read_tokens)
+    return (uncached * prompt_price + cache_read_tokens * cached_price + output_tokens * completion_price) / 1_000_000
+
+
+def record_llm_call(
+    model: str,
+    latency_seconds: float,
+    *,
+    call_site: str | None = None,
+    default_call_site: str = "text",
+    input_tokens: int = 0,
+    output_tokens: int = 0,
+    cache_read_tokens: int = 0,
+    error: BaseException | None = None,
+) -> None:
+    """Record one model or embedding request.
+
+    Args:
+        model: Model name
+        latency_seconds: Request latency
+        call_site: Call site (default: the active llm_call_site scope)
+        default_call_site: Label used outside any scope
+        input_tokens: Prompt tokens
+        output_tokens: Completion tokens
+        cache_read_tokens: Prompt tokens served from the provider's prompt cache
+        error: Exception raised by the request, if any
+    """
+    input_tokens, output_tokens, cache_read_tokens = int(input_tokens or 0), int(output_tokens or 0), int(cache_read_tokens or 0)
+    scope = _call_site.get()
+    site = call_site or (scope.name if scope is not None else default_call_site)
+    now = time.time()
+    with _lock:
+        stats = _sites.setdefault((site, model), _SiteStats())
+        stats.requests += 1
+        if scope is not None and call_site is None:
+            if scope.requests:
+                stats.retries += 1
+            scope.requests += 1
+        if error is not None:
+            stats.errors += 1
+            stats.throttled += int(getattr(error, "status_code", None) == 429)
+        stats.input_tokens += input_tokens
+        stats.output_tokens += output_tokens
+        stats.cache_read_tokens += cache_read_tokens
+        stats.cost_usd += estimate_cost_usd(model, input_tokens, output_tokens, cache_read_tokens)
+        stats.latency_ms.record(latency_seconds * 1000, now)
+        if error is None:
+            stats.tokens.record(input_tokens + output_tokens, now)
+
+
+def record_cache_hit(call_site: str, model: str) -> None:
+    """Record a result served from a cache instead of a model request.
+
+    Args:
+        call_site: Call site name
+        model: Model the cached result was generated with
+    """
+    with _lock:
+        _sites.setdefault((call_site, model), _SiteStats()).cache_hits += 1
+
+
+def get_llm_telemetry() -> dict[str, Any]:
+    """Telemetry of this worker, most expensive call sites first.
+
+    Returns:
+        Dict with since, window_seconds, total_requests, total_cost_usd and
+        call_sites (counters, tokens, cost, latency and tokens-per-request
+        percentiles over the rolling window)
+    """
+    now = time.time()
+    with _lock:
+        call_sites = []
+        for (site, model), stats in _sites.items():
+            latency = stats.latency_ms.snapshot(now)
+            tokens = stats.tokens.snapshot(now)
+            call_sites.append({
+                "call_site": site,
+                "model": model,
+                "requests": stats.requests,
+                "errors": stats.errors,
+                "throttled": stats.throttled,
+                "retries": stats.retries,
+                "cache_hits": stats.cache_hits,
+                "input_tokens": stats.input_tokens,
+                "output_tokens": stats.output_tokens,
+                "cache_read_tokens": stats.cache_read_tokens,
+                "cost_usd": round(stats.cost_usd, 6),
+                "latency_ms": {
+                    "count": latency.count,
+                    "p50": round(latency.percentile(50), 1),
+                    "p90": round(latency.percentile(90), 1),
+                    "p99": round(latency.percentile(99), 1),
+                    "max": round(latency.max, 1),
+                },
+                "tokens_per_request": {
+                    "p50": round(tokens.percentile(50)),
+                    "p99": round(tokens.percentile(99)),
+                    "max": round(tokens.max),
+                },
+            })
+    call_sites.sort(key=lambda entry: (entry["cost_usd"], entry["input_tokens"] + entry["output_tokens"]), reverse=True)
+    return {
+        "since": datetime.fromtimestamp(_started_at, tz=timezone.utc).isoformat(),
+        "window_seconds": ROLLING_WINDOW_SECONDS,
+        "total_requests": sum(entry["requests"] for entry in call_sites),
+        "total_cost_usd": round(sum(entry["cost_usd"] for entry in call_sites), 6),
+        "call_sites": call_sites,
+    }
+
+
+def dump_llm_telemetry(path: str | Path) -> Path:
+    """Write a JSON snapshot of get_llm_telemetry().
+
+    Args:
+        path: Output file
+
+    Returns:
+        Path written
+    """
+    output = Path(path)
+    output.write_text(json.dumps(get_llm_telemetry(), indent=2), encoding="utf-8")
+    return output
+
+
+def reset_llm_telemetry() -> None:
+    """Clear all telemetry (tests)."""
+    global _started_at
+    with _lock:
+        _sites.clear()
+        _started_at = time.time()
@@ -2,6 +2,10 @@
 
 This service builds a read-only, story-driven view of how the season
 is unfolding relative to the plan, week by week.
+
+Per-week facts (key sessions, flags, planned vs completed counts) come from the
+materialized CalendarWeekSummary rows; only weeks without a fresh row are
+rebuilt from calendar items for the request.
 """
 
 from datetime import date, datetime, timedelta, timezone
@@ -12,14 +16,17 @@ from sqlalchemy import select
 
 from app.api.schemas.schemas import CalendarSession
 from app.api.schemas.season import GoalRace, SeasonPhase, SeasonSummary, SeasonWeek
-from app.calendar.view_helper import calendar_session_from_view_row, get_calendar_items_from_view
+from app.calendar.week_summary_store import (
+    load_calendar_sessions,
+    load_week_summaries,
+    summarize_week_sessions,
+)
 from app.coach.schemas.intent_schemas import SeasonPlan
 from app.coach.utils.llm_client import CoachLLMClient
 from app.db.models import RacePlan, User
 from app.db.session import get_session
-from app.pairing.session_links import get_link_for_activity, get_link_for_planned
 from app.services.intelligence.store import IntentStore
-from app.utils.timezone import now_user, to_utc
+from app.utils.timezone import now_user
 
 
 def _get_week_start(date_obj: date) -> date:
@@ -106,88 +113,17 @@ def _get_phase_intent(phase_name: str) -> str:
     return intents.get(phase_name, "Continue training progression")
 
 
-def _get_key_sessions_for_week(
-    sessions: list[CalendarSession],
-    week_start: date,
-) -> list[str]:
-    """Extract key session names for a week.
-
-    Args:
-        sessions: List of calendar sessions
-        week_start: Monday date of the week
-
-    Returns:
-        List of key session names (no metrics)
-    """
-    week_end = week_start + timedelta(days=6)
-    week_start_str = week_start.strftime("%Y-%m-%d")
-    week_end_str = week_end.strftime("%Y-%m-%d")
-
-    week_sessions = [
-        s
-        for s in sessions
-        if s.date >= week_start_str and s.date <= week_end_str and s.status == "completed"
-    ]
-
-    # Extract unique session titles/types, prioritizing planned sessions
-    key_sessions = []
-    seen = set()
-    for session in week_sessions:
-        name = session.title or session.type or "Training"
-        if name and name not in seen:
-            key_sessions.append(name)
-            seen.add(name)
-            if len(key_sessions) >= 3:  # Limit to 3 key sessions
-                break
-
-    return key_sessions
-
-
-def _detect_week_flags(
-    sessions: list[CalendarSession],
-    week_start: date,
-) -> list[Literal["fatigue", "missed_sessions"]]:
-    """Detect flags for a week (fatigue, missed sessions).
-
-    Args:
-        sessions: List of calendar sessions
-        week_start: Monday date of the week
-
-    Returns:
-        List of flags
-    """
-    week_end = week_start + timedelta(days=6)
+def _sessions_in_week(sessions: list[CalendarSession], week_start: date) -> list[CalendarSession]:
+    """Filter sessions to those dated within the week starting at week_start."""
     week_start_str = week_start.strftime("%Y-%m-%d")
-    week_end_str = week_end.strftime("%Y-%m-%d")
-
-    week_sessions = [
-        s for s in sessions if s.date >= week_start_str and s.date <= week_end_str
-    ]
-
-    flags = []
-
-    # Check for missed sessions (planned but not completed)
-    planned_count = sum(1 for s in week_sessions if s.status == "planned")
-    completed_count = sum(1 for s in week_sessions if s.status == "completed")
-    if planned_count > 0 and completed_count < planned_count * 0.7:
-        flags.append("missed_sessions")
-
-    # Simple fatigue detection: high volume of hard sessions
-    hard_sessions = sum(
-        1
-        for s in week_sessions
-        if s.status == "completed" and s.intensity in {"hard", "moderate"}
-    )
-    if hard_sessions >= 4:
-        flags.append("fatigue")
-
-    return flags
+    week_end_str = (week_start + timedelta(days=6)).strftime("%Y-%m-%d")
+    return [s for s in sessions if week_start_str <= s.date <= week_end_str]
 
 
 async def _generate_week_coach_summary(
     week_index: int,
     week_start: date,
-    week_sessions: list[CalendarSession],
+    week_facts: dict,
     plan_intent: str,
     phase_name: str,
 ) -> str:
@@ -196,7 +132,7 @@ async def _generate_week_coach_summary(
     Args:
         week_index: Week number in season
         week_start: Monday date of the week
-        week_sessions: Sessions for this week
+        week_facts: Week summary values (completed_count, planned_count, completed_titles)
         plan_intent: Season plan intent/focus
         phase_name: Current phase name
 
@@ -206,17 +142,17 @@ async def _generate_week_coach_summary(
     client = CoachLLMClient()
 
     # Build context for LLM
-    completed_sessions = [s for s in week_sessions if s.status == "completed"]
-    planned_sessions = [s for s in week_sessions if s.status == "planned"]
+    completed_count = week_facts["completed_count"]
+    planned_count = week_facts["planned_count"]
 
     context = {
         "week_index": week_index,
         "week_start": week_start.isoformat(),
         "phase": phase_name,
         "plan_intent": plan_intent,
-        "completed_sessions_count": len(completed_sessions),
-        "planned_sessions_count": len(planned_sessions),
-        "key_sessions": [s.title or s.type or "Training" for s in completed_sessions[:5] if s.title or s.type],
+        "completed_sessions_count": completed_count,
+        "planned_sessions_count": planned_count,
+        "key_sessions": list(week_facts["completed_titles"]),
     }
 
     try:
@@ -224,9 +160,9 @@ async def _generate_week_coach_summary(
     except Exception as e:
         logger.error(f"Error generating week coach summary: {e}")
         # Fallback to simple summary
-        if len(completed_sessions) >= len(planned_sessions) * 0.8:
+        if completed_count >= planned_count * 0.8:
             return f"Week {week_index} aligned well with the {phase_name.lower()} phase intent. Training consistency was maintained."
-        if len(completed_sessions) < len(planned_sessions) * 0.5:
+        if completed_count < planned_count * 0.5:
             return f"Week {week_index} saw reduced volume relative to plan. Recovery and consistency should be prioritized."
         return f"Week {week_index} training progressed within the {phase_name.lower()} phase framework."
 
@@ -393,64 +329,21 @@ async def build_season_summary(
 
             plan_focus = plan.focus if plan.focus else "Training progression"
 
-        # Get calendar sessions for season period
-        season_start_utc = to_utc(
-            datetime.combine(season_start, datetime.min.time()).replace(tzinfo=timezone.utc)
-        )
-        season_end_utc = to_utc(
-            datetime.combine(season_end, datetime.max.time()).replace(tzinfo=timezone.utc)
-        )
-
-        view_rows = get_calendar_items_from_view(
-            session, user_id, season_start_utc, season_end_utc
-        )
-
-        # Build pairing maps
-        pairing_map: dict[str, str] = {}
-        activity_pairing_map: dict[str, str] = {}
-
-        for row in view_rows:
-            item_id = str(row.get("item_id", ""))
-            kind = str(row.get("kind", ""))
-
-            if kind == "planned":
-                link = get_link_for_planned(session, item_id)
-                if link:
-                    pairing_map[item_id] = link.activity_id
-            elif kind == "activity":
-                link = get_link_for_activity(session, item_id)
-                if link:
-                    activity_pairing_map[item_id] = link.planned_session_id
-
-        # Filter and convert to CalendarSession
-        enriched_rows = []
-        for row in view_rows:
-            item_id = str(row.get("item_id", ""))
-            kind = str(row.get("kind", ""))
-            payload = row.get("payload") or {}
-
-            if kind == "activity" and item_id in activity_pairing_map:
-                continue
-
-            if kind == "planned" and item_id in pairing_map:
-                payload = {**payload, "paired_activity_id": pairing_map[item_id]}
-
-            enriched_row = {**row, "payload": payload}
-            enriched_rows.append(enriched_row)
-
-        all_sessions = [
-            calendar_session_from_view_row(row) for row in enriched_rows
-        ]
-        all_sessions.sort(key=lambda s: s.date)
+        # Per-week facts: materialized rows where fresh, calendar items otherwise
+        week_starts = [_get_week_start(season_start + timedelta(weeks=n)) for n in range(total_weeks)]
+        materialized = load_week_summaries(session, user_id, week_starts)
+        missing_weeks = [w for w in week_starts if w not in materialized]
+        all_sessions: list[CalendarSession] = []
+        if missing_weeks:
+            all_sessions = load_calendar_sessions(
+                session, user_id, min(missing_weeks), max(missing_weeks) + timedelta(days=6)
+            )
 
         # Build weeks
         weeks: list[SeasonWeek] = []
         current_phase_name = "Base"
 
-        for week_num in range(1, total_weeks + 1):
-            week_start_date = season_start + timedelta(weeks=week_num - 1)
-            week_start_date = _get_week_start(week_start_date)
-
+        for week_num, week_start_date in enumerate(week_starts, start=1):
             phase_name = _infer_phase_name(week_num, total_weeks)
             if week_num == 1 or phase_name != _infer_phase_name(week_num - 1, total_weeks):
                 current_phase_name = phase_name
@@ -459,22 +352,23 @@ async def build_season_summary(
             if week_status == "current":
                 current_phase_name = phase_name
 
-            # Get sessions for this week
-            week_sessions = [
-                s
-                for s in all_sessions
-                if s.date >= week_start_date.strftime("%Y-%m-%d")
-                and s.date <= (week_start_date + timedelta(days=6)).strftime("%Y-%m-%d")
-            ]
-
-            key_sessions = _get_key_sessions_for_week(all_sessions, week_start_date)
-            flags = _detect_week_flags(all_sessions, week_start_date)
+            row = materialized.get(week_start_date)
+            if row is not None:
+                week_facts = {
+                    "completed_count": row.completed_count,
+                    "planned_count": row.planned_count,
+                    "completed_titles": row.completed_titles or [],
+                    "key_sessions": row.key_sessions or [],
+                    "flags": row.flags or [],
+                }
+            else:
+                week_facts = summarize_week_sessions(_sessions_in_week(all_sessions, week_start_date))
 
             # Generate coach summary using LLM
             coach_summary = await _generate_week_coach_summary(
                 week_index=week_num,
                 week_start=week_start_date,
-                week_sessions=week_sessions,
+                week_facts=week_facts,
                 plan_intent=plan_focus,
                 phase_name=phase_name,
             )
@@ -484,8 +378,8 @@ async def build_season_summary(
                 date_range=_format_date_range(week_start_date),
                 status=week_status,
                 coach_summary=coach_summary,
-                key_sessions=key_sessions,
-                flags=flags,
+                key_sessions=week_facts["key_sessions"],
+                flags=week_facts["flags"],
             )
             weeks.append(week)
 
@@ -4,6 +4,10 @@ PHASE A + B: Build weekly summary card from execution summaries.
 
 This module provides deterministic aggregation and templated narrative generation
 for weekly summary cards. No LLM calls - pure derived data + templates.
+
+Aggregation reads the materialized CalendarWeekSummary row when a fresh one
+exists (see app.calendar.week_summary_store) and only falls back to walking
+the week's planned sessions and activities otherwise.
 """
 
 from __future__ import annotations
@@ -15,7 +19,7 @@ from loguru import logger
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
-from app.db.models import Activity, PlannedSession
+from app.db.models import Activity, CalendarWeekSummary, PlannedSession
 from app.pairing.session_links import get_link_for_activity, get_link_for_planned
 from app.services.execution_state import derive_execution_state
 from app.services.workout_execution_service import get_execution_summary
@@ -60,6 +64,40 @@ class WeeklyExecutionSummaryContext:
         self.key_session_summaries = key_session_summaries or []
 
 
+def is_week_summary_fresh(row: CalendarWeekSummary, today: date) -> bool:
+    """Whether a materialized week summary still reflects the clock.
+
+    Missed sessions are derived from the current time, so a row computed while
+    its week was still running goes stale once days pass without writes.
+
+    Args:
+        row: Materialized week summary
+        today: Current UTC date
+
+    Returns:
+        True if the row can be served as-is
+    """
+    week_end = row.week_start + timedelta(days=6)
+    computed_on = row.computed_at.astimezone(timezone.utc).date() if row.computed_at.tzinfo else row.computed_at.date()
+    if today > week_end:
+        return computed_on > week_end
+    if today >= row.week_start:
+        return computed_on == today
+    return True
+
+
+def _context_from_week_summary(row: CalendarWeekSummary) -> WeeklyExecutionSummaryContext:
+    """Build execution summary context from a materialized week summary."""
+    return WeeklyExecutionSummaryContext(
+        total_planned_sessions=row.total_planned_sessions,
+        executed_as_planned_count=row.executed_as_planned_count,
+        missed_sessions_count=row.missed_sessions_count,
+        unplanned_sessions_count=row.unplanned_sessions_count,
+        strongest_session_id=row.strongest_session_id,
+        strongest_session_narrative=row.strongest_session_narrative,
+    )
+
+
 def build_weekly_execution_summary_context(
     session: Session,
     user_id: str,
@@ -301,8 +339,17 @@ def build_weekly_summary_card(
     # Calculate week end (Sunday)
     week_end = week_start + timedelta(days=6)
 
-    # PHASE A: Aggregate execution summaries
-    context = build_weekly_execution_summary_context(session, user_id, week_start, week_end)
+    # PHASE A: Aggregate execution summaries (materialized row when fresh)
+    materialized = session.execute(
+        select(CalendarWeekSummary).where(
+            CalendarWeekSummary.user_id == user_id,
+            CalendarWeekSummary.week_start == week_start,
+        )
+    ).scalar_one_or_none()
+    if materialized and is_week_summary_fresh(materialized, datetime.now(timezone.utc).date()):
+        context = _context_from_week_summary(materialized)
+    else:
+        context = build_weekly_execution_summary_context(session, user_id, week_start, week_end)
 
     # PHASE B: Generate templated narrative
     narrative = build_weekly_summary_narrative(context, week_start)
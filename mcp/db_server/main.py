@@ -13,6 +13,10 @@ Implements MCP-compliant tools for database operations:
 - adjust_training_load
 - recommend_next_session
 - share_report
+
+Endpoints:
+- POST /mcp/tools/call: one tool call
+- POST /mcp/tools/batch: several independent tool calls, run concurrently
 """
 
 import asyncio
@@ -159,19 +163,97 @@ logger.add(
 )
 
 
+# Tool dispatch table
+TOOL_MAP: dict[str, Any] = {
+    "load_context": load_context_tool,
+    "save_context": save_context_tool,
+    "get_recent_activities": get_recent_activities_tool,
+    "get_yesterday_activities": get_yesterday_activities_tool,
+    "save_planned_sessions": save_planned_sessions_tool,
+    "add_workout": add_workout_tool,
+    "plan_week": plan_week_tool,
+    "plan_season": plan_season_tool,
+    "run_analysis": run_analysis_tool,
+    "explain_training_state": explain_training_state_tool,
+    "adjust_training_load": adjust_training_load_tool,
+    "recommend_next_session": recommend_next_session_tool,
+    "share_report": share_report_tool,
+    "get_planned_sessions": get_planned_sessions_tool,
+    "emit_progress_event": emit_progress_event_tool,
+}
+
+# Upper bound on calls accepted in one /mcp/tools/batch request
+MAX_BATCH_CALLS = 16
+
+
+def _error_payload(error_code: str, error_message: str) -> dict[str, Any]:
+    return {"error": {"code": error_code, "message": error_message}}
+
+
 def create_error_response(error_code: str, error_message: str) -> JSONResponse:
     """Create MCP-compliant error response."""
     return JSONResponse(
         status_code=200,  # MCP uses 200 with error payload
-        content={
-            "error": {
-                "code": error_code,
-                "message": error_message,
-            },
-        },
+        content=_error_payload(error_code, error_message),
     )
 
 
+async def _execute_tool(tool_name: Any, arguments: Any) -> dict[str, Any]:
+    """Run one tool call and build its MCP payload.
+
+    Args:
+        tool_name: Requested tool name
+        arguments: Tool arguments
+
+    Returns:
+        {"result": ...} on success, {"error": {"code", "message"}} on failure
+    """
+    if not tool_name:
+        return _error_payload("INVALID_REQUEST", "Missing 'tool' field")
+
+    if tool_name not in TOOL_MAP:
+        return _error_payload(
+            "TOOL_NOT_FOUND",
+            f"Tool '{tool_name}' not found. Available tools: {list(TOOL_MAP.keys())}",
+        )
+
+    tool_func = TOOL_MAP[tool_name]
+
+    # Execute tool (tools are sync, but we're in async context)
+    try:
+        result = await asyncio.to_thread(tool_func, arguments)
+    except MCPError as e:
+        logger.debug(
+            "MCP tool raised MCPError",
+            tool=tool_name,
+            error_code=e.code,
+            error_message=e.message,
+        )
+        return _error_payload(e.code, e.message)
+    except Exception as e:
+        # Extract original error from exception chain for better debugging
+        original_error = e.__cause__ if e.__cause__ else e
+        original_error_type = type(original_error).__name__
+        original_error_message = str(original_error)
+        logger.debug(
+            "MCP tool raised unexpected exception",
+            tool=tool_name,
+            error_type=type(e).__name__,
+            error_message=str(e),
+            has_cause=bool(e.__cause__),
+            original_error_type=original_error_type if e.__cause__ else None,
+            original_error_message=original_error_message if e.__cause__ else None,
+        )
+        logger.error(f"Tool execution error: {e}", exc_info=True)
+        # Include original error in message for debugging
+        if e.__cause__:
+            error_msg = f"Tool execution failed: {original_error_type}: {original_error_message} (wrapped: {type(e).__name__}: {e!s})"
+        else:
+            error_msg = f"Tool execution failed: {type(e).__name__}: {e!s}"
+        return _error_payload("INTERNAL_ERROR", error_msg)
+    return {"result": result}
+
+
 @app.post("/mcp/tools/call")
 async def call_tool(request: Request) -> JSONResponse:
     """Handle MCP tool call requests.
@@ -186,81 +268,59 @@ async def call_tool(request: Request) -> JSONResponse:
     """
     try:
         body = await request.json()
-        tool_name = body.get("tool")
-        arguments = body.get("arguments", {})
-
-        if not tool_name:
-            return create_error_response("INVALID_REQUEST", "Missing 'tool' field")
-
-        # Route to appropriate tool
-        tool_map = {
-            "load_context": load_context_tool,
-            "save_context": save_context_tool,
-            "get_recent_activities": get_recent_activities_tool,
-            "get_yesterday_activities": get_yesterday_activities_tool,
-            "save_planned_sessions": save_planned_sessions_tool,
-            "add_workout": add_workout_tool,
-            "plan_week": plan_week_tool,
-            "plan_season": plan_season_tool,
-            "run_analysis": run_analysis_tool,
-            "explain_training_state": explain_training_state_tool,
-            "adjust_training_load": adjust_training_load_tool,
-            "recommend_next_session": recommend_next_session_tool,
-            "share_report": share_report_tool,
-            "get_planned_sessions": get_planned_sessions_tool,
-            "emit_progress_event": emit_progress_event_tool,
-        }
-
-        if tool_name not in tool_map:
-            return create_error_response(
-                "TOOL_NOT_FOUND",
-                f"Tool '{tool_name}' not found. Available tools: {list(tool_map.keys())}",
-            )
+        payload = await _execute_tool(body.get("tool"), body.get("arguments", {}))
+        return JSONResponse(status_code=200, content=payload)
+    except json.JSONDecodeError:
+        return create_error_response("INVALID_REQUEST", "Invalid JSON in request body")
+    except Exception as e:
+        logger.error(f"Request handling error: {e}", exc_info=True)
+        return create_error_response("INTERNAL_ERROR", f"Request handling failed: {e!s}")
 
-        tool_func = tool_map[tool_name]
 
-        # Execute tool (tools are sync, but we're in async context)
-        try:
-            result = await asyncio.to_thread(tool_func, arguments)
-            return JSONResponse(
-                status_code=200,
-                content={"result": result},
-            )
-        except MCPError as e:
-            logger.debug(
-                "MCP tool raised MCPError",
-                tool=tool_name,
-                error_code=e.code,
-                error_message=e.message,
-            )
-            return create_error_response(e.code, e.message)
-        except Exception as e:
-            # Extract original error from exception chain for better debugging
-            original_error = e.__cause__ if e.__cause__ else e
-            original_error_type = type(original_error).__name__
-            original_error_message = str(original_error)
-            logger.debug(
-                "MCP tool raised unexpected exception",
-                tool=tool_name,
-                error_type=type(e).__name__,
-                error_message=str(e),
-                has_cause=bool(e.__cause__),
-                original_error_type=original_error_type if e.__cause__ else None,
-                original_error_message=original_error_message if e.__cause__ else None,
+@app.post("/mcp/tools/batch")
+async def call_tools_batch(request: Request) -> JSONResponse:
+    """Handle several independent MCP tool calls in one request.
+
+    Calls run concurrently; one failing call does not affect the others.
+
+    Expected request body:
+    {
+        "calls": [
+            {"tool": "tool_name", "arguments": {...}},
+            ...
+        ]
+    }
+
+    Returns {"results": [...]} with one MCP payload ({"result": ...} or
+    {"error": ...}) per call, in request order. Request-level problems
+    (bad JSON, missing/oversized "calls") return a single error payload.
+    """
+    try:
+        body = await request.json()
+        calls = body.get("calls")
+        if not isinstance(calls, list) or not calls:
+            return create_error_response("INVALID_REQUEST", "Missing or empty 'calls' list")
+        if len(calls) > MAX_BATCH_CALLS:
+            return create_error_response(
+                "INVALID_REQUEST",
+                f"Too many calls in batch: {len(calls)} (max {MAX_BATCH_CALLS})",
             )
-            logger.error(f"Tool execution error: {e}", exc_info=True)
-            # Include original error in message for debugging
-            if e.__cause__:
-                error_msg = f"Tool execution failed: {original_error_type}: {original_error_message} (wrapped: {type(e).__name__}: {e!s})"
-            else:
-                error_msg = f"Tool execution failed: {type(e).__name__}: {e!s}"
-            return create_error_response("INTERNAL_ERROR", error_msg)
 
+        results = await asyncio.gather(
+            *(
+                _execute_tool(call.get("tool"), call.get("arguments", {}))
+                if isinstance(call, dict)
+                else _execute_tool(None, None)  # -> INVALID_REQUEST payload
+                for call in calls
+            )
+        )
+        logger.debug(f"[MCP] Batch of {len(calls)} calls completed")
+        return JSONResponse(status_code=200, content={"results": list(results)})
     except json.JSONDecodeError:
         return create_error_response("INVALID_REQUEST", "Invalid JSON in request body")
     except Exception as e:
-        logger.error(f"Request handling error: {e}", exc_info=True)
-        return create_error_response("INTERNAL_ERROR", f"Request handling failed: {e!s}")
+        logger.error(f"Batch request handling error: {e}", exc_info=True)
+        return create_error_response("INTERNAL_ERROR", f"Batch request handling failed: {e!s}")
 
 
 @app.get("/health")
@@ -1,4 +1,8 @@
-"""Prompt loading tools for MCP FS server."""
+"""Prompt loading tools for MCP FS server.
+
+Prompt contents are served from the in-process prompt registry (loaded once,
+reloaded on file mtime change) instead of being re-read on every request.
+"""
 
 import sys
 from pathlib import Path
@@ -6,6 +10,7 @@ from typing import NoReturn
 
 from loguru import logger
 
+from app.coach.prompts.registry import get_prompt
 from mcp.fs_server.errors import MCPError
 
 
@@ -37,7 +42,7 @@ def load_orchestrator_prompt_tool(arguments: dict) -> dict:
         if not ORCHESTRATOR_PROMPT_PATH.exists():
             _raise_file_not_found(str(ORCHESTRATOR_PROMPT_PATH))
 
-        content = ORCHESTRATOR_PROMPT_PATH.read_text(encoding="utf-8")
+        content = get_prompt(ORCHESTRATOR_PROMPT_PATH.name)
 
         logger.info(f"Loaded orchestrator prompt ({len(content)} bytes)")
     except FileNotFoundError:
@@ -86,7 +91,7 @@ def load_prompt_tool(arguments: dict) -> dict:
         if not prompt_path.exists():
             _raise_file_not_found(filename)
 
-        content = prompt_path.read_text(encoding="utf-8")
+        content = get_prompt(filename)
 
         logger.info(f"Loaded prompt file {filename} ({len(content)} bytes)")
     except MCPError:
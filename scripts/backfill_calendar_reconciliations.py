@@ -0,0 +1,85 @@
+"""Backfill script to persist calendar reconciliation results for existing users.
+
+Calendar reads look up stored CalendarReconciliation rows instead of running
+reconciliation on every request. Rows are maintained from write paths, so data
+written before that change has none. This script reconciles each user's full
+planned-session range once and stores the results.
+
+Usage:
+    From project root:
+    python scripts/backfill_calendar_reconciliations.py [--user-id USER_ID]
+
+    Or as a module:
+    python -m scripts.backfill_calendar_reconciliations [--user-id USER_ID]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+
+from loguru import logger
+from sqlalchemy import func, select
+
+from app.calendar.reconciliation_store import refresh_reconciliation
+from app.db.models import PlannedSession
+from app.db.session import SessionLocal
+
+
+def backfill_calendar_reconciliations(*, user_id: str | None = None) -> dict[str, int]:
+    """Reconcile and persist results for every user with planned sessions.
+
+    Args:
+        user_id: Optional single user to backfill
+
+    Returns:
+        Dictionary with counts: {'users', 'sessions', 'errors'}
+    """
+    logger.info(f"Starting calendar reconciliation backfill (user_id={user_id})")
+
+    stats: dict[str, int] = {"users": 0, "sessions": 0, "errors": 0}
+
+    db = SessionLocal()
+    try:
+        query = select(
+            PlannedSession.user_id,
+            func.min(PlannedSession.starts_at),
+            func.max(PlannedSession.starts_at),
+        ).group_by(PlannedSession.user_id)
+        if user_id:
+            query = query.where(PlannedSession.user_id == user_id)
+        ranges = db.execute(query).all()
+    finally:
+        db.close()
+
+    logger.info(f"Found {len(ranges)} users with planned sessions")
+
+    for row_user_id, first_start, last_start in ranges:
+        try:
+            results = refresh_reconciliation(row_user_id, first_start.date(), last_start.date())
+            stats["users"] += 1
+            stats["sessions"] += len(results)
+        except Exception as e:
+            logger.error(f"Failed to backfill reconciliation for user_id={row_user_id}: {e}")
+            stats["errors"] += 1
+
+    logger.info("Backfill completed", **stats)
+    return stats
+
+
+def main() -> int:
+    """Main entry point for the backfill script."""
+    parser = argparse.ArgumentParser(description="Backfill stored calendar reconciliation results")
+    parser.add_argument("--user-id", default=None, help="Only backfill this user")
+    args = parser.parse_args()
+
+    try:
+        stats = backfill_calendar_reconciliations(user_id=args.user_id)
+    except Exception:
+        logger.exception("Backfill failed")
+        return 1
+    return 1 if stats["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
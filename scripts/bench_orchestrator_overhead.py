@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""Microbenchmark: per-turn orchestrator overhead excluding model latency.
+
+Runs run_conversation() against an instant in-process model with MCP context
+loading and slot persistence stubbed out, so the measured time is what the
+orchestrator itself costs per chat turn (agent setup, prompt/profile
+assembly, token guard, logging, post-processing).
+
+Usage:
+    python scripts/bench_orchestrator_overhead.py [--turns 200] [--history 20] [--debug]
+
+--debug enables a DEBUG log sink (to /dev/null) to show the cost of the
+debug-level prompt logging that is skipped when the level is disabled.
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+os.environ.setdefault("OPENAI_API_KEY", "sk-bench")
+
+from loguru import logger
+from pydantic_ai.messages import ModelResponse, ToolCallPart
+from pydantic_ai.models.function import AgentInfo, FunctionModel
+
+from app.coach.agents import orchestrator_agent
+from app.coach.agents.orchestrator_deps import CoachDeps, StructuredProfileData
+
+DECISION_ARGS = {
+    "intent": "question",
+    "horizon": None,
+    "action": "NO_ACTION",
+    "response_type": "recommendation",
+    "confidence": 0.9,
+    "message": "Keep today's run easy and conversational.",
+}
+
+
+def _instant_model(_messages, info: AgentInfo) -> ModelResponse:
+    """Model stand-in that answers immediately with a fixed decision."""
+    return ModelResponse(parts=[ToolCallPart(tool_name=info.output_tools[0].name, args=DECISION_ARGS)])
+
+
+def _history(length: int) -> list[dict[str, str]]:
+    return [
+        {"role": "user" if i % 2 == 0 else "assistant", "content": f"Message {i}: " + "training detail " * 40}
+        for i in range(length)
+    ]
+
+
+def _deps() -> CoachDeps:
+    return CoachDeps(
+        athlete_id=1,
+        user_id="bench-user",
+        structured_profile_data=StructuredProfileData(
+            structured_profile={
+                "training_context": {"primary_sport": "run", "experience_level": "intermediate"},
+                "goals": {"goal_type": "race"},
+                "preferences": {"recovery_preference": "active"},
+            },
+            constraints={"availability_hours_per_week": 8, "injury_status": "none"},
+            narrative_bio="Consistent runner building toward a spring marathon. " * 5,
+        ),
+    )
+
+
+async def _run(turns: int, history_length: int) -> list[float]:
+    history = _history(history_length)
+
+    def _call_tool(name: str, _args: dict):
+        if name == "load_context":
+            return {"messages": history}
+        return {}
+
+    def _load_prompt(_name: str) -> str:
+        return "You are the Virtus coaching orchestrator. " * 200
+
+    def _slots(**_kwargs):
+        return None, [], {}
+
+    durations: list[float] = []
+    with (
+        patch.object(orchestrator_agent, "ORCHESTRATOR_AGENT_MODEL", FunctionModel(_instant_model)),
+        patch.object(orchestrator_agent, "call_tool", AsyncMock(side_effect=_call_tool)),
+        patch.object(orchestrator_agent, "load_prompt", AsyncMock(side_effect=_load_prompt)),
+        patch.object(orchestrator_agent, "_compute_missing_slots_for_decision", AsyncMock(side_effect=_slots)),
+    ):
+        orchestrator_agent.ORCHESTRATOR_INSTRUCTIONS = ""
+        orchestrator_agent.ORCHESTRATOR_AGENT = None
+        deps = _deps()
+        # Warm-up turn: loads instructions and creates the agent
+        warmup = await orchestrator_agent.run_conversation("How should I run today?", deps, conversation_id="bench")
+        if warmup.message != DECISION_ARGS["message"]:
+            raise RuntimeError(f"Benchmark turn did not take the normal decision path: {warmup.message!r}")
+        for _ in range(turns):
+            start = time.perf_counter()
+            await orchestrator_agent.run_conversation("How should I run today?", deps, conversation_id="bench")
+            durations.append(time.perf_counter() - start)
+    return durations
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Per-turn orchestrator overhead (no model latency)")
+    parser.add_argument("--turns", type=int, default=200, help="Measured turns")
+    parser.add_argument("--history", type=int, default=20, help="Messages of loaded history per turn")
+    parser.add_argument("--debug", action="store_true", help="Enable a DEBUG log sink")
+    args = parser.parse_args()
+
+    logger.remove()
+    logger.add(os.devnull, level="DEBUG" if args.debug else "INFO")
+
+    durations = asyncio.run(_run(args.turns, args.history))
+    ms = sorted(d * 1000 for d in durations)
+    p95 = ms[min(len(ms) - 1, int(len(ms) * 0.95))]
+    print(
+        f"orchestrator overhead over {len(ms)} turns (history={args.history}, debug={args.debug}): "
+        f"mean={statistics.mean(ms):.2f}ms p50={statistics.median(ms):.2f}ms p95={p95:.2f}ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""Load test the coach, the planner and the nightly decision job against the LLM stand-in.
+
+Start the stand-in first (scripts/llm_stand_in.py). Scenarios:
+
+- chat: concurrent users POST /coach/chat to a running API. Start the API with
+  OPENAI_BASE_URL pointing at the stand-in; --token is a bearer token of a
+  dev user.
+- plan: runs plan creation (plan_race_simple) in-process, --concurrency plans
+  at a time. It saves plans for --user-id, so use a dev database.
+- nightly: runs the nightly daily-decision batch in-process once.
+
+In-process scenarios set OPENAI_BASE_URL to --stand-in themselves.
+
+Reports throughput and latency percentiles, the stand-in's request counters
+and the LLM telemetry per call site (from the API for chat). --json writes
+the report.
+
+Usage:
+    python scripts/llm_load_test.py chat --api http://127.0.0.1:8000 --token TOKEN [--users 20] [--turns 10]
+    python scripts/llm_load_test.py plan --user-id USER --athlete-id 1 [--plans 5] [--concurrency 5]
+    python scripts/llm_load_test.py nightly [--concurrency 10]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+import uuid
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+CHAT_MESSAGES = [
+    "How should I run today?",
+    "I felt tired on my long run, should I change anything this week?",
+    "What is the goal of tomorrow's workout?",
+    "Can you explain my training load?",
+]
+
+
+def _percentile(sorted_values: list[float], q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * q / 100))]
+
+
+def _report(name: str, durations: list[float], errors: int, elapsed: float) -> dict[str, Any]:
+    ms = sorted(duration * 1000 for duration in durations)
+    return {
+        "scenario": name,
+        "completed": len(ms),
+        "errors": errors,
+        "elapsed_seconds": round(elapsed, 2),
+        "throughput_per_second": round(len(ms) / elapsed, 2) if elapsed else 0.0,
+        "latency_ms": {
+            "p50": round(_percentile(ms, 50), 1),
+            "p90": round(_percentile(ms, 90), 1),
+            "p99": round(_percentile(ms, 99), 1),
+            "max": round(ms[-1], 1) if ms else 0.0,
+        },
+    }
+
+
+async def _run_chat(args: argparse.Namespace) -> dict[str, Any]:
+    durations: list[float] = []
+    errors = 0
+
+    async def _user(client: httpx.AsyncClient) -> None:
+        nonlocal errors
+        headers = {"Authorization": f"Bearer {args.token}", "X-Conversation-Id": f"c_{uuid.uuid4()}"}
+        for turn in range(args.turns):
+            started = time.perf_counter()
+            try:
+                response = await client.post(
+                    "/coach/chat", json={"message": CHAT_MESSAGES[turn % len(CHAT_MESSAGES)]}, headers=headers
+                )
+                response.raise_for_status()
+            except httpx.HTTPError:
+                errors += 1
+                continue
+            durations.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    async with httpx.AsyncClient(base_url=args.api, timeout=300.0) as client:
+        await asyncio.gather(*(_user(client) for _ in range(args.users)))
+    return _report("chat", durations, errors, time.perf_counter() - started)
+
+
+async def _run_plan(args: argparse.Namespace) -> dict[str, Any]:
+    from app.planner.plan_race_simple import plan_race_simple  # noqa: PLC0415
+
+    semaphore = asyncio.Semaphore(args.concurrency)
+    race_date = datetime.now(UTC) + timedelta(weeks=args.weeks)
+    durations: list[float] = []
+    errors = 0
+
+    async def _plan() -> None:
+        nonlocal errors
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                await plan_race_simple(race_date, args.distance, args.user_id, args.athlete_id)
+            except Exception as e:
+                errors += 1
+                print(f"plan failed: {type(e).__name__}: {e}")
+                return
+            durations.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(_plan() for _ in range(args.plans)))
+    return _report("plan", durations, errors, time.perf_counter() - started)
+
+
+async def _run_nightly(args: argparse.Namespace) -> dict[str, Any]:
+    from app.services.intelligence.scheduler import generate_daily_decisions_async  # noqa: PLC0415
+
+    user_timings: list[float] = []
+    started = time.perf_counter()
+    stats = await generate_daily_decisions_async(
+        concurrency=args.concurrency, llm_per_minute=args.llm_per_minute, user_timings=user_timings
+    )
+    elapsed = time.perf_counter() - started
+    report = _report("nightly", user_timings, stats["errors"], elapsed)
+    report["batch"] = stats
+    report["throughput_per_second"] = round(stats["success"] / elapsed, 2) if elapsed else 0.0
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Load test against the LLM stand-in")
+    parser.add_argument("scenario", choices=["chat", "plan", "nightly"])
+    parser.add_argument("--stand-in", default="http://127.0.0.1:8900/v1", help="Stand-in base URL")
+    parser.add_argument("--json", type=Path, default=None, help="Write the report as JSON")
+    parser.add_argument("--api", default="http://127.0.0.1:8000", help="API base URL (chat)")
+    parser.add_argument("--token", default="", help="Bearer token (chat)")
+    parser.add_argument("--users", type=int, default=10, help="Concurrent chat users")
+    parser.add_argument("--turns", type=int, default=5, help="Chat turns per user")
+    parser.add_argument("--user-id", default="", help="User to plan for (plan)")
+    parser.add_argument("--athlete-id", type=int, default=0, help="Athlete to plan for (plan)")
+    parser.add_argument("--distance", default="Marathon", help="Race distance (plan)")
+    parser.add_argument("--weeks", type=int, default=16, help="Weeks until the race (plan)")
+    parser.add_argument("--plans", type=int, default=5, help="Plans to create (plan)")
+    parser.add_argument("--concurrency", type=int, default=5, help="Plans or users processed at once (plan, nightly)")
+    parser.add_argument(
+        "--llm-per-minute", type=int, default=None, help="Nightly LLM start rate (default: settings; 0: unlimited)"
+    )
+    args = parser.parse_args()
+
+    if args.scenario == "plan" and not (args.user_id and args.athlete_id):
+        parser.error("plan needs --user-id and --athlete-id")
+
+    # Before any app import, so every OpenAI client of this process uses the stand-in
+    os.environ["OPENAI_BASE_URL"] = args.stand_in
+    os.environ.setdefault("OPENAI_API_KEY", "sk-stand-in")
+
+    runner = {"chat": _run_chat, "plan": _run_plan, "nightly": _run_nightly}[args.scenario]
+    report = asyncio.run(runner(args))
+
+    stand_in_root = args.stand_in.rstrip("/").removesuffix("/v1")
+    try:
+        report["stand_in"] = httpx.get(f"{stand_in_root}/stand-in/stats", timeout=5.0).json()
+    except httpx.HTTPError as e:
+        report["stand_in"] = {"error": str(e)}
+    if args.scenario == "chat":
+        try:
+            response = httpx.get(
+                f"{args.api}/internal/ai/llm-telemetry", headers={"Authorization": f"Bearer {args.token}"}, timeout=5.0
+            )
+            report["llm_telemetry"] = response.json()["call_sites"]
+        except (httpx.HTTPError, KeyError, ValueError):
+            report["llm_telemetry"] = []
+    else:
+        from app.services.llm.telemetry import get_llm_telemetry  # noqa: PLC0415
+
+        report["llm_telemetry"] = get_llm_telemetry()["call_sites"]
+
+    latency = report["latency_ms"]
+    print(
+        f"{report['scenario']}: {report['completed']} completed, {report['errors']} errors in {report['elapsed_seconds']}s "
+        f"({report['throughput_per_second']}/s) p50={latency['p50']}ms p90={latency['p90']}ms "
+        f"p99={latency['p99']}ms max={latency['max']}ms"
+    )
+    print(f"stand-in: {report['stand_in']}")
+    for site in report.get("llm_telemetry", []):
+        print(
+            f"  {site['call_site']} ({site['model']}): {site['requests']} requests, {site['retries']} retries, "
+            f"p50={site['latency_ms']['p50']}ms p99={site['latency_ms']['p99']}ms"
+        )
+    if args.json:
+        args.json.write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
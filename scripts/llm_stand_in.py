@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""Run the local OpenAI-compatible LLM stand-in (app.services.llm.stand_in).
+
+Usage:
+    python scripts/llm_stand_in.py [--port 8900] [--recordings data/llm_recordings]
+        [--record-upstream https://api.openai.com/v1] [--median-ms 800] [--p95-ms 2500]
+        [--latency DailyDecision=1500:4000 ...] [--error-rate 0.02] [--throttle-share 0.5] [--seed 1]
+
+Then start the API, workers or scripts with OPENAI_BASE_URL=http://127.0.0.1:8900/v1.
+
+--record-upstream forwards requests without a recording to the real API
+(OPENAI_API_KEY) and saves the responses under --recordings, so a recorded
+session can be replayed offline later.
+"""
+
+import argparse
+import os
+import sys
+from pathlib import Path
+
+import uvicorn
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.services.llm.stand_in import LatencyProfile, StandInConfig, create_stand_in_app
+
+
+def _latency_override(value: str) -> tuple[str, LatencyProfile]:
+    """Parse OUTPUT=MEDIAN_MS:P95_MS."""
+    name, _, profile = value.partition("=")
+    median_ms, _, p95_ms = profile.partition(":")
+    return name, LatencyProfile(median_ms=float(median_ms), p95_ms=float(p95_ms or median_ms))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Local OpenAI-compatible LLM stand-in")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8900)
+    parser.add_argument("--recordings", type=Path, default=None, help="Directory of recorded responses")
+    parser.add_argument("--record-upstream", default=None, help="Upstream base URL to record unrecorded requests from")
+    parser.add_argument("--median-ms", type=float, default=800.0, help="Median response latency")
+    parser.add_argument("--p95-ms", type=float, default=2500.0, help="p95 response latency")
+    parser.add_argument(
+        "--latency",
+        type=_latency_override,
+        action="append",
+        default=[],
+        help="Latency per output type: OUTPUT=MEDIAN_MS:P95_MS (e.g. DailyDecision=1500:4000, text, embeddings)",
+    )
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of requests that fail")
+    parser.add_argument("--throttle-share", type=float, default=0.5, help="Share of failures returned as 429")
+    parser.add_argument("--seed", type=int, default=None, help="Random seed")
+    args = parser.parse_args()
+
+    config = StandInConfig(
+        recordings_dir=args.recordings,
+        record_upstream=args.record_upstream,
+        upstream_api_key=os.getenv("OPENAI_API_KEY", ""),
+        latency=LatencyProfile(median_ms=args.median_ms, p95_ms=args.p95_ms),
+        latency_by_output=dict(args.latency),
+        error_rate=args.error_rate,
+        throttle_share=args.throttle_share,
+        seed=args.seed,
+    )
+    print(f"LLM stand-in on http://{args.host}:{args.port}/v1 (set OPENAI_BASE_URL to this)")
+    uvicorn.run(create_stand_in_app(config), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+"""Tests for the shared day/time index used by reconciliation and conflicts."""
+
+from datetime import date, datetime, timedelta, timezone
+
+from app.calendar.conflicts import ConflictType, detect_execution_conflicts_batch, index_sessions_by_day
+from app.calendar.day_index import DayIndex
+from app.calendar.reconciliation import (
+    CompletedActivityInput,
+    PlannedSessionInput,
+    ReconciliationConfig,
+    SessionStatus,
+    _find_candidate_activities,
+    reconcile_sessions,
+)
+from app.db.models import PlannedSession
+
+
+def _activity(activity_id: str, start: datetime) -> CompletedActivityInput:
+    return CompletedActivityInput(
+        activity_id=activity_id,
+        start_time=start,
+        type="Run",
+        duration_seconds=1800,
+        distance_meters=None,
+        source="strava",
+    )
+
+
+class TestDayIndex:
+    def test_between_is_inclusive_and_time_ordered(self):
+        base = datetime(2024, 5, 1, tzinfo=timezone.utc)
+        items = [base + timedelta(hours=h) for h in (30, 0, 12, 24, 6)]
+        index = DayIndex(items, start=lambda d: d)
+
+        assert index.between(base + timedelta(hours=6), base + timedelta(hours=24)) == [
+            base + timedelta(hours=6),
+            base + timedelta(hours=12),
+            base + timedelta(hours=24),
+        ]
+        assert index.between(base - timedelta(days=2), base - timedelta(days=1)) == []
+
+    def test_naive_datetimes_are_treated_as_utc(self):
+        naive = datetime(2024, 5, 1, 9, 0, tzinfo=timezone.utc).replace(tzinfo=None)
+        index = DayIndex([naive], start=lambda d: d)
+
+        assert len(index.between(datetime(2024, 5, 1, tzinfo=timezone.utc), datetime(2024, 5, 2, tzinfo=timezone.utc))) == 1
+        assert index.has_day(date(2024, 5, 1))
+
+    def test_add_keeps_order_and_day_buckets(self):
+        base = datetime(2024, 5, 1, 8, 0, tzinfo=timezone.utc)
+        index = DayIndex([base, base + timedelta(days=2)], start=lambda d: d)
+
+        index.add(base + timedelta(days=1))
+
+        assert list(index) == [base, base + timedelta(days=1), base + timedelta(days=2)]
+        assert index.days() == {date(2024, 5, 1), date(2024, 5, 2), date(2024, 5, 3)}
+        assert len(index) == 3
+
+    def test_custom_day_key(self):
+        local = timezone(timedelta(hours=-8))
+        late_evening = datetime(2024, 5, 1, 22, 0, tzinfo=local)  # 2024-05-02 in UTC
+        index = DayIndex([late_evening], start=lambda d: d, day=lambda d: d.date())
+
+        assert index.on_day(date(2024, 5, 1)) == [late_evening]
+        assert index.on_day(date(2024, 5, 2)) == []
+
+
+class TestReconciliationUsesIndex:
+    def test_candidate_window_lookup_matches_tolerance(self):
+        planned = PlannedSessionInput(
+            session_id="s1",
+            date=date(2024, 5, 10),
+            type="Run",
+            duration_minutes=30,
+            distance_km=None,
+            intensity=None,
+            status=None,
+        )
+        activities = [
+            _activity("too-early", datetime(2024, 5, 9, 11, 0, tzinfo=timezone.utc)),
+            _activity("early-edge", datetime(2024, 5, 9, 12, 0, tzinfo=timezone.utc)),
+            _activity("same-day", datetime(2024, 5, 10, 7, 0, tzinfo=timezone.utc)),
+            _activity("late-edge", datetime(2024, 5, 11, 12, 0, tzinfo=timezone.utc)),
+            _activity("too-late", datetime(2024, 5, 11, 13, 0, tzinfo=timezone.utc)),
+        ]
+
+        candidates = _find_candidate_activities(planned, activities, {"same-day"}, ReconciliationConfig())
+
+        assert [c.activity_id for c in candidates] == ["early-edge", "late-edge"]
+
+    def test_season_length_reconciliation_matches_same_day_activities(self):
+        start = date(2024, 1, 1)
+        planned = [
+            PlannedSessionInput(
+                session_id=f"s{i}",
+                date=start + timedelta(days=i),
+                type="Run",
+                duration_minutes=30,
+                distance_km=None,
+                intensity=None,
+                status=None,
+            )
+            for i in range(0, 180, 3)
+        ]
+        activities = [
+            _activity(f"a{i}", datetime.combine(start + timedelta(days=i), datetime.min.time()).replace(
+                hour=7, tzinfo=timezone.utc
+            ))
+            for i in range(0, 180, 6)
+        ]
+
+        results = reconcile_sessions(planned, activities)
+
+        completed = [r for r in results if r.status == SessionStatus.COMPLETED]
+        assert len(completed) == 30
+        assert all(r.matched_activity_id == f"a{r.session_id[1:]}" for r in completed)
+
+
+class TestExecutionConflictsUseIndex:
+    def test_batch_detects_same_day_overlap_and_duplicates(self):
+        existing = [
+            PlannedSession(
+                id="existing-1",
+                user_id="u1",
+                starts_at=datetime(2024, 6, 3, 7, 0, tzinfo=timezone.utc),
+                sport="run",
+                title="Easy",
+            ),
+            PlannedSession(
+                id="existing-2",
+                user_id="u1",
+                starts_at=datetime(2024, 6, 5, 7, 0, tzinfo=timezone.utc),
+                sport="run",
+                title="Tempo",
+            ),
+        ]
+        candidates = [
+            {"id": "new-1", "date": date(2024, 6, 3), "duration_minutes": 45, "time": "07:30"},
+            {"id": "new-2", "date": date(2024, 6, 4), "duration_minutes": 45, "time": "07:30"},
+            {"id": "existing-2", "date": date(2024, 6, 6), "duration_minutes": 45, "time": "07:30"},
+        ]
+
+        conflicts = detect_execution_conflicts_batch(existing, candidates)
+
+        assert {(c.existing_session_id, c.conflict_type) for c in conflicts} == {
+            ("existing-1", ConflictType.TIME_OVERLAP),
+            ("existing-2", ConflictType.DUPLICATE_SESSION),
+        }
+
+    def test_index_sessions_by_day_buckets_on_stored_day(self):
+        session = PlannedSession(
+            id="s1", user_id="u1", starts_at=datetime(2024, 6, 3, 7, 0, tzinfo=timezone.utc), sport="run", title="Easy"
+        )
+
+        index = index_sessions_by_day([session])
+
+        assert index.on_day(date(2024, 6, 3)) == [session]
@@ -0,0 +1,125 @@
+"""Tests for bulk execution-state prefetch used by calendar list views.
+
+Tests cover:
+- Links, planned sessions, paired activities and summaries load in bulk
+- Query count stays constant as the number of planned sessions grows
+- Converters read from the context instead of querying per row
+"""
+
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import event
+
+from app.calendar.api import _load_planned_session_with_activity, _planned_session_to_calendar
+from app.calendar.execution_context import load_execution_context
+from app.db.models import Activity, PlannedSession, SessionLink, WorkoutExecutionSummary
+
+USER_ID = "user-ctx"
+
+
+@contextmanager
+def _count_queries(session):
+    statements: list[str] = []
+
+    def _before(_conn, _cursor, statement, _params, _context, _executemany):
+        statements.append(statement)
+
+    engine = session.get_bind()
+    event.listen(engine, "before_cursor_execute", _before)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", _before)
+
+
+def _seed(session, count: int) -> list[str]:
+    """Create `count` planned sessions; every other one is paired with a summarized activity."""
+    base = datetime(2024, 4, 1, 7, 0, tzinfo=timezone.utc)
+    planned_ids = []
+    for i in range(count):
+        planned = PlannedSession(
+            id=f"ps-{count}-{i}",
+            user_id=USER_ID,
+            starts_at=base + timedelta(days=i),
+            sport="run",
+            title="Easy run",
+            duration_seconds=1800,
+            status="planned",
+        )
+        session.add(planned)
+        planned_ids.append(planned.id)
+        if i % 2 == 0:
+            activity = Activity(
+                id=f"act-{count}-{i}",
+                user_id=USER_ID,
+                sport="run",
+                starts_at=base + timedelta(days=i, minutes=5),
+                duration_seconds=1750,
+            )
+            session.add(activity)
+            session.flush()
+            session.add(
+                SessionLink(
+                    user_id=USER_ID,
+                    planned_session_id=planned.id,
+                    activity_id=activity.id,
+                    status="confirmed",
+                    match_reason={"same_day": True},
+                )
+            )
+            session.add(
+                WorkoutExecutionSummary(
+                    activity_id=activity.id,
+                    planned_session_id=planned.id,
+                    user_id=USER_ID,
+                    narrative="On target",
+                )
+            )
+    session.commit()
+    return planned_ids
+
+
+def test_context_resolves_pairs_and_summaries(db_session):
+    planned_ids = _seed(db_session, 4)
+
+    context = load_execution_context(db_session, planned_ids, ["act-4-0", "act-4-2"])
+
+    assert set(context.planned_sessions) == set(planned_ids)
+    assert context.paired_activity_id("ps-4-0") == "act-4-0"
+    assert context.paired_activity_id("ps-4-1") is None
+    assert context.paired_planned_id("act-4-2") == "ps-4-2"
+    assert context.linked_activity("ps-4-2").id == "act-4-2"
+    assert context.summary_for_activity("act-4-0").narrative == "On target"
+
+
+def test_query_count_is_constant_in_plan_length(db_session):
+    small = _seed(db_session, 3)
+    large = _seed(db_session, 60)
+    db_session.expunge_all()
+
+    with _count_queries(db_session) as small_queries:
+        load_execution_context(db_session, small)
+    db_session.expunge_all()
+    with _count_queries(db_session) as large_queries:
+        load_execution_context(db_session, large)
+
+    assert len(small_queries) == len(large_queries) == 4
+
+
+def test_converters_use_context_without_querying(db_session):
+    planned_ids = _seed(db_session, 6)
+    context = load_execution_context(db_session, planned_ids)
+    now_utc = datetime(2024, 5, 1, tzinfo=timezone.utc)
+
+    with _count_queries(db_session) as queries:
+        paired_state = _load_planned_session_with_activity(db_session, "ps-6-0", {}, now_utc, context)
+        unpaired_state = _load_planned_session_with_activity(db_session, "ps-6-1", {}, now_utc, context)
+        calendar_session = _planned_session_to_calendar(
+            context.planned_sessions["ps-6-2"], session=db_session, context=context
+        )
+
+    assert queries == []
+    assert paired_state.reason == "On target"
+    assert unpaired_state.state != paired_state.state
+    assert calendar_session.execution_state.reason == "On target"
@@ -1,7 +1,7 @@
 """Unit tests for calendar reconciliation API layer.
 
 Tests cover:
-- _run_reconciliation_safe() behavior with MISSED status
+- _run_reconciliation_safe() lookup behavior (MISSED, COMPLETED, SKIPPED)
 - Season endpoint DB vs final status counters
 """
 
@@ -13,23 +13,34 @@ import pytest
 from app.calendar.reconciliation import ReconciliationResult, SessionStatus
 
 
+def _empty_store_session() -> Mock:
+    """Mock DB session with no stored reconciliation rows."""
+    session = Mock()
+    session.execute.return_value.scalars.return_value = []
+    return session
+
+
+def _planned(session_id: str) -> Mock:
+    planned = Mock()
+    planned.id = session_id
+    planned.starts_at = datetime(2024, 1, 15, 8, 0, tzinfo=timezone.utc)
+    return planned
+
+
 class TestReconciliationSafeMissedStatus:
-    """Test _run_reconciliation_safe() preserves planned status for MISSED results."""
+    """Test _run_reconciliation_safe() status mapping (read-only lookup)."""
 
-    @patch("app.calendar.api.reconcile_calendar")
-    @patch("app.calendar.api.auto_match_sessions")
-    def test_missed_status_does_not_override_planned(
+    @patch("app.calendar.reconciliation_store.auto_match_sessions")
+    @patch("app.calendar.reconciliation_store.reconcile_calendar")
+    def test_missed_status_is_reported_without_matches(
         self,
-        mock_auto_match: Mock,
         mock_reconcile: Mock,
+        mock_auto_match: Mock,
     ):
-        """Test that MISSED reconciliation result does NOT override planned status."""
+        """MISSED is exposed for the frontend label but never marks an activity as matched."""
         from app.calendar.api import _run_reconciliation_safe
 
-        # Setup: Planned session with status="planned"
         session_id = "session-1"
-
-        # Mock reconciliation result: MISSED with no matched_activity_id
         mock_reconcile.return_value = [
             ReconciliationResult(
                 session_id=session_id,
@@ -42,37 +53,23 @@ class TestReconciliationSafeMissedStatus:
             )
         ]
 
-        # Run reconciliation
         reconciliation_map, matched_activity_ids = _run_reconciliation_safe(
-            user_id="test-user",
-            athlete_id=1,
-            start_date=date(2024, 1, 1),
-            end_date=date(2024, 1, 31),
+            _empty_store_session(), "test-user", [_planned(session_id)]
         )
 
-        # Assert: MISSED status should NOT be in reconciliation_map
-        # This preserves the DB status ("planned")
-        assert session_id not in reconciliation_map, (
-            "MISSED status should NOT override DB status. "
-            "reconciliation_map should be empty to preserve planned status."
-        )
+        assert reconciliation_map[session_id] == "missed"
         assert matched_activity_ids == set(), "No matched activities for MISSED status"
 
-        # Verify reconcile_calendar was called
+        # Reads never auto-match (no write side effects)
         mock_reconcile.assert_called_once()
+        mock_auto_match.assert_not_called()
 
-        # Verify auto_match was NOT called (no matched activities)
-        mock_auto_match.assert_called_once_with(
-            user_id="test-user",
-            reconciliation_results=mock_reconcile.return_value,
-        )
-
-    @patch("app.calendar.api.reconcile_calendar")
-    @patch("app.calendar.api.auto_match_sessions")
+    @patch("app.calendar.reconciliation_store.auto_match_sessions")
+    @patch("app.calendar.reconciliation_store.reconcile_calendar")
     def test_completed_status_with_matched_activity_overrides(
         self,
-        mock_auto_match: Mock,
         mock_reconcile: Mock,
+        mock_auto_match: Mock,
     ):
         """Test that COMPLETED status with matched_activity_id DOES override DB status."""
         from app.calendar.api import _run_reconciliation_safe
@@ -80,7 +77,6 @@ class TestReconciliationSafeMissedStatus:
         session_id = "session-1"
         activity_id = "activity-1"
 
-        # Mock reconciliation result: COMPLETED with matched_activity_id
         mock_reconcile.return_value = [
             ReconciliationResult(
                 session_id=session_id,
@@ -93,34 +89,21 @@ class TestReconciliationSafeMissedStatus:
             )
         ]
 
-        # Run reconciliation
         reconciliation_map, matched_activity_ids = _run_reconciliation_safe(
-            user_id="test-user",
-            athlete_id=1,
-            start_date=date(2024, 1, 1),
-            end_date=date(2024, 1, 31),
+            _empty_store_session(), "test-user", [_planned(session_id)]
         )
 
-        # Assert: COMPLETED status SHOULD be in reconciliation_map
         assert reconciliation_map[session_id] == "completed"
         assert activity_id in matched_activity_ids
+        mock_auto_match.assert_not_called()
 
-        mock_reconcile.assert_called_once()
-        mock_auto_match.assert_called_once()
-
-    @patch("app.calendar.api.reconcile_calendar")
-    @patch("app.calendar.api.auto_match_sessions")
-    def test_skipped_status_overrides(
-        self,
-        mock_auto_match: Mock,
-        mock_reconcile: Mock,
-    ):
+    @patch("app.calendar.reconciliation_store.reconcile_calendar")
+    def test_skipped_status_overrides(self, mock_reconcile: Mock):
         """Test that SKIPPED status DOES override DB status (user explicitly skipped)."""
         from app.calendar.api import _run_reconciliation_safe
 
         session_id = "session-1"
 
-        # Mock reconciliation result: SKIPPED (no matched_activity_id)
         mock_reconcile.return_value = [
             ReconciliationResult(
                 session_id=session_id,
@@ -133,20 +116,26 @@ class TestReconciliationSafeMissedStatus:
             )
         ]
 
-        # Run reconciliation
         reconciliation_map, matched_activity_ids = _run_reconciliation_safe(
-            user_id="test-user",
-            athlete_id=1,
-            start_date=date(2024, 1, 1),
-            end_date=date(2024, 1, 31),
+            _empty_store_session(), "test-user", [_planned(session_id)]
         )
 
-        # Assert: SKIPPED status SHOULD be in reconciliation_map
         assert reconciliation_map[session_id] == "skipped"
         assert matched_activity_ids == set()
 
-        mock_reconcile.assert_called_once()
-        mock_auto_match.assert_called_once()
+    @patch("app.calendar.reconciliation_store.reconcile_calendar")
+    def test_lookup_failure_falls_back_to_planned_status(self, mock_reconcile: Mock):
+        """Errors in the lookup leave DB statuses untouched."""
+        from app.calendar.api import _run_reconciliation_safe
+
+        session = Mock()
+        session.execute.side_effect = RuntimeError("db down")
+
+        reconciliation_map, matched_activity_ids = _run_reconciliation_safe(session, "test-user", [_planned("s")])
+
+        assert reconciliation_map == {}
+        assert matched_activity_ids == set()
+        mock_reconcile.assert_not_called()
 
 
 class TestSeasonEndpointCounters:
@@ -0,0 +1,166 @@
+"""Tests for persisted calendar reconciliation results.
+
+Tests cover:
+- Refresh persists results (write side) and auto-matches
+- Lookups read stored rows without reconciling or writing
+- Write hooks mark the right (user, day) windows dirty
+- Dirty days queued while the refresh worker is busy are merged into one round
+"""
+
+import threading
+from contextlib import contextmanager
+from datetime import date, datetime, timezone
+from unittest.mock import Mock
+
+import pytest
+from sqlalchemy import select
+
+from app.calendar import reconciliation_store
+from app.calendar.reconciliation import ReasonCode, ReconciliationResult, SessionStatus
+from app.db.models import Activity, CalendarReconciliation, PlannedSession
+
+
+def _result(session_id: str, status: SessionStatus, activity_id: str | None = None) -> ReconciliationResult:
+    return ReconciliationResult(
+        session_id=session_id,
+        date="2024-03-05",
+        status=status,
+        matched_activity_id=activity_id,
+        confidence=1.0,
+        reason_code=ReasonCode.EXACT_MATCH if activity_id else ReasonCode.NO_ACTIVITY_FOUND,
+        explanation="test",
+    )
+
+
+def _planned(session_id: str, user_id: str = "user-1") -> PlannedSession:
+    return PlannedSession(
+        id=session_id,
+        user_id=user_id,
+        starts_at=datetime(2024, 3, 5, 7, 0, tzinfo=timezone.utc),
+        sport="run",
+        status="planned",
+    )
+
+
+@pytest.fixture
+def store_session(db_session, monkeypatch):
+    """Route reconciliation_store's own sessions to the test session."""
+
+    @contextmanager
+    def _get_session():
+        yield db_session
+
+    monkeypatch.setattr(reconciliation_store, "get_session", _get_session)
+    return db_session
+
+
+def test_refresh_persists_and_lookup_reads_without_reconciling(store_session, monkeypatch):
+    reconcile = Mock(
+        return_value=[
+            _result("ps-1", SessionStatus.COMPLETED, "act-1"),
+            _result("ps-2", SessionStatus.MISSED),
+        ]
+    )
+    auto_match = Mock(return_value=1)
+    monkeypatch.setattr(reconciliation_store, "reconcile_calendar", reconcile)
+    monkeypatch.setattr(reconciliation_store, "auto_match_sessions", auto_match)
+
+    reconciliation_store.refresh_reconciliation("user-1", date(2024, 3, 4), date(2024, 3, 6))
+
+    auto_match.assert_called_once()
+    rows = store_session.execute(select(CalendarReconciliation)).scalars().all()
+    assert {r.planned_session_id: r.status for r in rows} == {"ps-1": "completed", "ps-2": "missed"}
+
+    reconcile.reset_mock()
+    reconciliation_map, matched = reconciliation_store.load_reconciliation(
+        store_session, "user-1", [_planned("ps-1"), _planned("ps-2")]
+    )
+
+    assert reconciliation_map == {"ps-1": "completed", "ps-2": "missed"}
+    assert matched == {"act-1"}
+    reconcile.assert_not_called()
+
+
+def test_refresh_drops_rows_for_sessions_that_left_the_window(store_session, monkeypatch):
+    monkeypatch.setattr(reconciliation_store, "auto_match_sessions", Mock())
+    monkeypatch.setattr(
+        reconciliation_store,
+        "reconcile_calendar",
+        Mock(return_value=[_result("ps-1", SessionStatus.MISSED), _result("ps-2", SessionStatus.MISSED)]),
+    )
+    reconciliation_store.refresh_reconciliation("user-1", date(2024, 3, 4), date(2024, 3, 6))
+
+    monkeypatch.setattr(
+        reconciliation_store, "reconcile_calendar", Mock(return_value=[_result("ps-1", SessionStatus.MISSED)])
+    )
+    reconciliation_store.refresh_reconciliation("user-1", date(2024, 3, 4), date(2024, 3, 6))
+
+    ids = store_session.execute(select(CalendarReconciliation.planned_session_id)).scalars().all()
+    assert ids == ["ps-1"]
+
+
+def test_lookup_reconciles_missing_rows_in_memory_only(store_session, monkeypatch):
+    reconcile = Mock(return_value=[_result("ps-9", SessionStatus.COMPLETED, "act-9")])
+    monkeypatch.setattr(reconciliation_store, "reconcile_calendar", reconcile)
+
+    reconciliation_map, matched = reconciliation_store.load_reconciliation(store_session, "user-1", [_planned("ps-9")])
+
+    assert reconciliation_map == {"ps-9": "completed"}
+    assert matched == {"act-9"}
+    assert store_session.execute(select(CalendarReconciliation)).scalars().all() == []
+
+
+def test_collect_dirty_marks_activity_and_planned_days(db_session):
+    db_session.add(_planned("ps-1"))
+    db_session.add(
+        Activity(
+            user_id="user-2",
+            sport="run",
+            starts_at=datetime(2024, 3, 7, 23, 30, tzinfo=timezone.utc),
+            duration_seconds=1800,
+        )
+    )
+
+    reconciliation_store._collect_dirty(db_session, None)
+
+    dirty = db_session.info[reconciliation_store._DIRTY_KEY]
+    assert dirty == {"user-1": {date(2024, 3, 5)}, "user-2": {date(2024, 3, 7)}}
+
+
+def test_merge_days_pads_and_merges_adjacent_windows():
+    windows = reconciliation_store._merge_days({date(2024, 3, 5), date(2024, 3, 7), date(2024, 3, 20)})
+
+    assert windows == [
+        (date(2024, 3, 4), date(2024, 3, 8)),
+        (date(2024, 3, 19), date(2024, 3, 21)),
+    ]
+
+
+def test_dirty_days_queued_while_busy_are_merged_into_one_worker_round(monkeypatch):
+    started = threading.Event()
+    release = threading.Event()
+    rounds: list[dict] = []
+    threads: set[str] = set()
+
+    def refresh(dirty):
+        threads.add(threading.current_thread().name)
+        rounds.append(dirty)
+        started.set()
+        release.wait(5)
+
+    monkeypatch.setattr(reconciliation_store, "refresh_dirty_days", refresh)
+
+    reconciliation_store.queue_dirty_days({"user-1": {date(2024, 3, 5)}})
+    assert started.wait(5)
+    for day in range(6, 9):
+        reconciliation_store.queue_dirty_days({"user-1": {date(2024, 3, day)}, "user-2": {date(2024, 3, day)}})
+    worker = reconciliation_store._worker
+    release.set()
+    worker.join(5)
+
+    assert len(threads) == 1
+    assert rounds == [
+        {"user-1": {date(2024, 3, 5)}},
+        {"user-1": {date(2024, 3, d) for d in range(6, 9)}, "user-2": {date(2024, 3, d) for d in range(6, 9)}},
+    ]
+    assert reconciliation_store._worker is None
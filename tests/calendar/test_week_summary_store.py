@@ -0,0 +1,197 @@
+"""Tests for materialized per-week calendar summaries.
+
+Tests cover:
+- Session-derived week facts (counts, load, key sessions, flags)
+- Refresh persists one row per week and updates it in place
+- A concurrent insert of the same week is retried as an update
+- Readers get fresh rows only; stale/missing weeks are rebuilt in the background,
+  once per (user, week) while a rebuild is queued or running
+- The weekly summary card reads the materialized row
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta, timezone
+from unittest.mock import Mock
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+
+from app.api.schemas.schemas import CalendarSession
+from app.calendar import week_summary_store
+from app.db.models import CalendarWeekSummary, PlannedSession
+from app.services.weekly_summary_builder import build_weekly_summary_card, is_week_summary_fresh
+
+USER_ID = "user-weeks"
+MONDAY = date(2024, 3, 4)
+
+
+def _calendar_session(day: date, status: str, title: str, intensity: str | None = None) -> CalendarSession:
+    return CalendarSession(
+        id=f"{title}-{day}",
+        date=day.isoformat(),
+        type="Run",
+        title=title,
+        duration_minutes=45,
+        intensity=intensity,
+        status=status,
+    )
+
+
+@pytest.fixture
+def store_session(db_session, monkeypatch):
+    """Route week_summary_store's own sessions to the test session."""
+
+    @contextmanager
+    def _get_session():
+        yield db_session
+
+    monkeypatch.setattr(week_summary_store, "get_session", _get_session)
+    return db_session
+
+
+def test_summarize_week_sessions():
+    sessions = [
+        _calendar_session(MONDAY, "completed", "Tempo", "hard"),
+        _calendar_session(MONDAY + timedelta(days=1), "completed", "Tempo", "hard"),
+        _calendar_session(MONDAY + timedelta(days=2), "completed", "Long run", "moderate"),
+        _calendar_session(MONDAY + timedelta(days=3), "completed", "Intervals", "hard"),
+        _calendar_session(MONDAY + timedelta(days=4), "planned", "Easy"),
+    ]
+
+    facts = week_summary_store.summarize_week_sessions(sessions)
+
+    assert facts["planned_count"] == 1
+    assert facts["completed_count"] == 4
+    assert facts["planned_duration_seconds"] == 45 * 60
+    assert facts["completed_duration_seconds"] == 4 * 45 * 60
+    assert facts["key_sessions"] == ["Tempo", "Long run", "Intervals"]
+    assert facts["completed_titles"] == ["Tempo", "Tempo", "Long run", "Intervals"]
+    assert facts["flags"] == ["fatigue"]
+
+
+def test_refresh_persists_and_updates_week_rows(store_session, monkeypatch):
+    store_session.add(
+        PlannedSession(
+            id="ps-1",
+            user_id=USER_ID,
+            starts_at=datetime(2024, 3, 5, 7, 0, tzinfo=timezone.utc),
+            sport="run",
+            title="Easy",
+            status="planned",
+        )
+    )
+    store_session.commit()
+    calendar_sessions = Mock(return_value=[_calendar_session(MONDAY + timedelta(days=1), "planned", "Easy")])
+    monkeypatch.setattr(week_summary_store, "load_calendar_sessions", calendar_sessions)
+
+    week_summary_store.refresh_week_summaries(USER_ID, [MONDAY + timedelta(days=2)])
+    calendar_sessions.return_value = [_calendar_session(MONDAY + timedelta(days=1), "completed", "Easy")]
+    week_summary_store.refresh_week_summaries(USER_ID, [MONDAY])
+
+    rows = store_session.execute(select(CalendarWeekSummary)).scalars().all()
+    assert len(rows) == 1
+    assert rows[0].week_start == MONDAY
+    assert rows[0].total_planned_sessions == 1
+    assert (rows[0].planned_count, rows[0].completed_count) == (0, 1)
+    assert rows[0].key_sessions == ["Easy"]
+
+
+def test_refresh_retries_concurrent_insert_as_update(monkeypatch):
+    session = Mock()
+    session.commit.side_effect = [IntegrityError("INSERT", {}, Exception("duplicate key")), None]
+
+    @contextmanager
+    def _get_session():
+        yield session
+
+    persist = Mock()
+    monkeypatch.setattr(week_summary_store, "get_session", _get_session)
+    monkeypatch.setattr(week_summary_store, "compute_week_summary", Mock(return_value={"planned_count": 1}))
+    monkeypatch.setattr(week_summary_store, "_persist_week_summaries", persist)
+
+    week_summary_store.refresh_week_summaries(USER_ID, [MONDAY])
+
+    session.rollback.assert_called_once()
+    assert persist.call_count == 2
+    assert persist.call_args.args == (session, USER_ID, {MONDAY: {"planned_count": 1}})
+
+
+def test_schedule_refresh_skips_weeks_already_in_flight(monkeypatch):
+    release = threading.Event()
+    refreshed: list[list[date]] = []
+
+    def refresh(user_id, weeks):
+        refreshed.append(weeks)
+        release.wait(5)
+
+    monkeypatch.setattr(week_summary_store, "refresh_weeks_for_days", refresh)
+    next_monday = MONDAY + timedelta(weeks=1)
+
+    week_summary_store._schedule_refresh(USER_ID, [MONDAY])
+    week_summary_store._schedule_refresh(USER_ID, [MONDAY, next_monday])
+    week_summary_store._schedule_refresh(USER_ID, [next_monday])
+    release.set()
+    deadline = time.monotonic() + 5
+    while week_summary_store._in_flight and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert sorted(refreshed) == [[MONDAY], [next_monday]]
+    assert not week_summary_store._in_flight
+
+
+def test_load_returns_fresh_rows_and_rebuilds_the_rest(db_session, monkeypatch):
+    now = datetime.now(timezone.utc)
+    past_week = week_summary_store.week_start_for(now.date()) - timedelta(weeks=4)
+    stale_week = past_week + timedelta(weeks=1)
+    db_session.add(CalendarWeekSummary(user_id=USER_ID, week_start=past_week, computed_at=now))
+    # Computed while the week was still running: missed sessions may have appeared since
+    db_session.add(
+        CalendarWeekSummary(user_id=USER_ID, week_start=stale_week, computed_at=datetime.combine(
+            stale_week, datetime.min.time(), tzinfo=timezone.utc
+        ))
+    )
+    db_session.commit()
+    scheduled = Mock()
+    monkeypatch.setattr(week_summary_store, "_schedule_refresh", scheduled)
+    missing_week = stale_week + timedelta(weeks=1)
+
+    rows = week_summary_store.load_week_summaries(db_session, USER_ID, [past_week, stale_week, missing_week])
+
+    assert list(rows) == [past_week]
+    scheduled.assert_called_once_with(USER_ID, [stale_week, missing_week])
+
+
+def test_is_week_summary_fresh_for_current_and_upcoming_weeks():
+    today = date(2024, 3, 6)
+    current = CalendarWeekSummary(week_start=MONDAY, computed_at=datetime(2024, 3, 5, 23, 0, tzinfo=timezone.utc))
+    upcoming = CalendarWeekSummary(
+        week_start=MONDAY + timedelta(weeks=1), computed_at=datetime(2024, 2, 1, tzinfo=timezone.utc)
+    )
+
+    assert not is_week_summary_fresh(current, today)
+    assert is_week_summary_fresh(current, date(2024, 3, 5))
+    assert is_week_summary_fresh(upcoming, today)
+
+
+def test_weekly_summary_card_reads_materialized_row(db_session):
+    db_session.add(
+        CalendarWeekSummary(
+            user_id=USER_ID,
+            week_start=MONDAY,
+            total_planned_sessions=5,
+            executed_as_planned_count=4,
+            missed_sessions_count=1,
+            unplanned_sessions_count=0,
+            computed_at=datetime.now(timezone.utc),
+        )
+    )
+    db_session.commit()
+
+    card = build_weekly_summary_card(db_session, USER_ID, MONDAY)
+
+    assert card["total_planned_sessions"] == 5
+    assert card["executed_as_planned_count"] == 4
+    assert card["narrative"].startswith("This week, You executed 4 of 5 planned sessions")
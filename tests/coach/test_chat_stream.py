@@ -0,0 +1,170 @@
+"""Tests for the streaming coach chat endpoint.
+
+Tests cover:
+- Structured-output JSON chunks are reduced to message text deltas
+- The orchestrator forwards message tokens while the model streams
+- /coach/chat/stream emits tokens, the final response, deferred progress and done
+- A failed streamed turn sends a generic error event
+"""
+
+import asyncio
+import json
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from pydantic_ai.messages import ModelResponse, ToolCallPart
+from pydantic_ai.models.function import AgentInfo, DeltaToolCall, FunctionModel
+
+import app.coach.agents.orchestrator_agent as orchestrator_agent
+from app.coach import api_chat
+from app.coach.agents.orchestrator_deps import CoachDeps
+from app.coach.chat_events import MessageFieldStreamer, emit_local_event, reset_chat_event_sink, set_chat_event_sink
+from app.coach.utils.schemas import CoachChatRequest, CoachChatResponse
+
+DECISION_JSON = json.dumps(
+    {
+        "intent": "question",
+        "horizon": None,
+        "action": "NO_ACTION",
+        "response_type": "recommendation",
+        "confidence": 0.9,
+        "message": 'Keep it "easy" today.\nHydrate.',
+    }
+)
+
+
+def test_message_field_streamer_emits_deltas():
+    streamer = MessageFieldStreamer("message")
+    chunks = [DECISION_JSON[i : i + 7] for i in range(0, len(DECISION_JSON), 7)]
+
+    text = "".join(streamer.feed(chunk) for chunk in chunks)
+
+    assert text == 'Keep it "easy" today.\nHydrate.'
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_streams_message_tokens():
+    def _model(_messages, info: AgentInfo) -> ModelResponse:
+        return ModelResponse(parts=[ToolCallPart(tool_name=info.output_tools[0].name, args=DECISION_JSON)])
+
+    async def _stream(_messages, info: AgentInfo):
+        for i in range(0, len(DECISION_JSON), 5):
+            yield {0: DeltaToolCall(name=info.output_tools[0].name if i == 0 else None, json_args=DECISION_JSON[i : i + 5])}
+
+    async def _call_tool(_name, _args):
+        return {"messages": []}
+
+    async def _load_prompt(_name):
+        return "You are the orchestrator."
+
+    async def _slots(**_kwargs):
+        return None, [], {}
+
+    tokens: list[str] = []
+    token = set_chat_event_sink(lambda event, data: tokens.append(data["text"]) if event == "token" else None)
+    try:
+        with (
+            patch.object(orchestrator_agent, "ORCHESTRATOR_AGENT_MODEL", FunctionModel(_model, stream_function=_stream)),
+            patch.object(orchestrator_agent, "ORCHESTRATOR_INSTRUCTIONS", ""),
+            patch.object(orchestrator_agent, "ORCHESTRATOR_AGENT", None),
+            patch.object(orchestrator_agent, "call_tool", _call_tool),
+            patch.object(orchestrator_agent, "load_prompt", _load_prompt),
+            patch.object(orchestrator_agent, "_compute_missing_slots_for_decision", _slots),
+            patch.object(
+                orchestrator_agent,
+                "enforce_token_limit",
+                lambda prompt, **_kwargs: (prompt, {"truncated": False, "final_tokens": 0}),
+            ),
+        ):
+            result = await orchestrator_agent.run_conversation("How today?", CoachDeps(athlete_id=1, user_id="u1"))
+    finally:
+        reset_chat_event_sink(token)
+
+    assert len(tokens) > 1
+    assert "".join(tokens) == result.message == 'Keep it "easy" today.\nHydrate.'
+
+
+class _FakeBus:
+    """In-process stand-in for the Redis pub/sub channel."""
+
+    def __init__(self):
+        self.queues: list[asyncio.Queue] = []
+
+    def publish(self, _conversation_id, event, data):
+        for queue in self.queues:
+            queue.put_nowait((event, data))
+
+    def subscription(self, _conversation_id):
+        bus = self
+
+        class _Subscription:
+            active = True
+
+            async def __aenter__(self):
+                self.queue = asyncio.Queue()
+                bus.queues.append(self.queue)
+                return self
+
+            async def __aexit__(self, *_exc):
+                bus.queues.remove(self.queue)
+
+            async def events(self):
+                while True:
+                    yield await self.queue.get()
+
+        return _Subscription()
+
+
+def _parse_sse(frames: list[str]) -> list[tuple[str, dict]]:
+    events = []
+    for frame in "".join(frames).split("\n\n"):
+        if frame.startswith("event: "):
+            name_line, data_line = frame.split("\n", 1)
+            events.append((name_line.removeprefix("event: "), json.loads(data_line.removeprefix("data: "))))
+    return events
+
+
+@pytest.mark.asyncio
+async def test_chat_stream_event_order(monkeypatch):
+    bus = _FakeBus()
+    monkeypatch.setattr(api_chat, "publish_chat_event", bus.publish)
+    monkeypatch.setattr(api_chat, "ChatEventSubscription", bus.subscription)
+
+    async def _plan_in_background():
+        bus.publish("c_1", "progress", {"stage": "planning_structure", "message": "Planning"})
+
+    async def _fake_coach_chat(_req, _request, background_tasks, _user_id):
+        emit_local_event("token", {"text": "Working"})
+        background_tasks.add_task(_plan_in_background)
+        return CoachChatResponse(intent="plan", reply="I'm working on your request.", response_type="plan")
+
+    monkeypatch.setattr(api_chat, "coach_chat", _fake_coach_chat)
+    request = SimpleNamespace(state=SimpleNamespace(conversation_id="c_1"))
+
+    response = await api_chat.coach_chat_stream(CoachChatRequest(message="Plan my race"), request, "u1")
+    frames = [frame async for frame in response.body_iterator]
+    events = _parse_sse(frames)
+
+    assert [name for name, _ in events] == ["token", "response", "progress", "done"]
+    assert events[1][1]["reply"] == "I'm working on your request."
+    assert events[2][1]["stage"] == "planning_structure"
+
+
+@pytest.mark.asyncio
+async def test_chat_stream_error_hides_exception_details(monkeypatch):
+    bus = _FakeBus()
+    monkeypatch.setattr(api_chat, "publish_chat_event", bus.publish)
+    monkeypatch.setattr(api_chat, "ChatEventSubscription", bus.subscription)
+
+    async def _failing_coach_chat(_req, _request, _background_tasks, _user_id):
+        await asyncio.sleep(0)
+        raise RuntimeError("postgres://admin:secret@db/virtus refused connection")
+
+    monkeypatch.setattr(api_chat, "coach_chat", _failing_coach_chat)
+    request = SimpleNamespace(state=SimpleNamespace(conversation_id="c_1"))
+
+    response = await api_chat.coach_chat_stream(CoachChatRequest(message="Hi"), request, "u1")
+    events = _parse_sse([frame async for frame in response.body_iterator])
+
+    assert events == [("error", {"message": api_chat.STREAM_ERROR_MESSAGE}), ("done", {})]
@@ -0,0 +1,120 @@
+"""Tests for the tiered chat intent router.
+
+Tests cover:
+- Rules resolve acknowledgments, explicit plan requests with one horizon, check-ins and concept questions
+- Change requests, negations, confirmations and ambiguous horizons are never resolved by rules
+- Nearest-neighbour matching resolves paraphrases of read-only examples only
+- Unresolved turns go to the LLM classifier
+- Stats report the fraction of turns resolved without a model call and per-tier latency
+- Live chat turns skip the model only for acknowledgments
+"""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.coach.agents import intent_router as router
+from app.coach.schemas.orchestration import OrchestrationDecision
+
+
+@pytest.fixture(autouse=True)
+def _reset_stats():
+    router.reset_router_stats()
+    yield
+    router.reset_router_stats()
+
+
+@pytest.fixture
+def llm_classifier(monkeypatch):
+    decision = OrchestrationDecision(
+        user_intent="revise",
+        horizon="day",
+        confidence=0.9,
+        action="CALL_TOOL",
+        tool_name="plan",
+        read_only=False,
+        reason="llm",
+    )
+    mock = AsyncMock(return_value=decision)
+    monkeypatch.setattr(router, "classify_intent", mock)
+    return mock
+
+
+@pytest.mark.parametrize(
+    ("message", "intent", "horizon", "action"),
+    [
+        ("Thanks!", "question", "none", "NO_TOOL"),
+        ("I ran yesterday", "question", "none", "NO_TOOL"),
+        ("Build me a plan for next week", "plan", "week", "CALL_TOOL"),
+        ("Can you create a marathon plan?", "plan", "season", "CALL_TOOL"),
+        ("How am I doing?", "assess", "none", "NO_TOOL"),
+        ("What does threshold mean?", "explain", "none", "NO_TOOL"),
+    ],
+)
+def test_rules_resolve_clear_messages(message, intent, horizon, action):
+    decision = router._match_rules(router._normalize(message))
+
+    assert (decision.user_intent, decision.horizon, decision.action) == (intent, horizon, action)
+
+
+@pytest.mark.parametrize(
+    "message",
+    [
+        "Please change tomorrow's run",
+        "Don't make a plan for next week",
+        "Create a plan for this week's race",  # two horizons
+        "I feel tired today",
+        "ok",
+        "Sure, go ahead",
+    ],
+)
+def test_rules_leave_unclear_messages_alone(message):
+    assert router._match_rules(router._normalize(message)) is None
+
+
+def test_nearest_neighbour_resolves_read_only_paraphrases_only():
+    decision = router._match_nearest_neighbour(router._normalize("Is my training going well?"))
+    assert decision.user_intent == "assess"
+    assert decision.action == "NO_TOOL"
+
+    # Closest example is a mutation request: leave it to the classifier
+    assert router._match_nearest_neighbour(router._normalize("What should I run today?")) is None
+    assert router._match_nearest_neighbour(router._normalize("Swap my long run with the tempo")) is None
+
+
+@pytest.mark.asyncio
+async def test_route_intent_escalates_and_reports_stats(llm_classifier):
+    for message in ["thanks", "how is my recovery going", "move my long run to saturday", "okay"]:
+        await router.route_intent(message, deps=None)
+
+    # "okay" may confirm a pending proposal, so only the classifier decides it
+    assert llm_classifier.await_count == 2
+    stats = router.get_router_stats()
+    assert stats["turns"] == 4
+    assert stats["resolved_without_llm"] == 0.5
+    assert (stats["tiers"]["rules"]["attempts"], stats["tiers"]["rules"]["resolved"]) == (4, 1)
+    assert stats["tiers"]["nearest_neighbour"]["resolved"] == 1
+    assert stats["tiers"]["llm"]["attempts"] == 2
+
+
+@pytest.mark.asyncio
+async def test_disabled_router_always_uses_llm(llm_classifier, monkeypatch):
+    monkeypatch.setattr(router.settings, "intent_router_enabled", False)
+
+    decision = await router.route_intent("thanks", deps=None)
+
+    assert decision.reason == "llm"
+    assert router.get_router_stats()["resolved_without_llm"] == 0.0
+
+
+def test_live_chat_turns_skip_the_model_only_for_acknowledgments():
+    assert router.route_chat_turn("Thanks!").reason == "Acknowledgment (rule)"
+    for message in ["How am I doing?", "okay"]:
+        assert router.route_chat_turn(message) is None
+        with router.model_turn():
+            pass
+
+    stats = router.get_router_stats()
+    assert stats["turns"] == 3
+    assert stats["resolved_without_llm"] == round(1 / 3, 3)
+    assert stats["tiers"]["llm"]["attempts"] == 2
@@ -0,0 +1,135 @@
+"""Tests for single-flight coalescing of LLM calls.
+
+Tests cover:
+- Identical concurrent calls share one execution (and get independent copies)
+- Different inputs are not coalesced
+- Calls from different event loops (threads) are coalesced
+- Leader failures reach in-process followers
+- A call waits for another worker's leader and reuses its handed-off result
+- A worker runs the call itself when the remote leader fails
+"""
+
+import asyncio
+import threading
+
+import pytest
+from pydantic import BaseModel
+
+from app.infra.llm import single_flight as sf
+
+
+class _Decision(BaseModel):
+    recommendation: str
+    notes: list[str]
+
+
+@pytest.fixture
+def fake_redis(fake_redis, monkeypatch):
+    monkeypatch.setattr(sf, "_get_redis_client", lambda: fake_redis)
+    monkeypatch.setattr(sf, "POLL_INTERVAL_SECONDS", 0.01)
+    return fake_redis
+
+
+def _counting_generator(delay: float = 0.05):
+    calls: list[dict] = []
+
+    @sf.coalesced("test.decision")
+    async def generate(context: dict) -> _Decision:
+        calls.append(context)
+        await asyncio.sleep(delay)
+        return _Decision(recommendation=f"run {context['load']}", notes=[])
+
+    return generate, calls
+
+
+@pytest.mark.asyncio
+async def test_identical_concurrent_calls_share_one_execution(fake_redis):
+    generate, calls = _counting_generator()
+
+    results = await asyncio.gather(*(generate({"load": 5, "user": "u1"}) for _ in range(5)))
+
+    assert len(calls) == 1
+    assert all(r == results[0] for r in results)
+    results[1].notes.append("edited")
+    assert results[0].notes == []
+    # Lock released, result handed off for other workers
+    assert [k.rsplit(":", 1)[1] for k in fake_redis.values] == ["result"]
+
+
+@pytest.mark.asyncio
+async def test_different_inputs_are_not_coalesced(fake_redis):
+    generate, calls = _counting_generator()
+
+    await asyncio.gather(generate({"load": 5, "user": "u1"}), generate({"load": 5, "user": "u2"}))
+
+    assert len(calls) == 2
+
+
+def test_calls_from_different_event_loops_are_coalesced(fake_redis):
+    generate, calls = _counting_generator(delay=0.2)
+    results: list[_Decision] = []
+
+    def _run():
+        results.append(asyncio.run(generate({"load": 3})))
+
+    threads = [threading.Thread(target=_run) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert [r.recommendation for r in results] == ["run 3"] * 3
+
+
+@pytest.mark.asyncio
+async def test_leader_failure_reaches_followers(fake_redis):
+    calls = 0
+
+    @sf.coalesced("test.failure")
+    async def generate(context: dict) -> str:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.02)
+        raise RuntimeError("LLM down")
+
+    results = await asyncio.gather(generate({"a": 1}), generate({"a": 1}), return_exceptions=True)
+
+    assert calls == 1
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert not any(k.endswith(":lock") for k in fake_redis.values)
+
+
+@pytest.mark.asyncio
+async def test_waits_for_other_worker_result(fake_redis):
+    generate, calls = _counting_generator()
+    flight_id = "test.decision:" + sf.flight_key((({"load": 7},), {}))
+    lock_key = f"{sf.KEY_PREFIX}{flight_id}:lock"
+    fake_redis.values[lock_key] = "other-worker"
+
+    async def _other_worker_finishes():
+        await asyncio.sleep(0.05)
+        fake_redis.values[f"{sf.KEY_PREFIX}{flight_id}:result"] = _Decision(recommendation="remote", notes=[]).model_dump_json()
+        del fake_redis.values[lock_key]
+
+    result, _ = await asyncio.gather(generate({"load": 7}), _other_worker_finishes())
+
+    assert calls == []
+    assert result.recommendation == "remote"
+
+
+@pytest.mark.asyncio
+async def test_runs_itself_when_other_worker_fails(fake_redis):
+    generate, calls = _counting_generator()
+    flight_id = "test.decision:" + sf.flight_key((({"load": 7},), {}))
+    lock_key = f"{sf.KEY_PREFIX}{flight_id}:lock"
+    fake_redis.values[lock_key] = "other-worker"
+
+    async def _other_worker_fails():
+        await asyncio.sleep(0.05)
+        del fake_redis.values[lock_key]
+
+    result, _ = await asyncio.gather(generate({"load": 7}), _other_worker_fails())
+
+    assert len(calls) == 1
+    assert result.recommendation == "run 7"
@@ -0,0 +1,179 @@
+"""Tests for MCP client batching, pooling limits and diagnostics flag.
+
+Tests cover:
+- Independent DB tool calls go out as one /mcp/tools/batch request
+- Per-call errors come back as MCPError without failing the batch
+- Servers without the batch endpoint fall back to individual calls
+- Per-tool concurrency limits, one permit per batched call
+- Turn prefetch serves reads until a write invalidates them
+- Caller-frame diagnostics can be turned off
+"""
+
+import asyncio
+import json
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+
+from app.coach import mcp_client
+from app.coach.mcp_client import MCPError, call_tool, call_tools_batch, coach_turn_reads, prefetch_turn_tools
+from app.config.settings import settings
+
+
+@pytest.fixture
+def mcp_transport(monkeypatch):
+    """Route the MCP client through an in-process handler; yields request log."""
+    requests: list[tuple[str, dict]] = []
+    handlers: dict[str, object] = {}
+
+    async def _handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        requests.append((request.url.path, body))
+        handler = handlers.get(request.url.path)
+        if handler is None:
+            return httpx.Response(404)
+        return await handler(body)
+
+    monkeypatch.setattr(mcp_client, "_client", httpx.AsyncClient(transport=httpx.MockTransport(_handler)))
+    monkeypatch.setattr(mcp_client, "MCP_BATCH_SERVERS", {mcp_client.MCP_DB_SERVER_URL})
+    monkeypatch.setattr(mcp_client, "record_mcp_success", lambda: None)
+    return requests, handlers
+
+
+async def _single_call(body: dict) -> httpx.Response:
+    return httpx.Response(200, json={"result": {"tool": body["tool"]}})
+
+
+@pytest.mark.asyncio
+async def test_batch_sends_one_request_and_maps_errors(mcp_transport):
+    requests, handlers = mcp_transport
+
+    async def _batch(body: dict) -> httpx.Response:
+        results = [
+            {"error": {"code": "USER_NOT_FOUND", "message": "no user"}}
+            if call["tool"] == "get_yesterday_activities"
+            else {"result": {"activities": [call["arguments"]["days"]]}}
+            for call in body["calls"]
+        ]
+        return httpx.Response(200, json={"results": results})
+
+    handlers["/mcp/tools/batch"] = _batch
+
+    recent, yesterday, unknown = await call_tools_batch(
+        [
+            ("get_recent_activities", {"user_id": "u1", "days": 7}),
+            ("get_yesterday_activities", {"user_id": "u1"}),
+            ("not_a_tool", {}),
+        ]
+    )
+
+    assert [path for path, _ in requests] == ["/mcp/tools/batch"]
+    assert recent == {"activities": [7]}
+    assert isinstance(yesterday, MCPError)
+    assert yesterday.code == "USER_NOT_FOUND"
+    assert isinstance(unknown, MCPError)
+    assert unknown.code == "TOOL_NOT_FOUND"
+
+
+@pytest.mark.asyncio
+async def test_batch_falls_back_without_batch_endpoint(mcp_transport):
+    requests, handlers = mcp_transport
+    handlers["/mcp/tools/call"] = _single_call
+
+    results = await call_tools_batch([("load_context", {"athlete_id": 1}), ("get_planned_sessions", {"user_id": "u1"})])
+
+    assert results == [{"tool": "load_context"}, {"tool": "get_planned_sessions"}]
+    assert [path for path, _ in requests].count("/mcp/tools/call") == 2
+    assert mcp_client.MCP_DB_SERVER_URL not in mcp_client.MCP_BATCH_SERVERS
+
+
+@pytest.mark.asyncio
+async def test_per_tool_concurrency_limit(mcp_transport, monkeypatch):
+    _, handlers = mcp_transport
+    monkeypatch.setitem(mcp_client.TOOL_CONCURRENCY_LIMITS, "run_analysis", 1)
+    in_flight = 0
+    peak = 0
+
+    async def _slow_call(body: dict) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return await _single_call(body)
+
+    handlers["/mcp/tools/call"] = _slow_call
+
+    await asyncio.gather(*(call_tool("run_analysis", {"user_id": "u1"}) for _ in range(3)))
+
+    assert peak == 1
+
+
+@pytest.mark.asyncio
+async def test_batch_takes_one_permit_per_call(mcp_transport, monkeypatch):
+    requests, handlers = mcp_transport
+    monkeypatch.setitem(mcp_client.TOOL_CONCURRENCY_LIMITS, "get_recent_activities", 2)
+    in_flight = 0
+    peak = 0
+
+    async def _batch(body: dict) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += len(body["calls"])
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= len(body["calls"])
+        return httpx.Response(200, json={"results": [{"result": {"days": call["arguments"]["days"]}} for call in body["calls"]]})
+
+    handlers["/mcp/tools/batch"] = _batch
+    handlers["/mcp/tools/call"] = _single_call
+
+    results = await call_tools_batch([("get_recent_activities", {"user_id": "u1", "days": days}) for days in range(5)])
+
+    assert results[:4] == [{"days": days} for days in range(4)]
+    assert results[4] == {"tool": "get_recent_activities"}
+    assert sorted(len(body.get("calls", [body])) for _, body in requests) == [1, 2, 2]
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_prefetch_serves_turn_reads_until_invalidated(mcp_transport):
+    requests, handlers = mcp_transport
+
+    async def _batch(body: dict) -> httpx.Response:
+        await asyncio.sleep(0)
+        return httpx.Response(200, json={"results": [{"result": {"tool": call["tool"]}} for call in body["calls"]]})
+
+    handlers["/mcp/tools/batch"] = _batch
+    handlers["/mcp/tools/call"] = _single_call
+    reads = coach_turn_reads(1, "u1")
+
+    await prefetch_turn_tools(reads)
+    assert [path for path, _ in requests] == ["/mcp/tools/batch"]
+    assert [call["tool"] for call in requests[0][1]["calls"]] == ["load_context", "get_recent_activities", "get_planned_sessions"]
+
+    for tool_name, arguments in reads:
+        assert await call_tool(tool_name, arguments) == {"tool": tool_name}
+    assert len(requests) == 1
+
+    # save_context only makes the prefetched history stale
+    await call_tool("save_context", {"athlete_id": 1, "model_name": "m", "user_message": "hi", "assistant_message": "hello"})
+    await call_tool(*reads[1])
+    await call_tool(*reads[0])
+    assert [body.get("tool") for _, body in requests[1:]] == ["save_context", "load_context"]
+
+
+@pytest.mark.asyncio
+async def test_diagnostics_flag_skips_frame_inspection(mcp_transport, monkeypatch):
+    _, handlers = mcp_transport
+    handlers["/mcp/tools/call"] = _single_call
+    currentframe = MagicMock(return_value=None)
+    monkeypatch.setattr(mcp_client.inspect, "currentframe", currentframe)
+
+    monkeypatch.setattr(settings, "mcp_client_diagnostics_enabled", False)
+    assert await call_tool("load_context", {"athlete_id": 1}) == {"tool": "load_context"}
+    assert currentframe.call_count == 0
+
+    monkeypatch.setattr(settings, "mcp_client_diagnostics_enabled", True)
+    await call_tool("load_context", {"athlete_id": 1})
+    assert currentframe.call_count == 1
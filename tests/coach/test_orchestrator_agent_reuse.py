@@ -0,0 +1,92 @@
+"""Tests for the long-lived orchestrator agent.
+
+Tests cover:
+- One agent instance is reused across turns
+- The athlete profile reaches the model as dynamic, per-run instructions
+- Profile text matches _inject_profile_into_prompt (used for token accounting)
+"""
+
+from unittest.mock import patch
+
+import pytest
+from pydantic_ai.messages import ModelResponse, ToolCallPart
+from pydantic_ai.models.function import AgentInfo, FunctionModel
+
+import app.coach.agents.orchestrator_agent as orchestrator_agent
+from app.coach.agents.orchestrator_deps import CoachDeps, StructuredProfileData
+
+BASE_INSTRUCTIONS = "You are the orchestrator."
+
+
+@pytest.fixture
+def stub_orchestrator():
+    """Instant model plus stubbed MCP/slot dependencies; yields seen instructions."""
+    seen_instructions: list[str | None] = []
+
+    def _model(messages, info: AgentInfo) -> ModelResponse:
+        seen_instructions.append(messages[-1].instructions)
+        args = {
+            "intent": "question",
+            "horizon": None,
+            "action": "NO_ACTION",
+            "response_type": "recommendation",
+            "confidence": 0.9,
+            "message": "Easy day.",
+        }
+        return ModelResponse(parts=[ToolCallPart(tool_name=info.output_tools[0].name, args=args)])
+
+    async def _call_tool(_name, _args):
+        return {"messages": []}
+
+    async def _load_prompt(_name):
+        return BASE_INSTRUCTIONS
+
+    async def _slots(**_kwargs):
+        return None, [], {}
+
+    with (
+        patch.object(orchestrator_agent, "ORCHESTRATOR_AGENT_MODEL", FunctionModel(_model)),
+        patch.object(orchestrator_agent, "ORCHESTRATOR_INSTRUCTIONS", ""),
+        patch.object(orchestrator_agent, "ORCHESTRATOR_AGENT", None),
+        patch.object(orchestrator_agent, "call_tool", _call_tool),
+        patch.object(orchestrator_agent, "load_prompt", _load_prompt),
+        patch.object(orchestrator_agent, "_compute_missing_slots_for_decision", _slots),
+        patch.object(
+            orchestrator_agent,
+            "enforce_token_limit",
+            lambda prompt, **_kwargs: (prompt, {"truncated": False, "final_tokens": 0}),
+        ),
+    ):
+        yield seen_instructions
+
+
+def _deps(user_id: str, goal_type: str | None) -> CoachDeps:
+    profile = None
+    if goal_type:
+        profile = StructuredProfileData(structured_profile={"goals": {"goal_type": goal_type}}, constraints={})
+    return CoachDeps(athlete_id=1, user_id=user_id, structured_profile_data=profile)
+
+
+@pytest.mark.asyncio
+async def test_agent_reused_with_per_run_profile(stub_orchestrator):
+    with patch.object(orchestrator_agent, "Agent", wraps=orchestrator_agent.Agent) as agent_cls:
+        await orchestrator_agent.run_conversation("How should I run today?", _deps("u1", "marathon"))
+        await orchestrator_agent.run_conversation("How should I run today?", _deps("u2", "5k"))
+        await orchestrator_agent.run_conversation("How should I run today?", _deps("u3", None))
+
+    assert agent_cls.call_count == 1
+    first, second, third = stub_orchestrator
+    assert "- Goal type: marathon" in first
+    assert "- Goal type: 5k" in second
+    assert "marathon" not in second
+    assert third == BASE_INSTRUCTIONS
+
+
+@pytest.mark.asyncio
+async def test_dynamic_instructions_match_injected_prompt(stub_orchestrator):
+    deps = _deps("u1", "half_marathon")
+
+    result = await orchestrator_agent.run_conversation("Plan my week", deps)
+
+    assert result.message == "Easy day."
+    assert stub_orchestrator[0] == orchestrator_agent._inject_profile_into_prompt(BASE_INSTRUCTIONS, deps)
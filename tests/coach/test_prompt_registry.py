@@ -0,0 +1,80 @@
+"""Tests for the in-process prompt registry.
+
+Tests cover:
+- Prompts from all directories are served from memory with a content hash
+- Hot reload on file mtime change
+- Unknown / path-like names are rejected
+- load_prompt() uses the registry by default and MCP only when configured
+"""
+
+import os
+
+import pytest
+
+from app.coach.prompts import loader, registry
+from app.coach.prompts.registry import PromptRegistry
+
+
+@pytest.fixture
+def prompt_dirs(tmp_path, monkeypatch):
+    coach_dir = tmp_path / "coach"
+    planner_dir = tmp_path / "planner"
+    coach_dir.mkdir()
+    planner_dir.mkdir()
+    (coach_dir / "orchestrator.txt").write_text("You are the orchestrator.", encoding="utf-8")
+    (planner_dir / "macro_plan.txt").write_text("Plan the macro cycle.", encoding="utf-8")
+    monkeypatch.setattr(registry, "RELOAD_CHECK_SECONDS", 0.0)
+    return coach_dir, planner_dir
+
+
+def test_serves_prompts_from_all_dirs_with_hash(prompt_dirs):
+    prompts = PromptRegistry(prompt_dirs)
+
+    orchestrator = prompts.get("orchestrator.txt")
+    macro = prompts.get("macro_plan.txt")
+
+    assert orchestrator.content == "You are the orchestrator."
+    assert macro.content == "Plan the macro cycle."
+    assert len(orchestrator.content_hash) == 16
+    assert orchestrator.content_hash != macro.content_hash
+    assert prompts.get("orchestrator.txt") is orchestrator
+
+
+def test_hot_reload_on_mtime_change(prompt_dirs):
+    coach_dir, _ = prompt_dirs
+    prompts = PromptRegistry(prompt_dirs)
+    before = prompts.get("orchestrator.txt")
+
+    path = coach_dir / "orchestrator.txt"
+    path.write_text("You are the new orchestrator.", encoding="utf-8")
+    os.utime(path, ns=(before.mtime_ns + 10**9, before.mtime_ns + 10**9))
+    after = prompts.get("orchestrator.txt")
+
+    assert after.content == "You are the new orchestrator."
+    assert after.content_hash != before.content_hash
+
+
+def test_rejects_unknown_and_path_names(prompt_dirs):
+    prompts = PromptRegistry(prompt_dirs)
+
+    with pytest.raises(FileNotFoundError):
+        prompts.get("missing.txt")
+    with pytest.raises(FileNotFoundError):
+        prompts.get("../coach/orchestrator.txt")
+
+
+@pytest.mark.asyncio
+async def test_load_prompt_source_selection(prompt_dirs, monkeypatch):
+    monkeypatch.setattr(registry, "_registry", PromptRegistry(prompt_dirs))
+
+    async def _remote(name):
+        return f"remote:{name}"
+
+    monkeypatch.setattr(loader, "_load_prompt_remote", _remote)
+
+    assert await loader.load_prompt("orchestrator.txt") == "You are the orchestrator."
+    assert loader.prompt_hash("orchestrator.txt") == registry.get_prompt_hash("orchestrator.txt")
+
+    monkeypatch.setattr(loader, "PROMPT_SOURCE", "mcp")
+    assert await loader.load_prompt("orchestrator.txt") == "remote:orchestrator.txt"
+    assert loader.prompt_hash("orchestrator.txt") is None
@@ -3,10 +3,12 @@
 This file makes shared fixtures available across all test modules.
 """
 
+import asyncio
 import os
 from contextlib import contextmanager, suppress
 
 import pytest
+import redis
 from loguru import logger
 from sqlalchemy import create_engine, event
 from sqlalchemy.engine import Engine
@@ -222,6 +224,7 @@ def db_session(monkeypatch):
         "app.calendar.training_summary",
         "app.plans.regenerate.regeneration_service",
         "app.plans.modify.repository",
+        "app.services.athlete_profile_regeneration",
     ]
 
     for module_path in modules_to_patch:
@@ -246,3 +249,177 @@ def db_session(monkeypatch):
             transaction.rollback()
         session.close()
         connection.close()
+
+
+class _FakeRedisPipeline:
+    """Queues commands and runs them against the fake client on execute()."""
+
+    def __init__(self, client):
+        self.client = client
+        self.ops: list[tuple] = []
+
+    def __getattr__(self, name):
+        def _queue(*args, **kwargs):
+            self.ops.append((name, args, kwargs))
+            return self
+
+        return _queue
+
+    def execute(self):
+        self.client.executions.append([name for name, _, _ in self.ops])
+        return [getattr(self.client, name)(*args, **kwargs) for name, args, kwargs in self.ops]
+
+
+class FakeRedis:
+    """In-memory stand-in for a decode_responses=True redis.Redis client.
+
+    Covers the string, list, sorted-set and hash commands the app uses. Set
+    `down = True` to make every command raise redis.ConnectionError.
+    """
+
+    def __init__(self):
+        self.values: dict[str, str] = {}
+        self.lists: dict[str, list[str]] = {}
+        self.zsets: dict[str, dict[str, float]] = {}
+        self.hashes: dict[str, dict[str, int]] = {}
+        self.ttls: dict[str, int] = {}
+        self.executions: list[list[str]] = []
+        self.down = False
+
+    def __getattribute__(self, name):
+        if not name.startswith("_") and object.__getattribute__(self, "down") and callable(object.__getattribute__(self, name)):
+            raise redis.ConnectionError("down")
+        return object.__getattribute__(self, name)
+
+    def pipeline(self, transaction=True):
+        return _FakeRedisPipeline(self)
+
+    # Strings
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def mget(self, *keys):
+        return [self.values.get(key) for key in keys]
+
+    def set(self, key, value, ex=None, nx=False):
+        if nx and key in self.values:
+            return None
+        self.values[key] = value.decode() if isinstance(value, bytes) else str(value)
+        if ex is not None:
+            self.ttls[key] = ex
+        return True
+
+    def incrby(self, key, amount):
+        self.values[key] = str(int(self.values.get(key, 0)) + amount)
+        return int(self.values[key])
+
+    def incr(self, key):
+        return self.incrby(key, 1)
+
+    def decrby(self, key, amount):
+        return self.incrby(key, -amount)
+
+    # Keys
+
+    def delete(self, *keys):
+        return sum(
+            any(store.pop(key, None) is not None for store in (self.values, self.lists, self.zsets, self.hashes)) for key in keys
+        )
+
+    def expire(self, key, seconds):
+        self.ttls[key] = seconds
+        return True
+
+    def ttl(self, key):
+        return self.ttls.get(key, -2)
+
+    def scan_iter(self, match=None, count=None):
+        prefix = (match or "").rstrip("*")
+        return [key for key in (*self.values, *self.lists, *self.zsets, *self.hashes) if key.startswith(prefix)]
+
+    # Lists
+
+    def rpush(self, key, *values):
+        self.lists.setdefault(key, []).extend(values)
+        return len(self.lists[key])
+
+    def ltrim(self, key, start, end):
+        items = self.lists.get(key, [])
+        self.lists[key] = items[start:] if end == -1 else items[start : end + 1]
+        return True
+
+    def lindex(self, key, index):
+        items = self.lists.get(key, [])
+        return items[index] if -len(items) <= index < len(items) else None
+
+    def lrange(self, key, start, end):
+        items = self.lists.get(key, [])
+        return items[start:] if end == -1 else items[start : end + 1]
+
+    def llen(self, key):
+        return len(self.lists.get(key, []))
+
+    # Sorted sets
+
+    def zadd(self, key, mapping, nx=False):
+        zset = self.zsets.setdefault(key, {})
+        added = 0
+        for member, score in mapping.items():
+            if nx and member in zset:
+                continue
+            added += member not in zset
+            zset[member] = score
+        return added
+
+    def zrangebyscore(self, key, _min, max_score, start=0, num=None):
+        members = sorted((score, member) for member, score in self.zsets.get(key, {}).items() if score <= max_score)
+        return [member for _, member in members][start : start + num if num else None]
+
+    def zrem(self, key, member):
+        return int(self.zsets.get(key, {}).pop(member, None) is not None)
+
+    def zcard(self, key):
+        return len(self.zsets.get(key, {}))
+
+    # Hashes
+
+    def hincrby(self, key, field, amount):
+        values = self.hashes.setdefault(key, {})
+        values[field] = values.get(field, 0) + amount
+        return values[field]
+
+    def hdel(self, key, field):
+        return int(self.hashes.get(key, {}).pop(field, None) is not None)
+
+
+class FakeAsyncRedis:
+    """asyncio view of a FakeRedis: same data, awaitable commands."""
+
+    def __init__(self, client: FakeRedis):
+        self.client = client
+
+    def __getattr__(self, name):
+        command = getattr(self.client, name)
+
+        async def _command(*args, **kwargs):
+            # Yield to the loop like a network round trip would
+            await asyncio.sleep(0)
+            return command(*args, **kwargs)
+
+        return _command
+
+
+@pytest.fixture
+def fake_redis():
+    """In-memory Redis client (see FakeRedis).
+
+    Test modules override this fixture to patch it into the module under test.
+    """
+    return FakeRedis()
+
+
+@pytest.fixture
+def fake_async_redis(fake_redis):
+    """asyncio client over the same data as fake_redis."""
+    return FakeAsyncRedis(fake_redis)
@@ -0,0 +1,120 @@
+"""Tests for pooled model clients.
+
+Tests cover:
+- get_model builds each (provider, model) once and reuses it
+- Model providers share the pooled async HTTP transport
+- Connections are kept alive and reused across requests (sync and async transports)
+- The async client works from successive asyncio.run() loops
+- A loop's connection pool is closed and released when asyncio.run() returns
+- Pool stats on the ops API
+"""
+
+import asyncio
+import gc
+import threading
+import weakref
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from app.internal.ops.router import get_llm_client_pool_stats
+from app.services.llm import client_pool
+from app.services.llm.model import get_model
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = b"ok"
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_args):
+        pass
+
+
+@pytest.fixture
+def server_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture(autouse=True)
+def _fresh_pool(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    client_pool.reset_client_pool()
+    yield
+    client_pool.reset_client_pool()
+
+
+def test_get_model_reuses_one_instance_per_model():
+    first = get_model("openai", "gpt-4o-mini")
+    second = get_model("openai", "gpt-4o-mini")
+    other = get_model("openai", "gpt-4o")
+
+    assert first is second
+    assert other is not first
+    assert first.wrapped.wrapped.client._client is client_pool.get_async_http_client()
+    assert client_pool.get_client_pool_stats()["models"] == {"cached": 2, "built": 2, "reused": 1, "reuse_rate": 0.333}
+
+
+def test_sync_transport_reuses_connections(server_url):
+    client = client_pool.get_sync_http_client()
+
+    for _ in range(3):
+        assert client.get(server_url).text == "ok"
+
+    stats = client_pool.get_client_pool_stats()["transports"]["sync"]
+    assert (stats["requests"], stats["connections_opened"]) == (3, 1)
+    assert stats["connection_reuse_rate"] == 0.667
+    assert (stats["open_connections"], stats["idle_connections"]) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_async_transport_reuses_connections_and_reports_on_ops_api(server_url):
+    client = client_pool.get_async_http_client()
+
+    for _ in range(4):
+        assert (await client.get(server_url)).text == "ok"
+
+    stats = await get_llm_client_pool_stats()
+    assert stats.transports["async"].requests == 4
+    assert stats.transports["async"].connections_opened == 1
+    assert stats.transports["async"].connection_reuse_rate == 0.75
+    await client.aclose()
+
+
+def test_async_client_is_usable_from_successive_event_loops(server_url):
+    client = client_pool.get_async_http_client()
+
+    async def _get() -> str:
+        return (await client.get(server_url)).text
+
+    # Each asyncio.run() closes its loop; a shared pool would fail with "Event loop is closed"
+    assert [asyncio.run(_get()) for _ in range(3)] == ["ok"] * 3
+    stats = client_pool.get_client_pool_stats()["transports"]["async"]
+    assert (stats["requests"], stats["connections_opened"]) == (3, 3)
+
+
+def test_loop_pool_is_released_after_asyncio_run(server_url):
+    client = client_pool.get_async_http_client()
+    loops: list[weakref.ref] = []
+
+    async def _get() -> str:
+        loops.append(weakref.ref(asyncio.get_running_loop()))
+        return (await client.get(server_url)).text
+
+    assert asyncio.run(_get()) == "ok"
+    gc.collect()
+
+    assert client._transport.pools() == []
+    assert loops[0]() is None
+    stats = client_pool.get_client_pool_stats()["transports"]["async"]
+    assert (stats["connections_opened"], stats["open_connections"]) == (1, 0)
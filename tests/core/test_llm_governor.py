@@ -0,0 +1,140 @@
+"""Tests for the process-wide LLM concurrency governor.
+
+Tests cover:
+- Freed slots go to the highest-priority lane first (FIFO within a lane)
+- A 429 halves the limit; decreases respect the cooldown
+- Successes grow the limit additively up to the ceiling
+- Slow requests shrink the limit
+- A cancelled waiter does not leak its slot
+- Per-lane queue depth and wait metrics
+- get_model() requests go through the governor
+"""
+
+import asyncio
+
+import pytest
+from pydantic_ai.exceptions import ModelHTTPError
+from pydantic_ai.models import ModelRequestParameters
+from pydantic_ai.models.test import TestModel
+
+from app.services.llm import governor as gov
+from app.services.llm.governor import BACKGROUND, INTERACTIVE, PLAN, LLMGovernor, llm_priority
+from app.services.llm.model import GovernedModel
+
+
+def _governor(limit: float = 1, **overrides) -> LLMGovernor:
+    params = {
+        "initial_limit": limit,
+        "min_limit": 1,
+        "max_limit": 10,
+        "target_latency_seconds": 60.0,
+        "cooldown_seconds": 0.0,
+    }
+    params.update(overrides)
+    return LLMGovernor(**params)
+
+
+@pytest.mark.asyncio
+async def test_freed_slots_go_to_highest_priority_lane():
+    governor = _governor(limit=1)
+    order: list[str] = []
+    release = asyncio.Event()
+
+    async def _request(name: str, lane: str) -> None:
+        async with governor.slot(lane):
+            order.append(name)
+            if name == "holder":
+                await release.wait()
+
+    holder = asyncio.create_task(_request("holder", INTERACTIVE))
+    await asyncio.sleep(0)
+    waiters = [
+        asyncio.create_task(_request(name, lane))
+        for name, lane in [("bg1", BACKGROUND), ("plan1", PLAN), ("chat1", INTERACTIVE), ("bg2", BACKGROUND), ("chat2", INTERACTIVE)]
+    ]
+    await asyncio.sleep(0.01)
+
+    stats = governor.stats()
+    assert stats["in_flight"] == 1
+    assert {lane: s["queue_depth"] for lane, s in stats["lanes"].items()} == {INTERACTIVE: 2, PLAN: 1, BACKGROUND: 2}
+
+    # Keep the limit at 1 so grants happen one by one
+    governor.max_limit = 1
+    release.set()
+    await asyncio.gather(holder, *waiters)
+
+    assert order == ["holder", "chat1", "chat2", "plan1", "bg1", "bg2"]
+    stats = governor.stats()
+    assert stats["lanes"][BACKGROUND]["granted"] == 2
+    assert stats["lanes"][BACKGROUND]["max_wait_ms"] > 0
+    assert stats["lanes"][BACKGROUND]["queue_depth"] == 0
+
+
+@pytest.mark.asyncio
+async def test_throttle_halves_limit_once_per_cooldown():
+    governor = _governor(limit=8, cooldown_seconds=60.0)
+
+    for _ in range(3):
+        with pytest.raises(ModelHTTPError):
+            async with governor.slot(INTERACTIVE):
+                raise ModelHTTPError(status_code=429, model_name="gpt-4o-mini")
+
+    stats = governor.stats()
+    assert stats["limit"] == 4
+    assert stats["throttled"] == 3
+
+
+@pytest.mark.asyncio
+async def test_success_grows_limit_additively_up_to_max():
+    governor = _governor(limit=2, max_limit=3)
+
+    for _ in range(2):
+        async with governor.slot(INTERACTIVE):
+            pass
+    assert governor.limit == pytest.approx(2 + 1 / 2 + 1 / 2.5)
+
+    for _ in range(20):
+        async with governor.slot(INTERACTIVE):
+            pass
+    assert governor.limit == 3
+
+
+def test_slow_request_shrinks_limit():
+    governor = _governor(limit=10, target_latency_seconds=1.0)
+    governor.in_flight = 1
+
+    governor.release(latency_seconds=5.0)
+
+    assert governor.limit == pytest.approx(9)
+    assert governor.stats()["slow"] == 1
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_leak_slot():
+    governor = _governor(limit=1)
+    await governor.acquire(INTERACTIVE)
+    waiter = asyncio.create_task(governor.acquire(BACKGROUND))
+    await asyncio.sleep(0)
+
+    # Grant and cancel in the same loop iteration
+    governor.release(0.1)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    assert governor.stats()["in_flight"] == 0
+    await asyncio.wait_for(governor.acquire(PLAN), timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_get_model_requests_go_through_governor(monkeypatch):
+    governor = _governor(limit=4)
+    monkeypatch.setattr(gov, "_governor", governor)
+    model = GovernedModel(TestModel())
+
+    with llm_priority(PLAN):
+        await model.request([], None, ModelRequestParameters())
+
+    stats = governor.stats()
+    assert stats["lanes"][PLAN]["granted"] == 1
+    assert stats["in_flight"] == 0
@@ -0,0 +1,150 @@
+"""Tests for hedged LLM requests under latency budgets.
+
+Tests cover:
+- A fast primary response is used without hedging
+- A slow primary is hedged after the hedge delay; the first result wins and the other is cancelled
+- A failing primary is hedged immediately
+- A spent budget cancels outstanding requests and raises LLMBudgetExceededError
+- The hedge delay follows the observed p95 once enough samples exist
+- Time queued in the LLM governor neither triggers a hedge nor spends the budget
+- Background-lane calls are neither hedged nor limited by the budget
+- Session text falls back to deterministic text when the budget is spent, also during plan creation
+"""
+
+import asyncio
+
+import pytest
+
+from app.domains.training_plan import session_text_generator as generator
+from app.domains.training_plan.enums import DayType
+from app.domains.training_plan.models import PlannedSession, SessionTemplate
+from app.services.llm import hedging
+from app.services.llm.governor import BACKGROUND, llm_priority
+from app.services.llm.hedging import LatencyBudget, LLMBudgetExceededError, hedged
+
+
+@pytest.fixture(autouse=True)
+def _fast_budget(monkeypatch):
+    hedging.reset_hedging_stats()
+    monkeypatch.setitem(hedging.LATENCY_BUDGETS, "test", LatencyBudget(hedge_after_seconds=0.05, total_seconds=0.5))
+    monkeypatch.setattr(hedging, "MIN_HEDGE_DELAY_SECONDS", 0.0)
+    monkeypatch.setattr(hedging, "_get_hedge_model", lambda _primary: "hedge")
+    yield
+    hedging.reset_hedging_stats()
+
+
+class _Calls:
+    """Fake model requests: delay and outcome per model."""
+
+    def __init__(self, **behaviour):
+        self.behaviour = behaviour
+        self.started: list[str] = []
+        self.cancelled: list[str] = []
+
+    async def run(self, model: str) -> str:
+        self.started.append(model)
+        delay, outcome = self.behaviour[model]
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.cancelled.append(model)
+            raise
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+@pytest.mark.asyncio
+async def test_fast_primary_is_not_hedged():
+    calls = _Calls(primary=(0.0, "primary result"))
+
+    assert await hedged("test", calls.run, "primary") == "primary result"
+    assert calls.started == ["primary"]
+    assert hedging.get_hedging_stats()["test"]["hedged"] == 0
+
+
+@pytest.mark.asyncio
+async def test_slow_primary_is_hedged_and_cancelled():
+    calls = _Calls(primary=(5.0, "primary result"), hedge=(0.01, "hedge result"))
+
+    assert await hedged("test", calls.run, "primary") == "hedge result"
+    assert calls.started == ["primary", "hedge"]
+    assert calls.cancelled == ["primary"]
+    stats = hedging.get_hedging_stats()["test"]
+    assert (stats["hedged"], stats["hedge_wins"]) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_failed_primary_is_hedged_immediately():
+    calls = _Calls(primary=(0.0, ValueError("invalid output")), hedge=(0.0, "hedge result"))
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+
+    assert await hedged("test", calls.run, "primary") == "hedge result"
+    assert loop.time() - started < 0.05
+
+
+@pytest.mark.asyncio
+async def test_spent_budget_raises_and_cancels_both_requests():
+    calls = _Calls(primary=(5.0, "primary result"), hedge=(5.0, "hedge result"))
+
+    with pytest.raises(LLMBudgetExceededError):
+        await hedged("test", calls.run, "primary")
+
+    assert sorted(calls.cancelled) == ["hedge", "primary"]
+    assert hedging.get_hedging_stats()["test"]["budget_exceeded"] == 1
+
+
+@pytest.mark.asyncio
+async def test_governor_queue_time_is_not_timed():
+    calls = _Calls(primary=(0.01, "primary result"), hedge=(0.0, "hedge result"))
+
+    async def _queued_run(model: str) -> str:
+        hedging.mark_queued()
+        await asyncio.sleep(0.6)  # Longer than the hedge delay and the whole budget
+        hedging.mark_admitted()
+        return await calls.run(model)
+
+    assert await hedged("test", _queued_run, "primary") == "primary result"
+    assert calls.started == ["primary"]
+    assert hedging._latencies["test"][0] < 0.3
+
+
+@pytest.mark.asyncio
+async def test_background_lane_is_not_hedged():
+    calls = _Calls(primary=(0.6, "primary result"), hedge=(0.0, "hedge result"))
+
+    with llm_priority(BACKGROUND):
+        assert await hedged("test", calls.run, "primary") == "primary result"
+
+    assert calls.started == ["primary"]
+    assert "test" not in hedging.get_hedging_stats()
+
+
+def test_hedge_delay_follows_observed_p95():
+    assert hedging.hedge_delay("test") == 0.05
+
+    for i in range(1, 21):
+        hedging._record_latency("test", i / 100)
+
+    assert hedging.observed_p95("test") == 0.19
+    assert hedging.hedge_delay("test") == 0.19
+
+
+@pytest.mark.asyncio
+async def test_session_text_falls_back_when_budget_is_spent(monkeypatch):
+    async def _over_budget(*_args, **_kwargs):
+        raise LLMBudgetExceededError("session_text: no LLM result within 45s budget")
+
+    monkeypatch.setattr(generator, "generate_session_text_llm", _over_budget)
+    monkeypatch.setattr(generator, "_get_cached_output", lambda _key: None)
+    monkeypatch.setattr(generator, "_set_cached_output", lambda _key, _output: None)
+    template = SessionTemplate(
+        template_id="easy_v1", description_key="easy", kind="easy_continuous", params={}, constraints={}, tags=[]
+    )
+    session = PlannedSession(day_index=0, day_type=DayType.EASY, distance=5.0, template=template)
+    context = {"philosophy_id": "daniels", "race_distance": "marathon", "phase": "build", "week_index": 3, "is_plan_creation": True}
+
+    output = await generator.generate_session_text(session, context)
+
+    assert output.computed["generated_by"] == "fallback"
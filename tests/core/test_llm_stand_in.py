@@ -0,0 +1,97 @@
+"""Tests for the local OpenAI-compatible LLM stand-in.
+
+Tests cover:
+- Agents get schema-valid synthetic outputs (also for validator-heavy output types)
+- Streamed text responses
+- Recorded responses are replayed by prompt hash
+- Injected errors use OpenAI's error format
+- Embeddings are deterministic unit vectors with usage
+"""
+
+import json
+import math
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+from openai import OpenAI
+from pydantic_ai import Agent
+from pydantic_ai.models.openai import OpenAIModel
+from pydantic_ai.providers.openai import OpenAIProvider
+
+from app.coach.schemas.intent_schemas import DailyDecision
+from app.coach.schemas.orchestrator_response import OrchestratorAgentResponse
+from app.services.llm.stand_in import LatencyProfile, StandInConfig, create_stand_in_app, prompt_hash
+
+INSTANT = LatencyProfile(median_ms=0.0, p95_ms=0.0)
+
+
+def _model(app) -> OpenAIModel:
+    client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://stand-in/v1")
+    return OpenAIModel("gpt-4o-mini", provider=OpenAIProvider(base_url="http://stand-in/v1", api_key="sk-test", http_client=client))
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("output_type", "field", "expected"),
+    [(DailyDecision, "recommendation", "easy"), (OrchestratorAgentResponse, "action", "NO_ACTION")],
+)
+async def test_agents_get_schema_valid_synthetic_output(output_type, field, expected):
+    app = create_stand_in_app(StandInConfig(latency=INSTANT))
+
+    result = await Agent(_model(app), output_type=output_type).run("How should I run today?")
+
+    assert isinstance(result.output, output_type)
+    assert getattr(result.output, field) == expected
+    assert result.usage().input_tokens > 0
+
+
+@pytest.mark.asyncio
+async def test_streamed_text_response():
+    app = create_stand_in_app(StandInConfig(latency=INSTANT))
+
+    async with Agent(_model(app)).run_stream("hello") as result:
+        output = await result.get_output()
+
+    assert output.startswith("Synthetic stand-in reply")
+
+
+def test_recorded_response_is_replayed(tmp_path):
+    body = {"model": "gpt-4o", "messages": [{"role": "user", "content": "How should I run today?"}]}
+    recording = {
+        "message": {"role": "assistant", "content": "Recorded answer"},
+        "usage": {"prompt_tokens": 12, "completion_tokens": 3, "total_tokens": 15},
+    }
+    (tmp_path / f"{prompt_hash(body)}.json").write_text(json.dumps(recording))
+    client = TestClient(create_stand_in_app(StandInConfig(recordings_dir=tmp_path, latency=INSTANT)))
+
+    # Another model replays the same recording
+    response = client.post("/v1/chat/completions", json={**body, "model": "gpt-4o-mini"}).json()
+
+    assert response["choices"][0]["message"]["content"] == "Recorded answer"
+    assert response["usage"]["prompt_tokens"] == 12
+    assert client.get("/stand-in/stats").json()["replayed"] == 1
+
+
+def test_injected_errors_use_openai_error_format():
+    client = TestClient(create_stand_in_app(StandInConfig(latency=INSTANT, error_rate=1.0, throttle_share=1.0, seed=1)))
+
+    response = client.post("/v1/chat/completions", json={"model": "gpt-4o", "messages": [{"role": "user", "content": "hi"}]})
+
+    assert response.status_code == 429
+    assert response.json()["error"]["type"] == "rate_limit_exceeded"
+    assert client.get("/stand-in/stats").json()["errors"] == 1
+
+
+def test_embeddings_are_deterministic_unit_vectors():
+    test_client = TestClient(create_stand_in_app(StandInConfig(latency=INSTANT)))
+    client = OpenAI(api_key="sk-test", base_url="http://testserver/v1", http_client=test_client)
+
+    first = client.embeddings.create(model="text-embedding-3-small", input=["easy run", "tempo run"])
+    again = client.embeddings.create(model="text-embedding-3-small", input="easy run")
+
+    assert len(first.data[0].embedding) == 1536
+    assert first.data[0].embedding == again.data[0].embedding
+    assert first.data[0].embedding != first.data[1].embedding
+    assert math.isclose(sum(value * value for value in first.data[0].embedding), 1.0, rel_tol=1e-6)
+    assert first.usage.prompt_tokens > 0
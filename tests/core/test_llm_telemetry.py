@@ -0,0 +1,122 @@
+"""Tests for LLM call telemetry.
+
+Tests cover:
+- Histogram percentiles stay within the bucket precision
+- Model requests record tokens, cost and latency under the active call site
+- Extra requests within one call site scope count as retries
+- Unmarked requests are labeled by their output type
+- Failed requests and cache hits are counted
+- Telemetry on the AI ops API and as a JSON dump
+"""
+
+import json
+
+import pytest
+from pydantic import BaseModel
+from pydantic_ai import Agent
+from pydantic_ai.messages import ModelResponse, TextPart, ToolCallPart
+from pydantic_ai.models.function import AgentInfo, FunctionModel
+from pydantic_ai.usage import RequestUsage
+
+from app.internal.ai_ops.router import get_llm_telemetry as get_llm_telemetry_endpoint
+from app.services.llm import telemetry
+from app.services.llm.model import InstrumentedModel
+from app.services.llm.telemetry import Histogram, llm_call_site
+
+
+class Verdict(BaseModel):
+    ok: bool
+
+
+@pytest.fixture(autouse=True)
+def _fresh_telemetry():
+    telemetry.reset_llm_telemetry()
+    yield
+    telemetry.reset_llm_telemetry()
+
+
+def _model(responses: list[ModelResponse]) -> InstrumentedModel:
+    def respond(_messages, _info: AgentInfo) -> ModelResponse:
+        return responses.pop(0)
+
+    return InstrumentedModel(FunctionModel(respond, model_name="gpt-4o-mini"))
+
+
+def _verdict(args: str, input_tokens: int = 1000, output_tokens: int = 200) -> ModelResponse:
+    return ModelResponse(
+        parts=[ToolCallPart(tool_name="final_result", args=args)],
+        usage=RequestUsage(input_tokens=input_tokens, output_tokens=output_tokens, cache_read_tokens=400),
+    )
+
+
+def _site(call_site: str) -> dict:
+    return next(site for site in telemetry.get_llm_telemetry()["call_sites"] if site["call_site"] == call_site)
+
+
+def test_histogram_percentiles_within_bucket_precision():
+    histogram = Histogram()
+    for value in range(1, 1001):
+        histogram.record(value)
+
+    for q, expected in ((50, 500), (90, 900), (99, 990)):
+        assert abs(histogram.percentile(q) - expected) / expected <= 1 / 16
+    assert histogram.percentile(100) == 1000
+
+
+@pytest.mark.asyncio
+async def test_request_records_tokens_cost_and_latency_under_call_site():
+    agent = Agent(_model([_verdict('{"ok": true}')]), output_type=Verdict)
+
+    with llm_call_site("coach.test"):
+        await agent.run("check")
+
+    site = _site("coach.test")
+    assert (site["model"], site["requests"], site["retries"]) == ("gpt-4o-mini", 1, 0)
+    assert (site["input_tokens"], site["output_tokens"], site["cache_read_tokens"]) == (1000, 200, 400)
+    # 600 uncached prompt, 400 cached prompt and 200 completion tokens
+    assert site["cost_usd"] == pytest.approx((600 * 0.15 + 400 * 0.075 + 200 * 0.60) / 1_000_000)
+    assert site["latency_ms"]["count"] == 1
+    assert site["tokens_per_request"]["max"] == 1200
+
+
+@pytest.mark.asyncio
+async def test_output_retry_counts_as_retry_and_unmarked_calls_use_output_label():
+    agent = Agent(_model([_verdict('{"ok": "maybe"}'), _verdict('{"ok": false}')]), output_type=Verdict)
+    with llm_call_site("coach.test"):
+        await agent.run("check")
+
+    plain = Agent(_model([ModelResponse(parts=[TextPart("hi")], usage=RequestUsage(input_tokens=5, output_tokens=1))]))
+    await plain.run("hello")
+
+    assert (_site("coach.test")["requests"], _site("coach.test")["retries"]) == (2, 1)
+    assert _site("text")["input_tokens"] == 5
+
+
+@pytest.mark.asyncio
+async def test_failed_requests_and_cache_hits_are_counted():
+    def fail(_messages, _info):
+        raise RuntimeError("provider down")
+
+    agent = Agent(InstrumentedModel(FunctionModel(fail, model_name="gpt-4o")), output_type=Verdict)
+    with pytest.raises(RuntimeError):
+        await agent.run("check")
+    telemetry.record_cache_hit("output:Verdict", "gpt-4o")
+
+    site = _site("output:Verdict")
+    assert (site["requests"], site["errors"], site["cache_hits"]) == (1, 1, 1)
+
+
+@pytest.mark.asyncio
+async def test_telemetry_on_ai_ops_api_and_as_json_dump(tmp_path):
+    telemetry.record_llm_call("text-embedding-3-small", 0.05, call_site="embeddings", input_tokens=100_000)
+    telemetry.record_llm_call("gpt-4o", 2.0, call_site="coach.daily_decision", input_tokens=1000, output_tokens=500)
+
+    stats = await get_llm_telemetry_endpoint()
+    assert stats.total_requests == 2
+    # Most expensive call site first
+    assert [site.call_site for site in stats.call_sites] == ["coach.daily_decision", "embeddings"]
+    assert stats.call_sites[1].cost_usd == pytest.approx(0.002)
+    assert stats.call_sites[0].latency_ms.max == 2000.0
+
+    dumped = json.loads(telemetry.dump_llm_telemetry(tmp_path / "telemetry.json").read_text())
+    assert dumped["total_cost_usd"] == stats.total_cost_usd
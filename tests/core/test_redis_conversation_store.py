@@ -0,0 +1,102 @@
+"""Tests for the Redis conversation store write path.
+
+Tests cover:
+- Compact entries round-trip to identical Message objects
+- Legacy JSON-object entries are still readable
+- Append, trim and TTL refresh go out in one pipelined transaction
+- Compaction replaces history in one transaction
+- The running token total follows appends, evictions and compaction
+- Modules share one Redis client
+"""
+
+import json
+
+import pytest
+
+from app.core import redis_conversation_store as store
+from app.core import redis_pool
+from app.core.message import Message
+
+
+@pytest.fixture
+def fake_redis(fake_redis, monkeypatch):
+    monkeypatch.setattr(store, "_get_redis_client", lambda: fake_redis)
+    return fake_redis
+
+
+def _message(i: int, metadata: dict[str, str] | None = None) -> Message:
+    return Message(
+        conversation_id="c_1",
+        user_id="u1",
+        role="user" if i % 2 == 0 else "assistant",
+        content=f"message {i} - ünïcode",
+        ts=f"2026-01-01T00:00:{i:02d}+00:00",
+        tokens=i + 1,
+        metadata=metadata or {},
+    )
+
+
+def test_compact_entry_round_trip():
+    message = _message(3, {"source": "chat"})
+
+    encoded = store._serialize_message(message)
+
+    assert json.loads(encoded)[0] == "m1"
+    assert store._deserialize_message(encoded, "c_1") == message
+
+
+def test_legacy_entry_still_readable():
+    message = _message(1)
+
+    assert store._deserialize_message(json.dumps(message.model_dump())) == message
+
+
+def test_write_message_is_one_pipelined_transaction(fake_redis, monkeypatch):
+    monkeypatch.setattr(store, "MAX_CONVERSATION_MESSAGES", 3)
+
+    for i in range(5):
+        store.write_message(_message(i))
+
+    assert fake_redis.executions == [["lindex", "rpush", "ltrim", "incrby", "expire", "expire"]] * 5
+    assert fake_redis.ttls["conversation:c_1:messages"] == store.CONVERSATION_TTL_SECONDS
+    assert [m.content for m in store.get_recent_messages("c_1", limit=10)] == [_message(i).content for i in (2, 3, 4)]
+
+
+def test_replace_messages(fake_redis):
+    for i in range(4):
+        store.write_message(_message(i))
+    fake_redis.executions.clear()
+
+    store.replace_messages("c_1", [_message(2), _message(3)])
+
+    assert fake_redis.executions == [["delete", "rpush", "set", "expire"]]
+    assert store.get_recent_messages("c_1") == [_message(2), _message(3)]
+    assert store.get_conversation_tokens("c_1") == 3 + 4
+
+
+def test_token_total_tracks_sliding_window(fake_redis, monkeypatch):
+    monkeypatch.setattr(store, "MAX_CONVERSATION_MESSAGES", 3)
+
+    for i in range(6):
+        store.write_message(_message(i))
+
+    # Messages 3, 4, 5 remain (tokens = i + 1)
+    assert store.get_conversation_tokens("c_1") == 4 + 5 + 6
+
+
+def test_token_total_rebuilt_for_legacy_history(fake_redis):
+    key = "conversation:c_1:messages"
+    fake_redis.lists[key] = [json.dumps(_message(0).model_dump()), json.dumps(_message(1).model_dump())]
+    fake_redis.ttls[key] = 100
+
+    # An append onto history without a counter must not leave a partial total behind
+    store.write_message(_message(2))
+    assert "conversation:c_1:tokens" not in fake_redis.values
+
+    assert store.get_conversation_tokens("c_1") == 1 + 2 + 3
+    assert fake_redis.values["conversation:c_1:tokens"] == "6"
+
+
+def test_shared_client_is_reused():
+    assert store._get_redis_client() is redis_pool.get_redis()
+    assert redis_pool.get_redis() is redis_pool.get_redis()
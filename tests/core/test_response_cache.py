@@ -0,0 +1,112 @@
+"""Tests for per-user data versions, ETags and the response cache.
+
+Tests cover:
+- 200 with ETag, then 304 for a matching If-None-Match without rebuilding
+- Cached body served while the data version is unchanged
+- Version bumps (explicit and from committed ORM writes) change the ETag
+- Background writes of materialized calendar rows bump the version too
+- Redis outages degrade to uncached responses
+"""
+
+from datetime import date, datetime, timezone
+
+import pytest
+from fastapi import Depends, FastAPI, Request
+from fastapi.testclient import TestClient
+
+from app.core import data_version, response_cache
+from app.db.models import Activity, CalendarWeekSummary
+
+
+@pytest.fixture
+def fake_redis(fake_redis, monkeypatch):
+    monkeypatch.setattr(data_version, "_get_redis_client", lambda: fake_redis)
+    monkeypatch.setattr(response_cache, "_get_redis_client", lambda: fake_redis)
+    # Keep the time bucket fixed for the duration of a test
+    monkeypatch.setattr(response_cache, "ETAG_TIME_BUCKET_SECONDS", 10**9)
+    return fake_redis
+
+
+@pytest.fixture
+def app_client():
+    calls = {"count": 0}
+    app = FastAPI()
+
+    def _user_id() -> str:
+        return "user-1"
+
+    @app.get("/poll")
+    def poll(request: Request, days: int = 7, user_id: str = Depends(_user_id)):
+        probe = response_cache.probe_response(request, user_id, "test.poll", {"days": days})
+        if (cached := probe.cached()) is not None:
+            return cached
+        calls["count"] += 1
+        return probe.respond({"days": days, "build": calls["count"]})
+
+    return TestClient(app), calls
+
+
+def test_etag_then_304_without_rebuilding(fake_redis, app_client):
+    client, calls = app_client
+
+    first = client.get("/poll")
+    etag = first.headers["etag"]
+    second = client.get("/poll", headers={"If-None-Match": etag})
+
+    assert first.status_code == 200
+    assert first.json() == {"days": 7, "build": 1}
+    assert second.status_code == 304
+    assert second.headers["etag"] == etag
+    assert calls["count"] == 1
+
+
+def test_cached_body_until_version_bump(fake_redis, app_client):
+    client, calls = app_client
+
+    first = client.get("/poll")
+    cached = client.get("/poll")
+    other_params = client.get("/poll", params={"days": 30})
+    data_version.bump_data_version(["user-1"])
+    fresh = client.get("/poll")
+
+    assert cached.json() == first.json()
+    assert cached.headers["etag"] == first.headers["etag"]
+    assert other_params.headers["etag"] != first.headers["etag"]
+    assert fresh.headers["etag"] != first.headers["etag"]
+    assert fresh.json()["build"] == 3
+    assert calls["count"] == 3
+
+
+def test_redis_down_serves_uncached(fake_redis, app_client):
+    client, calls = app_client
+    fake_redis.down = True
+
+    response = client.get("/poll", headers={"If-None-Match": "*"})
+
+    assert response.status_code == 200
+    assert "etag" not in response.headers
+    assert calls["count"] == 1
+
+
+def test_committed_writes_bump_owner_version(fake_redis, db_session):
+    db_session.add(
+        Activity(
+            user_id="user-7",
+            sport="run",
+            starts_at=datetime(2024, 3, 5, 7, 0, tzinfo=timezone.utc),
+            duration_seconds=1800,
+        )
+    )
+    data_version._collect_changed(db_session, None)
+    data_version._bump_changed(db_session)
+
+    assert data_version.get_data_version("user-7") == 1
+    assert data_version.get_data_version("user-8") == 0
+
+
+def test_materialized_calendar_rows_bump_owner_version(fake_redis, db_session):
+    db_session.add(CalendarWeekSummary(user_id="user-7", week_start=date(2024, 3, 4)))
+    data_version._collect_changed(db_session, None)
+    data_version._bump_changed(db_session)
+
+    assert data_version.get_data_version("user-7") == 1
@@ -0,0 +1,102 @@
+"""Tests for the background conversation summarization queue.
+
+Tests cover:
+- Enqueueing a pending conversation is deduplicated
+- A worker pass summarizes due conversations with bounded concurrency and persists them
+- Failures are retried, then dropped after the attempt limit
+- In-process fallback when Redis is unavailable
+"""
+
+import asyncio
+
+import pytest
+
+from app.core import summarization_queue
+
+
+@pytest.fixture
+def queue(fake_redis, monkeypatch):
+    monkeypatch.setattr(summarization_queue, "_get_redis_client", lambda: fake_redis)
+    monkeypatch.setattr(summarization_queue, "SUMMARY_QUEUE_DEBOUNCE_SECONDS", 0)
+    monkeypatch.setattr(summarization_queue, "SUMMARY_RETRY_DELAY_SECONDS", 0)
+    monkeypatch.setattr(summarization_queue, "_local_queue", {})
+    monkeypatch.setattr(summarization_queue, "_local_attempts", {})
+    saved: list[str] = []
+    monkeypatch.setattr(summarization_queue, "save_conversation_summary", lambda cid, _summary: saved.append(cid))
+    return fake_redis, saved
+
+
+def test_enqueue_is_deduplicated(queue):
+    summarization_queue.enqueue_conversation_summary("c_1")
+    summarization_queue.enqueue_conversation_summary("c_1")
+    summarization_queue.enqueue_conversation_summary("c_2")
+
+    assert summarization_queue.get_queue_depth() == 2
+
+
+@pytest.mark.asyncio
+async def test_pass_summarizes_with_bounded_concurrency(queue, monkeypatch):
+    _, saved = queue
+    in_flight = 0
+    peak = 0
+
+    async def _summarize(conversation_id):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return {"conversation_id": conversation_id}
+
+    monkeypatch.setattr(summarization_queue, "summarize_conversation", _summarize)
+    for i in range(5):
+        summarization_queue.enqueue_conversation_summary(f"c_{i}")
+
+    stats = await summarization_queue.run_summarization_pass(batch_size=4, concurrency=2)
+
+    assert stats == {"claimed": 4, "succeeded": 4, "failed": 0}
+    assert peak == 2
+    assert sorted(saved) == ["c_0", "c_1", "c_2", "c_3"]
+    assert summarization_queue.get_queue_depth() == 1
+
+
+@pytest.mark.asyncio
+async def test_failures_retry_then_drop(queue, monkeypatch):
+    fake, saved = queue
+    monkeypatch.setattr(summarization_queue, "SUMMARY_MAX_ATTEMPTS", 2)
+
+    async def _fail(_conversation_id):
+        await asyncio.sleep(0)
+        raise RuntimeError("LLM unavailable")
+
+    monkeypatch.setattr(summarization_queue, "summarize_conversation", _fail)
+    summarization_queue.enqueue_conversation_summary("c_1")
+
+    first = await summarization_queue.run_summarization_pass()
+    assert first["failed"] == 1
+    assert summarization_queue.get_queue_depth() == 1
+
+    second = await summarization_queue.run_summarization_pass()
+    assert second["failed"] == 1
+    assert summarization_queue.get_queue_depth() == 0
+    assert fake.hashes[summarization_queue.ATTEMPTS_KEY] == {}
+    assert saved == []
+
+
+@pytest.mark.asyncio
+async def test_in_process_fallback_when_redis_down(queue, monkeypatch):
+    fake, saved = queue
+    fake.down = True
+
+    async def _summarize(conversation_id):
+        await asyncio.sleep(0)
+        return {"conversation_id": conversation_id}
+
+    monkeypatch.setattr(summarization_queue, "summarize_conversation", _summarize)
+    summarization_queue.enqueue_conversation_summary("c_1")
+    summarization_queue.enqueue_conversation_summary("c_1")
+
+    assert summarization_queue.get_queue_depth() == 1
+    stats = await summarization_queue.run_summarization_pass()
+    assert stats["succeeded"] == 1
+    assert saved == ["c_1"]
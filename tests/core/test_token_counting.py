@@ -0,0 +1,81 @@
+"""Tests for incremental token accounting.
+
+Tests cover:
+- Counts are memoized per distinct message
+- Batch counting matches count_tokens and encodes only uncached messages
+- The token guard uses stored counts and truncates oldest-first
+"""
+
+from collections import OrderedDict
+
+import pytest
+
+from app.core import token_counting, token_guard
+
+
+class _WordEncoding:
+    """tiktoken stand-in: one token per whitespace-separated word."""
+
+    def __init__(self):
+        self.encoded: list[str] = []
+
+    def encode(self, text):
+        self.encoded.append(text)
+        return text.split()
+
+    def encode_batch(self, texts):
+        return [self.encode(text) for text in texts]
+
+
+@pytest.fixture
+def encoding(monkeypatch):
+    fake = _WordEncoding()
+    monkeypatch.setattr(token_counting, "_get_encoding", lambda: fake)
+    monkeypatch.setattr(token_counting, "_count_cache", OrderedDict())
+    return fake
+
+
+def test_count_tokens_is_memoized(encoding):
+    first = token_counting.count_tokens("user", "how far today", "c_1", "u1")
+    second = token_counting.count_tokens("user", "how far today", "c_1", "u1")
+
+    assert first == second == 4
+    assert len(encoding.encoded) == 1
+
+
+def test_batch_matches_single_counts(encoding):
+    token_counting.count_tokens("user", "already seen", "c_1", "u1")
+    encoding.encoded.clear()
+
+    counts = token_counting.count_tokens_batch(
+        [("user", "already seen"), ("assistant", "run easy 5k"), ("user", "ok"), ("assistant", "run easy 5k")],
+        conversation_id="c_1",
+        user_id="u1",
+    )
+
+    assert counts == [3, 4, 2, 4]
+    assert sorted(encoding.encoded) == ["assistant\nrun easy 5k", "user\nok"]
+
+
+def test_batch_enforces_ceiling(encoding, monkeypatch):
+    monkeypatch.setattr(token_counting, "MAX_TOKENS_PER_MESSAGE", 3)
+
+    with pytest.raises(ValueError, match="exceeds maximum"):
+        token_counting.count_tokens_batch([("user", "one two three four")], "c_1", "u1")
+
+
+def test_guard_uses_stored_counts_and_truncates_oldest_first(encoding):
+    messages = [
+        {"role": "system", "content": "be a coach"},
+        {"role": "user", "content": "old question", "tokens": 40},
+        {"role": "assistant", "content": "old answer", "tokens": 3},
+        {"role": "user", "content": "recent question", "tokens": 5},
+        {"role": "user", "content": "what now"},
+    ]
+
+    final, meta = token_guard.enforce_token_limit(messages, "c_1", "u1", max_prompt_tokens=20)
+
+    assert [m["content"] for m in final] == ["be a coach", "old answer", "recent question", "what now"]
+    assert meta == {"truncated": True, "removed_count": 1, "final_tokens": 4 + 3 + 5 + 3, "original_tokens": 55}
+    # Only the messages without stored counts were encoded
+    assert sorted(encoding.encoded) == ["system\nbe a coach", "user\nwhat now"]
@@ -0,0 +1,188 @@
+"""Tests for the content-addressed LLM output cache.
+
+Tests cover:
+- Canonical keys (stable under dict ordering, sensitive to prompt/model)
+- Redis and disk tiers, with disk hits promoted to Redis
+- Disk TTL expiry and LRU eviction (the directory is only scanned to evict)
+- Async lookups and writes share both tiers with the sync ones
+- Hit/miss and saved-latency metrics in planner observability
+- Session text generation skipping the LLM on a hit
+- Output of a hedge model not cached under the primary model's key
+"""
+
+import os
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.domains.training_plan.enums import DayType
+from app.domains.training_plan.models import SessionTextInput
+from app.infra.llm import output_cache
+from app.infra.llm import session_text as infra_session_text
+from app.infra.llm.output_cache import LLMOutputCache, content_key
+from app.planner.observability import get_cache_stats, reset_cache_stats
+
+
+@pytest.fixture
+def fake_redis(fake_redis, fake_async_redis, monkeypatch):
+    monkeypatch.setattr(output_cache, "_get_redis_client", lambda: fake_redis)
+    monkeypatch.setattr(output_cache, "_get_async_redis_client", lambda: fake_async_redis)
+    reset_cache_stats()
+    yield fake_redis
+    reset_cache_stats()
+
+
+def _input(**overrides) -> SessionTextInput:
+    values = {
+        "philosophy_id": "daniels",
+        "race_distance": "marathon",
+        "phase": "build",
+        "week_index": 3,
+        "day_type": DayType.QUALITY,
+        "allocated_distance_mi": 8.0,
+        "allocated_duration_min": None,
+        "template_id": "cruise_v1",
+        "template_kind": "cruise_intervals",
+        "params": {"reps": [4, 5], "work_duration_min": 8},
+        "constraints": {"hard_minutes_max": 30},
+    }
+    values.update(overrides)
+    return SessionTextInput(**values)
+
+
+def test_content_key_is_canonical():
+    base = content_key(_input(), "prompt", "gpt-4o-mini")
+
+    assert content_key(_input(params={"work_duration_min": 8, "reps": [4, 5]}), "prompt", "gpt-4o-mini") == base
+    assert content_key(_input(allocated_distance_mi=8), "prompt", "gpt-4o-mini") == base
+    assert content_key(_input(), "prompt v2", "gpt-4o-mini") != base
+    assert content_key(_input(), "prompt", "gpt-4o") != base
+    assert content_key(_input(allocated_distance_mi=8.5), "prompt", "gpt-4o-mini") != base
+
+
+def test_disk_hit_when_redis_down_and_promoted(fake_redis, tmp_path):
+    cache = LLMOutputCache("session_text", disk_dir=tmp_path)
+    fake_redis.down = True
+    cache.set("k1", {"title": "Cruise"}, latency_seconds=2.5)
+
+    assert cache.get("missing") is None
+    assert cache.get("k1") == {"title": "Cruise"}
+
+    fake_redis.down = False
+    assert cache.get("k1") == {"title": "Cruise"}
+    assert "llm_cache:session_text:k1" in fake_redis.values
+    stats = get_cache_stats()["session_text"]
+    assert (stats["hits"], stats["misses"]) == (2, 1)
+    assert stats["saved_seconds"] == pytest.approx(5.0)
+    assert stats["hit_rate"] == pytest.approx(2 / 3)
+
+
+def test_disk_ttl_and_lru_eviction(fake_redis, tmp_path):
+    fake_redis.down = True
+    cache = LLMOutputCache("session_text", disk_dir=tmp_path, ttl_seconds=60, max_disk_entries=2)
+    cache.set("old", {"n": 1})
+    cache.set("recent", {"n": 2})
+    past = time.time() - 30
+    os.utime(tmp_path / "old.json", (past, past))
+    os.utime(tmp_path / "recent.json", (past - 10, past - 10))
+    cache.get("recent")  # touch: "old" is now least recently used
+
+    cache.set("new", {"n": 3})
+
+    assert sorted(p.stem for p in tmp_path.glob("*.json")) == ["new", "recent"]
+    with patch.object(output_cache.time, "time", return_value=time.time() + 120):
+        assert cache.get("recent") is None
+    assert not (tmp_path / "recent.json").exists()
+
+
+def test_disk_writes_scan_directory_only_to_evict(fake_redis, tmp_path, monkeypatch):
+    fake_redis.down = True
+    cache = LLMOutputCache("session_text", disk_dir=tmp_path, max_disk_entries=3)
+    scans = 0
+    real_glob = type(tmp_path).glob
+
+    def counting_glob(path, pattern):
+        nonlocal scans
+        scans += 1
+        return real_glob(path, pattern)
+
+    monkeypatch.setattr(type(tmp_path), "glob", counting_glob)
+    for n in range(3):
+        cache.set(f"k{n}", {"n": n})
+    cache.set("k0", {"n": 0})  # overwrite: not a new entry
+    assert scans == 1
+
+    cache.set("k3", {"n": 3})
+
+    assert scans == 2
+    assert len(list(real_glob(tmp_path, "*.json"))) == 3
+
+
+@pytest.mark.asyncio
+async def test_async_lookups_share_tiers_with_sync_ones(fake_redis, tmp_path):
+    cache = LLMOutputCache("session_text", disk_dir=tmp_path)
+    await cache.aset("k1", {"title": "Cruise"}, latency_seconds=1.5)
+
+    assert cache.get("k1") == {"title": "Cruise"}
+    assert (tmp_path / "k1.json").exists()
+
+    fake_redis.values.clear()
+    assert await cache.aget("k1") == {"title": "Cruise"}
+    assert "llm_cache:session_text:k1" in fake_redis.values
+    assert await cache.aget("missing") is None
+    stats = get_cache_stats()["session_text"]
+    assert (stats["hits"], stats["misses"]) == (2, 1)
+
+
+@pytest.mark.asyncio
+async def test_session_text_hit_skips_llm(fake_redis, tmp_path, monkeypatch):
+    cache = LLMOutputCache("session_text", disk_dir=tmp_path)
+    monkeypatch.setattr(infra_session_text, "_OUTPUT_CACHE", cache)
+    input_data = _input()
+    key = content_key(input_data, infra_session_text._load_prompt(), infra_session_text.USER_FACING_MODEL)
+    cached = {
+        "title": "Cruise Intervals",
+        "description": "4 x 8 min at threshold",
+        "structure": {"warmup_mi": 2.0, "main": [], "cooldown_mi": 1.0},
+        "computed": {"total_distance_mi": 8.0, "hard_minutes": 32, "intensity_minutes": {"T": 32}},
+    }
+    cache.set(key, cached, latency_seconds=4.0)
+
+    with patch.object(infra_session_text, "Agent", side_effect=AssertionError("LLM called")):
+        output = await infra_session_text.generate_session_text_llm(input_data)
+
+    assert output.title == "Cruise Intervals"
+    assert output.computed["hard_minutes"] == 32
+    assert get_cache_stats()["session_text"]["saved_seconds"] == pytest.approx(4.0)
+
+
+@pytest.mark.asyncio
+async def test_session_text_from_hedge_model_is_not_cached(fake_redis, tmp_path, monkeypatch):
+    cache = LLMOutputCache("session_text", disk_dir=tmp_path)
+    monkeypatch.setattr(infra_session_text, "_OUTPUT_CACHE", cache)
+    monkeypatch.setattr(infra_session_text, "validate_llm_output", lambda _input_data, _output: True)
+    primary = SimpleNamespace(model_name=infra_session_text.USER_FACING_MODEL)
+    monkeypatch.setattr(infra_session_text, "get_model", lambda _provider, _name: primary)
+
+    async def _hedge_wins(_call_site, run, _primary):
+        return await run(SimpleNamespace(model_name="hedge-model"))
+
+    monkeypatch.setattr(infra_session_text, "hedged", _hedge_wins)
+    parsed = SimpleNamespace(
+        title="Cruise Intervals",
+        description="4 x 8 min at threshold",
+        structure={"warmup_mi": 2.0, "main": [], "cooldown_mi": 1.0},
+        computed={"total_distance_mi": 8.0, "hard_minutes": 32, "intensity_minutes": {"T": 32}},
+    )
+    agent = MagicMock()
+    agent.run = AsyncMock(return_value=SimpleNamespace(output=parsed))
+    input_data = _input()
+
+    with patch.object(infra_session_text, "Agent", return_value=agent):
+        output = await infra_session_text.generate_session_text_llm(input_data)
+
+    assert output.title == "Cruise Intervals"
+    key = content_key(input_data, infra_session_text._load_prompt(), infra_session_text.USER_FACING_MODEL)
+    assert cache.get(key) is None
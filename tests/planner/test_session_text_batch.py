@@ -0,0 +1,137 @@
+"""Tests for batched (one request per week) session text generation.
+
+Tests cover:
+- One LLM request covers all uncached sessions of a week
+- Each item is validated; invalid or missing items come back as None
+- A failed batch request falls back to per-session generation for every session
+- Only failing sessions are generated individually, in original order
+"""
+
+from types import SimpleNamespace
+from typing import ClassVar
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.domains.training_plan import session_text_generator as generator
+from app.domains.training_plan.enums import DayType
+from app.domains.training_plan.models import PlannedSession, SessionTemplate, SessionTextInput, SessionTextOutput
+from app.domains.training_plan.schemas import SessionTextBatchItemSchema, SessionTextBatchSchema
+from app.infra.llm import session_text as infra_session_text
+
+
+class _MemoryCache:
+    def __init__(self):
+        self.entries: dict[str, dict] = {}
+
+    async def aget(self, key):
+        return self.entries.get(key)
+
+    async def aset(self, key, value, latency_seconds=0.0):
+        self.entries[key] = value
+
+
+class _FakeAgent:
+    """Stand-in for pydantic_ai.Agent returning a canned batch output."""
+
+    runs: ClassVar[list[str]] = []
+    output: ClassVar[SessionTextBatchSchema | Exception | None] = None
+
+    def __init__(self, **_kwargs):
+        pass
+
+    async def run(self, user_message):
+        _FakeAgent.runs.append(user_message)
+        if isinstance(_FakeAgent.output, Exception):
+            raise _FakeAgent.output
+        return SimpleNamespace(output=_FakeAgent.output)
+
+
+@pytest.fixture
+def fake_llm(monkeypatch):
+    _FakeAgent.runs = []
+    _FakeAgent.output = None
+    monkeypatch.setattr(infra_session_text, "Agent", _FakeAgent)
+    monkeypatch.setattr(infra_session_text, "get_model", lambda *_args: None)
+    monkeypatch.setattr(infra_session_text, "_OUTPUT_CACHE", _MemoryCache())
+    return _FakeAgent
+
+
+def _input(template_id: str, distance: float) -> SessionTextInput:
+    return SessionTextInput(
+        philosophy_id="daniels",
+        race_distance="marathon",
+        phase="build",
+        week_index=3,
+        day_type=DayType.EASY,
+        allocated_distance_mi=distance,
+        allocated_duration_min=None,
+        template_id=template_id,
+        template_kind="easy_continuous",
+        params={},
+        constraints={},
+    )
+
+
+def _item(session: int, distance: float) -> SessionTextBatchItemSchema:
+    return SessionTextBatchItemSchema(
+        session=session,
+        title=f"Easy {distance}",
+        description="Easy aerobic run",
+        structure={"warmup_mi": 0, "main": [], "cooldown_mi": 0},
+        computed={"total_distance_mi": distance, "hard_minutes": 0, "intensity_minutes": {}},
+    )
+
+
+def _output(title: str) -> SessionTextOutput:
+    return SessionTextOutput(title=title, description="d", structure={}, computed={})
+
+
+@pytest.mark.asyncio
+async def test_batch_validates_each_item(fake_llm):
+    inputs = [_input("easy_a", 5.0), _input("easy_b", 6.0), _input("easy_c", 4.0)]
+    # Session 2 exceeds its allocated distance; session 3 is missing from the output
+    fake_llm.output = SessionTextBatchSchema(sessions=[_item(2, 9.0), _item(1, 5.0)])
+
+    outputs = await infra_session_text.generate_session_texts_batch_llm(inputs)
+
+    assert len(fake_llm.runs) == 1
+    assert "=== Session 3 ===" in fake_llm.runs[0]
+    assert [o.title if o else None for o in outputs] == ["Easy 5.0", None, None]
+
+    # Accepted output is cached per session: a second batch only sends the rest
+    fake_llm.output = SessionTextBatchSchema(sessions=[_item(1, 6.0), _item(2, 4.0)])
+    outputs = await infra_session_text.generate_session_texts_batch_llm(inputs)
+
+    assert "=== Session 3 ===" not in fake_llm.runs[1]
+    assert [o.title for o in outputs] == ["Easy 5.0", "Easy 6.0", "Easy 4.0"]
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_request_returns_no_outputs(fake_llm):
+    fake_llm.output = RuntimeError("rate limited")
+
+    outputs = await infra_session_text.generate_session_texts_batch_llm([_input("easy_a", 5.0), _input("easy_b", 6.0)])
+
+    assert outputs == [None, None]
+
+
+@pytest.mark.asyncio
+async def test_only_failing_sessions_are_generated_individually(monkeypatch):
+    template = SessionTemplate(
+        template_id="easy_v1", description_key="easy", kind="easy_continuous", params={}, constraints={}, tags=[]
+    )
+    sessions = [PlannedSession(day_index=i, day_type=DayType.EASY, distance=5.0 + i, template=template) for i in range(3)]
+    context = {"philosophy_id": "daniels", "race_distance": "marathon", "phase": "build", "week_index": 3}
+    batch = AsyncMock(return_value=[_output("batched 0"), None, _output("batched 2")])
+    individual = AsyncMock(return_value=_output("individual 1"))
+    monkeypatch.setattr(generator, "generate_session_texts_batch_llm", batch)
+    monkeypatch.setattr(generator, "generate_session_text", individual)
+    monkeypatch.setattr(generator, "_get_cached_output", lambda _key: None)
+    monkeypatch.setattr(generator, "_set_cached_output", lambda _key, _output: None)
+
+    outputs = await generator.generate_session_texts(sessions, context)
+
+    assert [o.title for o in outputs] == ["batched 0", "individual 1", "batched 2"]
+    assert len(batch.await_args.args[0]) == 3
+    individual.assert_awaited_once_with(sessions[1], context)
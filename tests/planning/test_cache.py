@@ -1,4 +1,7 @@
-from app.planning.cache import clear_cache, get_cached_session, set_cached_session
+import pytest
+
+from app.planning import cache
+from app.planning.cache import clear_cache, get_cache_stats, get_cached_session, set_cached_session
 from app.planning.schema.session_output import SessionBlock, SessionPlan
 from app.planning.schema.session_spec import Intensity, SessionSpec, SessionType, Sport
 
@@ -63,3 +66,83 @@ def test_cache_miss():
 
     cached = get_cached_session(spec)
     assert cached is None
+
+
+@pytest.fixture
+def fake_redis(fake_redis, monkeypatch):
+    monkeypatch.setattr(cache, "_get_redis_client", lambda: fake_redis)
+    clear_cache()
+    yield fake_redis
+    clear_cache()
+
+
+def _spec(distance_km: float = 10.0, goal: str = "tempo development") -> SessionSpec:
+    return SessionSpec(
+        sport=Sport.RUN,
+        session_type=SessionType.TEMPO,
+        intensity=Intensity.TEMPO,
+        target_distance_km=distance_km,
+        goal=goal,
+        phase="base",
+        week_number=1,
+        day_of_week=0,
+    )
+
+
+def _plan(title: str = "Tempo Run") -> SessionPlan:
+    return SessionPlan(
+        title=title,
+        structure=[SessionBlock(type="steady", distance_km=10.0, intensity="tempo")],
+        notes="Stay controlled",
+    )
+
+
+def test_cache_key_is_stable_and_covers_prompt_fields():
+    key = cache._cache_key(_spec())
+
+    # Stable hex digest, not process-seeded hash()
+    assert key == cache._cache_key(_spec())
+    assert len(key) == 64
+    assert cache._cache_key(_spec(goal="threshold support")) != key
+
+
+def test_redis_tier_shared_across_workers(fake_redis):
+    set_cached_session(_spec(), _plan())
+    # Simulate another worker: empty memory tier, same Redis
+    cache._spec_cache.clear()
+    cache._memory_bytes = 0
+
+    cached = get_cached_session(_spec())
+
+    assert cached is not None
+    assert cached.title == "Tempo Run"
+    assert any(cache.get_template_library_version() in key for key in fake_redis.values)
+    stats = get_cache_stats()
+    assert (stats["redis_hits"], stats["memory_hits"], stats["misses"]) == (1, 0, 0)
+
+
+def test_memory_tier_is_size_bounded_lru(fake_redis, monkeypatch):
+    fake_redis.down = True
+    entry_size = len(_plan().model_dump_json())
+    monkeypatch.setattr(cache, "MAX_MEMORY_BYTES", entry_size * 2)
+
+    set_cached_session(_spec(5.0), _plan())
+    set_cached_session(_spec(6.0), _plan())
+    assert get_cached_session(_spec(5.0)) is not None  # 6.0 is now least recently used
+    set_cached_session(_spec(7.0), _plan())
+
+    assert get_cached_session(_spec(6.0)) is None
+    assert get_cached_session(_spec(5.0)) is not None
+    stats = get_cache_stats()
+    assert stats["evictions"] == 1
+    assert stats["entries"] == 2
+    assert stats["memory_bytes"] <= stats["max_memory_bytes"]
+
+
+def test_library_version_change_orphans_entries(fake_redis, monkeypatch):
+    set_cached_session(_spec(), _plan())
+    cache._spec_cache.clear()
+    cache._memory_bytes = 0
+    monkeypatch.setattr(cache, "_library_version", "new-library")
+
+    assert get_cached_session(_spec()) is None
@@ -0,0 +1,116 @@
+"""Tests for concurrent context assembly.
+
+Tests cover:
+- Sources are fetched concurrently and timed individually
+- The assembled context is immutable
+- Identical sources are fetched once per assembly
+- Failed optional sources fall back to their default; required ones raise
+- Async assembly mixes coroutine and sync sources
+- Recent decisions are loaded in one query, latest version per date
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from app.db.models import DailyDecision
+from app.services.intelligence import context_builder, store
+from app.services.intelligence.context_assembler import ContextSource, assemble_context, assemble_context_async
+
+
+def _slow(value: str, delay: float = 0.2) -> str:
+    time.sleep(delay)
+    return value
+
+
+def test_sources_are_fetched_concurrently():
+    started = time.perf_counter()
+
+    assembled = assemble_context("test", [ContextSource(name, _slow, (name,)) for name in ("a", "b", "c")])
+
+    assert time.perf_counter() - started < 0.45
+    assert dict(assembled.values) == {"a": "a", "b": "b", "c": "c"}
+    assert set(assembled.timings_ms) == {"a", "b", "c"}
+    assert all(elapsed >= 150 for elapsed in assembled.timings_ms.values())
+    with pytest.raises(TypeError):
+        assembled.values["a"] = "changed"  # type: ignore[index]
+
+
+def test_identical_sources_are_fetched_once():
+    calls: list[str] = []
+    lock = threading.Lock()
+
+    def _fetch(user_id: str) -> str:
+        with lock:
+            calls.append(user_id)
+        return f"activities for {user_id}"
+
+    assembled = assemble_context(
+        "test",
+        [ContextSource("activities", _fetch, ("u1",)), ContextSource("history", _fetch, ("u1",)), ContextSource("other", _fetch, ("u2",))],
+    )
+
+    assert sorted(calls) == ["u1", "u2"]
+    assert assembled["activities"] == assembled["history"] == "activities for u1"
+
+
+def test_failed_sources_use_default_unless_required():
+    def _broken() -> None:
+        raise RuntimeError("db down")
+
+    assembled = assemble_context("test", [ContextSource("optional", _broken, default=[]), ContextSource("ok", _slow, ("x", 0))])
+
+    assert assembled["optional"] == []
+    assert assembled.failed == ("optional",)
+
+    with pytest.raises(RuntimeError, match="db down"):
+        assemble_context("test", [ContextSource("required", _broken, required=True)])
+
+
+@pytest.mark.asyncio
+async def test_async_assembly_mixes_coroutines_and_sync_sources():
+    async def _history(athlete_id: int) -> list[str]:
+        return [f"message for {athlete_id}"]
+
+    assembled = await assemble_context_async(
+        "test", [ContextSource("history", _history, (1,)), ContextSource("adapter", _slow, ("rag", 0.05))]
+    )
+
+    assert dict(assembled.values) == {"history": ["message for 1"], "adapter": "rag"}
+    assert assembled.timings_ms["adapter"] >= 40
+
+
+def test_recent_decisions_use_latest_active_version_per_date(db_session, monkeypatch):
+    @contextmanager
+    def _get_session():
+        yield db_session
+
+    monkeypatch.setattr(store, "get_session", _get_session)
+    monkeypatch.setattr(context_builder, "DailyDecision", lambda **data: SimpleNamespace(**data))
+    decision_date = date(2026, 3, 10)
+
+    def _add(days_ago: int, version: int, recommendation: str, is_active: bool = True) -> None:
+        day = decision_date - timedelta(days=days_ago)
+        db_session.add(
+            DailyDecision(
+                user_id="u1",
+                decision_date=datetime.combine(day, datetime.min.time()).replace(tzinfo=timezone.utc),
+                decision_data={"recommendation": recommendation},
+                version=version,
+                is_active=is_active,
+            )
+        )
+
+    _add(1, 1, "easy")
+    _add(1, 2, "moderate")
+    _add(3, 1, "rest")
+    _add(2, 1, "hard", is_active=False)
+    db_session.flush()
+
+    decisions = context_builder._get_recent_decisions_for_context("u1", decision_date)
+
+    assert [d.recommendation for d in decisions] == ["moderate", "rest"]
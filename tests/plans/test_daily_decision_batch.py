@@ -0,0 +1,166 @@
+"""Tests for the overnight daily-decision batch.
+
+Tests cover:
+- The bulk fingerprint prefilter skips users whose decision is newer than their inputs
+- Remaining users are processed concurrently within the configured bound
+- Per-user failures are counted without stopping the batch
+- Only users whose decision is generated take a rate-limit slot
+"""
+
+import asyncio
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.db.models import Activity, DailyDecision, StravaAccount
+from app.services.intelligence import scheduler, triggers
+
+
+@pytest.fixture
+def batch_db(db_session, monkeypatch):
+    @contextmanager
+    def _get_session():
+        yield db_session
+
+    monkeypatch.setattr(scheduler, "get_session", _get_session)
+    monkeypatch.setattr(scheduler, "RegenerationTriggers", lambda: None)
+    monkeypatch.setattr(scheduler, "IntentStore", lambda: None)
+    return db_session
+
+
+def _day_start() -> datetime:
+    return datetime.combine(datetime.now(timezone.utc).date(), datetime.min.time()).replace(tzinfo=timezone.utc)
+
+
+def _add_decision(session, user_id: str, created_at: datetime) -> None:
+    session.add(
+        DailyDecision(
+            user_id=user_id,
+            decision_data={},
+            decision_date=_day_start(),
+            is_active=True,
+            created_at=created_at,
+        )
+    )
+
+
+def _add_activity(session, user_id: str, updated_at: datetime) -> None:
+    session.add(
+        Activity(
+            user_id=user_id,
+            sport="run",
+            starts_at=_day_start() - timedelta(days=1),
+            duration_seconds=1800,
+            metrics={},
+            updated_at=updated_at,
+        )
+    )
+
+
+def test_prefilter_skips_users_with_up_to_date_decisions(batch_db):
+    now = datetime.now(timezone.utc)
+    # u_new: no decision yet; u_same: decided after last input; u_changed: activity synced after decision
+    _add_activity(batch_db, "u_same", now - timedelta(hours=3))
+    _add_decision(batch_db, "u_same", now - timedelta(hours=1))
+    _add_decision(batch_db, "u_changed", now - timedelta(hours=2))
+    _add_activity(batch_db, "u_changed", now - timedelta(minutes=30))
+    batch_db.flush()
+
+    selected = scheduler._select_users_to_process(
+        [("u_new", 1), ("u_same", 2), ("u_changed", 3)],
+        now.date(),
+    )
+
+    assert selected == [("u_new", 1), ("u_changed", 3)]
+
+
+@pytest.mark.asyncio
+async def test_batch_runs_users_concurrently_and_counts_outcomes(batch_db, monkeypatch):
+    for i in range(6):
+        batch_db.add(StravaAccount(user_id=f"u{i}", athlete_id=str(100 + i), access_token="a", refresh_token="r", expires_at=0))
+    _add_decision(batch_db, "u5", datetime.now(timezone.utc))
+    batch_db.flush()
+
+    in_flight = 0
+    peak = 0
+
+    async def _process(user_id, _athlete_id, _today, _triggers, _store, _rate_limiter):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.02)
+        in_flight -= 1
+        if user_id == "u0":
+            raise RuntimeError("LLM unavailable")
+        return user_id != "u1"
+
+    monkeypatch.setattr(scheduler, "_process_user_daily_decision", _process)
+
+    user_timings: list[float] = []
+    stats = await scheduler.generate_daily_decisions_async(concurrency=2, llm_per_minute=0, user_timings=user_timings)
+
+    assert stats == {"total": 6, "prefiltered": 1, "success": 3, "skipped": 2, "errors": 1}
+    assert peak == 2
+    assert len(user_timings) == 5
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_spaces_request_starts():
+    limiter = scheduler._RequestRateLimiter(per_minute=1200)  # one start every 50ms
+    loop = asyncio.get_running_loop()
+    starts: list[float] = []
+
+    async def _request():
+        await limiter.wait()
+        starts.append(loop.time())
+
+    await asyncio.gather(*(_request() for _ in range(3)))
+
+    assert starts[2] - starts[0] >= 0.09
+
+
+class _FakeRuntime:
+    @staticmethod
+    def compute_context_hash(context):
+        return context["hash"]
+
+    @staticmethod
+    async def run_daily_decision(_user_id, _athlete_id, _context):
+        await asyncio.sleep(0)
+        return {"recommendation": "rest"}
+
+
+class _FakeStore:
+    @staticmethod
+    def save_daily_decision(**_kwargs):
+        return "decision-1"
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_slot_is_taken_only_for_generations(monkeypatch):
+    regeneration = triggers.RegenerationTriggers.__new__(triggers.RegenerationTriggers)
+    regeneration.runtime = _FakeRuntime()
+    regeneration.store = _FakeStore()
+    monkeypatch.setattr(
+        regeneration, "should_regenerate_daily_decision", lambda _user_id, _date, context_hash: context_hash == "changed"
+    )
+
+    async def _direct(_namespace, _key, call, _result_type):
+        return await call()
+
+    monkeypatch.setattr(triggers, "single_flight", _direct)
+    slots = 0
+
+    async def _take_slot():
+        nonlocal slots
+        await asyncio.sleep(0)
+        slots += 1
+
+    today = datetime.now(timezone.utc).date()
+    for context_hash in ("unchanged", "unchanged", "changed"):
+        await regeneration.maybe_regenerate_daily_decision(
+            "u1", 1, today, {"hash": context_hash}, before_generation=_take_slot
+        )
+
+    assert slots == 1
@@ -1,14 +1,21 @@
 """Unit tests for athlete profile regeneration engine."""
 
+import asyncio
 from datetime import UTC, datetime, timezone
 
 import pytest
 
 from app.db.models import AthleteBio, AthleteProfile, User
+from app.models.athlete_profile import NarrativeBio
+from app.services import athlete_profile_regeneration
+from app.services.athlete_bio_generator import profile_summary_hash
 from app.services.athlete_profile_regeneration import (
     TRIGGER_FIELDS,
     handle_profile_change,
+    regenerate_bio,
+    regenerate_stale_bios,
 )
+from app.services.athlete_profile_service import get_profile_schema
 
 
 @pytest.fixture
@@ -134,3 +141,154 @@ def test_trigger_fields_list():
     assert "training_context.primary_sport" in TRIGGER_FIELDS
     assert "constraints.availability_days_per_week" in TRIGGER_FIELDS
     assert "preferences.recovery_preference" in TRIGGER_FIELDS
+
+
+def _add_profile_and_bio(db_session, user_id, *, depends_on_hash=None, stale=False, source="ai_generated"):
+    db_session.add(AthleteProfile(user_id=user_id, identity={"first_name": "John"}, goals={"primary_goal": "Marathon"}))
+    db_session.commit()
+    if depends_on_hash == "current":
+        depends_on_hash = profile_summary_hash(get_profile_schema(db_session, user_id))
+    db_session.add(
+        AthleteBio(
+            id=f"bio-{user_id}",
+            user_id=user_id,
+            text="Old bio text",
+            confidence_score=0.8,
+            source=source,
+            depends_on_hash=depends_on_hash,
+            last_generated_at=datetime.now(UTC),
+            stale=stale,
+        )
+    )
+    db_session.commit()
+
+
+def test_handle_profile_change_skips_unchanged_profile_summary(db_session, test_user_id):
+    """Test that a bio generated from the same profile summary is left as is."""
+    _add_profile_and_bio(db_session, test_user_id, depends_on_hash="current")
+
+    handle_profile_change(db_session, test_user_id, ["goals.primary_goal"])
+
+    bio = db_session.query(AthleteBio).filter_by(user_id=test_user_id).one()
+    assert bio.stale is False
+
+
+@pytest.mark.asyncio
+async def test_regenerate_stale_bios_regenerates_with_bounded_concurrency(db_session, monkeypatch):
+    """Test that stale AI bios are regenerated in one batch, at most `concurrency` at a time."""
+    for index in range(4):
+        db_session.add(User(id=f"user-{index}", email=f"u{index}@example.com", auth_provider="email", role="athlete"))
+        db_session.commit()
+        _add_profile_and_bio(db_session, f"user-{index}", depends_on_hash="outdated", stale=True)
+
+    running = 0
+    peak = 0
+
+    async def fake_generate(profile):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return NarrativeBio(text="New bio text", confidence_score=0.9, source="ai_generated", depends_on_hash=None)
+
+    monkeypatch.setattr(athlete_profile_regeneration, "generate_athlete_bio", fake_generate)
+
+    stats = await regenerate_stale_bios(concurrency=2)
+
+    assert stats == {"stale": 4, "unchanged": 0, "regenerated": 4, "errors": 0}
+    assert peak == 2
+    for bio in db_session.query(AthleteBio).all():
+        assert (bio.text, bio.stale) == ("New bio text", False)
+        assert bio.depends_on_hash == profile_summary_hash(get_profile_schema(db_session, bio.user_id))
+
+
+@pytest.mark.asyncio
+async def test_regenerate_stale_bios_skips_llm_for_unchanged_and_user_edited(db_session, monkeypatch):
+    """Test that unchanged bios are only un-marked and user-edited bios are not touched."""
+    db_session.add(User(id="user-edited", email="edited@example.com", auth_provider="email", role="athlete"))
+    db_session.add(User(id="user-same", email="same@example.com", auth_provider="email", role="athlete"))
+    db_session.commit()
+    _add_profile_and_bio(db_session, "user-edited", stale=True, source="user_edited")
+    _add_profile_and_bio(db_session, "user-same", depends_on_hash="current", stale=True)
+
+    async def fail_generate(profile):
+        await asyncio.sleep(0)
+        raise AssertionError("bio should not be generated")
+
+    monkeypatch.setattr(athlete_profile_regeneration, "generate_athlete_bio", fail_generate)
+
+    stats = await regenerate_stale_bios()
+
+    assert stats == {"stale": 1, "unchanged": 1, "regenerated": 0, "errors": 0}
+    assert db_session.query(AthleteBio).filter_by(user_id="user-same").one().stale is False
+    edited = db_session.query(AthleteBio).filter_by(user_id="user-edited").one()
+    assert (edited.text, edited.stale) == ("Old bio text", True)
+
+
+def test_regenerate_bio_stores_failed_generation_as_stale_template(db_session, test_user_id, monkeypatch):
+    """Test that a template bio stored after an LLM failure is queued for another attempt."""
+    _add_profile_and_bio(db_session, test_user_id, depends_on_hash="current")
+
+    async def fail_generate(profile):
+        await asyncio.sleep(0)
+        raise RuntimeError("LLM unavailable")
+
+    monkeypatch.setattr(athlete_profile_regeneration, "generate_athlete_bio", fail_generate)
+
+    regenerate_bio(db_session, test_user_id)
+
+    bio = db_session.query(AthleteBio).filter_by(user_id=test_user_id).one()
+    assert bio.text != "Old bio text"
+    assert (bio.depends_on_hash, bio.stale) == (None, True)
+
+
+@pytest.mark.asyncio
+async def test_regenerate_stale_bios_keeps_bio_stale_on_failure(db_session, monkeypatch):
+    """Test that a failed regeneration leaves the bio stale for the next pass."""
+    db_session.add(User(id="user-fail", email="fail@example.com", auth_provider="email", role="athlete"))
+    db_session.commit()
+    _add_profile_and_bio(db_session, "user-fail", depends_on_hash="outdated", stale=True)
+
+    async def fail_generate(profile):
+        await asyncio.sleep(0)
+        raise RuntimeError("LLM unavailable")
+
+    monkeypatch.setattr(athlete_profile_regeneration, "generate_athlete_bio", fail_generate)
+
+    stats = await regenerate_stale_bios()
+
+    assert stats == {"stale": 1, "unchanged": 0, "regenerated": 0, "errors": 1}
+    bio = db_session.query(AthleteBio).filter_by(user_id="user-fail").one()
+    assert (bio.text, bio.depends_on_hash, bio.stale) == ("Old bio text", "outdated", True)
+
+
+@pytest.mark.asyncio
+async def test_regenerate_stale_bios_does_not_starve_on_failing_bio(db_session, monkeypatch):
+    """Test that a bio that keeps failing does not hold the batch from other stale bios."""
+    for user_id in ("user-a-fails", "user-b"):
+        db_session.add(User(id=user_id, email=f"{user_id}@example.com", auth_provider="email", role="athlete"))
+        db_session.commit()
+        _add_profile_and_bio(db_session, user_id, depends_on_hash="outdated", stale=True)
+    db_session.query(AthleteBio).filter_by(user_id="user-a-fails").one().last_generated_at = datetime(2020, 1, 1, tzinfo=UTC)
+    db_session.commit()
+
+    async def generate(profile):
+        await asyncio.sleep(0)
+        if profile.identity.last_name == "Fails":
+            raise RuntimeError("LLM unavailable")
+        return NarrativeBio(text="New bio text", confidence_score=0.9, source="ai_generated", depends_on_hash=None)
+
+    db_session.query(AthleteProfile).filter_by(user_id="user-a-fails").one().identity = {
+        "first_name": "John",
+        "last_name": "Fails",
+    }
+    db_session.commit()
+    monkeypatch.setattr(athlete_profile_regeneration, "generate_athlete_bio", generate)
+
+    first = await regenerate_stale_bios(batch_size=1)
+    second = await regenerate_stale_bios(batch_size=1)
+
+    assert (first["errors"], second["regenerated"]) == (1, 1)
+    assert db_session.query(AthleteBio).filter_by(user_id="user-b").one().text == "New bio text"
+    assert db_session.query(AthleteBio).filter_by(user_id="user-a-fails").one().stale is True